@@ -0,0 +1,55 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class BacktestResultModel:
+    # fmt: off
+    strategyName: str
+    initialBalance: float
+    balance: float
+    profitPercentage: float                 # (Em base 100%) Lucro/prejuízo total
+    trades: int                             # Compras + vendas realizadas (o fechamento final não conta)
+
+    equity: np.ndarray = field(default_factory=lambda: np.empty(0), repr=False)             # Curva de capital candle a candle
+    position: np.ndarray = field(default_factory=lambda: np.empty(0), repr=False)           # 1.0 = comprado, 0.0 = fora
+    tradeList: pd.DataFrame = field(default_factory=pd.DataFrame, repr=False)               # Uma linha por operação fechada
+
+    # Métricas (calculadas a partir da curva de capital, ver tests/backtestMetrics.py)
+    maxDrawdownPercentage: float = 0.0      # (Em base 100%) Maior queda do capital a partir de um pico
+    sharpeRatio: float = 0.0                # Anualizado
+    sortinoRatio: float = 0.0               # Anualizado, considera só a volatilidade das perdas
+    exposurePercentage: float = 0.0         # (Em base 100%) Parte dos candles com posição aberta
+    winRatePercentage: float = 0.0          # (Em base 100%) Operações com lucro
+    averageTradePercentage: float = 0.0     # (Em base 100%) Resultado médio por operação
+    turnover: float = 0.0                   # Volume negociado / capital médio
+
+    # fmt: on
+
+    def metrics(self):
+        """Resumo numérico do backtest (sem curvas), pronto para tabelas de varredura e dashboards."""
+        return {
+            "profit_percentage": self.profitPercentage,
+            "balance": self.balance,
+            "trades": self.trades,
+            "max_drawdown_percentage": self.maxDrawdownPercentage,
+            "sharpe_ratio": self.sharpeRatio,
+            "sortino_ratio": self.sortinoRatio,
+            "exposure_percentage": self.exposurePercentage,
+            "win_rate_percentage": self.winRatePercentage,
+            "average_trade_percentage": self.averageTradePercentage,
+            "turnover": self.turnover,
+        }
+
+    def printResults(self):
+        print(f"🔹 Balanço final: ${self.balance:.2f}")
+        print(f"📈 Lucro/prejuízo percentual: {self.profitPercentage:.2f}%")
+        print(f"📊 Total de operações realizadas: {self.trades}")
+        print(f"📉 Drawdown máximo: {self.maxDrawdownPercentage:.2f}%")
+        print(f"⚖️ Sharpe: {self.sharpeRatio:.2f} | Sortino: {self.sortinoRatio:.2f}")
+        print(
+            f"⏱️ Exposição: {self.exposurePercentage:.2f}% | Acerto: {self.winRatePercentage:.2f}% | "
+            f"Média por operação: {self.averageTradePercentage:.2f}% | Giro: {self.turnover:.2f}x"
+        )
@@ -1,6 +1,13 @@
 from modules.BinanceTraderBot import BinanceTraderBot
 from binance.client import Client
+from modules.CandleStore import CandleStore
+from indicators.ohlcv_view import ohlcvView
 from tests.backtestRunner import backtestRunner
+from tests.parameterSweep import parameterSweep
+from tests.walkForward import walkForward
+from tests.eventBacktestRunner import eventBacktestRunner
+from tests.intrabarBacktestRunner import intrabarBacktestRunner
+from tests.portfolioBacktestRunner import buildPanel, portfolioBacktestRunner
 from strategies.ut_bot_alerts import *
 from strategies.moving_average_antecipation import getMovingAverageAntecipationTradeStrategy
 from strategies.moving_average import getMovingAverageTradeStrategy
@@ -25,50 +32,68 @@ CANDLE_PERIOD = Client.KLINE_INTERVAL_1HOUR
 
 CLANDES_RODADOS =  31*24  # 7 dias de 24 horas, com 4 candles por hora
 
-# ------------------------------------------------------------------------
-# ⏬ SELEÇÃO DE ESTRATÉGIAS ⏬
+# ----------------------------------------
+# 📦 FONTE DOS CANDLES 📦
 
-devTrader = BinanceTraderBot(
-    stock_code=STOCK_CODE,
-    operation_code=OPERATION_CODE,
-    traded_quantity=0,
-    traded_percentage=100,
-    candle_period=CANDLE_PERIOD,
-    # volatility_factor=VOLATILITY_FACTOR,
-)
+USE_CANDLE_STORE = True  # True = lê o arquivo local de candles (sem rede) | False = baixa os últimos 1000 candles da Binance
+SYNC_CANDLE_STORE = False  # True = atualiza o arquivo local com os candles novos da Binance antes de rodar (vazio = sempre baixa)
+SYNC_START_TIME = "2024-01-01"  # Início do download quando o arquivo local ainda está vazio
 
+# ------------------------------------------------------------------------
+# ⏬ SELEÇÃO DE ESTRATÉGIAS ⏬
 
-devTrader.updateAllData()
+if USE_CANDLE_STORE:
+    candle_store = CandleStore()
+    # data/candles/ fica fora do git: em um checkout novo o arquivo local está vazio e é baixado na primeira execução
+    if SYNC_CANDLE_STORE or candle_store.rows(OPERATION_CODE, CANDLE_PERIOD) == 0:
+        candle_store.syncFromBinance(Client(), OPERATION_CODE, CANDLE_PERIOD, start_time=SYNC_START_TIME)
+    stock_data = ohlcvView(candle_store.read(OPERATION_CODE, CANDLE_PERIOD))
+else:
+    devTrader = BinanceTraderBot(
+        stock_code=STOCK_CODE,
+        operation_code=OPERATION_CODE,
+        traded_quantity=0,
+        traded_percentage=100,
+        candle_period=CANDLE_PERIOD,
+        # volatility_factor=VOLATILITY_FACTOR,
+    )
+    devTrader.updateAllData()
+    stock_data = devTrader.stock_data
+
+print(f"📦 {len(stock_data)} candles de {OPERATION_CODE} ({CANDLE_PERIOD}) carregados.")
+if len(stock_data) == 0:
+    print(f"⚠️ Nenhum candle de {OPERATION_CODE} ({CANDLE_PERIOD}) disponível: confira o símbolo e o intervalo.")
 
 # print(f"\n{STOCK_CODE} - UT BOTS - {str(CANDLE_PERIOD)}")
 # backtestRunner(
-#     stock_data=devTrader.stock_data,
+#     stock_data=stock_data,
 #     strategy_function=utBotAlerts,
 #     periods=CLANDES_RODADOS,
 #     initial_balance=INITIAL_BALANCE,
+#     print_results=True,
 #     atr_multiplier=2,
 #     atr_period=1,
 #     verbose=False,
 # )
 
-devTrader.updateAllData()
-
 print(f"\n{STOCK_CODE} - MA RSI e VOLUME - {str(CANDLE_PERIOD)}")
 backtestRunner(
-    stock_data=devTrader.stock_data,
+    stock_data=stock_data,
     strategy_function=getMovingAverageRSIVolumeStrategy,
     periods=CLANDES_RODADOS,
     initial_balance=INITIAL_BALANCE,
+    print_results=True,
     verbose=False,
 )
 
 
 # print(f"\n{STOCK_CODE} - MA ANTECIPATION - {str(CANDLE_PERIOD)}")
 # backtestRunner(
-#     stock_data=devTrader.stock_data,
+#     stock_data=stock_data,
 #     strategy_function=getMovingAverageAntecipationTradeStrategy,
 #     periods=CLANDES_RODADOS,
 #     initial_balance=INITIAL_BALANCE,
+#     print_results=True,
 #     volatility_factor=0.5,
 #     fast_window=7,
 #     slow_window=40,
@@ -77,10 +102,11 @@ backtestRunner(
 
 # print(f"\n{STOCK_CODE} - MA SIMPLES FALLBACK - {str(CANDLE_PERIOD)}")
 # backtestRunner(
-#     stock_data=devTrader.stock_data,
+#     stock_data=stock_data,
 #     strategy_function=getMovingAverageTradeStrategy,
 #     periods=CLANDES_RODADOS,
 #     initial_balance=INITIAL_BALANCE,
+#     print_results=True,
 #     fast_window=7,
 #     slow_window=40,
 #     verbose=False,
@@ -88,10 +114,11 @@ backtestRunner(
 
 print(f"\n{STOCK_CODE} - RSI - {str(CANDLE_PERIOD)}")
 backtestRunner(
-    stock_data=devTrader.stock_data,
+    stock_data=stock_data,
     strategy_function=getRsiTradeStrategy,
     periods=CLANDES_RODADOS,
     initial_balance=INITIAL_BALANCE,
+    print_results=True,
     low=30,
     high=70,
     verbose=False,
@@ -99,31 +126,114 @@ backtestRunner(
 
 print(f"\n{STOCK_CODE} - VORTEX - {str(CANDLE_PERIOD)}")
 backtestRunner(
-    stock_data=devTrader.stock_data,
+    stock_data=stock_data,
     strategy_function=getVortexTradeStrategy,
     periods=CLANDES_RODADOS,
     initial_balance=INITIAL_BALANCE,
+    print_results=True,
     verbose=False,
 )
 
 print(f"\n{STOCK_CODE} - TON V3 - {str(CANDLE_PERIOD)}")
 backtestRunner(
-    stock_data=devTrader.stock_data,
+    stock_data=stock_data,
     strategy_function=getAdvancedTradeStrategy_v3,
     periods=CLANDES_RODADOS,
     initial_balance=INITIAL_BALANCE,
+    print_results=True,
     verbose=False,
 )
 
 print(f"\n{STOCK_CODE} - T3 - {str(CANDLE_PERIOD)}")
 backtestRunner(
-    stock_data=devTrader.stock_data,
+    stock_data=stock_data,
     strategy_function=getT3MATradeStrategy,
     periods=CLANDES_RODADOS,
     initial_balance=INITIAL_BALANCE,
+    print_results=True,
     fast_period=7,
     slow_period=40,
     volume_factor=0.7,
     verbose=False,
 )
+
+# 🔎 Varredura de parâmetros (grid) em paralelo, para escolher os MAIN_STRATEGY_ARGS
+# print(f"\n{STOCK_CODE} - T3 SWEEP - {str(CANDLE_PERIOD)}")
+# sweep_results = parameterSweep(
+#     stock_data=stock_data,
+#     strategy_function=getT3MATradeStrategy,
+#     param_grid={
+#         "fast_period": [5, 7, 9, 12],
+#         "slow_period": [30, 40, 50],
+#         "volume_factor": [0.5, 0.7, 0.9],
+#     },
+#     periods=CLANDES_RODADOS,
+#     initial_balance=INITIAL_BALANCE,
+# )
+# print(sweep_results.head(10).to_string(index=False))
+
+# 🔁 Walk-forward: otimiza no treino e avalia na janela seguinte (reajuste semanal dos MAIN_STRATEGY_ARGS)
+# print(f"\n{STOCK_CODE} - T3 WALK-FORWARD - {str(CANDLE_PERIOD)}")
+# walk_forward = walkForward(
+#     stock_data=stock_data,
+#     strategy_function=getT3MATradeStrategy,
+#     param_grid={
+#         "fast_period": [5, 7, 9, 12],
+#         "slow_period": [30, 40, 50],
+#         "volume_factor": [0.5, 0.7, 0.9],
+#     },
+#     train_size=4 * 7 * 24,  # 4 semanas de candles de 1h
+#     test_size=7 * 24,  # 1 semana
+#     initial_balance=INITIAL_BALANCE,
+# )
+
+# 🤖 Simulação da lógica completa do bot (stop loss, trailing, take profit e espera após ordens)
+# print(f"\n{STOCK_CODE} - T3 SIMULAÇÃO DO BOT - {str(CANDLE_PERIOD)}")
+# eventBacktestRunner(
+#     stock_data=stock_data,
+#     main_strategy=getT3MATradeStrategy,
+#     main_strategy_args={"fast_period": 7, "slow_period": 40, "volume_factor": 0.7},
+#     stock_code=STOCK_CODE,
+#     operation_code=OPERATION_CODE,
+#     initial_balance=INITIAL_BALANCE,
+#     stop_loss_percentage=3.5,
+#     take_profit_at_percentage=[2, 4, 8],
+#     take_profit_amount_percentage=[70, 30, 100],
+#     delay_after_order=60 * 60,
+#     periods=CLANDES_RODADOS,
+# )
+
+# 🕯️ Stop loss, trailing e take profit avaliados na máxima / mínima de cada candle
+# print(f"\n{STOCK_CODE} - T3 INTRABAR - {str(CANDLE_PERIOD)}")
+# intrabarBacktestRunner(
+#     stock_data=stock_data,
+#     strategy_function=getT3MATradeStrategy,
+#     periods=CLANDES_RODADOS,
+#     initial_balance=INITIAL_BALANCE,
+#     print_results=True,
+#     stop_loss_percentage=3.5,
+#     take_profit_at_percentage=[2, 4, 8],
+#     take_profit_amount_percentage=[70, 30, 100],
+#     both_hit="stop_first",
+#     fast_period=7,
+#     slow_period=40,
+#     volume_factor=0.7,
+#     verbose=False,
+# )
+
+# 🧺 Carteira: vários símbolos alinhados em um painel, com saldo compartilhado
+# PORTFOLIO = {"BTC": "BTCUSDT", "XRP": "XRPUSDT", "SOL": "SOLUSDT", "ADA": "ADAUSDT"}
+# portfolio_data = {}
+# for stock_code, operation_code in PORTFOLIO.items():
+#     portfolio_data[operation_code] = CandleStore().read(operation_code, CANDLE_PERIOD)
+# print(f"\nCARTEIRA - T3 - {str(CANDLE_PERIOD)}")
+# portfolioBacktestRunner(
+#     panel=buildPanel(portfolio_data),
+#     strategy_function=getT3MATradeStrategy,
+#     periods=CLANDES_RODADOS,
+#     initial_balance=INITIAL_BALANCE,
+#     fast_period=7,
+#     slow_period=40,
+#     volume_factor=0.7,
+# )
 print("\n\n")
@@ -0,0 +1,77 @@
+import contextlib
+import io
+import os
+import sys
+import time
+
+# Configuração de caminhos para importações
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, SRC_DIR)
+
+from benchmarks.synthetic_candles import generateSyntheticCandles
+from tests.backtestRunner import backtestRunner
+from tests.vectorBacktestRunner import vectorBacktestRunner
+from strategies.moving_average import getMovingAverageTradeStrategy
+from strategies.t3_strategy import getT3MATradeStrategy
+
+# ------------------------------------------------------------------------
+# ⏱️ AJUSTES DO BENCHMARK ⏱️
+
+BENCHMARK_SIZES = [1_000, 10_000, 100_000]  # Quantidade de candles de cada rodada
+
+# O backtestRunner tem custo quadrático: acima deste tamanho o tempo é estimado
+# a partir da maior rodada medida (t * (n / n_medido) ** 2) em vez de executado.
+LEGACY_MAX_ROWS = 10_000
+
+STRATEGIES = [
+    ("MA SIMPLES", getMovingAverageTradeStrategy, {"fast_window": 7, "slow_window": 40, "verbose": False}),
+    ("T3", getT3MATradeStrategy, {"fast_period": 7, "slow_period": 40, "volume_factor": 0.7, "verbose": False}),
+]
+
+# ------------------------------------------------------------------------
+
+
+def timeRunner(runner, stock_data, strategy_function, strategy_kwargs):
+    # O benchmark só precisa do tempo e do resultado; qualquer log das estratégias é descartado
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = runner(
+            stock_data=stock_data,
+            strategy_function=strategy_function,
+            periods=len(stock_data),
+            **strategy_kwargs,
+        )
+        elapsed = time.perf_counter() - start
+    return elapsed, result.profitPercentage
+
+
+def runBenchmark():
+    print(f"{'Estratégia':<12} {'Candles':>9} {'Legado (s)':>14} {'Vetorizado (s)':>15} {'Speedup':>10}  Mesmo resultado")
+
+    for name, strategy_function, strategy_kwargs in STRATEGIES:
+        last_measured = None  # (candles, segundos) da maior rodada legada executada
+
+        for size in BENCHMARK_SIZES:
+            stock_data = generateSyntheticCandles(size)
+            vector_time, vector_profit = timeRunner(vectorBacktestRunner, stock_data, strategy_function, strategy_kwargs)
+
+            if size <= LEGACY_MAX_ROWS:
+                legacy_time, legacy_profit = timeRunner(backtestRunner, stock_data, strategy_function, strategy_kwargs)
+                last_measured = (size, legacy_time)
+                legacy_text = f"{legacy_time:.3f}"
+                same_result = "sim" if abs(legacy_profit - vector_profit) < 1e-6 else "NÃO"
+            elif last_measured is not None:
+                legacy_time = last_measured[1] * (size / last_measured[0]) ** 2
+                legacy_text = f"~{legacy_time:.0f} (est.)"
+                same_result = "-"
+            else:
+                legacy_time = float("nan")
+                legacy_text = "-"
+                same_result = "-"
+
+            speedup = legacy_time / vector_time if vector_time > 0 else float("nan")
+            print(f"{name:<12} {size:>9} {legacy_text:>14} {vector_time:>15.3f} {speedup:>9.0f}x  {same_result}")
+
+
+if __name__ == "__main__":
+    runBenchmark()
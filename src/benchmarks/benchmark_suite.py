@@ -0,0 +1,377 @@
+import argparse
+import contextlib
+import importlib
+import inspect
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+# Configuração de caminhos para importações
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, SRC_DIR)
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic_candles import generateSyntheticCandles, SHORT_COLUMN_NAMES
+
+"""
+Suíte de benchmark de todos os indicadores e estratégias sobre candles sintéticos reprodutíveis.
+
+Mede cada função de indicators/, cada Indicators.get* de indicators/extras/Indicators.py e cada estratégia de
+strategies/ e strategies/extras/ nos dois formatos de colunas (close_price/... e close/...), em tamanhos crescentes,
+e grava o resultado em JSON para acompanhar regressões ao longo do tempo.
+
+Uso (a partir de src/):
+    python benchmarks/benchmark_suite.py
+    python benchmarks/benchmark_suite.py --sizes 1000 10000 --filter T3 --baseline benchmarks/results/anterior.json
+"""
+
+# ------------------------------------------------------------------------
+# ⏱️ AJUSTES DO BENCHMARK ⏱️
+
+BENCHMARK_SIZES = [1_000, 10_000, 100_000, 1_000_000]  # Quantidade de candles de cada rodada
+LAYOUTS = ["close_price", "close"]  # Formatos de colunas testados
+REPEAT = 3  # Execuções por medição (vale a melhor)
+
+# Tempo máximo estimado de uma execução: se a projeção linear para o próximo tamanho passar disso,
+# os tamanhos maiores da mesma função são pulados
+MAX_SECONDS = 30.0
+
+RESULTS_DIR = os.path.join(SRC_DIR, "benchmarks", "results")
+
+# Scripts geradores de código: importá-los executa a geração de arquivos
+EXCLUDED_MODULES = {"indicators_creator", "indicators-update", "create_strategies"}
+
+# Módulos de apoio de indicators/ (kernels, janelas, cache, grafo de dependências, visão OHLCV): não recebem candles
+# e são medidos através dos indicadores e estratégias que os usam
+ENGINE_MODULES = {
+    "indicator_cache",
+    "indicator_graph",
+    "kernels",
+    "ohlcv_view",
+    "pivot_levels",
+    "price_action",
+    "rolling_extrema",
+    "rolling_regression",
+    "session_vwap",
+    "streaming",
+    "weighted_windows",
+}
+
+# Funções de módulos medidos que não recebem candles nem a série de fechamento
+EXCLUDED_FUNCTIONS = {
+    "period_batch.t3Panel",  # Painel (tempo x símbolo), conferido em benchmarks/panel_decision_check.py
+}
+
+# Funções que recebem a série de fechamento em vez do DataFrame de candles
+SERIES_INPUT = {
+    "indicators": {
+        "rsi.rsi",
+        "macd.macd",
+        "Indicators.getRSI",
+        "Indicators.getMACD",
+        "period_batch.emaBatch",
+        "period_batch.wilderBatch",
+        "period_batch.smaBatch",
+        "period_batch.rollingStdBatch",
+        "period_batch.t3Batch",
+        "period_batch.rsiBatch",
+    }
+}
+
+# Valores usados para parâmetros obrigatórios (sem valor padrão)
+REQUIRED_ARGUMENTS = {
+    "window": 14,
+    "fast_window": 12,
+    "slow_window": 26,
+    "signal_window": 9,
+    "last_only": False,
+    "volatility_factor": 0.5,
+    "spans": [7, 20, 40],
+    "windows": [7, 14, 40],
+    "periods": [7, 20, 40],
+}
+
+# ------------------------------------------------------------------------
+
+
+def _moduleNames(package):
+    package_dir = os.path.join(SRC_DIR, *package.split("."))
+    names = []
+    for file_name in sorted(os.listdir(package_dir)):
+        module_name = file_name[:-3]
+        if file_name.endswith(".py") and not file_name.startswith("__") and module_name not in EXCLUDED_MODULES:
+            names.append(module_name)
+    return names
+
+
+def _importModule(module_path, targets, group):
+    """Importa o módulo; em caso de falha (ex: dependência ausente) registra o erro como um alvo."""
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return importlib.import_module(module_path)
+    except Exception as e:
+        targets.append({"group": group, "name": module_path, "function": None, "error": f"{type(e).__name__}: {e}"})
+        return None
+
+
+def _indicatorMethods(module, group, targets):
+    # Métodos estáticos get* da classe Indicators
+    for name, function in inspect.getmembers(module.Indicators, inspect.isfunction):
+        if name.startswith("get"):
+            targets.append({"group": group, "name": f"Indicators.{name}", "function": function, "error": None})
+
+
+def discoverTargets():
+    """
+    Encontra as funções medidas pela suíte.
+
+    :return: Lista de dicionários {group, name, function, error}; módulos que não importam entram com o erro.
+    """
+    targets = []
+
+    # indicators/: funções públicas de cada módulo + Indicators.get*
+    for module_name in _moduleNames("indicators"):
+        if module_name in ENGINE_MODULES:
+            continue
+        module = _importModule(f"indicators.{module_name}", targets, "indicators")
+        if module is None:
+            continue
+        if module_name == "Indicators":
+            _indicatorMethods(module, "indicators", targets)
+            continue
+        for name, function in inspect.getmembers(module, inspect.isfunction):
+            if f"{module_name}.{name}" in EXCLUDED_FUNCTIONS:
+                continue
+            if function.__module__ == module.__name__ and not name.startswith("_"):
+                targets.append({"group": "indicators", "name": f"{module_name}.{name}", "function": function, "error": None})
+
+    # indicators/extras/: Indicators.get*
+    module = _importModule("indicators.extras.Indicators", targets, "indicators.extras")
+    if module is not None:
+        _indicatorMethods(module, "indicators.extras", targets)
+
+    # strategies/ e strategies/extras/: funções públicas que recebem stock_data (as versões em lote, que recebem
+    # a lista de combinações, são conferidas pela estratégia em benchmarks/strategy_contract_check.py)
+    for package in ("strategies", "strategies.extras"):
+        for module_name in _moduleNames(package):
+            module = _importModule(f"{package}.{module_name}", targets, package)
+            if module is None:
+                continue
+            for name, function in inspect.getmembers(module, inspect.isfunction):
+                if function.__module__ != module.__name__ or name.startswith("_"):
+                    continue
+                parameters = list(inspect.signature(function).parameters)
+                if parameters and parameters[0] == "stock_data" and "combinations" not in parameters:
+                    targets.append({"group": package, "name": f"{module_name}.{name}", "function": function, "error": None})
+
+    return targets
+
+
+def _callArguments(target, candles, layout):
+    """
+    Monta os argumentos da chamada: o primeiro parâmetro recebe o DataFrame (ou a série de fechamento, ver
+    SERIES_INPUT), os obrigatórios vêm de REQUIRED_ARGUMENTS e verbose é sempre False.
+    """
+    parameters = list(inspect.signature(target["function"]).parameters.values())
+    close_column = SHORT_COLUMN_NAMES["close_price"] if layout == "close" else "close_price"
+    first = candles[close_column] if target["name"] in SERIES_INPUT.get(target["group"], ()) else candles
+
+    kwargs = {}
+    for parameter in parameters[1:]:
+        if parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD):
+            continue
+        if parameter.name == "verbose":
+            kwargs["verbose"] = False
+        elif parameter.default is inspect.Parameter.empty:
+            kwargs[parameter.name] = REQUIRED_ARGUMENTS[parameter.name]
+    return first, kwargs
+
+
+def timeCall(target, candles, layout, repeat=REPEAT):
+    """
+    Mede a melhor de 'repeat' execuções da função sobre uma cópia dos candles (funções que alteram o DataFrame
+    não afetam as medições seguintes). Logs das funções são descartados.
+
+    :return: Tempo em segundos.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        first, kwargs = _callArguments(target, candles.copy(), layout)
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            target["function"](first, **kwargs)
+            elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        if elapsed > 1.0:
+            break  # Execuções longas já são estáveis; não vale repetir
+    return best
+
+
+def runBenchmarkSuite(sizes=None, layouts=None, repeat=REPEAT, max_seconds=MAX_SECONDS, name_filter=None, verbose=True):
+    """
+    Executa a suíte e devolve uma linha por (função, formato, tamanho).
+
+    :param sizes: Tamanhos (candles) medidos. None = BENCHMARK_SIZES.
+    :param layouts: Formatos de colunas ("close_price", "close"). None = LAYOUTS.
+    :param repeat: Execuções por medição (vale a melhor).
+    :param max_seconds: Tempo máximo projetado para uma execução antes de pular os tamanhos maiores.
+    :param name_filter: Mede apenas funções cujo nome contém este texto.
+    :param verbose: Exibe cada medição.
+    :return: Lista de dicionários {group, name, layout, rows, status, seconds, rows_per_second, error}.
+    """
+    sizes = sorted(sizes or BENCHMARK_SIZES)
+    layouts = layouts or LAYOUTS
+
+    targets = discoverTargets()
+    if name_filter:
+        targets = [target for target in targets if name_filter.lower() in target["name"].lower()]
+
+    results = []
+    # Alvos que não devem rodar nos próximos tamanhos: (grupo, nome, formato) -> motivo
+    stopped = {}
+
+    if verbose:
+        print(f"{'Grupo':<18} {'Função':<62} {'Formato':<12} {'Candles':>9} {'Tempo (s)':>11}  Status")
+
+    for size in sizes:
+        for layout in layouts:
+            candles = generateSyntheticCandles(size, layout=layout)
+
+            for target in targets:
+                key = (target["group"], target["name"], layout)
+                result = {
+                    "group": target["group"],
+                    "name": target["name"],
+                    "layout": layout,
+                    "rows": size,
+                    "status": "ok",
+                    "seconds": None,
+                    "rows_per_second": None,
+                    "error": None,
+                }
+
+                if target["error"] is not None:
+                    result.update(status="error", error=target["error"])
+                elif key in stopped:
+                    result.update(status="skipped", error=stopped[key])
+                else:
+                    try:
+                        seconds = timeCall(target, candles, layout, repeat)
+                        result.update(seconds=seconds, rows_per_second=size / seconds if seconds > 0 else None)
+
+                        next_sizes = [next_size for next_size in sizes if next_size > size]
+                        if next_sizes and seconds * next_sizes[0] / size > max_seconds:
+                            stopped[key] = f"Projeção acima de {max_seconds:.0f}s a partir de {size} candles"
+                    except Exception as e:
+                        result.update(status="error", error=f"{type(e).__name__}: {e}")
+                        stopped[key] = f"Erro com {size} candles"
+
+                results.append(result)
+                if verbose:
+                    seconds_text = f"{result['seconds']:.5f}" if result["seconds"] is not None else "-"
+                    status_text = result["status"] if result["error"] is None else f"{result['status']} ({result['error'][:60]})"
+                    print(f"{result['group']:<18} {result['name']:<62} {layout:<12} {size:>9} {seconds_text:>11}  {status_text}")
+
+    return results
+
+
+def _gitCommit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=SRC_DIR, stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+
+def saveResults(results, output_path=None):
+    """
+    Grava os resultados em JSON junto com o ambiente da medição (versões, máquina e commit).
+
+    :param output_path: Arquivo de saída. None = benchmarks/results/benchmark_<data>.json.
+    :return: Caminho do arquivo gravado.
+    """
+    if output_path is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output_path = os.path.join(RESULTS_DIR, f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+
+    report = {
+        "created_at": datetime.now().astimezone().isoformat(),
+        "commit": _gitCommit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "results": results,
+    }
+    with open(output_path, "w", encoding="utf-8") as output_file:
+        json.dump(report, output_file, indent=1)
+    return output_path
+
+
+def compareResults(results, baseline_path, threshold=0.2):
+    """
+    Compara com um JSON anterior e lista as medições que ficaram mais lentas que o limite.
+
+    :param threshold: Aumento relativo de tempo considerado regressão (0.2 = 20% mais lento).
+    :return: Lista de dicionários {group, name, layout, rows, baseline_seconds, seconds, ratio}.
+    """
+    with open(baseline_path, "r", encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)["results"]
+
+    baseline_seconds = {
+        (row["group"], row["name"], row["layout"], row["rows"]): row["seconds"] for row in baseline if row["seconds"] is not None
+    }
+    regressions = []
+    for row in results:
+        key = (row["group"], row["name"], row["layout"], row["rows"])
+        if row["seconds"] is None or key not in baseline_seconds or baseline_seconds[key] <= 0:
+            continue
+        ratio = row["seconds"] / baseline_seconds[key]
+        if ratio > 1 + threshold:
+            regressions.append(
+                {
+                    **dict(zip(("group", "name", "layout", "rows"), key)),
+                    "baseline_seconds": baseline_seconds[key],
+                    "seconds": row["seconds"],
+                    "ratio": ratio,
+                }
+            )
+    return sorted(regressions, key=lambda regression: regression["ratio"], reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de indicadores e estratégias sobre candles sintéticos.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=BENCHMARK_SIZES, help="Tamanhos (candles) medidos.")
+    parser.add_argument("--layouts", nargs="+", choices=LAYOUTS, default=LAYOUTS, help="Formatos de colunas.")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="Execuções por medição (vale a melhor).")
+    parser.add_argument("--max-seconds", type=float, default=MAX_SECONDS, help="Tempo máximo projetado por execução.")
+    parser.add_argument("--filter", dest="name_filter", default=None, help="Mede apenas funções cujo nome contém o texto.")
+    parser.add_argument("--output", default=None, help="Arquivo JSON de saída.")
+    parser.add_argument("--baseline", default=None, help="JSON anterior para comparar e listar regressões.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Aumento relativo de tempo considerado regressão.")
+    args = parser.parse_args()
+
+    results = runBenchmarkSuite(args.sizes, args.layouts, args.repeat, args.max_seconds, args.name_filter)
+    output_path = saveResults(results, args.output)
+    print(f"\n💾 Resultados gravados em: {output_path}")
+
+    if args.baseline:
+        regressions = compareResults(results, args.baseline, args.threshold)
+        if not regressions:
+            print(f"✅ Nenhuma regressão acima de {args.threshold * 100:.0f}% em relação a {args.baseline}")
+        for regression in regressions:
+            print(
+                f"⚠️ {regression['group']} {regression['name']} [{regression['layout']}, {regression['rows']} candles]: "
+                f"{regression['baseline_seconds']:.5f}s -> {regression['seconds']:.5f}s ({regression['ratio']:.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
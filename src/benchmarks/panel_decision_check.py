@@ -0,0 +1,98 @@
+import contextlib
+import io
+import os
+import sys
+import time
+
+# Configuração de caminhos para importações
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, SRC_DIR)
+
+from benchmarks.synthetic_candles import generateSyntheticCandles
+from indicators.ohlcv_view import ohlcvView
+from strategies.moving_average import getMovingAverageTradeStrategy
+from strategies.moving_average_antecipation import getMovingAverageAntecipationTradeStrategy
+from strategies.signal_series import getPanelDecisions
+from strategies.t3_strategy import getT3MATradeStrategy
+from strategies.vortex_strategy import getVortexTradeStrategy
+
+"""
+Conferência do modo painel do bot ao vivo (modules/PanelRunner.py).
+
+Para cada quantidade de símbolos, gera candles sintéticos com a mesma linha do tempo (como os bots de um mesmo
+CANDLE_PERIOD) e um símbolo com histórico menor, e compara as decisões de getPanelDecisions com a estratégia ao vivo
+chamada símbolo a símbolo. Também mede o tempo de um ciclo nos dois modos.
+
+Uso (a partir de src/):
+    python benchmarks/panel_decision_check.py
+"""
+
+# ------------------------------------------------------------------------
+# 🔎 AJUSTES DA CONFERÊNCIA 🔎
+
+SYMBOL_COUNTS = [4, 40, 400]  # Quantidades de símbolos avaliados juntos
+LIVE_WINDOW = 1_000  # Candles de cada símbolo (limite do get_klines)
+
+STRATEGIES = [
+    (getT3MATradeStrategy, {"fast_period": 7, "slow_period": 40, "volume_factor": 0.7}),
+    (getMovingAverageTradeStrategy, {}),
+    (getMovingAverageAntecipationTradeStrategy, {"volatility_factor": 0.5, "fast_window": 9, "slow_window": 21}),
+    (getVortexTradeStrategy, {}),
+]
+
+# ------------------------------------------------------------------------
+
+
+def checkPanelDecisions(symbol_counts=None, n_rows=LIVE_WINDOW, verbose=True):
+    """
+    Compara as decisões em painel com as decisões símbolo a símbolo.
+
+    :param symbol_counts: Quantidades de símbolos. None = SYMBOL_COUNTS.
+    :param n_rows: Candles de cada símbolo.
+    :param verbose: Exibe a tabela de resultados.
+    :return: Lista de dicionários {strategy, symbols, ok, per_symbol_s, panel_s}.
+    """
+    results = []
+    for n_symbols in symbol_counts or SYMBOL_COUNTS:
+        stock_data_by_symbol = {f"S{i}": ohlcvView(generateSyntheticCandles(n_rows, seed=i)) for i in range(n_symbols)}
+        stock_data_by_symbol["NOVO"] = ohlcvView(generateSyntheticCandles(n_rows // 2, seed=n_symbols))  # Histórico menor
+
+        for strategy, strategy_args in STRATEGIES:
+            kwargs = dict(strategy_args, verbose=False)
+
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                expected = {
+                    symbol: strategy(ohlcvView(stock_data, read_only=True), **kwargs)
+                    for symbol, stock_data in stock_data_by_symbol.items()
+                }
+            per_symbol_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            decisions = getPanelDecisions(strategy, stock_data_by_symbol, **kwargs)
+            panel_s = time.perf_counter() - start
+
+            results.append(
+                {
+                    "strategy": strategy.__name__,
+                    "symbols": len(stock_data_by_symbol),
+                    "ok": decisions == expected,
+                    "per_symbol_s": per_symbol_s,
+                    "panel_s": panel_s,
+                }
+            )
+
+    if verbose:
+        print(f"{'Estratégia':<44} {'Símbolos':>8} {'Símbolo a símbolo (s)':>22} {'Painel (s)':>11}  OK")
+        for result in results:
+            print(
+                f"{result['strategy']:<44} {result['symbols']:>8} {result['per_symbol_s']:>22.3f} "
+                f"{result['panel_s']:>11.3f}  {'sim' if result['ok'] else 'NÃO'}"
+            )
+
+    return results
+
+
+if __name__ == "__main__":
+    check = checkPanelDecisions()
+    sys.exit(0 if all(result["ok"] for result in check) else 1)
@@ -0,0 +1,182 @@
+import contextlib
+import io
+import os
+import sys
+
+# Configuração de caminhos para importações
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, SRC_DIR)
+
+import pandas as pd
+
+from benchmarks.benchmark_suite import LAYOUTS, _callArguments, discoverTargets
+from benchmarks.synthetic_candles import generateSyntheticCandles
+from indicators.ohlcv_view import ohlcvView
+from modules.StrategyRunner import StrategyRunner
+from strategies.signal_series import getSignalBatch, getSignalBatchFunction, getSignalSeries, getSignalSeriesFunction
+
+"""
+Conferência do contrato das estratégias: candles somente leitura, sem cópia e sem alteração da entrada.
+
+Cada estratégia de strategies/ e strategies/extras/ (e as versões em série e em lote, quando existirem) é chamada com
+os candles de ohlcvView(read_only=True), como no StrategyRunner e nos backtests. A chamada precisa:
+- dar o mesmo resultado (ou o mesmo erro) da chamada sobre uma cópia gravável dos candles;
+- não escrever nos arrays (escritas no lugar levantam ValueError nos candles somente leitura);
+- não criar nem remover colunas no DataFrame recebido;
+- não levantar erro nos candles no formato de getStockData (layout "close_price"), que é o que o bot e o CandleStore
+  entregam: um erro nesse formato é reprovado mesmo que a cópia gravável levante o mesmo erro.
+A versão em série também precisa dar, em cada candle i, a decisão da estratégia ao vivo sobre stock_data.iloc[: i + 1]
+(reexecução por prefixo em REPLAY_ROWS candles); um prefixo em que a estratégia ao vivo levanta erro (ex: IndexError
+por falta de candles) equivale a None, que é o que os backtests fazem com um candle sem decisão.
+Também confere que o StrategyRunner não altera os dicionários de argumentos das estratégias.
+
+Uso (a partir de src/):
+    python benchmarks/strategy_contract_check.py
+"""
+
+# ------------------------------------------------------------------------
+# 🔎 AJUSTES DA CONFERÊNCIA 🔎
+
+CHECK_ROWS = 1_000  # Candles da conferência (janela do bot ao vivo)
+REPLAY_ROWS = 250  # Candles da comparação entre a versão em série e a reexecução por prefixo (custo quadrático)
+
+# ------------------------------------------------------------------------
+
+
+def _outcome(function, *args, **kwargs):
+    """(resultado, None) ou (None, erro levantado); logs descartados."""
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return function(*args, **kwargs), None
+    except Exception as e:
+        return None, e
+
+
+def _sameResult(a, b):
+    if isinstance(a, (pd.Series, pd.DataFrame)) or isinstance(b, (pd.Series, pd.DataFrame)):
+        return type(a) is type(b) and a.equals(b)
+    if a is None or b is None:
+        return a is b
+    return a == b
+
+
+def _checkCall(name, function, candles, call, must_succeed=False):
+    """
+    Compara call(candles somente leitura) com call(cópia gravável) e confere que a entrada ficou intacta.
+
+    :param must_succeed: True = qualquer erro reprova (candles no formato de getStockData).
+
+    :return: Dicionário {strategy, ok, error}.
+    """
+    snapshot = candles.copy()
+    expected, expected_error = _outcome(call, function, ohlcvView(candles.copy()))
+
+    frozen = ohlcvView(candles, read_only=True)
+    columns = list(frozen.columns)
+    result, error = _outcome(call, function, frozen)
+
+    problems = []
+    if error is not None and must_succeed:
+        problems.append(f"erro nos candles de getStockData: {type(error).__name__}: {error}")
+    elif error is not None and (expected_error is None or type(error) is not type(expected_error)):
+        problems.append(f"{type(error).__name__}: {error}")
+    elif error is None and not _sameResult(result, expected):
+        problems.append("resultado diferente da cópia gravável")
+    if list(frozen.columns) != columns:
+        problems.append("alterou as colunas do DataFrame recebido")
+    if not candles.equals(snapshot):
+        problems.append("alterou os candles originais")
+    return {"strategy": name, "ok": not problems, "error": "; ".join(problems) or None}
+
+
+def _checkSeriesReplay(name, function, candles, kwargs):
+    """
+    Compara a versão em série com a estratégia ao vivo chamada em cada prefixo dos candles (somente leitura).
+
+    :return: Dicionário {strategy, ok, error}.
+    """
+    series_kwargs = {key: value for key, value in kwargs.items() if key != "verbose"}
+    decisions, error = _outcome(getSignalSeries, function, candles, **series_kwargs)
+    if error is not None:
+        return {"strategy": name, "ok": False, "error": f"{type(error).__name__}: {error}"}
+
+    frozen = ohlcvView(candles, read_only=True)
+    mismatches = []
+    for i in range(len(frozen)):
+        expected, _ = _outcome(function, frozen.iloc[: i + 1], **kwargs)  # Erro no prefixo = None
+        if not _sameResult(decisions.iloc[i], expected):
+            mismatches.append(i)
+
+    error = None
+    if mismatches:
+        error = f"série difere da reexecução por prefixo em {len(mismatches)} candles (primeiro: {mismatches[0]})"
+    return {"strategy": name, "ok": not mismatches, "error": error}
+
+
+def _checkStrategyRunner():
+    """O StrategyRunner não escreve stock_data/verbose nos dicionários de argumentos."""
+
+    class _Runner:
+        fallback_activated = True
+
+    main_args, fallback_args = {"period": 14}, {"period": 7}
+    received = []
+
+    def strategy(stock_data, verbose, period):
+        received.append(stock_data)
+        return None
+
+    candles = generateSyntheticCandles(50)
+    with contextlib.redirect_stdout(io.StringIO()):
+        StrategyRunner.execute(_Runner(), strategy, strategy, candles, main_args, fallback_args, verbose=False)
+
+    ok = main_args == {"period": 14} and fallback_args == {"period": 7} and received[0] is not received[1]
+    return {"strategy": "StrategyRunner.execute", "ok": ok, "error": None if ok else "alterou os argumentos"}
+
+
+def checkStrategyContract(n_rows=CHECK_ROWS, layouts=None, replay_rows=REPLAY_ROWS, verbose=True):
+    """
+    Confere o contrato de todas as estratégias.
+
+    :param n_rows: Quantidade de candles sintéticos.
+    :param replay_rows: Candles da comparação da versão em série com a reexecução por prefixo.
+    :param layouts: Formatos de colunas ("close_price", "close"). None = LAYOUTS de benchmark_suite.py.
+    :param verbose: Exibe as estratégias reprovadas e o total.
+    :return: Lista de dicionários {strategy, ok, error}.
+    """
+    results = [_checkStrategyRunner()]
+    targets = [target for target in discoverTargets() if target["group"].startswith("strategies")]
+
+    for layout in layouts or LAYOUTS:
+        candles = generateSyntheticCandles(n_rows, layout=layout)
+        for target in targets:
+            name = f"{target['name']} [{layout}]"
+            if target["function"] is None:
+                results.append({"strategy": name, "ok": False, "error": target["error"]})
+                continue
+
+            _, kwargs = _callArguments(target, candles, layout)
+            must_succeed = layout == "close_price"  # Formato de getStockData e do CandleStore
+            results.append(_checkCall(name, target["function"], candles, lambda f, data: f(data, **kwargs), must_succeed))
+            series_kwargs = {key: value for key, value in kwargs.items() if key != "verbose"}
+            if getSignalSeriesFunction(target["function"]) is not None:
+                series_call = lambda f, data: getSignalSeries(f, data, **series_kwargs)
+                results.append(_checkCall(f"{name} série", target["function"], candles, series_call, must_succeed))
+                replay_candles = candles.iloc[:replay_rows]
+                results.append(_checkSeriesReplay(f"{name} série x prefixos", target["function"], replay_candles, kwargs))
+            if getSignalBatchFunction(target["function"]) is not None:
+                batch_call = lambda f, data: getSignalBatch(f, data, [series_kwargs])
+                results.append(_checkCall(f"{name} lote", target["function"], candles, batch_call, must_succeed))
+
+    if verbose:
+        for result in results:
+            if not result["ok"]:
+                print(f"❌ {result['strategy']}: {result['error']}")
+        print(f"{sum(result['ok'] for result in results)}/{len(results)} chamadas respeitam o contrato.")
+
+    return results
+
+
+if __name__ == "__main__":
+    check = checkStrategyContract()
+    sys.exit(0 if all(result["ok"] for result in check) else 1)
@@ -0,0 +1,196 @@
+import os
+import sys
+import time
+
+# Configuração de caminhos para importações
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, SRC_DIR)
+
+import numpy as np
+
+from benchmarks.synthetic_candles import generateSyntheticCandles, SHORT_COLUMN_NAMES
+from indicators.atr import atr
+from indicators.extras.Indicators import Indicators
+from indicators.macd import macd
+from indicators.rsi import rsi
+from indicators.session_vwap import sessionVWAP
+from indicators.streaming import (
+    StreamingATR,
+    StreamingAroon,
+    StreamingEhlerFisher,
+    StreamingFisherTransform,
+    StreamingMACD,
+    StreamingRSI,
+    StreamingRollingExtreme,
+    StreamingRollingStd,
+    StreamingSessionVWAP,
+    StreamingSMA,
+    StreamingT3,
+    StreamingVortex,
+)
+from indicators.t3 import t3MovingAverage
+from indicators.vortex import vortex
+
+"""
+Conferência dos indicadores incrementais (indicators/streaming.py) contra as versões em lote.
+
+Simula o loop ao vivo: cada candle chega primeiro "aberto" (preços perturbados) via update e depois é
+corrigido com os preços finais via revise. O resultado precisa bater com o cálculo em lote sobre o histórico final.
+Também mede o custo por candle do streaming contra recalcular o indicador nos 1000 candles baixados a cada ciclo.
+"""
+
+# ------------------------------------------------------------------------
+# 🔎 AJUSTES DA CONFERÊNCIA 🔎
+
+CHECK_ROWS = 5_000  # Candles da conferência
+LIVE_WINDOW = 1_000  # Candles recalculados pelo bot a cada ciclo (limite do get_klines)
+TOLERANCE = 1e-9  # Erro relativo máximo aceito
+
+# ------------------------------------------------------------------------
+
+
+def _indicatorCases(stock_data):
+    """(nome, fábrica do indicador streaming, colunas de entrada, cálculo em lote, índice do valor na tupla)"""
+    short = stock_data.rename(columns=SHORT_COLUMN_NAMES)
+    close = stock_data["close_price"]
+    candle_columns = ["high_price", "low_price", "close_price"]
+    high = stock_data["high_price"]
+    vwap_columns = candle_columns + ["volume"]
+    return [
+        ("RSI 14", lambda: StreamingRSI(14), ["close_price"], lambda: rsi(close, 14, False), None),
+        ("MACD 12/26/9 (linha)", lambda: StreamingMACD(12, 26, 9), ["close_price"], lambda: macd(close, 12, 26, 9)[0], 0),
+        ("MACD 12/26/9 (sinal)", lambda: StreamingMACD(12, 26, 9), ["close_price"], lambda: macd(close, 12, 26, 9)[1], 1),
+        ("T3 7", lambda: StreamingT3(7, 0.7), ["close_price"], lambda: t3MovingAverage(short, 7, 0.7), None),
+        ("T3 40", lambda: StreamingT3(40, 0.7), ["close_price"], lambda: t3MovingAverage(short, 40, 0.7), None),
+        ("Vortex 14 (VI+)", lambda: StreamingVortex(14), candle_columns, lambda: vortex(stock_data, 14, True), 0),
+        ("Vortex 14 (VI-)", lambda: StreamingVortex(14), candle_columns, lambda: vortex(stock_data, 14, False), 1),
+        ("ATR 14", lambda: StreamingATR(14), candle_columns, lambda: atr(short, 14), None),
+        ("SMA 40", lambda: StreamingSMA(40), ["close_price"], lambda: close.rolling(40).mean(), None),
+        ("STD 20", lambda: StreamingRollingStd(20), ["close_price"], lambda: close.rolling(20).std(), None),
+        ("Máxima 20", lambda: StreamingRollingExtreme(20), ["high_price"], lambda: high.rolling(20).max(), 0),
+        (
+            "Candles desde máx. 20",
+            lambda: StreamingRollingExtreme(20),
+            ["high_price"],
+            lambda: high.rolling(20).apply(lambda window: 19 - window.argmax(), raw=True),
+            1,
+        ),
+        (
+            "Aroon 14 (oscilador)",
+            lambda: StreamingAroon(14),
+            ["high_price", "low_price"],
+            lambda: Indicators.getAroon(short)[2],
+            2,
+        ),
+        (
+            "Ehler Fisher 10",
+            lambda: StreamingEhlerFisher(10),
+            ["high_price", "low_price"],
+            lambda: Indicators.getEhlerFisherTransform(short, 10),
+            None,
+        ),
+        (
+            "Fisher Transform 10",
+            lambda: StreamingFisherTransform(10),
+            ["high_price", "low_price"],
+            lambda: Indicators.getFisherTransform(short, 10),
+            None,
+        ),
+        (
+            "VWAP",
+            lambda: StreamingSessionVWAP(14),
+            vwap_columns,
+            lambda: Indicators.getVolumeWeightedAveragePrice(short, 14)[0],
+            0,
+        ),
+        (
+            "VWAP desvio 14",
+            lambda: StreamingSessionVWAP(14),
+            vwap_columns,
+            lambda: sessionVWAP(high, short["low"], close, short["volume"], std_period=14)["std_dev"],
+            1,
+        ),
+        (
+            "VWAP desvio ponderado",
+            lambda: StreamingSessionVWAP(14),
+            vwap_columns,
+            lambda: sessionVWAP(high, short["low"], close, short["volume"])["weighted_std"],
+            2,
+        ),
+    ]
+
+
+def checkStreamingIndicators(stock_data=None, n_rows=CHECK_ROWS, tolerance=TOLERANCE, seed=7, verbose=True):
+    """
+    Compara os indicadores streaming com as versões em lote.
+
+    :param stock_data: Candles no formato de getStockData. None = candles sintéticos de n_rows.
+    :param n_rows: Quantidade de candles sintéticos.
+    :param tolerance: Erro relativo máximo aceito.
+    :param seed: Semente das perturbações dos candles abertos.
+    :param verbose: Exibe a tabela de resultados.
+    :return: Lista de dicionários {indicator, max_error, nan_mismatch, ok, streaming_us, batch_us}.
+    """
+    if stock_data is None:
+        stock_data = generateSyntheticCandles(n_rows)
+    stock_data = stock_data.reset_index(drop=True)
+    rng = np.random.default_rng(seed)
+
+    results = []
+    for name, factory, columns, batch, position in _indicatorCases(stock_data):
+        rows = list(zip(*(stock_data[column].to_numpy(dtype=float).tolist() for column in columns)))
+        noise = (1 + rng.normal(0.0, 0.002, size=(len(rows), len(columns)))).tolist()
+
+        # Loop ao vivo: candle aberto (update) e depois fechado (revise)
+        indicator = factory()
+        streamed = []
+        for row, factors in zip(rows, noise):
+            indicator.update(*(value * factor for value, factor in zip(row, factors)))
+            value = indicator.revise(*row)
+            streamed.append(value if position is None else value[position])
+        streamed = np.array(streamed, dtype=float)
+        expected = np.asarray(batch(), dtype=float)
+
+        nan_mismatch = int((np.isnan(streamed) != np.isnan(expected)).sum())
+        valid = ~np.isnan(streamed) & ~np.isnan(expected)
+        scale = np.maximum(np.abs(expected[valid]), 1.0)
+        max_error = float(np.max(np.abs(streamed[valid] - expected[valid]) / scale)) if valid.any() else 0.0
+
+        # Custo por candle: update do streaming x recálculo em lote sobre a janela do bot
+        indicator = factory()
+        start = time.perf_counter()
+        for row in rows:
+            indicator.update(*row)
+        streaming_us = (time.perf_counter() - start) / len(rows) * 1e6
+
+        window_case = _indicatorCases(stock_data.iloc[-LIVE_WINDOW:].reset_index(drop=True))
+        window_batch = next(case[3] for case in window_case if case[0] == name)
+        start = time.perf_counter()
+        window_batch()
+        batch_us = (time.perf_counter() - start) * 1e6
+
+        results.append(
+            {
+                "indicator": name,
+                "max_error": max_error,
+                "nan_mismatch": nan_mismatch,
+                "ok": nan_mismatch == 0 and max_error <= tolerance,
+                "streaming_us": streaming_us,
+                "batch_us": batch_us,
+            }
+        )
+
+    if verbose:
+        print(f"{'Indicador':<22} {'Erro máx.':>10} {'NaN dif.':>9} {'Streaming (µs)':>15} {f'Lote {LIVE_WINDOW} (µs)':>16}  OK")
+        for result in results:
+            print(
+                f"{result['indicator']:<22} {result['max_error']:>10.1e} {result['nan_mismatch']:>9} "
+                f"{result['streaming_us']:>15.1f} {result['batch_us']:>16.1f}  {'sim' if result['ok'] else 'NÃO'}"
+            )
+
+    return results
+
+
+if __name__ == "__main__":
+    check = checkStreamingIndicators()
+    sys.exit(0 if all(result["ok"] for result in check) else 1)
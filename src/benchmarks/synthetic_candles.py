@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+
+# Nomes das colunas no formato curto (close/open/high/low) usado por parte dos indicadores em indicators/extras
+SHORT_COLUMN_NAMES = {"close_price": "close", "open_price": "open", "high_price": "high", "low_price": "low"}
+
+
+def generateSyntheticCandles(n_rows, seed=42, start_price=30000.0, interval_minutes=15, volatility=0.004, layout="close_price"):
+    """
+    Gera candles OHLCV sintéticos e reprodutíveis (passeio aleatório geométrico) no mesmo formato de
+    BinanceTraderBot.getStockData, para benchmarks e backtests sem acesso à rede.
+
+    :param n_rows: Quantidade de candles.
+    :param seed: Semente do gerador aleatório (mesma semente = mesmos candles).
+    :param start_price: Preço inicial.
+    :param interval_minutes: Duração de cada candle em minutos.
+    :param volatility: Desvio padrão do retorno logarítmico por candle.
+    :param layout: "close_price" (colunas de getStockData) ou "close" (close, open_time, open, high, low, volume).
+    :return: DataFrame com as colunas close_price, open_time, open_price, high_price, low_price e volume.
+    """
+    if layout not in ("close_price", "close"):
+        raise ValueError(f"Layout inválido: {layout}. Use 'close_price' ou 'close'.")
+
+    rng = np.random.default_rng(seed)
+
+    log_returns = rng.normal(0.0, volatility, n_rows)
+    close = start_price * np.exp(np.cumsum(log_returns))
+    open_ = np.empty(n_rows)
+    open_[0] = start_price
+    open_[1:] = close[:-1]
+
+    # Pavios proporcionais à volatilidade, sempre envolvendo abertura e fechamento
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0.0, volatility / 2, n_rows)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0.0, volatility / 2, n_rows)))
+    volume = rng.lognormal(mean=3.0, sigma=0.5, size=n_rows)
+
+    start_ms = 1_600_000_000_000
+    open_time_ms = start_ms + np.arange(n_rows, dtype=np.int64) * interval_minutes * 60_000
+    open_time = pd.to_datetime(open_time_ms, unit="ms").tz_localize("UTC").tz_convert("America/Sao_Paulo")
+
+    candles = pd.DataFrame(
+        {
+            "close_price": close,
+            "open_time": open_time,
+            "open_price": open_,
+            "high_price": high,
+            "low_price": low,
+            "volume": volume,
+        }
+    )
+    return candles.rename(columns=SHORT_COLUMN_NAMES) if layout == "close" else candles
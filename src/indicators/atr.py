@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from .indicator_graph import atrNode, column, evaluateNodes
+
 """
 O que é ATR (Average True Range)?
 
@@ -25,19 +27,6 @@ def atr(data: pd.DataFrame, window=14):
     :return: Série Pandas com o ATR calculado
     """
 
-    high = data["high"]
-    low = data["low"]
-    close = data["close"]
-
-    # Cálculo do True Range (TR)
-    tr1 = high - low
-    tr2 = np.abs(high - close.shift(1))
-    tr3 = np.abs(low - close.shift(1))
-
-    # True Range é o maior valor entre os três cálculos acima
-    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-
-    # ATR é a média móvel do True Range
-    atr_values = true_range.rolling(window=window).mean()
-
-    return atr_values
+    # True Range = maior entre máxima - mínima e as distâncias ao fechamento anterior (termos de trueRangeParts)
+    atr_node = atrNode(column("high"), column("low"), column("close"), window)
+    return evaluateNodes(data, {"atr": atr_node})["atr"]
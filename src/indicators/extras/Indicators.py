@@ -14,6 +14,14 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.kernels import adaptiveAverageKernel, ehlerRangeKernel, psarKernel, smmaKernel, supertrendKernel
+from indicators.pivot_levels import PIVOT_COLUMNS, pivotLevels, sessionKeys
+from indicators.price_action import fractalPoints, onBalanceVolume
+from indicators.rolling_extrema import highLowChannels, rollingExtrema
+from indicators.rolling_regression import rollingRegression
+from indicators.session_vwap import sessionIds, sessionVWAP
+from indicators.weighted_windows import almaWeights, hullWeights, triangularWeights, weightedMovingAverage, wmaWeights
+
 class Indicators:
     """
     Classe que fornece acesso centralizado a todos os indicadores técnicos.
@@ -191,8 +199,7 @@ class Indicators:
                 raise ValueError(f"Coluna '{col}' não encontrada nos dados")
         
         # Calcular os mínimos e máximos para o período
-        low_min = data['low'].rolling(window=k_period).min()
-        high_max = data['high'].rolling(window=k_period).max()
+        high_max, low_min = highLowChannels(data['high'], data['low'], [k_period])[k_period]
         
         # Calcular RSV (Raw Stochastic Value)
         # Evitar divisão por zero
@@ -227,8 +234,7 @@ class Indicators:
                 raise ValueError(f"Coluna '{col}' não encontrada nos dados")
         
         # Calcular os máximos e mínimos para o período
-        high_max = data['high'].rolling(window=period).max()
-        low_min = data['low'].rolling(window=period).min()
+        high_max, low_min = highLowChannels(data['high'], data['low'], [period])[period]
         
         # Calcular Williams %R
         # Evitar divisão por zero
@@ -260,19 +266,23 @@ class Indicators:
             if col not in data.columns:
                 raise ValueError(f"Coluna '{col}' não encontrada nos dados")
         
+        # Máximos/mínimos dos três períodos de uma vez
+        channels = highLowChannels(data['high'], data['low'], [tenkan_period, kijun_period, senkou_span_b_period])
+        
         # Função para calcular a média dos máximos/mínimos de um período
-        def donchian(high, low, period):
-            return (high.rolling(window=period).max() + low.rolling(window=period).min()) / 2
+        def donchian(period):
+            highest, lowest = channels[period]
+            return (highest + lowest) / 2
         
         # Calcular os componentes do Ichimoku
-        tenkan_sen = donchian(data['high'], data['low'], tenkan_period)
-        kijun_sen = donchian(data['high'], data['low'], kijun_period)
+        tenkan_sen = donchian(tenkan_period)
+        kijun_sen = donchian(kijun_period)
         
         # Senkou Span A (Primeira linha da nuvem)
         senkou_span_a = ((tenkan_sen + kijun_sen) / 2).shift(displacement)
         
         # Senkou Span B (Segunda linha da nuvem)
-        senkou_span_b = donchian(data['high'], data['low'], senkou_span_b_period).shift(displacement)
+        senkou_span_b = donchian(senkou_span_b_period).shift(displacement)
         
         # Chikou Span (Linha de Atraso)
         chikou_span = data['close'].shift(-displacement)
@@ -308,26 +318,8 @@ class Indicators:
         upperband = hl2 + (multiplier * atr)
         lowerband = hl2 - (multiplier * atr)
         
-        # Preparar arrays para os resultados
-        supertrend = np.zeros_like(data['close'])
-        direction = np.zeros_like(data['close'])  # 1 para tendência de alta, -1 para tendência de baixa
-        
-        # Calculando o Supertrend
-        for i in range(1, len(data)):
-            if data['close'].iloc[i] > upperband.iloc[i-1]:
-                supertrend[i] = lowerband.iloc[i]
-                direction[i] = 1
-            elif data['close'].iloc[i] < lowerband.iloc[i-1]:
-                supertrend[i] = upperband.iloc[i]
-                direction[i] = -1
-            else:
-                supertrend[i] = supertrend[i-1]
-                direction[i] = direction[i-1]
-                
-                if direction[i] == 1 and lowerband.iloc[i] < supertrend[i]:
-                    supertrend[i] = lowerband.iloc[i]
-                elif direction[i] == -1 and upperband.iloc[i] > supertrend[i]:
-                    supertrend[i] = upperband.iloc[i]
+        # Calculando o Supertrend (kernel compartilhado, ver indicators/kernels.py)
+        supertrend, direction = supertrendKernel(data['close'], upperband, lowerband)
         
         return pd.Series(supertrend, index=data.index), pd.Series(direction, index=data.index)
     @staticmethod
@@ -475,23 +467,8 @@ class Indicators:
         # O CMO normalizado para o range 0-1
         k = abs(cmo) / 100
         
-        # Inicializar VIDYA com o primeiro valor válido de preço
-        vidya = np.zeros(len(data))
-        vidya[:] = np.nan
-        
-        # Encontrar o primeiro índice válido (onde CMO não é NaN)
-        first_valid = cmo.first_valid_index()
-        if first_valid is not None:
-            idx = data.index.get_loc(first_valid)
-            # Inicializar VIDYA com o primeiro valor de preço
-            vidya[idx] = data[price_col].iloc[idx]
-            
-            # Calcular VIDYA para os valores restantes
-            for i in range(idx + 1, len(data)):
-                # Fator de suavização ajustado pela volatilidade (k)
-                alpha = sc * k.iloc[i]
-                # VIDYA(i) = VIDYA(i-1) + α * (Price(i) - VIDYA(i-1))
-                vidya[i] = vidya[i-1] + alpha * (data[price_col].iloc[i] - vidya[i-1])
+        # VIDYA(i) = VIDYA(i-1) + α * (Price(i) - VIDYA(i-1)), com α = sc * k e semente no primeiro CMO válido
+        vidya = adaptiveAverageKernel(data[price_col], sc * k)
         
         return pd.Series(vidya, index=data.index)
     @staticmethod
@@ -522,56 +499,20 @@ class Indicators:
                 date_column = col
                 break
         
-        # Calcular o preço típico (high + low + close) / 3
-        data['typical_price'] = (data['high'] + data['low'] + data['close']) / 3
-        
-        # Calcular o valor negociado (preço típico * volume)
-        data['tp_volume'] = data['typical_price'] * data['volume']
-        
+        # Número da sessão (dia) de cada candle, a partir dos segundos desde a época
+        sessions = None
         if reset_daily and date_column:
-            # Extrair apenas a data (sem hora) para agrupar por dia
-            if pd.api.types.is_datetime64_any_dtype(data[date_column]):
-                data['day'] = data[date_column].dt.date
-            else:
-                # Tentar converter para datetime
-                try:
-                    data['day'] = pd.to_datetime(data[date_column]).dt.date
-                except:
-                    # Se não conseguir converter, usar o dia do index (se for datetime)
-                    if pd.api.types.is_datetime64_any_dtype(data.index):
-                        data['day'] = data.index.date
-                    else:
-                        # Se tudo falhar, não resetar diariamente
-                        reset_daily = False
-        
-        # Calcular o VWAP
-        if reset_daily and 'day' in data.columns:
-            # Resetar os cálculos por dia
-            data['cum_tp_volume'] = data.groupby('day')['tp_volume'].cumsum()
-            data['cum_volume'] = data.groupby('day')['volume'].cumsum()
-        else:
-            # Acumular continuamente
-            data['cum_tp_volume'] = data['tp_volume'].cumsum()
-            data['cum_volume'] = data['volume'].cumsum()
-        
-        # Evitar divisão por zero
-        data['vwap'] = np.where(
-            data['cum_volume'] > 0,
-            data['cum_tp_volume'] / data['cum_volume'],
-            data['typical_price']
-        )
-        
-        # Calcular desvio do preço em relação ao VWAP
-        data['price_dev'] = data['typical_price'] - data['vwap']
-        
-        # Calcular desvio padrão do preço em relação ao VWAP
-        if reset_daily and 'day' in data.columns:
-            data['std_dev'] = data.groupby('day')['price_dev'].rolling(window=period).std().reset_index(level=0, drop=True)
-        else:
-            data['std_dev'] = data['price_dev'].rolling(window=period).std()
-        
-        # Preencher valores NaN
-        data['std_dev'] = data['std_dev'].fillna(0)
+            try:
+                sessions = sessionIds(data[date_column])
+            except:
+                # Se não conseguir converter, usar o dia do index (se for datetime)
+                if pd.api.types.is_datetime64_any_dtype(data.index):
+                    sessions = sessionIds(data.index)
+        
+        # Calcular o VWAP (acumulado por dia ou contínuo) e o desvio padrão do preço em relação a ele
+        vwap_data = sessionVWAP(data['high'], data['low'], data['close'], data['volume'], sessions, period)
+        data['vwap'] = vwap_data['vwap']
+        data['std_dev'] = vwap_data['std_dev'].fillna(0)
         
         # Calcular bandas de desvio padrão
         data['upper_band'] = data['vwap'] + (data['std_dev'] * 2)
@@ -605,24 +546,10 @@ class Indicators:
         data = data.copy()
         data['median_price'] = (data['high'] + data['low']) / 2
         
-        # Função para calcular SMMA (Smoothed Moving Average)
-        def calculate_smma(price_series, period):
-            smma = np.zeros_like(price_series)
-            smma[:period] = np.nan
-            
-            # Inicializar com a média dos primeiros 'period' elementos
-            smma[period - 1] = np.mean(price_series[:period])
-            
-            # Calcular o SMMA para os elementos restantes
-            for i in range(period, len(price_series)):
-                smma[i] = (smma[i - 1] * (period - 1) + price_series[i]) / period
-            
-            return smma
-        
-        # Calcular as três linhas do Alligator
-        jaw_smma = calculate_smma(data['median_price'].values, jaw_period)
-        teeth_smma = calculate_smma(data['median_price'].values, teeth_period)
-        lips_smma = calculate_smma(data['median_price'].values, lips_period)
+        # Calcular as três linhas do Alligator (SMMA, ver indicators/kernels.py)
+        jaw_smma = smmaKernel(data['median_price'], jaw_period)
+        teeth_smma = smmaKernel(data['median_price'], teeth_period)
+        lips_smma = smmaKernel(data['median_price'], lips_period)
         
         # Criar séries
         jaw = pd.Series(jaw_smma, index=data.index)
@@ -653,13 +580,8 @@ class Indicators:
         if price_col not in data.columns:
             raise ValueError(f"Coluna '{price_col}' não encontrada nos dados")
         
-        # Gerar pesos para o WMA
-        weights = np.arange(1, period + 1)
-        
-        # Calcular o WMA
-        wma = data[price_col].rolling(window=period).apply(
-            lambda x: np.sum(weights * x) / np.sum(weights), raw=True
-        )
+        # Calcular o WMA (pesos 1, 2, ..., period)
+        wma = weightedMovingAverage(data[price_col], wmaWeights(period))
         
         return wma
     
@@ -705,28 +627,8 @@ class Indicators:
             if col not in data.columns:
                 raise ValueError(f"Coluna '{col}' não encontrada nos dados")
         
-        # Calcular OBV
-        data = data.copy()
-        data['price_change'] = data['close'].diff()
-        data['obv'] = 0
-        
-        # Inicialização do OBV
-        data.loc[1:, 'obv'] = np.nan
-        
-        # Para o primeiro dia, OBV é igual ao volume
-        if len(data) > 0:
-            data.loc[0, 'obv'] = data.loc[0, 'volume']
-        
-        # Cálculo do OBV para os dias seguintes
-        for i in range(1, len(data)):
-            if data.loc[i, 'price_change'] > 0:
-                data.loc[i, 'obv'] = data.loc[i-1, 'obv'] + data.loc[i, 'volume']
-            elif data.loc[i, 'price_change'] < 0:
-                data.loc[i, 'obv'] = data.loc[i-1, 'obv'] - data.loc[i, 'volume']
-            else:
-                data.loc[i, 'obv'] = data.loc[i-1, 'obv']
-        
-        return data['obv']
+        # Calcular OBV (soma acumulada do volume com o sinal da variação do preço)
+        return onBalanceVolume(data['close'], data['volume']).rename('obv')
     @staticmethod
     def getAcceleratorOscillator(data, sma_period=5, ao_period_fast=5, ao_period_slow=34):
         """
@@ -786,22 +688,8 @@ class Indicators:
         if price_col not in data.columns:
             raise ValueError(f"Coluna '{price_col}' não encontrada nos dados")
         
-        # Calcular os parâmetros para o ALMA
-        m = np.floor(offset * (period - 1))
-        s = period / sigma
-        
-        # Calcular os pesos do ALMA
-        weights = np.zeros(period)
-        for i in range(period):
-            weights[i] = np.exp(-((i - m) ** 2) / (2 * s * s))
-        
-        # Normalizar os pesos
-        weights = weights / np.sum(weights)
-        
-        # Aplicar os pesos à janela móvel
-        alma = data[price_col].rolling(window=period).apply(
-            lambda x: np.sum(weights * x), raw=True
-        )
+        # Aplicar os pesos gaussianos do ALMA à janela móvel
+        alma = weightedMovingAverage(data[price_col], almaWeights(period, sigma, offset))
         
         return alma
     
@@ -823,14 +711,9 @@ class Indicators:
             if col not in data.columns:
                 raise ValueError(f"Coluna '{col}' não encontrada nos dados")
         
-        # Calcular os índices do máximo e mínimo no período
-        high_idx = data['high'].rolling(window=period).apply(
-            lambda x: period - x.argmax() - 1 if not np.isnan(x).all() else np.nan
-        )
-        
-        low_idx = data['low'].rolling(window=period).apply(
-            lambda x: period - x.argmin() - 1 if not np.isnan(x).all() else np.nan
-        )
+        # Calcular há quantos candles ocorreram o máximo e o mínimo do período
+        high_idx = rollingExtrema(data['high'], period, find_max=True)['bars_since'].rename(data['high'].name)
+        low_idx = rollingExtrema(data['low'], period, find_max=False)['bars_since'].rename(data['low'].name)
         
         # Calcular Aroon Up e Aroon Down
         aroon_up = 100 * (period - high_idx) / period
@@ -1054,8 +937,7 @@ class Indicators:
                 raise ValueError(f"Coluna '{col}' não encontrada nos dados")
         
         # Calcular as bandas do Donchian Channel
-        upper_band = data['high'].rolling(window=period).max()
-        lower_band = data['low'].rolling(window=period).min()
+        upper_band, lower_band = highLowChannels(data['high'], data['low'], [period])[period]
         middle_band = (upper_band + lower_band) / 2
         
         return upper_band, middle_band, lower_band
@@ -1095,47 +977,18 @@ class Indicators:
         data = data.copy()
         data['price_mid'] = (data['high'] + data['low']) / 2
         
-        # Iniciar valores
-        data['max_h'] = np.nan
-        data['min_l'] = np.nan
-        
-        # Preencher a primeira linha com valores iniciais para evitar NaN
-        if len(data) > 0:
-            data.loc[0, 'max_h'] = data.loc[0, 'price_mid']
-            data.loc[0, 'min_l'] = data.loc[0, 'price_mid']
-        
         # Calcular máximos e mínimos com um método adaptativo (Ehlers)
         # Isso usa uma técnica de alisamento que é mais responsiva a mudanças recentes
-        alpha = 2.0 / (period + 1.0)
-        
-        for i in range(1, len(data)):
-            # Atualizar máximo
-            max_value = data.loc[i-1, 'max_h']
-            if data.loc[i, 'price_mid'] > max_value:
-                max_value = data.loc[i, 'price_mid']
-            else:
-                max_value = max_value - alpha * (max_value - data.loc[i, 'price_mid'])
-            data.loc[i, 'max_h'] = max_value
-            
-            # Atualizar mínimo
-            min_value = data.loc[i-1, 'min_l']
-            if data.loc[i, 'price_mid'] < min_value:
-                min_value = data.loc[i, 'price_mid']
-            else:
-                min_value = min_value + alpha * (data.loc[i, 'price_mid'] - min_value)
-            data.loc[i, 'min_l'] = min_value
-        
-        # Normalizar os preços para o intervalo [-1, 1]
-        data['value'] = np.nan
+        max_h, min_l = ehlerRangeKernel(data['price_mid'], period)
+        data['max_h'] = max_h
+        data['min_l'] = min_l
         
-        # Calcular o valor normalizado
-        for i in range(1, len(data)):
-            price_range = data.loc[i, 'max_h'] - data.loc[i, 'min_l']
-            if price_range == 0:
-                data.loc[i, 'value'] = 0
-            else:
-                # Fórmula de Ehlers para normalização
-                data.loc[i, 'value'] = 2 * ((data.loc[i, 'price_mid'] - data.loc[i, 'min_l']) / price_range - 0.5)
+        # Normalizar os preços para o intervalo [-1, 1] com a fórmula de Ehlers (amplitude zero = 0)
+        price_range = max_h - min_l
+        with np.errstate(divide='ignore', invalid='ignore'):
+            value = np.where(price_range == 0, 0.0, 2 * ((data['price_mid'].to_numpy() - min_l) / price_range - 0.5))
+        value[:1] = np.nan  # O primeiro candle não é normalizado
+        data['value'] = value
         
         # Suavizar o valor normalizado com uma média móvel
         data['smooth_value'] = data['value'].rolling(window=period).mean().fillna(0)
@@ -1284,26 +1137,15 @@ class Indicators:
             if col not in data.columns:
                 raise ValueError(f"Coluna '{col}' não encontrada nos dados")
         
-        # Inicializar os arrays de resultado
-        data = data.copy()
-        data['fractal_up'] = False
-        data['fractal_down'] = False
-        
         # Um fractal de alta ocorre quando o high atual é maior que n high anteriores e posteriores
         # Um fractal de baixa ocorre quando o low atual é menor que n low anteriores e posteriores
+        # (vizinho NaN descarta o fractal, como a comparação candle a candle)
+        fractal_up, fractal_down = fractalPoints(data['high'], data['low'], window, skipna=False)
         
-        for i in range(window, len(data) - window):
-            # Verificar fractal de alta
-            if all(data['high'].iloc[i] > data['high'].iloc[i-j] for j in range(1, window+1)) and \
-               all(data['high'].iloc[i] > data['high'].iloc[i+j] for j in range(1, window+1)):
-                data.iloc[i, data.columns.get_loc('fractal_up')] = True
-            
-            # Verificar fractal de baixa
-            if all(data['low'].iloc[i] < data['low'].iloc[i-j] for j in range(1, window+1)) and \
-               all(data['low'].iloc[i] < data['low'].iloc[i+j] for j in range(1, window+1)):
-                data.iloc[i, data.columns.get_loc('fractal_down')] = True
-        
-        return data['fractal_up'], data['fractal_down']
+        fractal_up = pd.Series(fractal_up, index=data.index, name='fractal_up')
+        fractal_down = pd.Series(fractal_down, index=data.index, name='fractal_down')
+        
+        return fractal_up, fractal_down
     
     @staticmethod
     def getGatorOscillator(data, jaw_period=13, jaw_offset=8, teeth_period=8, teeth_offset=5, lips_period=5, lips_offset=3):
@@ -1385,24 +1227,8 @@ class Indicators:
         if price_col not in data.columns:
             raise ValueError(f"Coluna '{price_col}' não encontrada nos dados")
         
-        # Calcular as WMAs para o HMA
-        half_period = period // 2
-        sqrt_period = int(np.sqrt(period))
-        
-        # Calcular o WMA com período normal
-        wma_period = Indicators.getWMA(data, period, use_close)
-        
-        # Calcular o WMA com metade do período
-        wma_half_period = Indicators.getWMA(data, half_period, use_close)
-        
-        # Calcular a diferença ponderada
-        diff = 2 * wma_half_period - wma_period
-        
-        # Criar um DataFrame temporário para calcular o WMA final
-        temp_df = pd.DataFrame({price_col: diff})
-        
-        # Calcular o HMA (WMA da diferença ponderada)
-        hma = Indicators.getWMA(temp_df, sqrt_period)
+        # HMA = WMA(sqrt(period)) de 2 * WMA(period / 2) - WMA(period), aplicado como um único vetor de pesos
+        hma = weightedMovingAverage(data[price_col], hullWeights(period))
         
         return hma
 
@@ -1465,26 +1291,10 @@ class Indicators:
         if price_col not in data.columns:
             raise ValueError(f"Coluna '{price_col}' não encontrada nos dados")
         
-        # Inicializar a série de resultado
-        linear_reg = pd.Series(index=data.index)
-        
-        # Para cada ponto, calcular a regressão linear para os 'period' pontos anteriores
-        for i in range(period, len(data) + 1):
-            # Dados para a regressão
-            y = data[price_col].iloc[i-period:i].values
-            x = np.arange(period)
-            
-            # Calcular a regressão linear
-            slope, intercept = np.polyfit(x, y, 1)
-            
-            # Valor da regressão no último ponto
-            regression_value = intercept + slope * (period - 1)
-            
-            # Armazenar o valor
-            if i < len(data):
-                linear_reg.iloc[i-1] = regression_value
-        
-        return linear_reg
+        # Regressão linear dos 'period' pontos até cada candle (valor da reta no último ponto)
+        linear_reg = rollingRegression(data[price_col], period)['fitted']
+        
+        return linear_reg.rename(None)
     @staticmethod
     def getMarketFacilitationIndex(data):
         """
@@ -1546,19 +1356,10 @@ class Indicators:
         # Calcular o fator de suavização
         sc = (er * (fast_sc - slow_sc) + slow_sc) ** 2
         
-        # Inicializar o KAMA
-        kama = pd.Series(index=close.index)
-        
-        # Definir o primeiro valor KAMA com o primeiro preço válido
-        first_valid_idx = period
-        if first_valid_idx < len(close):
-            kama.iloc[first_valid_idx] = close.iloc[first_valid_idx]
-        
-        # Calcular o KAMA para os pontos restantes
-        for i in range(first_valid_idx + 1, len(close)):
-            kama.iloc[i] = kama.iloc[i-1] + sc.iloc[i] * (close.iloc[i] - kama.iloc[i-1])
+        # KAMA(i) = KAMA(i-1) + SC(i) * (Preço(i) - KAMA(i-1)), com semente no preço do candle 'period'
+        kama = adaptiveAverageKernel(close, sc, start=period)
         
-        return kama
+        return pd.Series(kama, index=close.index)
     @staticmethod
     def getMFI(data, period=14):
         """
@@ -1637,13 +1438,15 @@ class Indicators:
         
         return middle, upper, lower
     @staticmethod
-    def getPivotPoints(data, pivot_type='standard'):
+    def getPivotPoints(data, pivot_type='standard', session=None):
         """
         Calcula o indicador Pivot Points
         
         Parâmetros:
         - data: DataFrame com os dados de preço
         - pivot_type: Tipo de cálculo ('standard', 'fibonacci', 'woodie', 'camarilla', 'demark')
+        - session: None para usar o candle anterior, ou frequência da sessão ('D', 'W', 'M') para usar a sessão
+          anterior (pelo open_time ou pelo índice de datas); os níveis são calculados uma vez por sessão
         
         Retorno:
         - pivot, s1, s2, s3, r1, r2, r3: Séries com os valores dos níveis de pivot
@@ -1654,118 +1457,20 @@ class Indicators:
             if col not in data.columns:
                 raise ValueError(f"Coluna '{col}' não encontrada nos dados")
         
-        # Adicionar a coluna open se necessário (para alguns métodos)
-        if 'open' not in data.columns and pivot_type.lower() == 'demark':
-            data = data.copy()
-            data['open'] = data['close'].shift(1)
+        # Abertura para o DeMark (sem a coluna open, usa o fechamento anterior)
+        open_prices = data['open'] if 'open' in data.columns else None
+        if open_prices is None and pivot_type.lower() == 'demark':
+            open_prices = data['close'].shift(1)
         
-        # Criar DataFrames para os valores anteriores
-        data = data.copy()
-        data['prev_high'] = data['high'].shift(1)
-        data['prev_low'] = data['low'].shift(1)
-        data['prev_close'] = data['close'].shift(1)
-        if 'open' in data.columns:
-            data['prev_open'] = data['open'].shift(1)
-        
-        # Inicializar séries para os níveis de pivot
-        pivot = pd.Series(index=data.index)
-        s1 = pd.Series(index=data.index)
-        s2 = pd.Series(index=data.index)
-        s3 = pd.Series(index=data.index)
-        r1 = pd.Series(index=data.index)
-        r2 = pd.Series(index=data.index)
-        r3 = pd.Series(index=data.index)
+        # Rótulo da sessão de cada candle (pivots diários, semanais...)
+        sessions = None
+        if session is not None:
+            sessions = sessionKeys(data['open_time'] if 'open_time' in data.columns else data.index, session)
         
         # Calcular os Pivot Points de acordo com o método selecionado
-        if pivot_type.lower() == 'standard':
-            # Pivot Point (PP) = (High + Low + Close) / 3
-            pivot = (data['prev_high'] + data['prev_low'] + data['prev_close']) / 3
-            
-            # Primeira resistência e suporte
-            r1 = 2 * pivot - data['prev_low']
-            s1 = 2 * pivot - data['prev_high']
-            
-            # Segunda resistência e suporte
-            r2 = pivot + (data['prev_high'] - data['prev_low'])
-            s2 = pivot - (data['prev_high'] - data['prev_low'])
-            
-            # Terceira resistência e suporte
-            r3 = r1 + (data['prev_high'] - data['prev_low'])
-            s3 = s1 - (data['prev_high'] - data['prev_low'])
-        
-        elif pivot_type.lower() == 'fibonacci':
-            pivot = (data['prev_high'] + data['prev_low'] + data['prev_close']) / 3
-            
-            range_hl = data['prev_high'] - data['prev_low']
-            
-            # Resistências (usando níveis de Fibonacci)
-            r1 = pivot + 0.382 * range_hl
-            r2 = pivot + 0.618 * range_hl
-            r3 = pivot + 1.000 * range_hl
-            
-            # Suportes (usando níveis de Fibonacci)
-            s1 = pivot - 0.382 * range_hl
-            s2 = pivot - 0.618 * range_hl
-            s3 = pivot - 1.000 * range_hl
-        
-        elif pivot_type.lower() == 'woodie':
-            # Woodie dá mais peso ao preço de fechamento
-            pivot = (data['prev_high'] + data['prev_low'] + 2 * data['prev_close']) / 4
-            
-            # Resistências e suportes
-            r1 = 2 * pivot - data['prev_low']
-            s1 = 2 * pivot - data['prev_high']
-            
-            r2 = pivot + (data['prev_high'] - data['prev_low'])
-            s2 = pivot - (data['prev_high'] - data['prev_low'])
-            
-            r3 = pivot + 2 * (data['prev_high'] - data['prev_low'])
-            s3 = pivot - 2 * (data['prev_high'] - data['prev_low'])
-        
-        elif pivot_type.lower() == 'camarilla':
-            pivot = (data['prev_high'] + data['prev_low'] + data['prev_close']) / 3
-            
-            range_hl = data['prev_high'] - data['prev_low']
-            
-            # Resistências (usando multiplicadores específicos)
-            r1 = data['prev_close'] + range_hl * 1.1 / 12
-            r2 = data['prev_close'] + range_hl * 1.1 / 6
-            r3 = data['prev_close'] + range_hl * 1.1 / 4
-            
-            # Suportes (usando multiplicadores específicos)
-            s1 = data['prev_close'] - range_hl * 1.1 / 12
-            s2 = data['prev_close'] - range_hl * 1.1 / 6
-            s3 = data['prev_close'] - range_hl * 1.1 / 4
-        
-        elif pivot_type.lower() == 'demark':
-            # Condições para determinar o valor X
-            x = pd.Series(index=data.index)
-            
-            # X depende da relação entre close e open
-            for i in range(len(data)):
-                if data['prev_close'].iloc[i] > data['prev_open'].iloc[i]:
-                    x.iloc[i] = data['prev_high'].iloc[i] * 2 + data['prev_low'].iloc[i] + data['prev_close'].iloc[i]
-                elif data['prev_close'].iloc[i] < data['prev_open'].iloc[i]:
-                    x.iloc[i] = data['prev_high'].iloc[i] + data['prev_low'].iloc[i] * 2 + data['prev_close'].iloc[i]
-                else:
-                    x.iloc[i] = data['prev_high'].iloc[i] + data['prev_low'].iloc[i] + data['prev_close'].iloc[i] * 2
-            
-            # Pivot Point DeMark
-            pivot = x / 4
-            
-            # Resistência e suporte
-            r1 = x / 2 - data['prev_low']
-            s1 = x / 2 - data['prev_high']
-            
-            # R2, R3, S2, S3 não são definidos no método DeMark original
-            r2 = pd.Series(np.nan, index=data.index)
-            r3 = pd.Series(np.nan, index=data.index)
-            s2 = pd.Series(np.nan, index=data.index)
-            s3 = pd.Series(np.nan, index=data.index)
-        
-        else:
-            raise ValueError(f"Tipo de Pivot Point '{pivot_type}' não reconhecido.")
+        levels = pivotLevels(data['high'], data['low'], data['close'], open_prices, pivot_type, sessions)
         
+        pivot, s1, s2, s3, r1, r2, r3 = (levels[column].rename(None) for column in PIVOT_COLUMNS)
         return pivot, s1, s2, s3, r1, r2, r3
     
     @staticmethod
@@ -1820,8 +1525,7 @@ class Indicators:
                 raise ValueError(f"Coluna '{col}' não encontrada nos dados")
         
         # Calcular os canais de preço
-        upper = data['high'].rolling(window=period).max()
-        lower = data['low'].rolling(window=period).min()
+        upper, lower = highLowChannels(data['high'], data['low'], [period])[period]
         
         return upper, lower
 
@@ -1845,86 +1549,9 @@ class Indicators:
             if col not in data.columns:
                 raise ValueError(f"Coluna '{col}' não encontrada nos dados")
         
-        # Inicializar colunas
-        data = data.copy()
-        data['psar'] = np.nan
-        data['trend'] = np.nan  # 1 para tendência de alta, -1 para tendência de baixa
-        data['af'] = af_start  # Fator de aceleração
-        data['ep'] = np.nan  # Extreme point
-        
-        # Determinar tendência inicial
-        # Vamos usar a inclinação dos primeiros preços para determinar a tendência inicial
-        if len(data) > 1:
-            if data['close'].iloc[1] > data['close'].iloc[0]:
-                initial_trend = 1  # Tendência de alta
-                data.loc[1, 'psar'] = data['low'].iloc[0]  # PSAR inicial abaixo do primeiro low
-                data.loc[1, 'ep'] = data['high'].iloc[1]  # Primeiro EP é o high atual
-            else:
-                initial_trend = -1  # Tendência de baixa
-                data.loc[1, 'psar'] = data['high'].iloc[0]  # PSAR inicial acima do primeiro high
-                data.loc[1, 'ep'] = data['low'].iloc[1]  # Primeiro EP é o low atual
-            
-            data.loc[1, 'trend'] = initial_trend
-        
-        # Calcular o PSAR para o restante dos dados
-        for i in range(2, len(data)):
-            prev_psar = data.loc[data.index[i-1], 'psar']
-            prev_trend = data.loc[data.index[i-1], 'trend']
-            prev_af = data.loc[data.index[i-1], 'af']
-            prev_ep = data.loc[data.index[i-1], 'ep']
-            
-            # Calcular o novo PSAR
-            current_psar = prev_psar + prev_af * (prev_ep - prev_psar)
-            
-            # Tendência de alta
-            if prev_trend == 1:
-                # Limitar o PSAR pelos mínimos anteriores
-                current_psar = min(current_psar, data['low'].iloc[i-2], data['low'].iloc[i-1])
-                
-                # Verificar se o PSAR é ultrapassado (tendência invertida)
-                if current_psar > data['low'].iloc[i]:
-                    current_trend = -1
-                    current_psar = max(data['high'].iloc[i-2], data['high'].iloc[i-1], data['high'].iloc[i])
-                    current_ep = data['low'].iloc[i]
-                    current_af = af_start
-                else:
-                    current_trend = 1
-                    # Atualizar EP se tiver novo máximo
-                    if data['high'].iloc[i] > prev_ep:
-                        current_ep = data['high'].iloc[i]
-                        current_af = min(prev_af + af_increment, af_max)
-                    else:
-                        current_ep = prev_ep
-                        current_af = prev_af
-            
-            # Tendência de baixa
-            else:
-                # Limitar o PSAR pelos máximos anteriores
-                current_psar = max(current_psar, data['high'].iloc[i-2], data['high'].iloc[i-1])
-                
-                # Verificar se o PSAR é ultrapassado (tendência invertida)
-                if current_psar < data['high'].iloc[i]:
-                    current_trend = 1
-                    current_psar = min(data['low'].iloc[i-2], data['low'].iloc[i-1], data['low'].iloc[i])
-                    current_ep = data['high'].iloc[i]
-                    current_af = af_start
-                else:
-                    current_trend = -1
-                    # Atualizar EP se tiver novo mínimo
-                    if data['low'].iloc[i] < prev_ep:
-                        current_ep = data['low'].iloc[i]
-                        current_af = min(prev_af + af_increment, af_max)
-                    else:
-                        current_ep = prev_ep
-                        current_af = prev_af
-            
-            # Armazenar valores
-            data.loc[data.index[i], 'psar'] = current_psar
-            data.loc[data.index[i], 'trend'] = current_trend
-            data.loc[data.index[i], 'af'] = current_af
-            data.loc[data.index[i], 'ep'] = current_ep
-        
-        return data['psar']
+        psar, _, _, _ = psarKernel(data['high'], data['low'], data['close'], af_start, af_increment, af_max)
+        
+        return pd.Series(psar, index=data.index, name='psar')
     @staticmethod
     def getROC(data, period=12):
         """
@@ -2091,26 +1718,10 @@ class Indicators:
         if price_col not in data.columns:
             raise ValueError(f"Coluna '{price_col}' não encontrada nos dados")
         
-        # Inicializar a série de resultado
-        tsf = pd.Series(index=data.index)
-        
-        # Para cada ponto, calcular a regressão linear para os 'period' pontos anteriores
-        for i in range(period, len(data) + 1):
-            if i < len(data):  # garantir que não estamos fora dos limites
-                # Dados para a regressão
-                y = data[price_col].iloc[i-period:i].values
-                x = np.arange(period)
-                
-                # Calcular a regressão linear
-                slope, intercept = np.polyfit(x, y, 1)
-                
-                # Valor da previsão 'forecast_periods' à frente
-                forecast_value = intercept + slope * (period - 1 + forecast_periods)
-                
-                # Armazenar o valor
-                tsf.iloc[i-1] = forecast_value
-        
-        return tsf
+        # Regressão linear dos 'period' pontos até cada candle, projetada 'forecast_periods' à frente
+        tsf = rollingRegression(data[price_col], period, forecast_periods)['forecast']
+        
+        return tsf.rename(None)
     @staticmethod
     def getTriangularMovingAverage(data, period=14, use_close=True):
         """
@@ -2128,11 +1739,8 @@ class Indicators:
         if price_col not in data.columns:
             raise ValueError(f"Coluna '{price_col}' não encontrada nos dados")
         
-        # Calcular a primeira média móvel simples (SMA)
-        sma = data[price_col].rolling(window=period).mean()
-        
-        # Calcular a média móvel triangular (média móvel da média móvel)
-        tma = sma.rolling(window=period).mean()
+        # Média móvel triangular (média móvel da média móvel), aplicada como um único vetor de pesos
+        tma = weightedMovingAverage(data[price_col], triangularWeights(period))
         
         return tma
     
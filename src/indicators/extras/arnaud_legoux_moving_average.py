@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from indicators.weighted_windows import almaWeights, weightedMovingAverage
+
 def arnaudLegouxMovingAverage(data, period=14, sigma=6.0, offset=0.85, use_close=True):
     """
     Calcula o indicador Arnaud Legoux Moving Average
@@ -33,26 +35,7 @@ def arnaudLegouxMovingAverage(data, period=14, sigma=6.0, offset=0.85, use_close
     if len(data) < period:
         return pd.Series(np.nan, index=data.index)
     
-    # Calcular os parâmetros para o ALMA
-    m = np.floor(offset * (period - 1))  # Controla o deslocamento da gaussiana
-    s = period / sigma  # Controla a largura da gaussiana
-    
-    # Inicializar pesos
-    weights = np.zeros(period)
-    
-    # Calcular pesos de acordo com a distribuição de Gauss
-    for i in range(period):
-        weights[i] = np.exp(-((i - m) ** 2) / (2 * s * s))
-    
-    # Normalizar pesos para que somem 1
-    weights = weights / np.sum(weights)
-    
-    # Inicializar resultado com valores NaN
-    alma_values = np.full(len(data), np.nan)
-    
-    # Aplicar ALMA para cada ponto, começando no índice 'period-1'
-    for i in range(period - 1, len(data)):
-        window = data[price_col].iloc[i - period + 1 : i + 1].values
-        alma_values[i] = np.sum(window * weights[::-1])  # Inverter pesos para corresponder ao janelamento correto
+    # Aplicar o ALMA (pesos invertidos para corresponder ao janelamento correto)
+    alma_values = weightedMovingAverage(data[price_col], almaWeights(period, sigma, offset)[::-1]).rename(None)
     
-    return pd.Series(alma_values, index=data.index)
\ No newline at end of file
+    return alma_values
\ No newline at end of file
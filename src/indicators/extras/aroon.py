@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from indicators.rolling_extrema import rollingExtrema
+
 def aroon(data, period=14):
     """
     Calcula o indicador Aroon
@@ -25,44 +27,13 @@ def aroon(data, period=14):
     # Criar uma cópia para evitar modificar o DataFrame original
     df = data.copy()
     
-    # Calcular os períodos desde o máximo/mínimo de alta/baixa
-    # Função para calcular índices dos máximos/mínimos em um período
-    def calculate_periods_since_extreme(df, period, high_low_col, find_max=True):
-        result = []
-        
-        for i in range(len(df)):
-            if i < period - 1:
-                result.append(np.nan)
-                continue
-                
-            # Extrair a janela para o período
-            window = df[high_low_col].iloc[i - period + 1 : i + 1]
-            
-            # Encontrar o índice do máximo ou mínimo relativo ao início da janela
-            if find_max:
-                idx = window.idxmax()
-            else:
-                idx = window.idxmin()
-            
-            # Converter para posição na janela
-            pos = df.index.get_loc(idx) - (i - period + 1)
-            
-            # Calcular períodos desde o extremo
-            periods_since = period - 1 - pos
-            
-            result.append(periods_since)
-        
-        return result
-    
-    # Calcular períodos desde o máximo e mínimo
-    periods_since_high = calculate_periods_since_extreme(df, period, high_col, find_max=True)
-    periods_since_low = calculate_periods_since_extreme(df, period, low_col, find_max=False)
+    # Calcular os períodos desde o máximo e mínimo
+    periods_since_high = rollingExtrema(df[high_col], period, find_max=True)['bars_since'].to_numpy()
+    periods_since_low = rollingExtrema(df[low_col], period, find_max=False)['bars_since'].to_numpy()
     
     # Calcular Aroon Up e Aroon Down
-    aroon_up = pd.Series([(period - p) / period * 100 if not np.isnan(p) else np.nan for p in periods_since_high], 
-                        index=df.index)
-    aroon_down = pd.Series([(period - p) / period * 100 if not np.isnan(p) else np.nan for p in periods_since_low], 
-                          index=df.index)
+    aroon_up = pd.Series((period - periods_since_high) / period * 100, index=df.index)
+    aroon_down = pd.Series((period - periods_since_low) / period * 100, index=df.index)
     
     # Calcular Aroon Oscillator
     aroon_oscillator = aroon_up - aroon_down
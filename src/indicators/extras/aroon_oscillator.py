@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from indicators.rolling_extrema import rollingExtrema
+
 def aroonOscillator(data, period=14):
     """
     Calcula o indicador Aroon Oscillator
@@ -25,29 +27,9 @@ def aroonOscillator(data, period=14):
     # Criar uma cópia para evitar modificar o DataFrame original
     df = data.copy()
     
-    # Função para calcular índices dos máximos/mínimos em um período
-    def rolling_argmax_min(series, window, find_max=True):
-        result = np.zeros(len(series))
-        result[:] = np.nan
-        
-        for i in range(window - 1, len(series)):
-            if find_max:
-                idx = series.iloc[i - window + 1:i + 1].idxmax()
-            else:
-                idx = series.iloc[i - window + 1:i + 1].idxmin()
-            
-            # Converter para dias desde o extremo (0 = hoje, window-1 = mais antigo)
-            loc_in_df = series.index.get_loc(idx)
-            loc_in_window = loc_in_df - (i - window + 1)
-            days_since = window - 1 - loc_in_window
-            
-            result[i] = days_since
-            
-        return pd.Series(result, index=series.index)
-    
-    # Calcular períodos desde o máximo e mínimo
-    days_since_high = rolling_argmax_min(df[high_col], period, find_max=True)
-    days_since_low = rolling_argmax_min(df[low_col], period, find_max=False)
+    # Calcular períodos desde o máximo e mínimo (0 = hoje, period-1 = mais antigo)
+    days_since_high = rollingExtrema(df[high_col], period, find_max=True)['bars_since'].rename(df[high_col].name)
+    days_since_low = rollingExtrema(df[low_col], period, find_max=False)['bars_since'].rename(df[low_col].name)
     
     # Calcular Aroon Up e Aroon Down
     aroon_up = 100 * (period - days_since_high) / period
@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from indicators.rolling_extrema import highLowChannels
+
 def donchianChannels(data, period=20):
     """
     Calcula o indicador Donchian Channels
@@ -25,11 +27,8 @@ def donchianChannels(data, period=20):
     # Criar uma cópia para evitar modificar o DataFrame original
     df = data.copy()
     
-    # Calcular a banda superior (máximo do período)
-    upper_band = df[high_col].rolling(window=period).max()
-    
-    # Calcular a banda inferior (mínimo do período)
-    lower_band = df[low_col].rolling(window=period).min()
+    # Calcular a banda superior (máximo do período) e a inferior (mínimo do período)
+    upper_band, lower_band = highLowChannels(df[high_col], df[low_col], [period])[period]
     
     # Calcular a banda do meio (média das bandas superior e inferior)
     middle_band = (upper_band + lower_band) / 2
@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from indicators.kernels import ehlerRangeKernel
+
 def ehlerFisherTransform(data, period=10):
     """
     Calcula o indicador Ehler Fisher Transform
@@ -28,47 +30,18 @@ def ehlerFisherTransform(data, period=10):
     # Calcular o valor médio (midpoint) do período
     df['price_mid'] = (df[high_col] + df[low_col]) / 2
     
-    # Iniciar valores para máximo e mínimo
-    df['max_h'] = np.nan
-    df['min_l'] = np.nan
-    
-    # Preencher a primeira linha com valores iniciais para evitar NaN
-    if len(df) > 0:
-        df.loc[df.index[0], 'max_h'] = df.loc[df.index[0], 'price_mid']
-        df.loc[df.index[0], 'min_l'] = df.loc[df.index[0], 'price_mid']
-    
     # Calcular máximos e mínimos com um método adaptativo (Ehlers)
     # Isso usa uma técnica de alisamento que é mais responsiva a mudanças recentes
-    alpha = 2.0 / (period + 1.0)
-    
-    for i in range(1, len(df)):
-        # Atualizar máximo
-        max_value = df.loc[df.index[i-1], 'max_h']
-        if df.loc[df.index[i], 'price_mid'] > max_value:
-            max_value = df.loc[df.index[i], 'price_mid']
-        else:
-            max_value = max_value - alpha * (max_value - df.loc[df.index[i], 'price_mid'])
-        df.loc[df.index[i], 'max_h'] = max_value
-        
-        # Atualizar mínimo
-        min_value = df.loc[df.index[i-1], 'min_l']
-        if df.loc[df.index[i], 'price_mid'] < min_value:
-            min_value = df.loc[df.index[i], 'price_mid']
-        else:
-            min_value = min_value + alpha * (df.loc[df.index[i], 'price_mid'] - min_value)
-        df.loc[df.index[i], 'min_l'] = min_value
-    
-    # Normalizar os preços para o intervalo [-1, 1]
-    df['value'] = np.nan
-    
-    # Calcular o valor normalizado
-    for i in range(1, len(df)):
-        price_range = df.loc[df.index[i], 'max_h'] - df.loc[df.index[i], 'min_l']
-        if price_range == 0:
-            df.loc[df.index[i], 'value'] = 0
-        else:
-            # Fórmula de Ehlers para normalização
-            df.loc[df.index[i], 'value'] = 2 * ((df.loc[df.index[i], 'price_mid'] - df.loc[df.index[i], 'min_l']) / price_range - 0.5)
+    max_h, min_l = ehlerRangeKernel(df['price_mid'], period)
+    df['max_h'] = max_h
+    df['min_l'] = min_l
+    
+    # Normalizar os preços para o intervalo [-1, 1] com a fórmula de Ehlers (amplitude zero = 0)
+    price_range = max_h - min_l
+    with np.errstate(divide='ignore', invalid='ignore'):
+        value = np.where(price_range == 0, 0.0, 2 * ((df['price_mid'].to_numpy() - min_l) / price_range - 0.5))
+    value[:1] = np.nan  # O primeiro candle não é normalizado
+    df['value'] = value
     
     # Suavizar o valor normalizado com uma média móvel
     df['smooth_value'] = df['value'].rolling(window=period).mean().fillna(0)
@@ -32,16 +32,11 @@ def fisherTransform(data, period=10):
     df['period_high'] = df['price_mid'].rolling(window=period).max()
     df['period_low'] = df['price_mid'].rolling(window=period).min()
     
-    # Normalizar os preços para o intervalo [-1, 1]
-    df['value'] = np.nan
-    
-    # Evitar divisão por zero
-    for i in range(period-1, len(df)):
-        price_range = df['period_high'].iloc[i] - df['period_low'].iloc[i]
-        if price_range == 0:
-            df.loc[df.index[i], 'value'] = 0
-        else:
-            df.loc[df.index[i], 'value'] = 2 * ((df['price_mid'].iloc[i] - df['period_low'].iloc[i]) / price_range - 0.5)
+    # Normalizar os preços para o intervalo [-1, 1] (amplitude zero = 0, evitando divisão por zero)
+    price_range = (df['period_high'] - df['period_low']).to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        normalized = 2 * ((df['price_mid'].to_numpy() - df['period_low'].to_numpy()) / price_range - 0.5)
+    df['value'] = np.where(price_range == 0, 0.0, normalized)
     
     # Calcular o Fisher Transform
     df['fisher_input'] = df['value'].rolling(window=period).mean()
@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from indicators.price_action import fractalPoints
+
 def fractals(data, window=2):
     """
     Calcula o indicador Fractals
@@ -36,20 +38,9 @@ def fractals(data, window=2):
     if len(df) < full_window:
         return fractal_up, fractal_down
     
-    # Identificar fractais
-    for i in range(window, len(df) - window):
-        # Verificar se é um fractal de alta (high point)
-        high_values_left = df[high_col].iloc[i-window:i]
-        high_values_right = df[high_col].iloc[i+1:i+window+1]
-        
-        if df[high_col].iloc[i] > high_values_left.max() and df[high_col].iloc[i] > high_values_right.max():
-            fractal_up.iloc[i] = df[high_col].iloc[i]
-        
-        # Verificar se é um fractal de baixa (low point)
-        low_values_left = df[low_col].iloc[i-window:i]
-        low_values_right = df[low_col].iloc[i+1:i+window+1]
-        
-        if df[low_col].iloc[i] < low_values_left.min() and df[low_col].iloc[i] < low_values_right.min():
-            fractal_down.iloc[i] = df[low_col].iloc[i]
+    # Identificar fractais (máximo/mínimo do centro contra os vizinhos de cada lado)
+    is_up, is_down = fractalPoints(df[high_col], df[low_col], window)
+    fractal_up = fractal_up.mask(is_up, df[high_col])
+    fractal_down = fractal_down.mask(is_down, df[low_col])
     
     return fractal_up, fractal_down
\ No newline at end of file
@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from indicators.kernels import smmaKernel
+
 def gatorOscillator(data, jaw_period=13, jaw_offset=8, teeth_period=8, teeth_offset=5, lips_period=5, lips_offset=3):
     """
     Calcula o indicador Gator Oscillator
@@ -33,24 +35,10 @@ def gatorOscillator(data, jaw_period=13, jaw_offset=8, teeth_period=8, teeth_off
     # Calcular o preço médio
     df['median_price'] = (df[high_col] + df[low_col]) / 2
     
-    # Implementar SMMA (Smoothed Moving Average)
-    def calculate_smma(data, period):
-        smma = np.zeros_like(data)
-        smma[:period] = np.nan
-        
-        # Inicializar com a média dos primeiros 'period' elementos
-        smma[period - 1] = np.mean(data[:period])
-        
-        # Calcular o SMMA para os elementos restantes
-        for i in range(period, len(data)):
-            smma[i] = (smma[i - 1] * (period - 1) + data[i]) / period
-        
-        return smma
-    
     # Calcular SMMAs para as linhas do Alligator
-    jaw_smma = calculate_smma(df['median_price'].values, jaw_period)
-    teeth_smma = calculate_smma(df['median_price'].values, teeth_period)
-    lips_smma = calculate_smma(df['median_price'].values, lips_period)
+    jaw_smma = smmaKernel(df['median_price'], jaw_period)
+    teeth_smma = smmaKernel(df['median_price'], teeth_period)
+    lips_smma = smmaKernel(df['median_price'], lips_period)
     
     # Criar as colunas do Alligator
     df['jaw'] = pd.Series(jaw_smma, index=df.index)
@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from indicators.weighted_windows import hullWeights, weightedMovingAverage
+
 def hullMovingAverage(data, period=14, use_close=True):
     """
     Calcula o indicador Hull Moving Average
@@ -27,30 +29,8 @@ def hullMovingAverage(data, period=14, use_close=True):
             # Caso 'open' não esteja disponível, usar 'close'
             price_col = 'close' if 'close' in data.columns else 'close'.lower()
     
-    # Criar uma cópia para evitar modificar o DataFrame original
-    df = data.copy()
-    
-    # Função para calcular a WMA (Weighted Moving Average)
-    def calculate_wma(series, period):
-        weights = np.arange(1, period + 1)
-        wma = series.rolling(window=period).apply(
-            lambda x: np.sum(weights * x) / np.sum(weights), raw=True
-        )
-        return wma
-    
-    # Calcular o Hull Moving Average
-    # 1. Calcular WMA com período original
-    wma_full = calculate_wma(df[price_col], period)
-    
-    # 2. Calcular WMA com período metade do original
-    period_half = period // 2
-    wma_half = calculate_wma(df[price_col], period_half)
-    
-    # 3. Calcular o raw HMA
-    raw_hma = 2 * wma_half - wma_full
-    
-    # 4. Calcular o HMA final
-    sqrt_period = int(np.sqrt(period))
-    hma = calculate_wma(raw_hma, sqrt_period)
+    # Calcular o Hull Moving Average: WMA(sqrt(period)) de 2 * WMA(period / 2) - WMA(period),
+    # aplicado como um único vetor de pesos
+    hma = weightedMovingAverage(data[price_col], hullWeights(period))
     
     return hma
\ No newline at end of file
@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from indicators.rolling_extrema import highLowChannels
+
 def ichimokuCloud(data, tenkan_period=9, kijun_period=26, senkou_span_b_period=52, displacement=26):
     """
     Calcula o indicador Ichimoku Cloud
@@ -29,21 +31,25 @@ def ichimokuCloud(data, tenkan_period=9, kijun_period=26, senkou_span_b_period=5
     # Criar uma cópia para evitar modificar o DataFrame original
     df = data.copy()
     
+    # Máximos/mínimos dos três períodos de uma vez
+    channels = highLowChannels(df[high_col], df[low_col], [tenkan_period, kijun_period, senkou_span_b_period])
+    
     # Função para calcular o meio do alcance (min/max) para um período
-    def donchian(high, low, period):
-        return (high.rolling(window=period).max() + low.rolling(window=period).min()) / 2
+    def donchian(period):
+        highest, lowest = channels[period]
+        return (highest + lowest) / 2
     
     # Cálculo do Tenkan-sen (Linha de Conversão)
-    tenkan_sen = donchian(df[high_col], df[low_col], tenkan_period)
+    tenkan_sen = donchian(tenkan_period)
     
     # Cálculo do Kijun-sen (Linha Base)
-    kijun_sen = donchian(df[high_col], df[low_col], kijun_period)
+    kijun_sen = donchian(kijun_period)
     
     # Cálculo do Senkou Span A (Primeira linha da nuvem)
     senkou_span_a = ((tenkan_sen + kijun_sen) / 2).shift(displacement)
     
     # Cálculo do Senkou Span B (Segunda linha da nuvem)
-    senkou_span_b = donchian(df[high_col], df[low_col], senkou_span_b_period).shift(displacement)
+    senkou_span_b = donchian(senkou_span_b_period).shift(displacement)
     
     # Cálculo do Chikou Span (Linha de Atraso)
     chikou_span = df[close_col].shift(-displacement)
@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from indicators.kernels import adaptiveAverageKernel
+
 def kama(data, period=14, fast_ema=2, slow_ema=30):
     """
     Calcula o indicador KAMA (Kaufman's Adaptive Moving Average)
@@ -47,24 +49,8 @@ def kama(data, period=14, fast_ema=2, slow_ema=30):
     # Calcular o fator de suavização
     df['smooth_factor'] = (df['efficiency_ratio'] * (fast_sc - slow_sc) + slow_sc) ** 2
     
-    # Inicializar o KAMA
-    kama_values = np.zeros(len(df))
-    kama_values[:] = np.nan
-    
-    # Definir o primeiro valor KAMA
-    # Normalmente, seria a média dos primeiros 'period' valores
-    if len(df) > period:
-        # O primeiro valor é o preço atual
-        kama_values[period-1] = df[close_col].iloc[period-1]
-    
-    # Calcular o KAMA para os pontos restantes
-    for i in range(period, len(df)):
-        prev_kama = kama_values[i-1]
-        if np.isnan(prev_kama):
-            kama_values[i] = df[close_col].iloc[i]
-        else:
-            current_sf = df['smooth_factor'].iloc[i]
-            current_close = df[close_col].iloc[i]
-            kama_values[i] = prev_kama + current_sf * (current_close - prev_kama)
+    # Calcular o KAMA (semente no preço do candle period-1; recomeça do preço enquanto o KAMA for NaN)
+    start = period - 1 if len(df) > period else len(df)
+    kama_values = adaptiveAverageKernel(df[close_col], df['smooth_factor'], start=start, reseed_nan=True)
     
     return pd.Series(kama_values, index=df.index)
\ No newline at end of file
@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from indicators.price_action import onBalanceVolume
+
 def obv(data):
     """
     Calcula o indicador OBV (On Balance Volume)
@@ -24,26 +26,7 @@ def obv(data):
     # Criar uma cópia para evitar modificar o DataFrame original
     df = data.copy()
     
-    # Calcular a variação do preço
-    df['price_change'] = df[close_col].diff()
-    
-    # Inicializar o OBV
-    obv_values = pd.Series(0, index=df.index)
-    
-    # Preencher o primeiro valor com o volume inicial
-    if len(df) > 0:
-        obv_values.iloc[0] = df[volume_col].iloc[0]
-    
-    # Calcular o OBV para os dias seguintes
-    for i in range(1, len(df)):
-        if df['price_change'].iloc[i] > 0:
-            # Preço subiu: adicionar volume
-            obv_values.iloc[i] = obv_values.iloc[i-1] + df[volume_col].iloc[i]
-        elif df['price_change'].iloc[i] < 0:
-            # Preço caiu: subtrair volume
-            obv_values.iloc[i] = obv_values.iloc[i-1] - df[volume_col].iloc[i]
-        else:
-            # Preço não mudou: manter o mesmo OBV
-            obv_values.iloc[i] = obv_values.iloc[i-1]
+    # OBV: soma acumulada do volume com o sinal da variação do preço
+    obv_values = onBalanceVolume(df[close_col], df[volume_col])
     
     return obv_values
\ No newline at end of file
@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from indicators.rolling_extrema import highLowChannels
+
 def priceChannels(data, period=20):
     """
     Calcula o indicador Price Channels
@@ -25,10 +27,7 @@ def priceChannels(data, period=20):
     # Criar uma cópia para evitar modificar o DataFrame original
     df = data.copy()
     
-    # Calcular o canal superior (máximo do período)
-    upper = df[high_col].rolling(window=period).max()
-    
-    # Calcular o canal inferior (mínimo do período)
-    lower = df[low_col].rolling(window=period).min()
+    # Calcular o canal superior (máximo do período) e o inferior (mínimo do período)
+    upper, lower = highLowChannels(df[high_col], df[low_col], [period])[period]
     
     return upper, lower
\ No newline at end of file
@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from indicators.rolling_regression import rollingRegression
+
 def timeSeriesForecast(data, period=14, forecast_periods=1, use_close=True):
     """
     Calcula o indicador Time Series Forecast
@@ -28,32 +30,7 @@ def timeSeriesForecast(data, period=14, forecast_periods=1, use_close=True):
             # Caso 'open' não esteja disponível, usar 'close'
             price_col = 'close' if 'close' in data.columns else 'close'.lower()
     
-    # Criar uma cópia para evitar modificar o DataFrame original
-    df = data.copy()
-    
-    # Função para calcular a previsão de regressão linear para um ponto no futuro
-    def linear_regression_forecast(series, period, forecast_periods=1):
-        # Criar array de índices (x) para a regressão
-        x = np.arange(period)
-        # Inicializar array para os resultados
-        result = np.zeros(len(series))
-        result[:] = np.nan
-        
-        # Percorrer a série para calcular a regressão para cada janela
-        for i in range(period - 1, len(series)):
-            # Obter os últimos 'period' valores (y)
-            y = series.iloc[i - period + 1:i + 1].values
-            
-            # Calcular a regressão linear (mx + b)
-            m, b = np.polyfit(x, y, 1)
-            
-            # Calcular o valor previsto para 'forecast_periods' à frente
-            forecast = m * (period - 1 + forecast_periods) + b
-            result[i] = forecast
-        
-        return pd.Series(result, index=series.index)
-    
     # Calcular o Time Series Forecast (previsão n períodos à frente)
-    tsf = linear_regression_forecast(df[price_col], period, forecast_periods)
+    tsf = rollingRegression(data[price_col], period, forecast_periods)['forecast'].rename(None)
     
     return tsf
\ No newline at end of file
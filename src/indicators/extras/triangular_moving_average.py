@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from indicators.weighted_windows import triangularWeights, weightedMovingAverage
+
 def triangularMovingAverage(data, period=14, use_close=True):
     """
     Calcula o indicador Triangular Moving Average
@@ -27,16 +29,10 @@ def triangularMovingAverage(data, period=14, use_close=True):
             # Caso 'open' não esteja disponível, usar 'close'
             price_col = 'close' if 'close' in data.columns else 'close'.lower()
     
-    # Criar uma cópia para evitar modificar o DataFrame original
-    df = data.copy()
-    
     # Calcular o período para cada SMA
     n = round((period + 1) / 2)
     
-    # Calcular a primeira SMA
-    sma1 = df[price_col].rolling(window=n).mean()
-    
-    # Calcular a segunda SMA (média móvel da primeira SMA)
-    tma = sma1.rolling(window=n).mean()
+    # TMA = SMA(n) da SMA(n), aplicada como um único vetor de pesos
+    tma = weightedMovingAverage(data[price_col], triangularWeights(n))
     
     return tma
\ No newline at end of file
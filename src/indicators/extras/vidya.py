@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from indicators.kernels import adaptiveAverageKernel
+
 def vidya(data, period=14, chande_period=10, use_close=True):
     """
     Calcula o indicador VIDYA (Variable Index Dynamic Average)
@@ -52,23 +54,8 @@ def vidya(data, period=14, chande_period=10, use_close=True):
     # Normalizar o CMO para o range 0-1
     k = abs(cmo) / 100
     
-    # Inicializar VIDYA como uma série de zeros
-    vidya_values = np.zeros(len(data))
-    vidya_values[:] = np.nan
-    
-    # Encontrar o primeiro índice válido
-    first_valid_idx = cmo.first_valid_index()
-    if first_valid_idx is not None:
-        idx = data.index.get_loc(first_valid_idx)
-        # Inicializar VIDYA com o primeiro valor de preço
-        vidya_values[idx] = data[price_col].iloc[idx]
-        
-        # Calcular VIDYA para os valores restantes
-        for i in range(idx + 1, len(data)):
-            # Fator de suavização ajustado pela volatilidade (k)
-            alpha = sc * k.iloc[i]
-            # VIDYA(i) = VIDYA(i-1) + α * (Price(i) - VIDYA(i-1))
-            vidya_values[i] = vidya_values[i-1] + alpha * (data[price_col].iloc[i] - vidya_values[i-1])
+    # VIDYA(i) = VIDYA(i-1) + α * (Price(i) - VIDYA(i-1)), com α = sc * k e semente no primeiro CMO válido
+    vidya_values = adaptiveAverageKernel(data[price_col], sc * k)
     
     vidya_series = pd.Series(vidya_values, index=data.index)
     
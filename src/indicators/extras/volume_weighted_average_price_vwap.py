@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from indicators.session_vwap import sessionIds, sessionVWAP
+
 def volumeWeightedAveragePrice(data, period=14, reset_daily=True):
     """
     Calcula o indicador Volume-Weighted Average Price (VWAP)
@@ -28,12 +30,6 @@ def volumeWeightedAveragePrice(data, period=14, reset_daily=True):
     # Criar uma cópia para evitar modificar o DataFrame original
     df = data.copy()
     
-    # Calcular o preço típico (high + low + close) / 3
-    df['typical_price'] = (df[high_col] + df[low_col] + df[close_col]) / 3
-    
-    # Calcular o valor negociado (preço típico * volume)
-    df['tp_volume'] = df['typical_price'] * df[volume_col]
-    
     # Verificar se temos a data para separar dias
     date_column = None
     for col in ['date', 'datetime', 'timestamp']:
@@ -41,54 +37,42 @@ def volumeWeightedAveragePrice(data, period=14, reset_daily=True):
             date_column = col
             break
     
-    # Se resetar diariamente e temos uma coluna de data
+    # Se resetar diariamente e temos uma coluna de data: número da sessão (dia) de cada candle
+    sessions = None
     if reset_daily and date_column:
-        # Extrair apenas a data (sem hora) para agrupar por dia
-        if pd.api.types.is_datetime64_any_dtype(df[date_column]):
-            df['day'] = df[date_column].dt.date
-        else:
-            # Tentar converter para datetime
-            try:
-                df['day'] = pd.to_datetime(df[date_column]).dt.date
-            except:
-                # Se não conseguir converter, usar o dia do index (se for datetime)
-                if pd.api.types.is_datetime64_any_dtype(df.index):
-                    df['day'] = df.index.date
-                else:
-                    # Se tudo falhar, não resetar diariamente
-                    reset_daily = False
-    
-    # Calcular o VWAP
-    if reset_daily and 'day' in df.columns:
-        # Resetar os cálculos por dia
-        df['cum_tp_volume'] = df.groupby('day')['tp_volume'].cumsum()
-        df['cum_volume'] = df.groupby('day')[volume_col].cumsum()
-    else:
-        # Usar janela móvel se não estiver resetando diariamente
-        if not reset_daily:
-            # Janela móvel para o período especificado
-            df['cum_tp_volume'] = df['tp_volume'].rolling(window=period).sum()
-            df['cum_volume'] = df[volume_col].rolling(window=period).sum()
-        else:
-            # Acumular continuamente se resetar diariamente mas não tiver coluna de data
-            df['cum_tp_volume'] = df['tp_volume'].cumsum()
-            df['cum_volume'] = df[volume_col].cumsum()
-    
-    # Evitar divisão por zero
-    df['vwap'] = np.where(
-        df['cum_volume'] > 0,
-        df['cum_tp_volume'] / df['cum_volume'],
-        df['typical_price']
-    )
-    
-    # Calcular desvio do preço em relação ao VWAP
-    df['price_dev'] = df['typical_price'] - df['vwap']
-    
-    # Calcular desvio padrão do preço em relação ao VWAP
-    if reset_daily and 'day' in df.columns:
-        df['std_dev'] = df.groupby('day')['price_dev'].rolling(window=period).std().reset_index(level=0, drop=True)
+        try:
+            sessions = sessionIds(df[date_column])
+        except:
+            # Se não conseguir converter, usar o dia do index (se for datetime)
+            if pd.api.types.is_datetime64_any_dtype(df.index):
+                sessions = sessionIds(df.index)
+            else:
+                # Se tudo falhar, não resetar diariamente
+                reset_daily = False
+    
+    if reset_daily:
+        # VWAP acumulado por dia (ou contínuo, se não tiver coluna de data) e desvio padrão em relação a ele
+        vwap_data = sessionVWAP(df[high_col], df[low_col], df[close_col], df[volume_col], sessions, period)
+        df['vwap'] = vwap_data['vwap']
+        df['std_dev'] = vwap_data['std_dev']
     else:
-        df['std_dev'] = df['price_dev'].rolling(window=period).std()
+        # Calcular o preço típico (high + low + close) / 3 e o valor negociado (preço típico * volume)
+        df['typical_price'] = (df[high_col] + df[low_col] + df[close_col]) / 3
+        df['tp_volume'] = df['typical_price'] * df[volume_col]
+        
+        # Janela móvel para o período especificado
+        df['cum_tp_volume'] = df['tp_volume'].rolling(window=period).sum()
+        df['cum_volume'] = df[volume_col].rolling(window=period).sum()
+        
+        # Evitar divisão por zero
+        df['vwap'] = np.where(
+            df['cum_volume'] > 0,
+            df['cum_tp_volume'] / df['cum_volume'],
+            df['typical_price']
+        )
+        
+        # Calcular desvio padrão do preço em relação ao VWAP
+        df['std_dev'] = (df['typical_price'] - df['vwap']).rolling(window=period).std()
     
     # Preencher valores NaN
     df['std_dev'] = df['std_dev'].fillna(0)
@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from indicators.kernels import smmaKernel
+
 def williamsAlligator(data, jaw_period=13, jaw_offset=8, teeth_period=8, teeth_offset=5, lips_period=5, lips_offset=3):
     """
     Calcula o indicador Williams Alligator
@@ -33,24 +35,10 @@ def williamsAlligator(data, jaw_period=13, jaw_offset=8, teeth_period=8, teeth_o
     # Calcular o preço médio
     df['median_price'] = (df[high_col] + df[low_col]) / 2
     
-    # Implementar SMMA (Smoothed Moving Average)
-    def calculate_smma(data, period):
-        smma = np.zeros_like(data)
-        smma[:period] = np.nan
-        
-        # Inicializar com a média dos primeiros 'period' elementos
-        smma[period - 1] = np.mean(data[:period])
-        
-        # Calcular o SMMA para os elementos restantes
-        for i in range(period, len(data)):
-            smma[i] = (smma[i - 1] * (period - 1) + data[i]) / period
-        
-        return smma
-    
     # Calcular SMMAs
-    smma_jaw = calculate_smma(df['median_price'].values, jaw_period)
-    smma_teeth = calculate_smma(df['median_price'].values, teeth_period)
-    smma_lips = calculate_smma(df['median_price'].values, lips_period)
+    smma_jaw = smmaKernel(df['median_price'], jaw_period)
+    smma_teeth = smmaKernel(df['median_price'], teeth_period)
+    smma_lips = smmaKernel(df['median_price'], lips_period)
     
     # Criar as colunas do Alligator
     jaw = pd.Series(smma_jaw, index=df.index)
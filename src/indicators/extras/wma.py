@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from indicators.weighted_windows import weightedMovingAverage, wmaWeights
+
 def wma(data, period=14, use_close=True):
     """
     Calcula o indicador WMA (Weighted Moving Average)
@@ -27,20 +29,10 @@ def wma(data, period=14, use_close=True):
             # Caso 'open' não esteja disponível, usar 'close'
             price_col = 'close' if 'close' in data.columns else 'close'.lower()
     
-    # Criar uma cópia para evitar modificar o DataFrame original
-    df = data.copy()
+    # Calcular o WMA (pesos 1, 2, ..., period, com maior peso para os valores mais recentes)
+    wma_values = weightedMovingAverage(data[price_col], wmaWeights(period))
     
-    # Função para calcular o WMA
-    def calculate_wma(series, period):
-        # Criar array de pesos, com maior peso para os valores mais recentes
-        weights = np.arange(1, period + 1)
-        
-        # Aplicar os pesos para cada janela
-        wma_values = series.rolling(window=period).apply(
-            lambda x: np.sum(weights * x) / np.sum(weights), raw=True
-        )
-        
-        return wma_values
+    return wma_values
     
     # Calcular o WMA
     wma_values = calculate_wma(df[price_col], period)
@@ -0,0 +1,177 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+"""
+Cache dos indicadores calculados em um ciclo do bot.
+
+No mesmo ciclo, o mesmo stock_data passa pela estratégia principal, pela de fallback e pelas ordens limitadas
+(RSI e média de volume). Com um ciclo ativo (IndicatorCache.cycle), as funções de indicators/ (rsi, macd, vortex,
+atr, t3MovingAverage) consultam o cache antes de calcular: cada indicador é calculado uma vez por candle por ativo.
+
+A chave é (símbolo, intervalo, open_time do último candle, indicador, parâmetros, entradas). As entradas entram pelo
+nome, tipo, tamanho e um hash de todos os valores: o candle aberto muda de preço sem mudar de open_time, e uma série
+reconstruída ou alterada pela estratégia (mesmo com o mesmo nome e as mesmas pontas) não reaproveita o valor da
+original. Fora de um ciclo (backtests) nada é guardado.
+
+Os valores devolvidos são compartilhados entre os chamadores: não devem ser alterados no lugar.
+"""
+
+# ------------------------------------------------------------------------
+# 🔧 AJUSTES 🔧
+
+MAX_ENTRIES = 512  # Entradas mantidas (as menos usadas saem primeiro)
+TTL_SECONDS = 60 * 60  # Tempo máximo de uma entrada no cache
+
+# ------------------------------------------------------------------------
+
+_active = threading.local()  # Ciclo ativo de cada thread (um bot por thread no main.py)
+
+
+def _digest(values):
+    # Hash de todos os valores, na ordem (tipos não numéricos passam antes pelo hash do pandas)
+    if isinstance(values, pd.Series) and not isinstance(values.dtype, np.dtype):
+        values = pd.util.hash_pandas_object(values, index=False)  # Ex: open_time com fuso horário
+    array = np.asarray(values)
+    if array.dtype.kind not in "biufcmM":
+        array = pd.util.hash_array(array.ravel())
+    return hashlib.blake2b(np.ascontiguousarray(array).view(np.uint8).ravel(), digest_size=16).digest()
+
+
+def _fingerprint(values):
+    # Identifica a entrada pelo conteúdo inteiro (~15 µs por coluna de 1000 candles), nunca pela identidade do objeto
+    if isinstance(values, pd.Series):
+        return values.name, str(values.dtype), len(values), _digest(values)
+    if isinstance(values, pd.DataFrame):
+        return tuple(values.columns), len(values), tuple(_fingerprint(column) for _, column in values.items())
+    if isinstance(values, np.ndarray):
+        return values.dtype.str, values.shape, _digest(values)
+    return values
+
+
+class IndicatorCache:
+    """
+    Cache LRU com validade (TTL) e contadores de acertos e cálculos.
+    """
+
+    def __init__(self, max_entries=MAX_ENTRIES, ttl_seconds=TTL_SECONDS):
+        """
+        :param max_entries: Quantidade máxima de entradas.
+        :param ttl_seconds: Segundos até uma entrada expirar (None = sem validade).
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # chave -> (momento do cálculo, valor)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _expired(self, stored_at, now):
+        return self.ttl_seconds is not None and now - stored_at > self.ttl_seconds
+
+    def get(self, key, compute):
+        """
+        Devolve o valor guardado na chave ou calcula (compute()) e guarda.
+
+        :param key: Chave (tupla hashable).
+        :param compute: Função sem argumentos que calcula o valor.
+        :return: Valor do indicador.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not self._expired(entry[0], now):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        value = compute()  # Fora do lock: outros bots não esperam o cálculo
+
+        with self._lock:
+            self._entries[key] = (now, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def purge(self):
+        """Remove as entradas expiradas."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, (stored_at, _) in self._entries.items() if self._expired(stored_at, now)]
+            for key in expired:
+                del self._entries[key]
+            self.evictions += len(expired)
+
+    def clear(self):
+        """Esvazia o cache e zera os contadores."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """
+        :return: Dicionário {hits, misses, evictions, entries, hit_rate}.
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+    @contextmanager
+    def cycle(self, symbol, interval, stock_data):
+        """
+        Ativa o cache na thread atual durante um ciclo do bot.
+
+        :param symbol: Símbolo negociado (ex: 'BTCUSDT').
+        :param interval: Intervalo dos candles (ex: '15m').
+        :param stock_data: Candles do ciclo; o open_time do último candle entra na chave.
+        """
+        if stock_data is None or len(stock_data) == 0:
+            open_time = None
+        elif "open_time" in stock_data.columns:
+            open_time = stock_data["open_time"].iloc[-1]
+        else:
+            open_time = stock_data.index[-1]
+
+        self.purge()
+        previous = getattr(_active, "scope", None)
+        _active.scope = (self, (symbol, interval, open_time))
+        try:
+            yield self
+        finally:
+            _active.scope = previous
+
+
+def cachedIndicator(indicator, params, inputs, compute):
+    """
+    Consulta o cache do ciclo ativo na thread (se houver) ou apenas calcula.
+
+    :param indicator: Nome do indicador.
+    :param params: Tupla com os parâmetros do cálculo.
+    :param inputs: Tupla com as séries/DataFrames lidos pelo cálculo.
+    :param compute: Função sem argumentos que calcula o indicador.
+    :return: Valor do indicador.
+    """
+    scope = getattr(_active, "scope", None)
+    if scope is None:
+        return compute()
+    cache, candle = scope
+    key = candle + (indicator, tuple(params), tuple(_fingerprint(values) for values in inputs))
+    return cache.get(key, compute)
+
+
+INDICATOR_CACHE = IndicatorCache()  # Cache compartilhado pelos bots (a chave separa símbolo e intervalo)
@@ -0,0 +1,180 @@
+import numpy as np
+import pandas as pd
+
+from .indicator_cache import cachedIndicator
+from .rolling_extrema import highLowChannels
+
+"""
+Grafo de dependências dos indicadores (DAG) com subexpressões compartilhadas.
+
+Cada nó é uma tupla canônica (operação, entradas, parâmetros), então o mesmo cálculo declarado por estratégias
+diferentes vira o mesmo nó: o True Range do Vortex, do ATR e do UT Bot, as EMAs de mesmo span do MACD e da
+estratégia v3, o diff/ganho/perda do RSI. O planejador (planNodes) junta as saídas pedidas, remove os nós repetidos
+e ordena as dependências; evaluateNodes calcula cada nó uma única vez por conjunto de candles.
+
+Durante um ciclo do bot (indicators/indicator_cache.py), cada nó também passa pelo cache do ciclo: estratégia
+principal, fallback e estratégias extras sobre o mesmo candle custam só a união dos nós distintos.
+
+As operações repetem exatamente as contas do pandas/NumPy usadas antes nos indicadores (mesmos resultados).
+"""
+
+
+def _ewmMean(x, span=None, alpha=None, min_periods=0):
+    return x.ewm(span=span, alpha=alpha, min_periods=min_periods, adjust=False).mean()
+
+
+# Operações disponíveis: nome -> função(valores das entradas..., **parâmetros)
+OPS = {
+    "diff": lambda x, periods=1: x.diff(periods),
+    "shift": lambda x, periods=1: x.shift(periods),
+    "gain": lambda x: x.where(x > 0, 0),  # Variação positiva (0 nas quedas e NaN)
+    "loss": lambda x: -x.where(x < 0, 0),  # Variação negativa em módulo
+    "clip": lambda x, lower=None, upper=None: x.clip(lower=lower, upper=upper),
+    "neg": lambda x: -x,
+    "abs": np.abs,
+    "sub": lambda a, b: a - b,
+    "div": lambda a, b: a / b,
+    "scale": lambda x, factor: factor * x,
+    "maximum": np.maximum,  # NaN se qualquer entrada for NaN
+    "row_max": lambda *values: pd.concat(values, axis=1).max(axis=1),  # Ignora NaN
+    "ewm_mean": _ewmMean,
+    "rolling_mean": lambda x, window, min_periods=None: x.rolling(window=window, min_periods=min_periods).mean(),
+    "rolling_sum": lambda x, window: x.rolling(window=window).sum(),
+    "channel": lambda high, low, window: highLowChannels(high, low, [window])[window],  # (máxima, mínima)
+    "item": lambda values, index: values[index],
+    "rsi": lambda avg_gain, avg_loss: 100 - (100 / (1 + avg_gain / avg_loss)),
+}
+
+
+# ------------------------------------------------------------------------
+# Declaração dos nós
+
+
+def node(op, *inputs, **params):
+    """
+    Declara um nó do grafo. Nós com a mesma operação, entradas e parâmetros são o mesmo nó.
+
+    :param op: Nome da operação (chave de OPS) ou 'column'.
+    :param inputs: Nós de entrada.
+    :param params: Parâmetros da operação.
+    :return: Chave do nó (tupla hashable).
+    """
+    if op != "column" and op not in OPS:
+        raise ValueError(f"Operação '{op}' não reconhecida no grafo de indicadores")
+    return (op, tuple(inputs), tuple(sorted(params.items())))
+
+
+def column(name):
+    """Nó de uma coluna dos candles (ex: 'close_price')."""
+    return node("column", name=name)
+
+
+def ema(source, span):
+    """Média exponencial ewm(span=span, adjust=False)."""
+    return node("ewm_mean", source, span=span)
+
+
+def sma(source, window, min_periods=None):
+    """Média móvel simples rolling(window, min_periods).mean()."""
+    return node("rolling_mean", source, window=window, min_periods=min_periods)
+
+
+def trueRangeParts(high, low, close):
+    """Termos do True Range: (máxima - mínima, |máxima - fechamento anterior|, |mínima - fechamento anterior|)."""
+    previous_close = node("shift", close)
+    return (
+        node("sub", high, low),
+        node("abs", node("sub", high, previous_close)),
+        node("abs", node("sub", low, previous_close)),
+    )
+
+
+def rsiNode(close, window):
+    """RSI de indicators/rsi.py: médias de Wilder (ewm alpha=1/window) dos ganhos e perdas."""
+    delta = node("diff", close)
+    avg_gain = node("ewm_mean", node("gain", delta), alpha=1 / window)
+    avg_loss = node("ewm_mean", node("loss", delta), alpha=1 / window)
+    return node("rsi", avg_gain, avg_loss)
+
+
+def macdNodes(close, fast_window=12, slow_window=26, signal_window=9):
+    """MACD de indicators/macd.py: (linha, sinal, histograma)."""
+    macd_line = node("sub", ema(close, fast_window), ema(close, slow_window))
+    signal_line = ema(macd_line, signal_window)
+    return macd_line, signal_line, node("sub", macd_line, signal_line)
+
+
+def vortexNodes(high, low, close, window=14):
+    """Vortex de indicators/vortex.py: (VI+, VI-)."""
+    high_low, high_close, low_close = trueRangeParts(high, low, close)
+    true_range = node("maximum", node("maximum", node("abs", high_low), high_close), low_close)
+    vm_plus = node("abs", node("sub", high, node("shift", low)))
+    vm_minus = node("abs", node("sub", low, node("shift", high)))
+    sum_tr = node("rolling_sum", true_range, window=window)
+    return (
+        node("div", node("rolling_sum", vm_plus, window=window), sum_tr),
+        node("div", node("rolling_sum", vm_minus, window=window), sum_tr),
+    )
+
+
+def atrNode(high, low, close, window=14):
+    """ATR de indicators/atr.py: média simples do True Range (maior termo, ignorando NaN)."""
+    return sma(node("row_max", *trueRangeParts(high, low, close)), window)
+
+
+# ------------------------------------------------------------------------
+# Planejamento e avaliação
+
+
+def planNodes(outputs):
+    """
+    Junta os nós pedidos (de uma ou várias estratégias) e suas dependências sem repetição.
+
+    :param outputs: Lista de nós (ou dicionário nome -> nó).
+    :return: Lista de nós distintos em ordem de cálculo (dependências antes).
+    """
+    keys = outputs.values() if isinstance(outputs, dict) else outputs
+    order = []
+    seen = set()
+
+    def visit(key):
+        if key in seen:
+            return
+        for dependency in key[1]:
+            visit(dependency)
+        seen.add(key)
+        order.append(key)
+
+    for key in keys:
+        visit(key)
+    return order
+
+
+def evaluateNodes(candles, outputs, memo=None):
+    """
+    Calcula os nós pedidos sobre os candles, cada nó distinto uma única vez.
+
+    :param candles: DataFrame (ou dicionário nome -> série) com as colunas lidas pelos nós 'column'.
+    :param outputs: Dicionário nome -> nó.
+    :param memo: Dicionário nó -> valor compartilhado entre chamadas sobre os mesmos candles (opcional).
+    :return: Dicionário nome -> valor (pd.Series ou tupla de séries).
+    """
+    memo = {} if memo is None else memo
+    sources = {}  # nó -> colunas de que ele depende (entram na chave do cache do ciclo)
+
+    for key in planNodes(outputs):
+        op, inputs, params = key
+        if op == "column":
+            name = params[0][1]
+            sources[key] = (name,)
+            memo.setdefault(key, candles[name])
+            continue
+
+        sources[key] = tuple(sorted({name for dependency in inputs for name in sources[dependency]}, key=str))
+        if key in memo:
+            continue
+        values = [memo[dependency] for dependency in inputs]
+        columns = tuple(memo[column(name)] for name in sources[key])  # Colunas já lidas (painéis copiam a cada leitura)
+        memo[key] = cachedIndicator("graph", (key,), columns, lambda: OPS[op](*values, **dict(params)))
+
+    return {name: memo[key] for name, key in outputs.items()}
@@ -0,0 +1,364 @@
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba está no requirements.txt; sem ele os kernels rodam como Python puro (mais lentos)
+    njit = None
+
+"""
+Kernels dos indicadores recursivos: máquinas de estado (PSAR, Supertrend, trailing stop do UT Bot), médias
+adaptativas/suavizadas (KAMA, VIDYA e a SMMA do Williams Alligator / Gator Oscillator), o máximo/mínimo
+adaptativo do Ehler Fisher Transform e as EMAs de vários períodos de uma vez (indicators/period_batch.py).
+
+Cada candle depende do estado do candle anterior, então não dá para vetorizar com pandas. Os kernels percorrem
+arrays crus guardando o estado em variáveis locais (nada de .loc/.iloc dentro do loop) e devolvem arrays NumPy.
+Com numba (requirements.txt) são compilados (njit): em 100k candles a SMMA fica ~50x mais rápida que o loop antigo
+do Alligator. Sem numba recebem listas Python, que têm o acesso item a item mais rápido, e o ganho cai (SMMA ~2x).
+
+Quem usa: Indicators (getPSAR, getSupertrend, getKAMA, getVIDYA, getWilliamsAlligator, getEhlerFisherTransform),
+os indicadores e as estratégias correspondentes em indicators/extras e strategies/extras, e strategies/ut_bot_alerts.py.
+"""
+
+NUMBA_AVAILABLE = njit is not None
+
+
+def _compile(function):
+    # Compila com numba quando disponível (cache em disco evita recompilar a cada execução)
+    return njit(cache=True)(function) if NUMBA_AVAILABLE else function
+
+
+def _kernelInput(values):
+    """Converte uma série/array para a entrada do kernel: array float64 contíguo (numba) ou lista Python."""
+    values = np.asarray(values, dtype=np.float64)
+    return np.ascontiguousarray(values) if NUMBA_AVAILABLE else values.tolist()
+
+
+@_compile
+def _psarLoop(high, low, close, af_start, af_increment, af_max):
+    n = len(close)
+    psar = np.full(n, np.nan)
+    trend = np.full(n, np.nan)  # 1 para tendência de alta, -1 para tendência de baixa
+    af = np.full(n, af_start)  # Fator de aceleração
+    ep = np.full(n, np.nan)  # Extreme point
+
+    if n < 2:
+        return psar, trend, af, ep
+
+    # Tendência inicial pela inclinação dos dois primeiros fechamentos
+    if close[1] > close[0]:
+        prev_trend = 1.0
+        prev_psar = low[0]  # PSAR inicial abaixo do primeiro low
+        prev_ep = high[1]  # Primeiro EP é o high atual
+    else:
+        prev_trend = -1.0
+        prev_psar = high[0]  # PSAR inicial acima do primeiro high
+        prev_ep = low[1]  # Primeiro EP é o low atual
+    prev_af = af_start
+    psar[1] = prev_psar
+    trend[1] = prev_trend
+    ep[1] = prev_ep
+
+    for i in range(2, n):
+        current_psar = prev_psar + prev_af * (prev_ep - prev_psar)
+
+        if prev_trend == 1:
+            # Limitar o PSAR pelos mínimos anteriores
+            current_psar = min(current_psar, low[i - 2], low[i - 1])
+
+            if current_psar > low[i]:  # Reversão para tendência de baixa
+                current_trend = -1.0
+                current_psar = max(high[i - 2], high[i - 1], high[i])
+                current_ep = low[i]
+                current_af = af_start
+            else:
+                current_trend = 1.0
+                if high[i] > prev_ep:  # Novo máximo
+                    current_ep = high[i]
+                    current_af = min(prev_af + af_increment, af_max)
+                else:
+                    current_ep = prev_ep
+                    current_af = prev_af
+        else:
+            # Limitar o PSAR pelos máximos anteriores
+            current_psar = max(current_psar, high[i - 2], high[i - 1])
+
+            if current_psar < high[i]:  # Reversão para tendência de alta
+                current_trend = 1.0
+                current_psar = min(low[i - 2], low[i - 1], low[i])
+                current_ep = high[i]
+                current_af = af_start
+            else:
+                current_trend = -1.0
+                if low[i] < prev_ep:  # Novo mínimo
+                    current_ep = low[i]
+                    current_af = min(prev_af + af_increment, af_max)
+                else:
+                    current_ep = prev_ep
+                    current_af = prev_af
+
+        psar[i] = current_psar
+        trend[i] = current_trend
+        af[i] = current_af
+        ep[i] = current_ep
+        prev_psar, prev_trend, prev_af, prev_ep = current_psar, current_trend, current_af, current_ep
+
+    return psar, trend, af, ep
+
+
+@_compile
+def _supertrendLoop(close, upperband, lowerband):
+    n = len(close)
+    supertrend = np.zeros(n)
+    direction = np.zeros(n)  # 1 para tendência de alta, -1 para tendência de baixa
+
+    current_supertrend = 0.0
+    current_direction = 0.0
+    for i in range(1, n):
+        if close[i] > upperband[i - 1]:
+            current_supertrend = lowerband[i]
+            current_direction = 1.0
+        elif close[i] < lowerband[i - 1]:
+            current_supertrend = upperband[i]
+            current_direction = -1.0
+        elif current_direction == 1 and lowerband[i] < current_supertrend:
+            current_supertrend = lowerband[i]
+        elif current_direction == -1 and upperband[i] > current_supertrend:
+            current_supertrend = upperband[i]
+
+        supertrend[i] = current_supertrend
+        direction[i] = current_direction
+
+    return supertrend, direction
+
+
+@_compile
+def _utBotLoop(close, atr, atr_multiplier):
+    n = len(close)
+    trailing_stop = np.zeros(n)
+    pos = np.zeros(n)
+
+    prev_stop = 0.0
+    prev_pos = 0.0
+    for i in range(1, n):
+        # Trailing stop dinâmico
+        if close[i] > prev_stop and close[i - 1] > prev_stop:
+            current_stop = max(prev_stop, close[i] - atr_multiplier * atr[i])
+        elif close[i] < prev_stop and close[i - 1] < prev_stop:
+            current_stop = min(prev_stop, close[i] + atr_multiplier * atr[i])
+        elif close[i] > prev_stop:
+            current_stop = close[i] - atr_multiplier * atr[i]
+        else:
+            current_stop = close[i] + atr_multiplier * atr[i]
+
+        # Cruzamento do preço com o trailing stop
+        if close[i - 1] < prev_stop and close[i] > current_stop:
+            current_pos = 1.0  # Compra
+        elif close[i - 1] > prev_stop and close[i] < current_stop:
+            current_pos = -1.0  # Venda
+        else:
+            current_pos = prev_pos  # Mantém a posição anterior
+
+        trailing_stop[i] = current_stop
+        pos[i] = current_pos
+        prev_stop, prev_pos = current_stop, current_pos
+
+    return trailing_stop, pos
+
+
+@_compile
+def _adaptiveAverageLoop(values, alpha, start, reseed_nan):
+    n = len(values)
+    average = np.full(n, np.nan)
+    if start >= n:
+        return average
+
+    prev = values[start]
+    average[start] = prev
+    for i in range(start + 1, n):
+        if reseed_nan and math.isnan(prev):
+            prev = values[i]  # Recomeça do preço atual enquanto a média estiver indefinida
+        else:
+            prev = prev + alpha[i] * (values[i] - prev)
+        average[i] = prev
+
+    return average
+
+
+@_compile
+def _ehlerRangeLoop(values, alpha):
+    n = len(values)
+    max_h = np.full(n, np.nan)
+    min_l = np.full(n, np.nan)
+    if n == 0:
+        return max_h, min_l
+
+    current_max = values[0]
+    current_min = values[0]
+    max_h[0] = current_max
+    min_l[0] = current_min
+    for i in range(1, n):
+        # Novo máximo/mínimo substitui; senão o extremo anterior decai em direção ao preço atual
+        if values[i] > current_max:
+            current_max = values[i]
+        else:
+            current_max = current_max - alpha * (current_max - values[i])
+        if values[i] < current_min:
+            current_min = values[i]
+        else:
+            current_min = current_min + alpha * (values[i] - current_min)
+        max_h[i] = current_max
+        min_l[i] = current_min
+
+    return max_h, min_l
+
+
+@_compile
+def _smmaLoop(values, period, seed):
+    n = len(values)
+    smma = np.full(n, np.nan)
+    if period < 1 or n < period:
+        return smma
+
+    prev = seed
+    smma[period - 1] = prev
+    for i in range(period, n):
+        prev = (prev * (period - 1) + values[i]) / period
+        smma[i] = prev
+
+    return smma
+
+
+@_compile
+def _ewmBatchLoop(values, alphas, minimum_periods):
+    # Uma linha por período; repete a conta do ewm(adjust=False).mean() do pandas (inclusive com NaN)
+    k = len(values)
+    n = len(values[0]) if k else 0
+    result = np.full((k, n), np.nan)
+
+    for j in range(k):
+        row = values[j]
+        new_wt = alphas[j]
+        old_wt_factor = 1.0 - new_wt
+        old_wt = 1.0
+        weighted = row[0] if n else np.nan
+        nobs = 0 if math.isnan(weighted) else 1
+        if n and nobs >= minimum_periods:
+            result[j, 0] = weighted
+        for i in range(1, n):
+            cur = row[i]
+            is_observation = not math.isnan(cur)
+            if is_observation:
+                nobs += 1
+            if not math.isnan(weighted):
+                old_wt *= old_wt_factor
+                if is_observation:
+                    if weighted != cur:
+                        weighted = ((old_wt * weighted) + (new_wt * cur)) / (old_wt + new_wt)
+                    old_wt = 1.0
+            elif is_observation:
+                weighted = cur
+            if nobs >= minimum_periods:
+                result[j, i] = weighted
+
+    return result
+
+
+def psarKernel(high, low, close, af_start=0.02, af_increment=0.02, af_max=0.2):
+    """
+    Parabolic SAR candle a candle.
+
+    :param high: Array/série com as máximas.
+    :param low: Array/série com as mínimas.
+    :param close: Array/série com os fechamentos.
+    :param af_start: Fator de aceleração inicial.
+    :param af_increment: Incremento do fator de aceleração.
+    :param af_max: Fator de aceleração máximo.
+    :return: Arrays (psar, trend, af, ep). O primeiro candle fica NaN (trend 1 = alta, -1 = baixa).
+    """
+    return _psarLoop(
+        _kernelInput(high), _kernelInput(low), _kernelInput(close), float(af_start), float(af_increment), float(af_max)
+    )
+
+
+def supertrendKernel(close, upperband, lowerband):
+    """
+    Supertrend a partir das bandas básicas (hl2 ± multiplicador * ATR).
+
+    :param close: Array/série com os fechamentos.
+    :param upperband: Array/série com a banda superior básica.
+    :param lowerband: Array/série com a banda inferior básica.
+    :return: Arrays (supertrend, direction), com direction 1 = alta, -1 = baixa e 0 antes da primeira definição.
+    """
+    return _supertrendLoop(_kernelInput(close), _kernelInput(upperband), _kernelInput(lowerband))
+
+
+def utBotKernel(close, atr, atr_multiplier):
+    """
+    Trailing stop dinâmico do UT Bot e posição (1 = compra, -1 = venda) de cada candle.
+
+    :param close: Array/série com os fechamentos.
+    :param atr: Array/série com o ATR de cada candle.
+    :param atr_multiplier: Multiplicador para o cálculo do Trailing Stop.
+    :return: Arrays (trailing_stop, pos).
+    """
+    return _utBotLoop(_kernelInput(close), _kernelInput(atr), float(atr_multiplier))
+
+
+def adaptiveAverageKernel(values, alpha, start=None, reseed_nan=False):
+    """
+    Média recursiva com alpha variável: media[i] = media[i-1] + alpha[i] * (valor[i] - media[i-1]).
+    Base do KAMA (alpha = constante suavizada pelo Efficiency Ratio) e do VIDYA (alpha = sc * |CMO| / 100).
+
+    :param values: Array/série com os preços.
+    :param alpha: Array/série com o fator de suavização de cada candle.
+    :param start: Posição da semente (media[start] = valor[start]). None = primeiro alpha válido (não NaN).
+    :param reseed_nan: Se True, recomeça do preço atual sempre que a média anterior for NaN.
+    :return: Array com a média (NaN antes da semente).
+    """
+    alpha = np.asarray(alpha, dtype=np.float64)
+    if start is None:
+        valid = ~np.isnan(alpha)
+        start = int(np.argmax(valid)) if valid.any() else len(alpha)
+    return _adaptiveAverageLoop(_kernelInput(values), _kernelInput(alpha), int(start), bool(reseed_nan))
+
+
+def smmaKernel(values, period):
+    """
+    SMMA (Smoothed Moving Average) do Williams Alligator: semente na média dos primeiros 'period' valores e depois
+    smma[i] = (smma[i-1] * (period - 1) + valor[i]) / period.
+
+    :param values: Array/série com os preços.
+    :param period: Período da SMMA.
+    :return: Array com a SMMA (NaN antes de completar o primeiro período, ou em tudo se faltar dado).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    period = int(period)
+    seed = float(np.mean(values[:period])) if 1 <= period <= len(values) else np.nan
+    return _smmaLoop(_kernelInput(values), period, seed)
+
+
+def ehlerRangeKernel(values, period):
+    """
+    Máximo e mínimo adaptativos do Ehler Fisher Transform: um novo extremo substitui o anterior; caso contrário o
+    extremo decai em direção ao preço com alpha = 2 / (period + 1).
+
+    :param values: Array/série com os preços (ponto médio high/low).
+    :param period: Período do Ehler Fisher Transform.
+    :return: Arrays (max_h, min_l), começando no primeiro preço.
+    """
+    return _ehlerRangeLoop(_kernelInput(values), 2.0 / (period + 1.0))
+
+
+def ewmBatchKernel(values, alphas, min_periods=0):
+    """
+    ewm(alpha=alphas[j], adjust=False).mean() de cada linha de 'values' em uma única chamada.
+
+    :param values: Array 2-D (período x tempo) com a série de cada período.
+    :param alphas: Fator de suavização de cada linha (1 / (1 + com), como o pandas calcula).
+    :param min_periods: Observações mínimas para haver valor (como no pandas, no mínimo 1).
+    :return: Array 2-D (período x tempo) com as médias.
+    """
+    values = np.asarray(values, dtype=np.float64).reshape(len(alphas), -1)
+    return _ewmBatchLoop(_kernelInput(values), _kernelInput(alphas), max(int(min_periods), 1))
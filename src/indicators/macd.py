@@ -1,8 +1,10 @@
 # indicators/macd.py
+from .indicator_graph import column, evaluateNodes, macdNodes
+
+
 def macd(series, fast_window, slow_window, signal_window):
-    fast_ema = series.ewm(span=fast_window, adjust=False).mean()
-    slow_ema = series.ewm(span=slow_window, adjust=False).mean()
-    macd_line = fast_ema - slow_ema
-    signal_line = macd_line.ewm(span=signal_window, adjust=False).mean()
-    histogram = macd_line - signal_line
-    return macd_line, signal_line, histogram
+    # EMAs rápida e lenta, linha de sinal e histograma calculados no grafo de indicadores (EMAs compartilhadas)
+    name = series.name if isinstance(series.name, str) else "source"
+    lines = dict(zip(("macd", "signal", "histogram"), macdNodes(column(name), fast_window, slow_window, signal_window)))
+    values = evaluateNodes({name: series}, lines)
+    return values["macd"], values["signal"], values["histogram"]
@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+
+"""
+Visão OHLCV com os dois esquemas de nomes de colunas sobre os mesmos arrays.
+
+getStockData e o CandleStore produzem open_price/high_price/low_price/close_price, enquanto indicators/t3.py,
+indicators/atr.py e a maior parte de indicators/extras e strategies/extras leem open/high/low/close. ohlcvView monta
+um DataFrame com os dois nomes apontando para o mesmo array NumPy de cada coluna (nada é copiado) e nomes em
+minúsculas, então qualquer indicador ou estratégia lê o nome que espera sem cópia nem renomeação a cada chamada.
+
+O DataFrame devolvido é um objeto novo: colunas criadas ou substituídas por uma estratégia (stock_data['x'] = ...)
+não aparecem nos candles originais. Escritas no lugar (.loc/.iloc/fillna(inplace=True)) alterariam os arrays
+compartilhados; com read_only=True os arrays vêm marcados como somente leitura e essas escritas levantam ValueError.
+É o contrato das estratégias (modules/StrategyRunner.py e tests/backtestRunner.py): recebem os candles somente
+leitura e devolvem valores derivados, sem copiar nem alterar a entrada (conferido por benchmarks/strategy_contract_check.py).
+"""
+
+# Nome curto -> nome do getStockData
+COLUMN_ALIASES = {
+    "open": "open_price",
+    "high": "high_price",
+    "low": "low_price",
+    "close": "close_price",
+}
+
+
+def hasBothSchemes(data):
+    """
+    Indica se cada coluna de preço presente nos candles já existe com os dois nomes (ex: saída de ohlcvView).
+
+    :param data: DataFrame de candles.
+    """
+    columns = data.columns
+    return all((short in columns) == (long in columns) for short, long in COLUMN_ALIASES.items())
+
+
+def isReadOnly(data):
+    """
+    Indica se nenhuma coluna NumPy dos candles pode ser alterada no lugar (ex: saída de ohlcvView(read_only=True)).
+
+    :param data: DataFrame de candles.
+    """
+    return all(not values.to_numpy().flags.writeable for _, values in data.items() if isinstance(values.dtype, np.dtype))
+
+
+def _frozen(values):
+    # Visão somente leitura do array da coluna (os candles originais continuam graváveis)
+    array = values.to_numpy().view()
+    array.flags.writeable = False
+    return array
+
+
+def ohlcvView(data: pd.DataFrame, read_only=False):
+    """
+    Candles com as colunas de preço nos dois esquemas (open/open_price, high/high_price, ...), sem copiar os dados.
+
+    Para candles que já são uma visão (ou já têm os dois nomes) devolve apenas uma cópia rasa (copy(deep=False)),
+    de forma que montar a visão uma vez por ciclo e chamá-la em cada estratégia custa só a criação do objeto.
+
+    :param data: DataFrame de candles em qualquer um dos esquemas (ou com nomes em maiúsculas, ex: 'Close').
+    :param read_only: True = colunas NumPy somente leitura (escritas no lugar levantam ValueError).
+    :return: pd.DataFrame com as mesmas linhas e índice, colunas em minúsculas e os apelidos das colunas de preço.
+    """
+    if data.columns.nlevels > 1:
+        return data.copy(deep=False)  # Painéis (campo x símbolo) seguem com os nomes originais
+    complete = hasBothSchemes(data) and all(not isinstance(name, str) or name == name.lower() for name in data.columns)
+    if complete and (not read_only or isReadOnly(data)):
+        return data.copy(deep=False)
+
+    columns = {}
+    for name in data.columns:
+        label = name.lower() if isinstance(name, str) else name
+        columns.setdefault(label, data[name])  # Em nomes repetidos após o lower(), vale a primeira coluna
+    for short, long in COLUMN_ALIASES.items():
+        if short in columns and long not in columns:
+            columns[long] = columns[short]
+        elif long in columns and short not in columns:
+            columns[short] = columns[long]
+
+    if read_only:
+        frozen = {}  # Apelidos recebem o mesmo array
+        for label, values in columns.items():
+            if isinstance(values.dtype, np.dtype):
+                if id(values) not in frozen:
+                    frozen[id(values)] = _frozen(values)
+                columns[label] = frozen[id(values)]
+
+    return pd.DataFrame(columns, index=data.index, copy=False)
@@ -0,0 +1,170 @@
+import numpy as np
+import pandas as pd
+
+from .kernels import NUMBA_AVAILABLE, ewmBatchKernel
+
+"""
+Indicadores de vários períodos em uma chamada, para varreduras de parâmetros (tests/parameterSweep.py).
+
+Cada função recebe a série de preços e uma lista de períodos e devolve um array 2-D (tempo x período), uma coluna
+por período na ordem pedida. Períodos repetidos são calculados uma única vez. As estratégias com versão em lote
+(atributo `signal_batch`, ver strategies/signal_series.py) montam os sinais de todas as combinações comparando
+colunas dessas matrizes, em vez de recalcular os indicadores combinação a combinação.
+
+As EMAs (e a T3 e o RSI, que são EMAs encadeadas) usam o kernel ewmBatchKernel de indicators/kernels.py: com numba,
+todos os períodos saem de uma única passada compilada; sem numba, cada período distinto usa o ewm do pandas. Médias
+e desvios móveis usam o rolling do pandas por janela distinta. Nos dois casos os valores são exatamente os das versões
+de um período (ewm(adjust=False), rolling().mean()/.std(), indicators/t3.py e indicators/rsi.py).
+"""
+
+
+def _distinct(periods):
+    # Períodos distintos na ordem em que aparecem e a coluna de cada período pedido
+    unique = list(dict.fromkeys(periods))
+    return unique, [unique.index(period) for period in periods]
+
+
+def _ewmColumns(values, coms, min_periods=0):
+    """ewm(com=coms[j], adjust=False).mean() de cada coluna de 'values' (tempo x período)."""
+    if values.shape[1] == 0:
+        return values.copy()
+    if NUMBA_AVAILABLE:
+        alphas = np.array([1.0 / (1.0 + com) for com in coms])
+        return ewmBatchKernel(values.T, alphas, min_periods).T
+    # Sem numba: um ewm do pandas por período distinto, sobre todas as colunas desse período
+    result = np.empty(values.shape)
+    for com in dict.fromkeys(coms):
+        columns = [j for j, column_com in enumerate(coms) if column_com == com]
+        frame = pd.DataFrame(values[:, columns])
+        result[:, columns] = frame.ewm(com=com, min_periods=min_periods, adjust=False).mean().to_numpy()
+    return result
+
+
+def _spanComs(spans):
+    return [(span - 1) / 2 for span in spans]  # Centro de massa do span, como no pandas
+
+
+def _emaColumns(values, coms, min_periods=0):
+    # Mesma série repetida em uma coluna por período distinto
+    unique, columns = _distinct(coms)
+    prices = np.asarray(values, dtype=np.float64)
+    averages = _ewmColumns(np.repeat(prices[:, None], len(unique), axis=1), unique, min_periods)
+    return averages[:, columns]
+
+
+def emaBatch(values, spans, min_periods=0):
+    """
+    EMAs ewm(span=span, adjust=False).mean() de vários spans.
+
+    :param values: Série/array com os preços.
+    :param spans: Lista de spans (ex: [7, 20, 40]).
+    :param min_periods: Observações mínimas para haver valor.
+    :return: Array 2-D (tempo x span).
+    """
+    return _emaColumns(values, _spanComs(spans), min_periods)
+
+
+def wilderBatch(values, windows, min_periods=0):
+    """
+    Médias de Wilder ewm(alpha=1/janela, adjust=False).mean() de várias janelas (base do RSI).
+
+    :param values: Série/array com os valores.
+    :param windows: Lista de janelas.
+    :param min_periods: Observações mínimas para haver valor.
+    :return: Array 2-D (tempo x janela).
+    """
+    alphas = [1 / window for window in windows]
+    return _emaColumns(values, [(1 - alpha) / alpha for alpha in alphas], min_periods)
+
+
+def smaBatch(values, windows, min_periods=None):
+    """
+    Médias móveis simples rolling(window, min_periods).mean() de várias janelas.
+
+    :param values: Série/array com os preços.
+    :param windows: Lista de janelas.
+    :param min_periods: Observações mínimas para haver valor (None = a própria janela).
+    :return: Array 2-D (tempo x janela).
+    """
+    prices = pd.Series(np.asarray(values, dtype=np.float64))
+    unique, columns = _distinct(list(windows))
+    averages = [prices.rolling(window=window, min_periods=min_periods).mean().to_numpy() for window in unique]
+    return np.column_stack(averages)[:, columns] if unique else np.empty((len(prices), 0))
+
+
+def rollingStdBatch(values, windows):
+    """
+    Desvios padrão amostrais móveis rolling(window).std() de várias janelas.
+
+    :param values: Série/array com os preços.
+    :param windows: Lista de janelas.
+    :return: Array 2-D (tempo x janela).
+    """
+    prices = pd.Series(np.asarray(values, dtype=np.float64))
+    unique, columns = _distinct(list(windows))
+    deviations = [prices.rolling(window=window).std().to_numpy() for window in unique]
+    return np.column_stack(deviations)[:, columns] if unique else np.empty((len(prices), 0))
+
+
+def _t3Columns(values, coms, volume_factor):
+    # Seis EMAs encadeadas sobre cada coluna (tempo x coluna), cada coluna com o seu centro de massa
+    emas = [values]
+    for _ in range(6):
+        emas.append(_ewmColumns(emas[-1], coms))
+    e3, e4, e5, e6 = emas[3:]
+
+    c1 = -volume_factor * volume_factor * volume_factor
+    return (
+        c1 * e6
+        + 3 * volume_factor * c1 * e5
+        + 3 * volume_factor * volume_factor * c1 * e4
+        + volume_factor * volume_factor * volume_factor * e3
+    )
+
+
+def t3Batch(values, periods, volume_factor=0.7):
+    """
+    T3 Moving Average (Tillson) de vários períodos com o mesmo fator de volume, como t3MovingAverage.
+
+    :param values: Série/array com os preços.
+    :param periods: Lista de períodos.
+    :param volume_factor: Fator de volume (0-1).
+    :return: Array 2-D (tempo x período).
+    """
+    unique, columns = _distinct(list(periods))
+    prices = np.asarray(values, dtype=np.float64)
+    t3 = _t3Columns(np.repeat(prices[:, None], len(unique), axis=1), _spanComs(unique), volume_factor)
+    return t3[:, columns]
+
+
+def t3Panel(prices: pd.DataFrame, period, volume_factor=0.7):
+    """
+    T3 Moving Average de cada coluna de um painel (tempo x símbolo) com o mesmo período: com numba, as EMAs de
+    todos os símbolos saem de uma única passada do kernel.
+
+    :param prices: DataFrame com os preços de cada símbolo.
+    :param period: Período da T3.
+    :param volume_factor: Fator de volume (0-1).
+    :return: DataFrame com o mesmo índice e colunas de prices.
+    """
+    values = prices.to_numpy(dtype=np.float64)
+    t3 = _t3Columns(values, _spanComs([period]) * values.shape[1], volume_factor)
+    return pd.DataFrame(t3, index=prices.index, columns=prices.columns)
+
+
+def rsiBatch(values, windows):
+    """
+    RSI de várias janelas, como indicators/rsi.py (médias de Wilder ewm(alpha=1/janela) dos ganhos e perdas).
+
+    :param values: Série/array com os fechamentos.
+    :param windows: Lista de janelas.
+    :return: Array 2-D (tempo x janela).
+    """
+    delta = pd.Series(np.asarray(values, dtype=np.float64)).diff()
+    gain = delta.where(delta > 0, 0).to_numpy()
+    loss = (-delta.where(delta < 0, 0)).to_numpy()
+
+    avg_gain = wilderBatch(gain, windows)
+    avg_loss = wilderBatch(loss, windows)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 100 - (100 / (1 + avg_gain / avg_loss))
@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+
+"""
+Níveis de Pivot Points (standard, fibonacci, woodie, camarilla e demark) calculados com arrays, sem loop por candle.
+
+Por padrão os níveis de cada candle vêm do candle anterior (comportamento original de Indicators.getPivotPoints).
+Com sessões (ex: pivots diários em candles de 15 minutos), a máxima, a mínima, a abertura e o fechamento de cada
+sessão são agregados uma única vez, os níveis são calculados uma vez por sessão a partir da sessão anterior e depois
+repetidos em todos os candles da sessão.
+"""
+
+PIVOT_TYPES = ("standard", "fibonacci", "woodie", "camarilla", "demark")
+
+PIVOT_COLUMNS = ["pivot", "s1", "s2", "s3", "r1", "r2", "r3"]
+
+
+def sessionKeys(times, session="D"):
+    """
+    Rótulo da sessão de cada candle (ex: o dia do open_time), no horário local do próprio open_time.
+
+    :param times: Série/índice com os horários de abertura dos candles (open_time).
+    :param session: Frequência da sessão no formato do pandas ('D' = diária, 'W' = semanal, 'M' = mensal).
+    :return: Array com um rótulo (pd.Period) por candle.
+    """
+    times = pd.Series(pd.DatetimeIndex(times))
+    if times.dt.tz is not None:
+        times = times.dt.tz_localize(None)  # Mantém o horário local (a sessão vira no dia do fuso do open_time)
+    return times.dt.to_period(session).to_numpy()
+
+
+def _levels(pivot_type, prev_high, prev_low, prev_close, prev_open):
+    """Níveis de pivot a partir dos preços de referência (candle ou sessão anterior), na ordem de PIVOT_COLUMNS."""
+    nan = np.full(len(prev_close), np.nan)
+    range_hl = prev_high - prev_low
+
+    if pivot_type == "standard":
+        # Pivot Point (PP) = (High + Low + Close) / 3
+        pivot = (prev_high + prev_low + prev_close) / 3
+        r1 = 2 * pivot - prev_low
+        s1 = 2 * pivot - prev_high
+        r2 = pivot + range_hl
+        s2 = pivot - range_hl
+        r3 = r1 + range_hl
+        s3 = s1 - range_hl
+
+    elif pivot_type == "fibonacci":
+        pivot = (prev_high + prev_low + prev_close) / 3
+        r1, r2, r3 = (pivot + level * range_hl for level in (0.382, 0.618, 1.000))
+        s1, s2, s3 = (pivot - level * range_hl for level in (0.382, 0.618, 1.000))
+
+    elif pivot_type == "woodie":
+        # Woodie dá mais peso ao preço de fechamento
+        pivot = (prev_high + prev_low + 2 * prev_close) / 4
+        r1 = 2 * pivot - prev_low
+        s1 = 2 * pivot - prev_high
+        r2 = pivot + range_hl
+        s2 = pivot - range_hl
+        r3 = pivot + 2 * range_hl
+        s3 = pivot - 2 * range_hl
+
+    elif pivot_type == "camarilla":
+        pivot = (prev_high + prev_low + prev_close) / 3
+        r1, r2, r3 = (prev_close + range_hl * 1.1 / divisor for divisor in (12, 6, 4))
+        s1, s2, s3 = (prev_close - range_hl * 1.1 / divisor for divisor in (12, 6, 4))
+
+    elif pivot_type == "demark":
+        if prev_open is None:
+            raise ValueError("O método DeMark requer a coluna 'open'")
+        # X depende da relação entre fechamento e abertura (empate ou NaN = fechamento com peso 2)
+        x = np.where(
+            prev_close > prev_open,
+            prev_high * 2 + prev_low + prev_close,
+            np.where(prev_close < prev_open, prev_high + prev_low * 2 + prev_close, prev_high + prev_low + prev_close * 2),
+        )
+        pivot = x / 4
+        r1 = x / 2 - prev_low
+        s1 = x / 2 - prev_high
+        # R2, R3, S2, S3 não são definidos no método DeMark original
+        r2, r3, s2, s3 = nan, nan.copy(), nan.copy(), nan.copy()
+
+    else:
+        raise ValueError(f"Tipo de Pivot Point '{pivot_type}' não reconhecido. Use um entre: {', '.join(PIVOT_TYPES)}.")
+
+    return pivot, s1, s2, s3, r1, r2, r3
+
+
+def pivotLevels(high, low, close, open_prices=None, pivot_type="standard", sessions=None):
+    """
+    Níveis de Pivot Points de cada candle.
+
+    :param high: Série/array com as máximas.
+    :param low: Série/array com as mínimas.
+    :param close: Série/array com os fechamentos.
+    :param open_prices: Série/array com as aberturas (obrigatório só para 'demark').
+    :param pivot_type: Um de PIVOT_TYPES.
+    :param sessions: None = níveis do candle anterior. Array com o rótulo da sessão de cada candle (ver sessionKeys)
+                     = níveis da sessão anterior, calculados uma vez por sessão (candles da primeira sessão ficam NaN).
+    :return: DataFrame com as colunas de PIVOT_COLUMNS (índice de close, se for pd.Series).
+    """
+    pivot_type = pivot_type.lower()
+    index = close.index if isinstance(close, pd.Series) else None
+    prices = {
+        "high": np.asarray(high, dtype=np.float64),
+        "low": np.asarray(low, dtype=np.float64),
+        "close": np.asarray(close, dtype=np.float64),
+    }
+    if open_prices is not None:
+        prices["open"] = np.asarray(open_prices, dtype=np.float64)
+
+    if sessions is None:
+        reference = {name: np.concatenate([[np.nan], values[:-1]]) if len(values) else values for name, values in prices.items()}
+        positions = None
+    else:
+        # Uma linha por sessão (sessões = trechos consecutivos com o mesmo rótulo)
+        keys = np.asarray(sessions)
+        session_id = np.concatenate([[0], np.cumsum(keys[1:] != keys[:-1])]) if len(keys) else np.zeros(0, dtype=np.int64)
+        aggregations = {"high": "max", "low": "min", "close": "last", "open": "first"}
+        grouped = pd.DataFrame(prices).groupby(session_id, sort=False)
+        per_session = {name: grouped[name].agg(aggregations[name]).to_numpy() for name in prices}
+        reference = {name: np.concatenate([[np.nan], values[:-1]]) for name, values in per_session.items()}
+        positions = session_id
+
+    levels = _levels(pivot_type, reference["high"], reference["low"], reference["close"], reference.get("open"))
+    if positions is not None:
+        levels = [values[positions] for values in levels]  # Repete os níveis da sessão em todos os seus candles
+    return pd.DataFrame(dict(zip(PIVOT_COLUMNS, levels)), index=index, columns=PIVOT_COLUMNS)
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+"""
+Fractals de Bill Williams e OBV (On Balance Volume) calculados com arrays, sem loop por candle.
+
+- Fractals: o candle central é comparado com a máxima/mínima dos 'window' candles de cada lado, montada com
+  comparações de arrays deslocados (um np.fmax/np.fmin por deslocamento).
+- OBV: soma acumulada do volume com o sinal da variação do fechamento (+ alta, - baixa, 0 sem variação).
+"""
+
+
+def fractalPoints(high, low, window=2, skipna=True):
+    """
+    Marca os fractais de alta (máxima maior que as 'window' máximas de cada lado) e de baixa (mínima menor que as
+    'window' mínimas de cada lado). Os primeiros e últimos 'window' candles nunca são fractais.
+
+    :param high: Série/array com as máximas.
+    :param low: Série/array com as mínimas.
+    :param window: Candles de cada lado do centro (janela de 2 * window + 1).
+    :param skipna: True = vizinhos NaN são ignorados (como Series.max()); False = qualquer vizinho NaN descarta o fractal.
+    :return: Arrays booleanos (fractal_up, fractal_down).
+    """
+    if window < 1:
+        raise ValueError("A janela do fractal precisa ter pelo menos 1 candle de cada lado")
+
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    n = len(high)
+    fractal_up = np.zeros(n, dtype=bool)
+    fractal_down = np.zeros(n, dtype=bool)
+    if n < 2 * window + 1:
+        return fractal_up, fractal_down
+
+    maximum, minimum = (np.fmax, np.fmin) if skipna else (np.maximum, np.minimum)
+    centers = slice(window, n - window)
+
+    def neighbours(values, reduce):
+        # Extremo de cada lado do centro; NaN no resultado faz a comparação dar False
+        left = right = None
+        for shift in range(1, window + 1):
+            before = values[window - shift : n - window - shift]
+            after = values[window + shift : n - window + shift]
+            left = before if left is None else reduce(left, before)
+            right = after if right is None else reduce(right, after)
+        return left, right
+
+    left, right = neighbours(high, maximum)
+    fractal_up[centers] = (high[centers] > left) & (high[centers] > right)
+    left, right = neighbours(low, minimum)
+    fractal_down[centers] = (low[centers] < left) & (low[centers] < right)
+    return fractal_up, fractal_down
+
+
+def onBalanceVolume(close, volume):
+    """
+    OBV: começa no volume do primeiro candle e soma (alta) ou subtrai (baixa) o volume de cada candle seguinte.
+    Fechamento sem variação (ou NaN) mantém o OBV anterior.
+
+    :param close: Série/array com os fechamentos.
+    :param volume: Série/array com os volumes.
+    :return: pd.Series (índice de close) ou array com o OBV.
+    """
+    prices = np.asarray(close, dtype=np.float64)
+    volumes = np.asarray(volume, dtype=np.float64)
+    direction = np.sign(np.diff(prices))  # NaN quando um dos fechamentos é NaN
+    # Volume com sinal; candles sem variação não entram na soma (nem o volume NaN deles)
+    steps = np.where((direction > 0) | (direction < 0), direction * volumes[1:], 0.0)
+    result = np.cumsum(np.concatenate([volumes[:1], steps]))
+    if isinstance(close, pd.Series):
+        return pd.Series(result, index=close.index)
+    return result
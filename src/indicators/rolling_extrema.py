@@ -0,0 +1,130 @@
+import numpy as np
+import pandas as pd
+
+"""
+Máximas/mínimas móveis e quantos candles atrás cada uma ocorreu (base do Aroon, Donchian, Price Channels, Ichimoku,
+Williams %R, KDJ e do estocástico da estratégia v3).
+
+O cálculo é vetorizado em NumPy: o extremo de blocos de 1, 2, 4, ... candles sai do extremo de dois blocos da metade
+do tamanho, e cada janela é coberta por dois blocos (sobrepostos) do maior tamanho que cabe nela. Os blocos são
+calculados uma única vez para a maior janela pedida, então várias janelas (ex: 9/26/52 do Ichimoku) saem da mesma
+passada. Em empates vale o candle mais antigo, igual ao np.argmax/np.argmin do rolling(...).apply.
+
+Janelas incompletas ou com NaN saem como NaN, igual ao rolling(window).max()/min() do pandas.
+A versão candle a candle (deque monotônica) fica em indicators/streaming.py (StreamingRollingExtreme).
+"""
+
+EXTREMA_COLUMNS = ["extreme", "bars_since"]
+
+
+def _windowExtremes(values, windows, track_position=True):
+    """
+    Máxima e posição da máxima (mais antiga em empates) de cada janela completa.
+
+    :param values: Array float64 sem NaN (NaN já trocado por -inf).
+    :param windows: Conjunto de tamanhos de janela (>= 1).
+    :param track_position: Se False, calcula só as máximas (posições saem como None).
+    :return: Dicionário {window: (máximas, posições)} com len(values) - window + 1 elementos por janela.
+    """
+    n = len(values)
+    spans = {window: 1 << (window.bit_length() - 1) for window in windows if window <= n}  # Maior potência de 2 <= window
+    levels = {}
+    value, position, span = values, np.arange(n) if track_position else None, 1
+    while True:
+        if span in spans.values():
+            levels[span] = (value, position)
+        if span * 2 > max(spans.values(), default=0):
+            break
+        # Bloco de 2·span candles = o melhor entre o bloco que começa em i e o que começa em i + span
+        value, position = _best(value, position, slice(0, len(value) - span), slice(span, len(value)))
+        span *= 2
+
+    result = {}
+    for window, span in spans.items():
+        value, position = levels[span]
+        # Janela [i, i + window - 1] = bloco que começa em i + bloco que termina no último candle da janela
+        result[window] = _best(value, position, slice(0, n - window + 1), slice(window - span, n - span + 1))
+    return result
+
+
+def _best(value, position, first, second):
+    # Extremo entre dois blocos; em empate fica o primeiro (mais antigo)
+    if position is None:
+        return np.maximum(value[first], value[second]), None
+    take_second = value[second] > value[first]
+    return np.where(take_second, value[second], value[first]), np.where(take_second, position[second], position[first])
+
+
+def _extremaArrays(values, windows, find_max, track_position):
+    """Extremo (e candles desde o extremo, se track_position) de cada janela como arrays do tamanho da série."""
+    windows = [int(window) for window in windows]
+    if windows and min(windows) < 1:
+        raise ValueError("A janela da máxima/mínima móvel precisa ser de pelo menos 1 candle")
+
+    prices = np.asarray(values, dtype=np.float64)
+    n = len(prices)
+    missing = np.isnan(prices)
+    signed = prices if find_max else -prices  # Mínima = máxima dos valores negados
+    extremes = _windowExtremes(np.where(missing, -np.inf, signed), set(windows), track_position)
+    missing_count = np.concatenate([[0], np.cumsum(missing)])
+
+    result = {}
+    for window in windows:
+        extreme = np.full(n, np.nan)
+        bars_since = np.full(n, np.nan) if track_position else None
+        if window in extremes:
+            value, position = extremes[window]
+            valid = missing_count[window:] == missing_count[: n - window + 1]
+            extreme[window - 1 :] = np.where(valid, value if find_max else -value, np.nan)
+            if track_position:
+                bars_since[window - 1 :] = np.where(valid, np.arange(window - 1, n) - position, np.nan)
+        result[window] = (extreme, bars_since)
+    return result
+
+
+def rollingExtremaSweep(values, windows, find_max=True):
+    """
+    Máxima (ou mínima) móvel para várias janelas de uma vez, com quantos candles atrás o extremo ocorreu.
+
+    :param values: Série/array com os preços.
+    :param windows: Lista de tamanhos de janela (>= 1).
+    :param find_max: True para máxima, False para mínima.
+    :return: Dicionário {window: DataFrame} com as colunas de EXTREMA_COLUMNS: extreme (o valor) e bars_since
+             (0 = candle atual, window - 1 = candle mais antigo da janela). NaN nas janelas incompletas ou com NaN.
+    """
+    index = values.index if isinstance(values, pd.Series) else None
+    return {
+        window: pd.DataFrame({"extreme": extreme, "bars_since": bars_since}, index=index, columns=EXTREMA_COLUMNS)
+        for window, (extreme, bars_since) in _extremaArrays(values, windows, find_max, True).items()
+    }
+
+
+def rollingExtrema(values, window, find_max=True):
+    """
+    Máxima (ou mínima) móvel e quantos candles atrás ela ocorreu.
+
+    :param values: Série/array com os preços.
+    :param window: Tamanho da janela (>= 1).
+    :param find_max: True para máxima, False para mínima.
+    :return: DataFrame com extreme (igual a rolling(window).max()/min()) e bars_since (candles desde o extremo).
+    """
+    return rollingExtremaSweep(values, [window], find_max)[int(window)]
+
+
+def highLowChannels(high, low, windows):
+    """
+    Máxima das máximas e mínima das mínimas para várias janelas (Donchian, Price Channels, Ichimoku, Williams %R, KDJ).
+    Só os valores: sem a posição do extremo, cada nível dos blocos é um único np.maximum.
+
+    :param high: Série/array com as máximas.
+    :param low: Série/array com as mínimas.
+    :param windows: Lista de tamanhos de janela.
+    :return: Dicionário {window: (highest, lowest)}; com pd.Series na entrada, as séries mantêm o índice e o nome.
+    """
+    highest = _extremaArrays(high, windows, True, False)
+    lowest = _extremaArrays(low, windows, False, False)
+
+    def output(extreme, source):
+        return pd.Series(extreme, index=source.index, name=source.name) if isinstance(source, pd.Series) else extreme
+
+    return {window: (output(highest[window][0], high), output(lowest[window][0], low)) for window in highest}
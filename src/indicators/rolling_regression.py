@@ -0,0 +1,143 @@
+import numpy as np
+import pandas as pd
+
+"""
+Regressão linear móvel (mínimos quadrados) em O(n) a partir de somas acumuladas.
+
+Cada janela de 'period' candles é ajustada com x = 0, 1, ..., period-1 (o mesmo que np.polyfit(np.arange(period), y, 1)).
+As somas da janela (Σy, Σx·y, Σy²) saem da diferença de duas somas acumuladas, então o custo não depende do período
+e várias janelas (ex: uma varredura de 'period') reaproveitam as mesmas somas.
+
+Para não perder precisão em séries longas, as somas acumuladas recomeçam a cada bloco de candles, com x contado a partir
+do início do bloco e y centrado na média do bloco. Cada bloco repete os últimos (maior período - 1) candles do anterior,
+então toda janela cabe inteira em um bloco.
+"""
+
+# ------------------------------------------------------------------------
+# 🔧 AJUSTES 🔧
+
+BLOCK_ROWS = 256  # Candles por bloco das somas acumuladas (blocos menores = somas menores = mais precisão)
+
+REGRESSION_COLUMNS = ["slope", "intercept", "fitted", "forecast", "r_squared", "residual_std"]
+
+# ------------------------------------------------------------------------
+
+
+def _blockSums(values, max_period):
+    """
+    Somas acumuladas por bloco de y, x·y, y² e da quantidade de NaN.
+
+    :return: Dicionário com as somas (matrizes achatadas), a média de cada bloco e as dimensões dos blocos.
+    """
+    y = np.asarray(values, dtype=np.float64)
+    n = len(y)
+    lead = max_period - 1  # Candles repetidos do bloco anterior
+    block = max(BLOCK_ROWS, lead)
+    n_blocks = max(-(-n // block), 1)
+    width = block + lead
+
+    rows = (np.arange(n_blocks) * block - lead)[:, None] + np.arange(width)[None, :]
+    inside = (rows >= 0) & (rows < n)
+    prices = y[np.clip(rows, 0, max(n - 1, 0))] if n else np.zeros(rows.shape)
+    missing = ~inside | np.isnan(prices)
+
+    # y centrado na média do bloco; candles faltando (fora da série ou NaN) entram como zero e são contados à parte
+    counts = np.maximum((~missing).sum(axis=1), 1)
+    anchor = np.where(missing, 0.0, prices).sum(axis=1) / counts
+    centered = np.where(missing, 0.0, prices - anchor[:, None])
+    x = np.arange(width, dtype=np.float64)
+
+    def cumulative(matrix):
+        # Coluna de zeros na frente: soma da janela [s, e] = acumulado[e + 1] - acumulado[s]
+        return np.concatenate([np.zeros((n_blocks, 1)), np.cumsum(matrix, axis=1)], axis=1).ravel()
+
+    return {
+        "n": n,
+        "block": block,
+        "lead": lead,
+        "width": width,
+        "anchor": anchor,
+        "sum_y": cumulative(centered),
+        "sum_xy": cumulative(x * centered),
+        "sum_yy": cumulative(centered * centered),
+        "sum_missing": cumulative(missing.astype(np.float64)),
+    }
+
+
+def _regressionFromSums(sums, period, forecast_periods):
+    """Coeficientes e estatísticas da regressão de todas as janelas de um período a partir das somas por bloco."""
+    n = sums["n"]
+    rows = np.arange(n)
+    blocks = rows // sums["block"]
+    end = rows - blocks * sums["block"] + sums["lead"]  # Posição do candle dentro do bloco
+    start = end - period + 1
+    base = blocks * (sums["width"] + 1)
+
+    def window(name):
+        cumulative = sums[name]
+        return cumulative[base + end + 1] - cumulative[base + np.maximum(start, 0)]
+
+    sum_y = window("sum_y")
+    sum_xy = window("sum_xy") - start * sum_y  # x da janela = x do bloco - início da janela
+    sum_yy = window("sum_yy")
+    valid = (rows >= period - 1) & (window("sum_missing") == 0)
+
+    # Mínimos quadrados com x = 0..period-1
+    sum_x = period * (period - 1) / 2
+    sum_xx = (period - 1) * period * (2 * period - 1) / 6
+    slope = (period * sum_xy - sum_x * sum_y) / (period * sum_xx - sum_x * sum_x)
+    intercept = (sum_y - slope * sum_x) / period + sums["anchor"][blocks]
+
+    # R² e desvio padrão dos resíduos (população, como np.std)
+    ss_total = np.maximum(sum_yy - sum_y * sum_y / period, 0.0)
+    ss_regression = slope * (sum_xy - sum_x * sum_y / period)
+    ss_residual = np.maximum(ss_total - ss_regression, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r_squared = np.where(ss_total > 0, np.minimum(ss_regression / ss_total, 1.0), 0.0)
+
+    result = {
+        "slope": slope,
+        "intercept": intercept,
+        "fitted": intercept + slope * (period - 1),
+        "forecast": intercept + slope * (period - 1 + forecast_periods),
+        "r_squared": r_squared,
+        "residual_std": np.sqrt(ss_residual / period),
+    }
+    return {column: np.where(valid, values, np.nan) for column, values in result.items()}
+
+
+def rollingRegressionSweep(values, periods, forecast_periods=1):
+    """
+    Regressão linear móvel para vários períodos de uma vez (as somas acumuladas são calculadas uma única vez).
+
+    :param values: Série/array com os preços.
+    :param periods: Lista de períodos (tamanho das janelas, >= 2).
+    :param forecast_periods: Candles à frente do último ponto da janela usados na previsão.
+    :return: Dicionário {period: DataFrame} com as colunas de REGRESSION_COLUMNS (NaN enquanto a janela não estiver
+             completa ou se tiver algum NaN).
+    """
+    periods = [int(period) for period in periods]
+    if not periods:
+        return {}
+    if min(periods) < 2:
+        raise ValueError("O período da regressão linear precisa ser de pelo menos 2 candles")
+
+    index = values.index if isinstance(values, pd.Series) else None
+    sums = _blockSums(values, max(periods))
+    return {
+        period: pd.DataFrame(_regressionFromSums(sums, period, forecast_periods), index=index, columns=REGRESSION_COLUMNS)
+        for period in periods
+    }
+
+
+def rollingRegression(values, period=14, forecast_periods=1):
+    """
+    Regressão linear móvel: para cada candle ajusta uma reta aos últimos 'period' preços (x = 0..period-1).
+
+    :param values: Série/array com os preços.
+    :param period: Tamanho da janela (>= 2).
+    :param forecast_periods: Candles à frente do último ponto da janela usados na previsão.
+    :return: DataFrame com slope, intercept, fitted (reta no último ponto), forecast (reta em period-1+forecast_periods),
+             r_squared e residual_std (desvio padrão dos resíduos).
+    """
+    return rollingRegressionSweep(values, [period], forecast_periods)[int(period)]
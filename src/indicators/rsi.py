@@ -1,21 +1,12 @@
 import pandas as pd
 
+from .indicator_graph import column, evaluateNodes, rsiNode
 
-def rsi(series, window, last_only):
-    # Diferença entre os preços
-    delta = series.diff(1)
-
-    # Ganhos e perdas
-    gain = delta.where(delta > 0, 0)
-    loss = -delta.where(delta < 0, 0)
 
-    # Média suavizada (Wilder's EMA)
-    avg_gain = gain.ewm(alpha=1 / window, adjust=False).mean()
-    avg_loss = loss.ewm(alpha=1 / window, adjust=False).mean()
-
-    # RS e RSI
-    rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
+def rsi(series, window, last_only):
+    # RSI pelas médias suavizadas de Wilder (ewm alpha=1/window) dos ganhos e perdas, calculado no grafo de indicadores
+    name = series.name if isinstance(series.name, str) else "source"
+    rsi = evaluateNodes({name: series}, {"rsi": rsiNode(column(name), window)})["rsi"]
 
     # Retornar apenas o último valor ou a série inteira
     if last_only:
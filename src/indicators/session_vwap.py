@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+from pandas.api.indexers import BaseIndexer
+
+"""
+VWAP ancorado na sessão (ex: reinicia todo dia) a partir de somas acumuladas.
+
+As sessões são números inteiros tirados do horário em segundos desde a época (horário local do open_time) dividido
+pela duração da sessão, sem criar objetos de data por candle. Por sessão o VWAP acumula preço típico·volume e volume,
+e a variância ponderada pelo volume sai da soma acumulada de volume·preço² (mesma ideia da versão candle a candle,
+StreamingSessionVWAP em indicators/streaming.py, que custa O(1) por candle no loop ao vivo).
+
+O desvio padrão móvel do preço em relação ao VWAP usa o rolling do pandas com janelas cortadas no início da sessão,
+o que dá o mesmo resultado de groupby(sessão).rolling(period).std() com os candles em ordem.
+"""
+
+SESSION_SECONDS = 86_400  # Sessão diária
+
+VWAP_COLUMNS = ["typical_price", "vwap", "std_dev", "weighted_std"]
+
+
+def sessionIds(times, session_seconds=SESSION_SECONDS):
+    """
+    Número da sessão de cada candle: segundos desde a época (no horário local do próprio open_time) // duração.
+    Com a sessão diária, o número muda à meia-noite local (o mesmo dia de open_time.dt.date).
+
+    :param times: Série/índice com os horários dos candles (datetime ou texto conversível).
+    :param session_seconds: Duração da sessão em segundos (86_400 = diária, 3_600 = por hora).
+    :return: Array int64 com o número da sessão de cada candle.
+    """
+    times = pd.DatetimeIndex(times)
+    if times.tz is not None:
+        times = times.tz_localize(None)  # Mantém o horário local
+    seconds = times.to_numpy(dtype="datetime64[s]").astype(np.int64)
+    return seconds // int(session_seconds)
+
+
+class _SessionWindowIndexer(BaseIndexer):
+    """Janelas de 'window_size' candles que nunca começam antes do primeiro candle da sessão."""
+
+    def get_window_bounds(self, num_values=0, min_periods=None, center=None, closed=None, step=None):
+        end = np.arange(1, num_values + 1, dtype=np.int64)
+        start = np.maximum(end - self.window_size, self.session_start).astype(np.int64)
+        return start, end
+
+
+def _sessionCumsum(values, sessions):
+    # Soma acumulada que reinicia a cada sessão (NaN fica NaN e não interrompe a soma, como cumsum do pandas)
+    if sessions is None:
+        return values.cumsum()
+    return values.groupby(sessions).cumsum()
+
+
+def sessionVWAP(high, low, close, volume, sessions=None, std_period=14):
+    """
+    VWAP acumulado por sessão e desvios do preço típico em relação a ele.
+
+    :param high: Série/array com as máximas.
+    :param low: Série/array com as mínimas.
+    :param close: Série/array com os fechamentos.
+    :param volume: Série/array com os volumes.
+    :param sessions: None = acumula a série inteira. Array com o número da sessão de cada candle (ver sessionIds).
+    :param std_period: Janela do desvio padrão móvel (std_dev).
+    :return: DataFrame com as colunas de VWAP_COLUMNS (índice de close, se for pd.Series):
+             - typical_price: (high + low + close) / 3
+             - vwap: Σ preço típico·volume / Σ volume da sessão (preço típico enquanto o volume acumulado for zero)
+             - std_dev: desvio padrão amostral móvel de (typical_price - vwap) em 'std_period' candles da sessão
+               (NaN até a janela estar completa dentro da sessão)
+             - weighted_std: desvio padrão do preço típico ponderado pelo volume desde o início da sessão
+    """
+    index = close.index if isinstance(close, pd.Series) else None
+    typical = pd.Series(
+        (np.asarray(high, dtype=np.float64) + np.asarray(low, dtype=np.float64) + np.asarray(close, dtype=np.float64)) / 3
+    )
+    volumes = pd.Series(np.asarray(volume, dtype=np.float64))
+    if sessions is not None:
+        sessions = np.asarray(sessions)
+
+    cum_volume = _sessionCumsum(volumes, sessions).to_numpy()
+    cum_tp_volume = _sessionCumsum(typical * volumes, sessions).to_numpy()
+    typical_price = typical.to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vwap = np.where(cum_volume > 0, cum_tp_volume / cum_volume, typical_price)
+
+    # Variância ponderada = E[preço²] - VWAP², com os preços centrados para não perder precisão
+    anchor = np.nanmean(typical_price) if np.isfinite(typical_price).any() else 0.0
+    centered = typical - anchor
+    cum_squares = _sessionCumsum(centered * centered * volumes, sessions).to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variance = cum_squares / cum_volume - (vwap - anchor) ** 2
+    weighted_std = np.where(cum_volume > 0, np.sqrt(np.maximum(variance, 0.0)), np.nan)
+
+    # Desvio padrão móvel dentro da sessão
+    deviation = pd.Series(typical_price - vwap)
+    if sessions is None:
+        std_dev = deviation.rolling(window=std_period).std()
+    else:
+        session_start = np.zeros(len(sessions), dtype=np.int64)
+        if len(sessions):
+            starts = np.flatnonzero(np.concatenate([[True], sessions[1:] != sessions[:-1]]))
+            session_start = starts[np.searchsorted(starts, np.arange(len(sessions)), side="right") - 1]
+        indexer = _SessionWindowIndexer(window_size=std_period, session_start=session_start)
+        std_dev = deviation.rolling(indexer, min_periods=std_period).std()
+
+    return pd.DataFrame(
+        {"typical_price": typical_price, "vwap": vwap, "std_dev": std_dev.to_numpy(), "weighted_std": weighted_std},
+        index=index,
+        columns=VWAP_COLUMNS,
+    )
@@ -0,0 +1,633 @@
+import math
+import sys
+from collections import deque
+
+"""
+Indicadores incrementais (streaming) para o loop ao vivo.
+
+Cada classe guarda o estado do indicador e recebe um candle por vez em tempo constante:
+- update(...): acrescenta um candle novo e devolve o valor do indicador nele.
+- revise(...): substitui o último candle (ex: candle ainda aberto que mudou) e devolve o valor corrigido.
+
+As contas reproduzem passo a passo as versões em lote de indicators/ (ewm(adjust=False) e rolling do pandas),
+então os valores batem com rsi, macd, t3MovingAverage, vortex, atr, rollingExtrema, sessionVWAP e os Fisher de
+Indicators sobre o mesmo histórico (ver benchmarks/streaming_check.py). Valores ainda indefinidos (aquecimento) saem como NaN.
+"""
+
+NAN = float("nan")
+EPSILON = sys.float_info.epsilon  # Mesmo valor de np.finfo(float).eps
+
+
+def _ewmAlpha(span=None, alpha=None):
+    # Mesmo caminho do pandas: span/alpha -> centro de massa -> alpha
+    if span is not None:
+        center_of_mass = (span - 1) / 2.0
+    else:
+        center_of_mass = (1 - alpha) / alpha
+    return 1.0 / (1.0 + center_of_mass)
+
+
+class StreamingEMA:
+    """Média móvel exponencial equivalente a series.ewm(span=..., adjust=False).mean() (ou alpha=...)."""
+
+    def __init__(self, span=None, alpha=None):
+        if (span is None) == (alpha is None):
+            raise ValueError("Informe apenas um entre span e alpha.")
+        self.alpha = _ewmAlpha(span, alpha)
+        self._old_weight_factor = 1.0 - self.alpha
+        self._state = (NAN, 1.0)  # (média, peso acumulado do valor anterior)
+        self._previous = self._state
+        self.value = NAN
+
+    def _apply(self, state, x):
+        weighted, old_weight = state
+        if weighted == weighted:
+            # NaN na entrada não altera a média, mas reduz o peso dela na próxima observação
+            old_weight *= self._old_weight_factor
+            if x == x:
+                if weighted != x:
+                    weighted = (old_weight * weighted + self.alpha * x) / (old_weight + self.alpha)
+                old_weight = 1.0
+        elif x == x:
+            weighted = x
+        return weighted, old_weight
+
+    def update(self, x):
+        self._previous = self._state
+        self._state = self._apply(self._state, x)
+        self.value = self._state[0]
+        return self.value
+
+    def revise(self, x):
+        self._state = self._apply(self._previous, x)
+        self.value = self._state[0]
+        return self.value
+
+
+class _RollingWindow:
+    """
+    Janela móvel de tamanho fixo com soma compensada (Kahan) e variância de Welford, como o rolling do pandas.
+    NaN ocupa posição na janela, mas não entra nas contas (o resultado só sai com a janela cheia de valores).
+    """
+
+    def __init__(self, window, track_variance=False):
+        self.window = window
+        self.track_variance = track_variance
+        self._values = deque()
+        self._evicted = None  # Valor que saiu da janela no último update (para revise)
+        self._state = self._emptyState()
+        self._previous = self._state
+
+    @staticmethod
+    def _emptyState():
+        # nobs, soma, compensações da soma (entradas / saídas), negativos, repetições, último valor,
+        # média, ssqdm, compensação da média
+        return (0, 0.0, 0.0, 0.0, 0, 0, NAN, 0.0, 0.0, 0.0)
+
+    def _add(self, state, x):
+        nobs, sum_x, add_compensation, remove_compensation, negatives, repeats, previous, mean_x, ssqdm, mean_compensation = state
+        if x != x:
+            return state
+        nobs += 1
+        y = x - add_compensation
+        t = sum_x + y
+        add_compensation = t - sum_x - y
+        sum_x = t
+        if math.copysign(1.0, x) < 0:
+            negatives += 1
+        repeats = repeats + 1 if x == previous else 1
+        previous = x
+        if self.track_variance:
+            previous_mean = mean_x - mean_compensation
+            y = x - mean_compensation
+            t = y - mean_x
+            mean_compensation = t + mean_x - y
+            mean_x = mean_x + t / nobs
+            ssqdm += (x - previous_mean) * (x - mean_x)
+        return (
+            nobs, sum_x, add_compensation, remove_compensation, negatives, repeats, previous, mean_x, ssqdm, mean_compensation
+        )
+
+    def _remove(self, state, x):
+        nobs, sum_x, add_compensation, remove_compensation, negatives, repeats, previous, mean_x, ssqdm, mean_compensation = state
+        if x != x:
+            return state
+        nobs -= 1
+        y = -x - remove_compensation
+        t = sum_x + y
+        remove_compensation = t - sum_x - y
+        sum_x = t
+        if math.copysign(1.0, x) < 0:
+            negatives -= 1
+        if self.track_variance:
+            if nobs:
+                previous_mean = mean_x - mean_compensation
+                y = x - mean_compensation
+                t = y - mean_x
+                mean_compensation = t + mean_x - y
+                mean_x = mean_x - t / nobs
+                ssqdm -= (x - previous_mean) * (x - mean_x)
+            else:
+                mean_x, ssqdm = 0.0, 0.0
+        return (
+            nobs, sum_x, add_compensation, remove_compensation, negatives, repeats, previous, mean_x, ssqdm, mean_compensation
+        )
+
+    def update(self, x):
+        self._previous = self._state
+        self._values.append(x)
+        self._evicted = self._values.popleft() if len(self._values) > self.window else None
+        self._state = self._apply(self._state, x, self._evicted)
+
+    def revise(self, x):
+        if not self._values:
+            return self.update(x)
+        self._values[-1] = x
+        self._state = self._apply(self._previous, x, self._evicted)
+
+    def _apply(self, state, x, evicted):
+        # Mesma ordem do pandas: sai o valor mais antigo, depois entra o novo
+        state = self._remove(state, evicted) if evicted is not None else state
+        return self._add(state, x)
+
+    def _full(self):
+        return len(self._values) == self.window and self._state[0] >= self.window
+
+    def sum(self):
+        nobs, sum_x, _, _, _, repeats, previous, *_ = self._state
+        if not self._full():
+            return NAN
+        return previous * nobs if repeats >= nobs else sum_x
+
+    def mean(self):
+        nobs, sum_x, _, _, negatives, repeats, previous, *_ = self._state
+        if not self._full():
+            return NAN
+        result = sum_x / nobs
+        if repeats >= nobs:
+            return previous
+        if negatives == 0 and result < 0:
+            return 0.0
+        if negatives == nobs and result > 0:
+            return 0.0
+        return result
+
+    def std(self, ddof=1):
+        nobs, _, _, _, _, repeats, _, _, ssqdm, _ = self._state
+        if not self._full() or nobs <= ddof:
+            return NAN
+        if nobs == 1 or repeats >= nobs:
+            return 0.0
+        return math.sqrt(max(ssqdm / (nobs - ddof), 0.0))
+
+
+class StreamingSMA:
+    """Média móvel simples equivalente a series.rolling(window).mean()."""
+
+    def __init__(self, window):
+        self._window = _RollingWindow(window)
+        self.value = NAN
+
+    def update(self, x):
+        self._window.update(x)
+        self.value = self._window.mean()
+        return self.value
+
+    def revise(self, x):
+        self._window.revise(x)
+        self.value = self._window.mean()
+        return self.value
+
+
+class StreamingRollingSum:
+    """Soma móvel equivalente a series.rolling(window).sum()."""
+
+    def __init__(self, window):
+        self._window = _RollingWindow(window)
+        self.value = NAN
+
+    def update(self, x):
+        self._window.update(x)
+        self.value = self._window.sum()
+        return self.value
+
+    def revise(self, x):
+        self._window.revise(x)
+        self.value = self._window.sum()
+        return self.value
+
+
+class StreamingRollingStd:
+    """Desvio padrão móvel equivalente a series.rolling(window).std(ddof=ddof)."""
+
+    def __init__(self, window, ddof=1):
+        self.ddof = ddof
+        self._window = _RollingWindow(window, track_variance=True)
+        self.value = NAN
+
+    def update(self, x):
+        self._window.update(x)
+        self.value = self._window.std(self.ddof)
+        return self.value
+
+    def revise(self, x):
+        self._window.revise(x)
+        self.value = self._window.std(self.ddof)
+        return self.value
+
+
+class StreamingRollingExtreme:
+    """
+    Máxima (ou mínima) móvel e candles desde o extremo, equivalente a indicators.rolling_extrema.rollingExtrema.
+    Deque monotônica: guarda só os candles que ainda podem virar o extremo da janela (O(1) amortizado por candle);
+    em empates fica o mais antigo. Devolve (extremo, candles desde o extremo).
+    """
+
+    def __init__(self, window, find_max=True):
+        if window < 1:
+            raise ValueError("A janela da máxima/mínima móvel precisa ser de pelo menos 1 candle")
+        self.window = window
+        self._sign = 1.0 if find_max else -1.0
+        self._candidates = deque()  # (posição, valor com sinal), do mais antigo (extremo) para o mais recente
+        self._position = -1
+        self._last_nan = -1  # Posição do último NaN (a janela só vale sem NaN)
+        self._undo = None  # O que o último candle alterou na deque (para revise)
+        self.value = (NAN, NAN)
+
+    def _push(self, x):
+        candidates = self._candidates
+        evicted = candidates.popleft() if candidates and candidates[0][0] <= self._position - self.window else None
+        popped = []
+        last_nan = self._last_nan
+        if x != x:
+            self._last_nan = self._position
+        else:
+            signed = self._sign * x
+            while candidates and candidates[-1][1] < signed:
+                popped.append(candidates.pop())
+            candidates.append((self._position, signed))
+        self._undo = (evicted, popped, last_nan, x == x)
+
+        if self._position < self.window - 1 or self._last_nan > self._position - self.window:
+            self.value = (NAN, NAN)
+        else:
+            position, signed = candidates[0]
+            self.value = (self._sign * signed, float(self._position - position))
+        return self.value
+
+    def update(self, x):
+        self._position += 1
+        return self._push(x)
+
+    def revise(self, x):
+        if self._undo is None:
+            return self.update(x)
+        # Desfaz o último candle e aplica o valor corrigido na mesma posição
+        evicted, popped, last_nan, appended = self._undo
+        if appended:
+            self._candidates.pop()
+        self._candidates.extend(reversed(popped))
+        if evicted is not None:
+            self._candidates.appendleft(evicted)
+        self._last_nan = last_nan
+        return self._push(x)
+
+
+class StreamingRSI:
+    """RSI de Wilder equivalente a indicators.rsi(series, window, last_only=False)."""
+
+    def __init__(self, window=14):
+        self._avg_gain = StreamingEMA(alpha=1 / window)
+        self._avg_loss = StreamingEMA(alpha=1 / window)
+        self._last_close = NAN
+        self._previous_close = NAN
+        self.value = NAN
+
+    def _apply(self, x):
+        delta = x - self._previous_close
+        gain = delta if delta > 0 else 0.0  # Primeiro candle (delta NaN) entra como 0, igual ao where do pandas
+        loss = -delta if delta < 0 else -0.0
+        return gain, loss
+
+    def _rsi(self):
+        avg_gain, avg_loss = self._avg_gain.value, self._avg_loss.value
+        if avg_loss == 0:
+            rs = math.inf if avg_gain > 0 else NAN
+        else:
+            rs = avg_gain / avg_loss
+        self.value = 100 - (100 / (1 + rs)) if rs == rs else NAN
+        return self.value
+
+    def update(self, x):
+        self._previous_close = self._last_close
+        self._last_close = x
+        gain, loss = self._apply(x)
+        self._avg_gain.update(gain)
+        self._avg_loss.update(loss)
+        return self._rsi()
+
+    def revise(self, x):
+        self._last_close = x
+        gain, loss = self._apply(x)
+        self._avg_gain.revise(gain)
+        self._avg_loss.revise(loss)
+        return self._rsi()
+
+
+class StreamingMACD:
+    """MACD equivalente a indicators.macd: devolve (macd_line, signal_line, histogram)."""
+
+    def __init__(self, fast_window=12, slow_window=26, signal_window=9):
+        self._fast = StreamingEMA(span=fast_window)
+        self._slow = StreamingEMA(span=slow_window)
+        self._signal = StreamingEMA(span=signal_window)
+        self.value = (NAN, NAN, NAN)
+
+    def _result(self, signal):
+        macd_line = self._fast.value - self._slow.value
+        self.value = (macd_line, signal, macd_line - signal)
+        return self.value
+
+    def update(self, x):
+        self._fast.update(x)
+        self._slow.update(x)
+        return self._result(self._signal.update(self._fast.value - self._slow.value))
+
+    def revise(self, x):
+        self._fast.revise(x)
+        self._slow.revise(x)
+        return self._result(self._signal.revise(self._fast.value - self._slow.value))
+
+
+class StreamingT3:
+    """T3 de Tillson equivalente a indicators.t3MovingAverage (seis EMAs encadeadas)."""
+
+    def __init__(self, period=14, volume_factor=0.7):
+        self.volume_factor = volume_factor
+        self._emas = [StreamingEMA(span=period) for _ in range(6)]
+        self.value = NAN
+
+    def _result(self):
+        volume_factor = self.volume_factor
+        c1 = -volume_factor * volume_factor * volume_factor
+        e3, e4, e5, e6 = (ema.value for ema in self._emas[2:])
+        self.value = (
+            c1 * e6
+            + 3 * volume_factor * c1 * e5
+            + 3 * volume_factor * volume_factor * c1 * e4
+            + volume_factor * volume_factor * volume_factor * e3
+        )
+        return self.value
+
+    def update(self, x):
+        for ema in self._emas:
+            x = ema.update(x)
+        return self._result()
+
+    def revise(self, x):
+        for ema in self._emas:
+            x = ema.revise(x)
+        return self._result()
+
+
+class _StreamingCandles:
+    """Base dos indicadores que dependem do candle anterior (high, low, close)."""
+
+    def __init__(self):
+        self._last = (NAN, NAN, NAN)
+        self._before_last = (NAN, NAN, NAN)
+
+    def _push(self, high, low, close):
+        self._before_last = self._last
+        self._last = (high, low, close)
+
+    def _replace(self, high, low, close):
+        self._last = (high, low, close)
+
+
+class StreamingVortex(_StreamingCandles):
+    """Vortex equivalente a indicators.vortex: devolve (VI+, VI-)."""
+
+    def __init__(self, window=14):
+        super().__init__()
+        self._sum_tr = StreamingRollingSum(window)
+        self._sum_vm_plus = StreamingRollingSum(window)
+        self._sum_vm_minus = StreamingRollingSum(window)
+        self.value = (NAN, NAN)
+
+    def _terms(self):
+        high, low, _ = self._last
+        previous_high, previous_low, previous_close = self._before_last
+        # np.maximum propaga NaN: sem candle anterior, TR e VM ficam NaN
+        true_range = abs(high - low)
+        for candidate in (abs(high - previous_close), abs(low - previous_close)):
+            true_range = candidate if candidate != candidate or candidate > true_range else true_range
+        return true_range, abs(high - previous_low), abs(low - previous_high)
+
+    def _result(self):
+        sum_tr = self._sum_tr.value
+        self.value = (self._sum_vm_plus.value / sum_tr, self._sum_vm_minus.value / sum_tr) if sum_tr == sum_tr else (NAN, NAN)
+        return self.value
+
+    def update(self, high, low, close):
+        self._push(high, low, close)
+        true_range, vm_plus, vm_minus = self._terms()
+        self._sum_tr.update(true_range)
+        self._sum_vm_plus.update(vm_plus)
+        self._sum_vm_minus.update(vm_minus)
+        return self._result()
+
+    def revise(self, high, low, close):
+        self._replace(high, low, close)
+        true_range, vm_plus, vm_minus = self._terms()
+        self._sum_tr.revise(true_range)
+        self._sum_vm_plus.revise(vm_plus)
+        self._sum_vm_minus.revise(vm_minus)
+        return self._result()
+
+
+class StreamingATR(_StreamingCandles):
+    """ATR equivalente a indicators.atr (média móvel simples do True Range)."""
+
+    def __init__(self, window=14):
+        super().__init__()
+        self._mean = StreamingSMA(window)
+        self.value = NAN
+
+    def _trueRange(self):
+        high, low, _ = self._last
+        previous_close = self._before_last[2]
+        # max(axis=1) do pandas ignora NaN: no primeiro candle o TR é high - low
+        true_range = high - low
+        for candidate in (abs(high - previous_close), abs(low - previous_close)):
+            if candidate > true_range or (true_range != true_range and candidate == candidate):
+                true_range = candidate
+        return true_range
+
+    def update(self, high, low, close):
+        self._push(high, low, close)
+        self.value = self._mean.update(self._trueRange())
+        return self.value
+
+    def revise(self, high, low, close):
+        self._replace(high, low, close)
+        self.value = self._mean.revise(self._trueRange())
+        return self.value
+
+
+class StreamingAroon:
+    """Aroon equivalente a Indicators.getAroon: devolve (aroon_up, aroon_down, aroon_oscillator)."""
+
+    def __init__(self, period=14):
+        self.period = period
+        self._highest = StreamingRollingExtreme(period, find_max=True)
+        self._lowest = StreamingRollingExtreme(period, find_max=False)
+        self.value = (NAN, NAN, NAN)
+
+    def _result(self):
+        period = self.period
+        aroon_up = 100 * (period - self._highest.value[1]) / period
+        aroon_down = 100 * (period - self._lowest.value[1]) / period
+        self.value = (aroon_up, aroon_down, aroon_up - aroon_down)
+        return self.value
+
+    def update(self, high, low):
+        self._highest.update(high)
+        self._lowest.update(low)
+        return self._result()
+
+    def revise(self, high, low):
+        self._highest.revise(high)
+        self._lowest.revise(low)
+        return self._result()
+
+
+def _fisher(x):
+    # Limita a +/- 0.999 (NaN continua NaN, como np.clip) e aplica a transformação de Fisher
+    if x != x:
+        return NAN
+    x = min(max(x, -0.999), 0.999)
+    return 0.5 * math.log((1 + x) / (1 - x))
+
+
+class StreamingEhlerFisher:
+    """Ehler Fisher Transform equivalente a Indicators.getEhlerFisherTransform (entrada: high, low)."""
+
+    def __init__(self, period=10):
+        self.alpha = 2.0 / (period + 1.0)
+        self._smooth = StreamingSMA(period)
+        self._state = None  # (máximo adaptativo, mínimo adaptativo)
+        self._previous = None
+        self.value = NAN
+
+    def _apply(self, state, high, low):
+        mid = (high + low) / 2
+        if state is None:
+            return (mid, mid), NAN  # O primeiro candle só inicia o máximo/mínimo
+        current_max, current_min = state
+        current_max = mid if mid > current_max else current_max - self.alpha * (current_max - mid)
+        current_min = mid if mid < current_min else current_min + self.alpha * (mid - current_min)
+        price_range = current_max - current_min
+        value = 0.0 if price_range == 0 else 2 * ((mid - current_min) / price_range - 0.5)
+        return (current_max, current_min), value
+
+    def _result(self, smooth):
+        self.value = _fisher(0.0 if smooth != smooth else smooth)  # fillna(0) da média
+        return self.value
+
+    def update(self, high, low):
+        self._previous = self._state
+        self._state, value = self._apply(self._state, high, low)
+        return self._result(self._smooth.update(value))
+
+    def revise(self, high, low):
+        self._state, value = self._apply(self._previous, high, low)
+        return self._result(self._smooth.revise(value))
+
+
+class StreamingFisherTransform:
+    """Fisher Transform equivalente a Indicators.getFisherTransform (entrada: high, low)."""
+
+    def __init__(self, period=10):
+        self._highest = StreamingRollingExtreme(period, find_max=True)
+        self._lowest = StreamingRollingExtreme(period, find_max=False)
+        self._mean = StreamingSMA(period)
+        self.value = NAN
+
+    def _value(self, mid):
+        highest, lowest = self._highest.value[0], self._lowest.value[0]
+        price_range = highest - lowest
+        if price_range == 0:
+            price_range = EPSILON  # Evitar divisão por zero
+        return 2 * ((mid - lowest) / price_range - 0.5)
+
+    def update(self, high, low):
+        mid = (high + low) / 2
+        self._highest.update(mid)
+        self._lowest.update(mid)
+        self.value = _fisher(self._mean.update(self._value(mid)))
+        return self.value
+
+    def revise(self, high, low):
+        mid = (high + low) / 2
+        self._highest.revise(mid)
+        self._lowest.revise(mid)
+        self.value = _fisher(self._mean.revise(self._value(mid)))
+        return self.value
+
+
+class StreamingSessionVWAP:
+    """
+    VWAP ancorado na sessão equivalente a indicators.session_vwap.sessionVWAP: devolve (vwap, std_dev, weighted_std).
+    O candle recebe o número da sessão (ver sessionIds); quando ele muda, as somas recomeçam. session=None = sem reinício.
+    O revise deve usar a mesma sessão do update que ele corrige.
+    """
+
+    def __init__(self, std_period=14):
+        self.std_period = std_period
+        self._std = StreamingRollingStd(std_period)
+        # (sessão, Σ volume, Σ preço típico·volume, Σ volume·(preço - âncora)², âncora = 1º preço da sessão)
+        self._state = (None, 0.0, 0.0, 0.0, NAN)
+        self._previous = self._state
+        self.value = (NAN, NAN, NAN)
+
+    def _apply(self, state, high, low, close, volume, session):
+        current, cum_volume, cum_tp_volume, cum_squares, anchor = state
+        new_session = session is not None and session != current
+        if new_session:
+            cum_volume, cum_tp_volume, cum_squares, anchor = 0.0, 0.0, 0.0, NAN
+
+        typical_price = (high + low + close) / 3
+        tp_volume = typical_price * volume
+        if anchor != anchor:
+            anchor = typical_price
+        # Como o cumsum do pandas: candle com NaN fica NaN e não entra na soma
+        if volume == volume:
+            cum_volume += volume
+        if tp_volume == tp_volume:
+            cum_tp_volume += tp_volume
+            cum_squares += volume * (typical_price - anchor) ** 2
+        row_volume = cum_volume if volume == volume else NAN
+        row_tp_volume = cum_tp_volume if tp_volume == tp_volume else NAN
+
+        if row_volume > 0:
+            vwap = row_tp_volume / row_volume
+            variance = (cum_squares if tp_volume == tp_volume else NAN) / row_volume - (vwap - anchor) ** 2
+            weighted_std = math.sqrt(max(variance, 0.0)) if variance == variance else NAN
+        else:
+            vwap, weighted_std = typical_price, NAN
+        state = (session if new_session else current, cum_volume, cum_tp_volume, cum_squares, anchor)
+        return state, new_session, typical_price - vwap, vwap, weighted_std
+
+    def update(self, high, low, close, volume, session=None):
+        self._previous = self._state
+        self._state, new_session, deviation, vwap, weighted_std = self._apply(self._state, high, low, close, volume, session)
+        if new_session:
+            self._std = StreamingRollingStd(self.std_period)  # Janela do desvio padrão recomeça na sessão
+        self.value = (vwap, self._std.update(deviation), weighted_std)
+        return self.value
+
+    def revise(self, high, low, close, volume, session=None):
+        self._state, _, deviation, vwap, weighted_std = self._apply(self._previous, high, low, close, volume, session)
+        self.value = (vwap, self._std.revise(deviation), weighted_std)
+        return self.value
@@ -1,6 +1,9 @@
 import pandas as pd
 import numpy as np
 
+from .indicator_cache import cachedIndicator
+from .period_batch import t3Panel
+
 def t3MovingAverage(data, period=14, volume_factor=0.7, use_close=True):
     """
     Calcula o indicador T3 Moving Average
@@ -28,14 +31,19 @@ def t3MovingAverage(data, period=14, volume_factor=0.7, use_close=True):
             # Caso 'open' não esteja disponível, usar 'close'
             price_col = 'close' if 'close' in data.columns else 'close'.lower()
     
-    # Criar uma cópia para evitar modificar o DataFrame original
-    df = data.copy()
-    
+    params = (period, volume_factor)
+    return cachedIndicator("t3", params, (data[price_col],), lambda: _t3Series(data[price_col], period, volume_factor))
+
+
+def _t3Series(prices, period, volume_factor):
+    if isinstance(prices, pd.DataFrame):
+        return t3Panel(prices, period, volume_factor)  # Painel (tempo x símbolo): todos os símbolos de uma vez
+
     # Calcular o fator de suavização (c1)
     c1 = -volume_factor * volume_factor * volume_factor
     
     # Calcular EMA 1
-    e1 = df[price_col].ewm(span=period, adjust=False).mean()
+    e1 = prices.ewm(span=period, adjust=False).mean()
     
     # Calcular EMA 2
     e2 = e1.ewm(span=period, adjust=False).mean()
@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from .indicator_graph import column, evaluateNodes, vortexNodes
+
 
 def vortex(data: pd.DataFrame, window=14, positive=True):
     """
@@ -10,25 +12,19 @@ def vortex(data: pd.DataFrame, window=14, positive=True):
     :param positive: Se True, retorna VI+, senão retorna VI-.
     :return: Pandas Series com os valores de VI+ ou VI-.
     """
+    # Só a linha pedida: a outra soma móvel (VM- ou VM+) não é calculada
+    lines = vortexNodes(column("high_price"), column("low_price"), column("close_price"), window)
+    return evaluateNodes(data, {"vi": lines[0] if positive else lines[1]})["vi"]
 
-    # Cálculo do Movimento Direcional Verdadeiro (True Range)
-    tr = np.abs(data["high_price"] - data["low_price"])
-    tr = np.maximum(tr, np.abs(data["high_price"] - data["close_price"].shift(1)))
-    tr = np.maximum(tr, np.abs(data["low_price"] - data["close_price"].shift(1)))
-
-    # Movimento Direcional Positivo (VM+)
-    vm_plus = np.abs(data["high_price"] - data["low_price"].shift(1))
-
-    # Movimento Direcional Negativo (VM-)
-    vm_minus = np.abs(data["low_price"] - data["high_price"].shift(1))
-
-    # Suavização por soma móvel
-    sum_tr = tr.rolling(window=window).sum()
-    sum_vm_plus = vm_plus.rolling(window=window).sum()
-    sum_vm_minus = vm_minus.rolling(window=window).sum()
-
-    # Calculando VI+ e VI-
-    vi_plus = sum_vm_plus / sum_tr
-    vi_minus = sum_vm_minus / sum_tr
 
-    return vi_plus if positive else vi_minus
+def vortexLines(data: pd.DataFrame, window=14):
+    """
+    Calcula VI+ e VI- de uma vez (o True Range é montado uma única vez para as duas linhas).
+    :param data: DataFrame contendo colunas 'high_price', 'low_price' e 'close_price'.
+    :param window: Período para cálculo.
+    :return: Tupla (VI+, VI-) de Pandas Series.
+    """
+    # True Range, VM+ e VM- somados na janela; os termos do True Range são nós compartilhados com o UT Bot
+    lines = vortexNodes(column("high_price"), column("low_price"), column("close_price"), window)
+    values = evaluateNodes(data, {"vi_plus": lines[0], "vi_minus": lines[1]})
+    return values["vi_plus"], values["vi_minus"]
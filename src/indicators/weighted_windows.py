@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+
+"""
+Médias móveis de pesos fixos (WMA, ALMA, Hull, TMA) calculadas de uma vez sobre a série inteira.
+
+Cada média é uma correlação da série com um vetor de pesos (np.correlate, em C), sem chamar Python por janela como
+o rolling(...).apply. Os pesos vão do candle mais antigo para o mais recente da janela (pesos[-1] multiplica o candle atual).
+
+Médias compostas viram um único vetor de pesos: o Hull (WMA de 2·WMA(n/2) - WMA(n)) e a TMA (SMA de uma SMA) são a
+convolução dos pesos das médias que as formam. Janelas incompletas ou com NaN saem como NaN, igual ao rolling do pandas.
+"""
+
+
+def wmaWeights(period):
+    """Pesos da WMA: 1, 2, ..., period (normalizados para somar 1)."""
+    if period < 1:
+        raise ValueError("O período da média ponderada precisa ser de pelo menos 1 candle")
+    weights = np.arange(1, period + 1, dtype=np.float64)
+    return weights / weights.sum()
+
+
+def almaWeights(period, sigma=6.0, offset=0.85):
+    """Pesos do ALMA: gaussiana centrada em floor(offset * (period - 1)) com largura period / sigma (normalizados)."""
+    if period < 1:
+        raise ValueError("O período do ALMA precisa ser de pelo menos 1 candle")
+    m = np.floor(offset * (period - 1))
+    s = period / sigma
+    weights = np.exp(-((np.arange(period) - m) ** 2) / (2 * s * s))
+    return weights / weights.sum()
+
+
+def hullWeights(period):
+    """Pesos do Hull Moving Average: WMA(int(sqrt(period))) de 2 * WMA(period // 2) - WMA(period)."""
+    half = np.zeros(period)
+    half[period - period // 2 :] = wmaWeights(period // 2)  # WMA curta alinhada aos candles mais recentes
+    raw = 2 * half - wmaWeights(period)
+    return np.convolve(raw, wmaWeights(int(np.sqrt(period))))
+
+
+def triangularWeights(period):
+    """Pesos da TMA: SMA(period) de uma SMA(period), ou seja, um triângulo com 2 * period - 1 candles."""
+    if period < 1:
+        raise ValueError("O período da média triangular precisa ser de pelo menos 1 candle")
+    sma = np.full(period, 1.0 / period)
+    return np.convolve(sma, sma)
+
+
+def _applyWeights(values, weights):
+    weights = np.asarray(weights, dtype=np.float64)
+    if weights.ndim != 1 or len(weights) == 0:
+        raise ValueError("Os pesos da média móvel precisam ser um vetor não vazio")
+
+    result = np.full(len(values), np.nan)
+    if len(values) >= len(weights):
+        result[len(weights) - 1 :] = np.correlate(values, weights, mode="valid")
+    return result
+
+
+def weightedMovingAverageBatch(values, weights_list):
+    """
+    Várias médias móveis de pesos fixos sobre a mesma série (ex: WMA curta, média e longa de uma estratégia).
+
+    :param values: Série/array com os preços.
+    :param weights_list: Lista de vetores de pesos (do candle mais antigo para o atual; tamanhos podem ser diferentes).
+    :return: Lista com uma média por vetor de pesos (pd.Series com o índice e o nome de values, ou array).
+    """
+    prices = np.ascontiguousarray(values, dtype=np.float64)
+    averages = [_applyWeights(prices, weights) for weights in weights_list]
+    if isinstance(values, pd.Series):
+        return [pd.Series(average, index=values.index, name=values.name) for average in averages]
+    return averages
+
+
+def weightedMovingAverage(values, weights):
+    """
+    Média móvel de pesos fixos: media[i] = soma(pesos * valores[i - len(pesos) + 1 : i + 1]).
+
+    :param values: Série/array com os preços.
+    :param weights: Vetor de pesos (do candle mais antigo para o atual). Use pesos normalizados para obter uma média.
+    :return: pd.Series com o índice e o nome de values (ou array), NaN nas janelas incompletas ou com NaN.
+    """
+    return weightedMovingAverageBatch(values, [weights])[0]
@@ -1,6 +1,7 @@
 import threading
 import time
 from modules.BinanceTraderBot import BinanceTraderBot
+from modules.PanelRunner import sharedPanelRunner
 from binance.client import Client
 from Models.StockStartModel import StockStartModel
 import logging
@@ -138,6 +139,8 @@ stocks_traded_list = [BTC_USDT]
 
 THREAD_LOCK = True # True = Executa 1 moeda por vez | False = Executa todas simultânemaente
 
+PANEL_MODE = False # True = Moedas com o mesmo CANDLE_PERIOD e estratégias são avaliadas juntas (em lote com THREAD_LOCK = False)
+
 # 🔴🔴🔴 CONFIGURAÇÕES - FIM 🔴🔴🔴
 # -------------------------------------------------------------------------------------------------
 
@@ -148,6 +151,11 @@ THREAD_LOCK = True # True = Executa 1 moeda por vez | False = Executa todas simu
 thread_lock = threading.Lock()
 
 def trader_loop(stockStart: StockStartModel):
+    panel_runner = None
+    if PANEL_MODE:
+        panel_runner = sharedPanelRunner(stockStart.candlePeriod, stockStart.mainStrategy, stockStart.mainStrategyArgs,
+                                         stockStart.fallbackStrategy, stockStart.fallbackStrategyArgs, stockStart.fallBackActivated)
+
     MaTrader = BinanceTraderBot(stock_code = stockStart.stockCode
                                 , operation_code = stockStart.operationCode
                                 , traded_quantity = stockStart.tradedQuantity
@@ -163,7 +171,8 @@ def trader_loop(stockStart: StockStartModel):
                                 , main_strategy = stockStart.mainStrategy
                                 , main_strategy_args =  stockStart.mainStrategyArgs
                                 , fallback_strategy = stockStart.fallbackStrategy
-                                , fallback_strategy_args = stockStart.fallbackStrategyArgs)
+                                , fallback_strategy_args = stockStart.fallbackStrategyArgs
+                                , panel_runner = panel_runner)
     
 
     total_executed:int = 1
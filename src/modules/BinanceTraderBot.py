@@ -11,7 +11,9 @@ from binance.exceptions import BinanceAPIException
 from dotenv import load_dotenv
 
 from modules.BinanceClient import BinanceClient
+from modules.CandleStore import klinesToStockData
 from modules.TraderOrder import TraderOrder
+from modules.TrailingStop import TRAILING_ACTIVATION_PERCENTAGE, TRAILING_GAP
 from modules.Logger import *
 from modules.StrategyRunner import StrategyRunner
 
@@ -19,6 +21,8 @@ from strategies.moving_average_antecipation import getMovingAverageAntecipationT
 from strategies.moving_average import getMovingAverageTradeStrategy
 
 from indicators import Indicators
+from indicators.indicator_cache import INDICATOR_CACHE, cachedIndicator
+from indicators.ohlcv_view import ohlcvView
 
 load_dotenv()
 api_key = os.getenv("BINANCE_API_KEY")
@@ -58,6 +62,7 @@ class BinanceTraderBot:
         main_strategy_args=None,
         fallback_strategy=None,
         fallback_strategy_args=None,
+        panel_runner=None,
     ):
         print("------------------------------------------------")
         print("🤖 Robo Trader iniciando...")
@@ -81,6 +86,10 @@ class BinanceTraderBot:
         self.fallback_strategy = fallback_strategy 
         self.fallback_strategy_args = fallback_strategy_args 
 
+        # Modo painel (modules/PanelRunner.py): a decisão sai de um lote com os candles dos bots do mesmo intervalo;
+        # cada bot continua buscando os seus candles (usados também no stop loss e take profit)
+        self.panel_runner = panel_runner
+
         self.time_to_trade = time_to_trade
         self.delay_after_order = delay_after_order
         self.time_to_sleep = time_to_trade
@@ -94,8 +103,8 @@ class BinanceTraderBot:
         # Configurações para o Trailing Stop Loss:
         # Se o ativo subir 3% em relação ao preço de compra, ativa o trailing
         # e reposiciona o stop loss para 1% abaixo do pico.
-        self.trailing_activation_percentage = 0.03  # 3% de alta para ativação
-        self.trailing_gap = 0.01  # Trailing stop 1% abaixo do pico
+        self.trailing_activation_percentage = TRAILING_ACTIVATION_PERCENTAGE  # 3% de alta para ativação
+        self.trailing_gap = TRAILING_GAP  # Trailing stop 1% abaixo do pico
         self.initial_stop_loss_price = None  # Será definido após a compra
         self.stop_loss_price = None  # Valor atual do stop loss (pode ser inicial ou trailing)
         self.max_price_since_buy = 0  # Pico do ativo após a compra
@@ -131,6 +140,8 @@ class BinanceTraderBot:
             self.last_stock_account_balance = self.getLastStockAccountBalance()
             self.actual_trade_position = self.getActualTradePosition()
             self.stock_data = self.getStockData()
+            if self.panel_runner is not None:
+                self.panel_runner.submit(self.operation_code, self.stock_data)  # Entra no próximo lote do painel
             self.open_orders = self.getOpenOrders()
             self.last_buy_price = self.getLastBuyPrice(verbose)
             self.last_sell_price = self.getLastSellPrice(verbose)
@@ -173,30 +184,8 @@ class BinanceTraderBot:
             interval=self.candle_period,
             limit=1000,
         )
-        prices = pd.DataFrame(candles)
-        prices.columns = [
-            "open_time",
-            "open_price",
-            "high_price",
-            "low_price",
-            "close_price",
-            "volume",
-            "close_time",
-            "quote_asset_volume",
-            "number_of_trades",
-            "taker_buy_base_asset_volume",
-            "taker_buy_quote_asset_volume",
-            "-",
-        ]
-        prices = prices[["close_price", "open_time", "open_price", "high_price", "low_price", "volume"]]
-        prices["close_price"] = pd.to_numeric(prices["close_price"], errors="coerce")
-        prices["open_price"] = pd.to_numeric(prices["open_price"], errors="coerce")
-        prices["high_price"] = pd.to_numeric(prices["high_price"], errors="coerce")
-        prices["low_price"] = pd.to_numeric(prices["low_price"], errors="coerce")
-        prices["volume"] = pd.to_numeric(prices["volume"], errors="coerce")
-        prices["open_time"] = pd.to_datetime(prices["open_time"], unit="ms").dt.tz_localize("UTC")
-        prices["open_time"] = prices["open_time"].dt.tz_convert("America/Sao_Paulo")
-        return prices
+        # Colunas nos dois esquemas (close_price e close) sobre os mesmos arrays: serve a todas as estratégias sem cópia
+        return ohlcvView(klinesToStockData(candles))
 
     def getLastBuyPrice(self, verbose=False):
         try:
@@ -327,6 +316,11 @@ class BinanceTraderBot:
         percentual_change = ((close_price - initial_price) / initial_price) * 100
         return percentual_change
 
+    def getAverageVolume(self, window=20):
+        # Média de volume do último candle (calculada uma vez por ciclo para compra e venda)
+        volume = self.stock_data["volume"]
+        return cachedIndicator("volume_mean", (window,), (volume,), lambda: volume.rolling(window=window).mean()).iloc[-1]
+
     def buyMarketOrder(self, quantity=None):
         try:
             if not self.actual_trade_position:
@@ -367,7 +361,7 @@ class BinanceTraderBot:
     def buyLimitedOrder(self, price=0):
         close_price = self.stock_data["close_price"].iloc[-1]
         volume = self.stock_data["volume"].iloc[-1]
-        avg_volume = self.stock_data["volume"].rolling(window=20).mean().iloc[-1]
+        avg_volume = self.getAverageVolume(window=20)
         rsi = Indicators.getRSI(series=self.stock_data["close_price"])
         if price == 0:
             if rsi < 30:
@@ -446,7 +440,7 @@ class BinanceTraderBot:
     def sellLimitedOrder(self, price=0):
         close_price = self.stock_data["close_price"].iloc[-1]
         volume = self.stock_data["volume"].iloc[-1]
-        avg_volume = self.stock_data["volume"].rolling(window=20).mean().iloc[-1]
+        avg_volume = self.getAverageVolume(window=20)
         rsi = Indicators.getRSI(series=self.stock_data["close_price"])
         if price == 0:
             if rsi > 70:
@@ -551,6 +545,9 @@ class BinanceTraderBot:
             return False
 
     def getFinalDecisionStrategy(self):
+        if self.panel_runner is not None:
+            return self.panel_runner.decision(self.operation_code, self.stock_data)
+
         final_decision = StrategyRunner.execute(
             self,
             stock_data=self.stock_data,
@@ -610,50 +607,58 @@ class BinanceTraderBot:
             # Atualiza todos os dados necessários (preços, saldos, posições)
             self.updateAllData(verbose=True)
             
-            # Verifica se há ordens abertas
-            has_buy_orders = self.hasOpenBuyOrder()
-            has_sell_orders = self.hasOpenSellOrder()
+            # Indicadores calculados neste ciclo (estratégias e ordens) ficam no cache até o próximo candle
+            with INDICATOR_CACHE.cycle(self.operation_code, self.candle_period, self.stock_data):
+                cache_stats = INDICATOR_CACHE.stats()
+                logging.debug(
+                    f"Cache de indicadores (acumulado): {cache_stats['hits']} acertos, "
+                    f"{cache_stats['misses']} cálculos, {cache_stats['evictions']} removidos"
+                )
 
-            # Se estiver em uma posição comprada, verifica stop loss e take profit
-            if self.actual_trade_position:
-                # Atualiza o trailing stop loss se necessário
-                self.updateTrailingStopLoss()
+                # Verifica se há ordens abertas
+                has_buy_orders = self.hasOpenBuyOrder()
+                has_sell_orders = self.hasOpenSellOrder()
+
+                # Se estiver em uma posição comprada, verifica stop loss e take profit
+                if self.actual_trade_position:
+                    # Atualiza o trailing stop loss se necessário
+                    self.updateTrailingStopLoss()
                 
-                # Verifica se o stop loss foi acionado
-                if self.stopLossTrigger():
-                    self.time_to_sleep = self.delay_after_order
-                    return
+                    # Verifica se o stop loss foi acionado
+                    if self.stopLossTrigger():
+                        self.time_to_sleep = self.delay_after_order
+                        return
                 
-                # Verifica se o take profit foi acionado
-                if self.takeProfitTrigger():
-                    self.time_to_sleep = self.delay_after_order
-                    return
+                    # Verifica se o take profit foi acionado
+                    if self.takeProfitTrigger():
+                        self.time_to_sleep = self.delay_after_order
+                        return
             
-            # Se não houver ordens abertas, executa a estratégia para decidir o próximo movimento
-            if not has_buy_orders and not has_sell_orders:
-                trade_decision = self.getFinalDecisionStrategy()
+                # Se não houver ordens abertas, executa a estratégia para decidir o próximo movimento
+                if not has_buy_orders and not has_sell_orders:
+                    trade_decision = self.getFinalDecisionStrategy()
                 
-                # Se houver um sinal de COMPRA e não estiver em posição comprada
-                if trade_decision == True and not self.actual_trade_position:
-                    print("🟢 Sinal de COMPRA detectado!")
-                    self.buyMarketOrder()
-                    self.time_to_sleep = self.delay_after_order
-                    return
+                    # Se houver um sinal de COMPRA e não estiver em posição comprada
+                    if trade_decision == True and not self.actual_trade_position:
+                        print("🟢 Sinal de COMPRA detectado!")
+                        self.buyMarketOrder()
+                        self.time_to_sleep = self.delay_after_order
+                        return
                 
-                # Se houver um sinal de VENDA e estiver em posição comprada
-                elif trade_decision == False and self.actual_trade_position:
-                    print("🔴 Sinal de VENDA detectado!")
-                    self.sellMarketOrder()
-                    self.time_to_sleep = self.delay_after_order
-                    return
+                    # Se houver um sinal de VENDA e estiver em posição comprada
+                    elif trade_decision == False and self.actual_trade_position:
+                        print("🔴 Sinal de VENDA detectado!")
+                        self.sellMarketOrder()
+                        self.time_to_sleep = self.delay_after_order
+                        return
                 
+                    else:
+                        print("⚪ Nenhum sinal de negociação detectado.")
+                        self.time_to_sleep = self.time_to_trade
                 else:
-                    print("⚪ Nenhum sinal de negociação detectado.")
-                    self.time_to_sleep = self.time_to_trade
-            else:
-                print(f"⏳ Aguardando execução das ordens abertas para {self.operation_code}...")
-                self.time_to_sleep = self.time_to_trade / 2  # Reduz o tempo para verificar mais rápido
-            
+                    print(f"⏳ Aguardando execução das ordens abertas para {self.operation_code}...")
+                    self.time_to_sleep = self.time_to_trade / 2  # Reduz o tempo para verificar mais rápido
+
         except Exception as e:
             logging.error(f"Erro durante a execução do ciclo de negociação: {e}")
             print(f"❌ Erro: {e}")
@@ -0,0 +1,255 @@
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CANDLE_STORE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "candles"))
+
+# Colunas gravadas (mesmo formato de BinanceTraderBot.getStockData); open_time em nanossegundos UTC
+CANDLE_COLUMNS = {
+    "close_price": "<f8",
+    "open_time": "<i8",
+    "open_price": "<f8",
+    "high_price": "<f8",
+    "low_price": "<f8",
+    "volume": "<f8",
+}
+KLINE_COLUMNS = [
+    "open_time",
+    "open_price",
+    "high_price",
+    "low_price",
+    "close_price",
+    "volume",
+    "close_time",
+    "quote_asset_volume",
+    "number_of_trades",
+    "taker_buy_base_asset_volume",
+    "taker_buy_quote_asset_volume",
+    "-",
+]
+
+
+def klinesToStockData(candles, timezone="America/Sao_Paulo"):
+    """
+    Converte a resposta de get_klines da Binance no DataFrame usado pelo bot e pelas estratégias.
+
+    :param candles: Lista de klines (listas com 12 campos) retornada pela API.
+    :param timezone: Fuso horário aplicado ao open_time.
+    :return: DataFrame com as colunas close_price, open_time, open_price, high_price, low_price e volume.
+    """
+    prices = pd.DataFrame(candles, columns=KLINE_COLUMNS)
+    prices = prices[["close_price", "open_time", "open_price", "high_price", "low_price", "volume"]]
+    prices["close_price"] = pd.to_numeric(prices["close_price"], errors="coerce")
+    prices["open_price"] = pd.to_numeric(prices["open_price"], errors="coerce")
+    prices["high_price"] = pd.to_numeric(prices["high_price"], errors="coerce")
+    prices["low_price"] = pd.to_numeric(prices["low_price"], errors="coerce")
+    prices["volume"] = pd.to_numeric(prices["volume"], errors="coerce")
+    prices["open_time"] = pd.to_datetime(prices["open_time"], unit="ms").dt.tz_localize("UTC")
+    prices["open_time"] = prices["open_time"].dt.tz_convert(timezone)
+    return prices
+
+
+class CandleStore:
+    """
+    Arquivo local de candles, um diretório por símbolo e intervalo.
+
+    Cada coluna é um arquivo binário bruto (append-only) lido com np.memmap: a leitura de anos de candles não
+    copia os preços para a memória, o sistema operacional carrega apenas as páginas acessadas. O meta.json guarda
+    a quantidade de linhas confirmadas; bytes gravados além dela (append interrompido) são descartados no próximo append.
+
+    Estrutura: <root>/<operation_code>/<interval>/{meta.json, close_price.bin, open_time.bin, ...}
+    """
+
+    def __init__(self, root=DEFAULT_CANDLE_STORE_DIR, timezone="America/Sao_Paulo"):
+        """
+        :param root: Diretório raiz do arquivo de candles.
+        :param timezone: Fuso horário aplicado ao open_time nas leituras.
+        """
+        self.root = root
+        self.timezone = timezone
+
+    # ------------------------------------------------------------------
+    # Metadados
+
+    def _path(self, operation_code, interval, name=None):
+        path = os.path.join(self.root, operation_code, interval)
+        return os.path.join(path, name) if name else path
+
+    def _readMeta(self, operation_code, interval):
+        meta_path = self._path(operation_code, interval, "meta.json")
+        if not os.path.exists(meta_path):
+            return {"rows": 0, "columns": CANDLE_COLUMNS}
+        with open(meta_path, "r", encoding="utf-8") as meta_file:
+            return json.load(meta_file)
+
+    def _writeMeta(self, operation_code, interval, meta):
+        # Grava em arquivo temporário e troca atomicamente: o meta.json nunca fica pela metade
+        meta_path = self._path(operation_code, interval, "meta.json")
+        temp_path = meta_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as meta_file:
+            json.dump(meta, meta_file)
+        os.replace(temp_path, meta_path)
+
+    def rows(self, operation_code, interval):
+        """Quantidade de candles gravados."""
+        return self._readMeta(operation_code, interval)["rows"]
+
+    def lastOpenTime(self, operation_code, interval):
+        """open_time (pd.Timestamp) do último candle gravado, ou None se o arquivo estiver vazio."""
+        arrays = self.readArrays(operation_code, interval, last=1)
+        if len(arrays["open_time"]) == 0:
+            return None
+        return pd.Timestamp(int(arrays["open_time"][-1]), unit="ns", tz="UTC").tz_convert(self.timezone)
+
+    # ------------------------------------------------------------------
+    # Escrita
+
+    def append(self, operation_code, interval, stock_data: pd.DataFrame):
+        """
+        Acrescenta candles ao final do arquivo. Candles com open_time menor ou igual ao último gravado são ignorados.
+
+        :param operation_code: Código da operação (ex: "BTCUSDT").
+        :param interval: Intervalo do candle (ex: "15m").
+        :param stock_data: DataFrame no formato de getStockData.
+        :return: Quantidade de candles gravados.
+        """
+        os.makedirs(self._path(operation_code, interval), exist_ok=True)
+        meta = self._readMeta(operation_code, interval)
+        rows = meta["rows"]
+
+        open_time = pd.DatetimeIndex(stock_data["open_time"])
+        if open_time.tz is None:
+            open_time = open_time.tz_localize("UTC")
+        open_time_ns = open_time.tz_convert("UTC").asi8
+
+        order = np.argsort(open_time_ns, kind="stable")
+        open_time_ns = open_time_ns[order]
+        keep = np.ones(len(order), dtype=bool)
+        keep[1:] = open_time_ns[1:] != open_time_ns[:-1]  # Remove horários duplicados
+
+        last = self.readArrays(operation_code, interval, last=1)["open_time"]
+        if len(last):
+            keep &= open_time_ns > last[-1]
+
+        if not keep.any():
+            return 0
+
+        for column, dtype in meta["columns"].items():
+            if column == "open_time":
+                values = open_time_ns[keep]
+            else:
+                values = stock_data[column].to_numpy(dtype=float)[order][keep]
+
+            column_path = self._path(operation_code, interval, f"{column}.bin")
+            with open(column_path, "ab") as column_file:
+                # Descarta bytes de um append interrompido antes de continuar
+                column_file.truncate(rows * np.dtype(dtype).itemsize)
+                column_file.write(np.ascontiguousarray(values, dtype=dtype).tobytes())
+
+        meta["rows"] = rows + int(keep.sum())
+        meta["interval"] = interval
+        self._writeMeta(operation_code, interval, meta)
+        return int(keep.sum())
+
+    def syncFromBinance(self, client, operation_code, interval, start_time=None, verbose=True):
+        """
+        Baixa da Binance os candles fechados que ainda não estão no arquivo (em páginas de 1000) e os acrescenta.
+
+        É a única operação que acessa a rede; os backtests leem apenas o arquivo local.
+
+        :param client: Cliente da Binance (ex: BinanceClient) com get_klines.
+        :param operation_code: Código da operação (ex: "BTCUSDT").
+        :param interval: Intervalo do candle (ex: Client.KLINE_INTERVAL_15MINUTE).
+        :param start_time: Início do download se o arquivo estiver vazio (data ou string; ex: "2023-01-01").
+        :param verbose: Exibe o progresso.
+        :return: Quantidade de candles acrescentados.
+        """
+        last = self.lastOpenTime(operation_code, interval)
+        if last is not None:
+            start_ms = int(last.value // 1_000_000) + 1
+        elif start_time is not None:
+            start = pd.Timestamp(start_time)
+            start_ms = int((start.tz_localize("UTC") if start.tz is None else start).value // 1_000_000)
+        else:
+            start_ms = 0
+
+        total = 0
+        while True:
+            candles = client.get_klines(symbol=operation_code, interval=interval, limit=1000, startTime=start_ms)
+            # Apenas candles já fechados entram no arquivo
+            now_ms = int(time.time() * 1000)
+            candles = [candle for candle in candles if candle[6] < now_ms]
+            if not candles:
+                break
+
+            total += self.append(operation_code, interval, klinesToStockData(candles, self.timezone))
+            start_ms = candles[-1][0] + 1
+            if verbose:
+                print(f"📥 {operation_code} {interval}: {total} candles baixados...")
+            if len(candles) < 1000:
+                break
+
+        if verbose:
+            stored = self.rows(operation_code, interval)
+            print(f"✅ {operation_code} {interval}: {total} candles novos | Total no arquivo: {stored}")
+        return total
+
+    # ------------------------------------------------------------------
+    # Leitura
+
+    def _rangeSlice(self, open_time, start, end, last):
+        begin, stop = 0, len(open_time)
+        if start is not None:
+            begin = int(np.searchsorted(open_time, self._toNanoseconds(start), side="left"))
+        if end is not None:
+            stop = int(np.searchsorted(open_time, self._toNanoseconds(end), side="right"))
+        if last is not None:
+            begin = max(begin, stop - last)
+        return slice(begin, stop)
+
+    def _toNanoseconds(self, value):
+        timestamp = pd.Timestamp(value)
+        if timestamp.tz is None:
+            timestamp = timestamp.tz_localize(self.timezone)
+        return timestamp.value
+
+    def readArrays(self, operation_code, interval, start=None, end=None, last=None):
+        """
+        Lê as colunas como arrays mapeados em memória (sem cópia).
+
+        :param start: Primeiro open_time incluído (data ou string; sem fuso = fuso do arquivo).
+        :param end: Último open_time incluído.
+        :param last: Quantidade máxima de candles finais (aplicada depois de start/end).
+        :return: Dicionário {coluna: np.memmap}; open_time em int64 (nanossegundos UTC).
+        """
+        meta = self._readMeta(operation_code, interval)
+        rows = meta["rows"]
+
+        arrays = {}
+        for column, dtype in meta["columns"].items():
+            if rows == 0:
+                arrays[column] = np.empty(0, dtype=dtype)
+            else:
+                arrays[column] = np.memmap(
+                    self._path(operation_code, interval, f"{column}.bin"), dtype=dtype, mode="r", shape=(rows,)
+                )
+
+        selection = self._rangeSlice(arrays["open_time"], start, end, last)
+        return {column: values[selection] for column, values in arrays.items()}
+
+    def read(self, operation_code, interval, start=None, end=None, last=None):
+        """
+        Lê os candles no formato de getStockData, pronto para backtestRunner e os demais motores.
+
+        As colunas de preço e volume continuam apontando para os arquivos mapeados (sem cópia);
+        apenas o open_time é convertido para datetime com fuso.
+
+        :return: DataFrame com as colunas close_price, open_time, open_price, high_price, low_price e volume.
+        """
+        arrays = self.readArrays(operation_code, interval, start=start, end=end, last=last)
+        open_time = pd.DatetimeIndex(np.asarray(arrays["open_time"]).view("M8[ns]")).tz_localize("UTC").tz_convert(self.timezone)
+        arrays["open_time"] = open_time
+        return pd.DataFrame({column: arrays[column] for column in CANDLE_COLUMNS}, copy=False)
@@ -0,0 +1,183 @@
+import threading
+
+from strategies.signal_series import getPanelDecisions
+
+"""
+Avaliação em painel das estratégias dos bots de um mesmo intervalo de candle.
+
+Os bots de stocks_traded_list com o mesmo CANDLE_PERIOD fecham o candle no mesmo instante e, sem o painel, cada
+thread calcula os mesmos indicadores sobre o seu próprio DataFrame. Com o painel, cada bot entrega ao PanelRunner os
+candles que já buscou no seu ciclo (submit, em updateAllData) e, ao pedir a decisão, todos os candles entregues e
+ainda não avaliados são empilhados em um painel (tempo x campo x símbolo) e avaliados em uma única passada sobre os
+arrays 2-D (getPanelDecisions em strategies/signal_series.py). Os bots desse lote recebem a decisão pronta.
+
+O painel não faz nenhuma chamada à API: cada bot continua buscando os seus próprios candles uma vez por ciclo, como
+sem o painel, e a decisão de cada símbolo é sempre calculada sobre os candles do ciclo atual do próprio bot. Stop
+loss, take profit e trailing usam esses mesmos candles. Nada é buscado nem calculado com a trava presa: um bot cujo
+símbolo está no lote de outro espera só o fim dessa avaliação.
+
+Os lotes se formam quando vários bots estão no meio do ciclo ao mesmo tempo (THREAD_LOCK = False no main.py, logo
+após o fechamento do candle). Com THREAD_LOCK = True os bots rodam um por vez e cada lote tem um único símbolo: o
+custo é o mesmo de chamar a estratégia direto.
+
+Em benchmarks/panel_decision_check.py (1000 candles por símbolo) a avaliação de um lote cresce de forma sublinear,
+não constante: a T3 vai de ~0.02-0.03 s com 5 símbolos a ~0.3-0.7 s com 401 (contra ~1.3-1.9 s símbolo a símbolo) e
+a Vortex de ~0.03 s a ~0.5 s (contra ~2 s).
+
+A decisão de cada símbolo é a mesma do StrategyRunner sobre os candles entregues (principal e, se inconclusiva e
+ativado, fallback). Estratégias sem versão em série para painel (atributo `supports_panel`) são chamadas símbolo a
+símbolo dentro do lote. No modo painel as estratégias rodam com verbose=False (sem o log de cada símbolo).
+"""
+
+_shared_runners = {}
+_shared_lock = threading.Lock()
+
+
+class PanelRunner:
+    """
+    Lotes de decisões dos bots de um mesmo intervalo e das mesmas estratégias, sobre os candles de cada bot.
+    """
+
+    def __init__(
+        self,
+        candle_period,
+        main_strategy,
+        main_strategy_args=None,
+        fallback_strategy=None,
+        fallback_strategy_args=None,
+        fallback_activated=False,
+    ):
+        """
+        :param candle_period: Intervalo dos candles (ex: '15m'); só bots do mesmo intervalo compartilham o painel.
+        :param main_strategy: Função da estratégia principal.
+        :param main_strategy_args: Dicionário com argumentos extras para a estratégia principal.
+        :param fallback_strategy: Função da estratégia secundária (fallback).
+        :param fallback_strategy_args: Dicionário com argumentos extras para a estratégia de fallback.
+        :param fallback_activated: Se True, a fallback decide os símbolos em que a principal for inconclusiva.
+        """
+        self.candle_period = candle_period
+        self.main_strategy = main_strategy
+        self.main_strategy_args = main_strategy_args
+        self.fallback_strategy = fallback_strategy
+        self.fallback_strategy_args = fallback_strategy_args
+        self.fallback_activated = fallback_activated
+
+        self._condition = threading.Condition()  # Protege o estado abaixo (nunca fica presa durante o cálculo)
+        self._pending = {}  # símbolo -> candles entregues e ainda não avaliados
+        self._running = set()  # símbolos no lote sendo avaliado por algum bot
+        self._results = {}  # símbolo -> (candles avaliados, decisão, erro)
+
+    def _strategyDecisions(self, strategy, strategy_args, stock_data_by_symbol):
+        """Decisões da estratégia em painel; se a passada falhar, símbolo a símbolo (o erro fica no símbolo)."""
+        kwargs = dict(strategy_args or {}, verbose=False)
+        try:
+            return getPanelDecisions(strategy, stock_data_by_symbol, **kwargs), {}
+        except Exception:
+            decisions, errors = {}, {}
+            for symbol, stock_data in stock_data_by_symbol.items():
+                try:
+                    decisions.update(getPanelDecisions(strategy, {symbol: stock_data}, **kwargs))
+                except Exception as e:
+                    errors[symbol] = e
+            return decisions, errors
+
+    def evaluate(self, stock_data_by_symbol):
+        """
+        Decisões finais (principal e, se necessário, fallback) de vários símbolos, como o StrategyRunner.
+
+        :param stock_data_by_symbol: Dicionário {símbolo: candles}.
+        :return: (decisões {símbolo: True, False ou None}, erros {símbolo: exceção}).
+        """
+        decisions, errors = self._strategyDecisions(self.main_strategy, self.main_strategy_args, stock_data_by_symbol)
+
+        if self.fallback_activated and self.fallback_strategy is not None:
+            pending = {symbol: stock_data_by_symbol[symbol] for symbol, decision in decisions.items() if decision is None}
+            if pending:
+                fallback, fallback_errors = self._strategyDecisions(self.fallback_strategy, self.fallback_strategy_args, pending)
+                decisions.update(fallback)
+                errors.update(fallback_errors)
+        return decisions, errors
+
+    def submit(self, symbol, stock_data):
+        """
+        Entrega os candles do ciclo atual do bot para o próximo lote.
+
+        :param symbol: Símbolo negociado (ex: 'BTCUSDT').
+        :param stock_data: Candles que o bot acabou de buscar (getStockData).
+        """
+        with self._condition:
+            self._pending[symbol] = stock_data
+
+    def _result(self, symbol, stock_data):
+        # Resultado já calculado para exatamente estes candles (ou None)
+        result = self._results.get(symbol)
+        if result is not None and result[0] is stock_data:
+            return result
+        return None
+
+    def decision(self, symbol, stock_data):
+        """
+        Decisão final do símbolo para os candles do ciclo atual do bot.
+
+        Se a decisão destes candles ainda não saiu, avalia em um único painel todos os candles entregues e pendentes
+        (inclusive os deste bot); se o símbolo já está no lote de outro bot, espera esse lote terminar.
+
+        :param symbol: Símbolo negociado.
+        :param stock_data: Candles do ciclo do bot (os mesmos entregues em submit).
+        :return: True (compra), False (venda) ou None.
+        """
+        with self._condition:
+            while self._result(symbol, stock_data) is None and symbol in self._running:
+                self._condition.wait()
+
+            result = self._result(symbol, stock_data)
+            if result is None:
+                self._pending[symbol] = stock_data
+                batch, self._pending = self._pending, {}
+                self._running.update(batch)
+
+        if result is None:
+            try:
+                decisions, errors = self.evaluate(batch)
+            except Exception as e:
+                decisions, errors = {}, {other: e for other in batch}
+            with self._condition:
+                for other, other_data in batch.items():
+                    self._results[other] = (other_data, decisions.get(other), errors.get(other))
+                self._running.difference_update(batch)
+                self._condition.notify_all()
+                result = self._results[symbol]
+
+        _, decision, error = result
+        if error is not None:
+            raise error
+        return decision
+
+
+def sharedPanelRunner(
+    candle_period,
+    main_strategy,
+    main_strategy_args=None,
+    fallback_strategy=None,
+    fallback_strategy_args=None,
+    fallback_activated=False,
+):
+    """
+    PanelRunner compartilhado pelos bots com o mesmo intervalo e as mesmas estratégias (e argumentos).
+
+    :return: PanelRunner (criado na primeira chamada com essa configuração).
+    """
+    key = (
+        candle_period,
+        main_strategy,
+        repr(sorted((main_strategy_args or {}).items())),
+        fallback_strategy,
+        repr(sorted((fallback_strategy_args or {}).items())),
+        bool(fallback_activated),
+    )
+    with _shared_lock:
+        if key not in _shared_runners:
+            _shared_runners[key] = PanelRunner(
+                candle_period, main_strategy, main_strategy_args, fallback_strategy, fallback_strategy_args, fallback_activated
+            )
+        return _shared_runners[key]
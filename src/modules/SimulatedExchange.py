@@ -0,0 +1,70 @@
+class SimulatedExchange:
+    """
+    Corretora em memória para simulações offline.
+
+    Implementa o create_order do python-binance usado por tests/eventBacktestRunner.py, executando ordens a mercado
+    no preço do candle atual, sem nenhuma chamada de rede. Os saldos ficam em balances e as ordens executadas em orders.
+    """
+
+    def __init__(self, stock_code, quote_code="USDT", initial_balance=1000, fee_percentage=0.0):
+        """
+        :param stock_code: Código do ativo negociado (ex: "BTC").
+        :param quote_code: Código da moeda de cotação (ex: "USDT").
+        :param initial_balance: Saldo inicial na moeda de cotação.
+        :param fee_percentage: (Em base 100%) Taxa cobrada sobre o valor de cada ordem, descontada da moeda de cotação.
+        """
+        self.stock_code = stock_code
+        self.quote_code = quote_code
+        self.fee_rate = fee_percentage / 100
+
+        self.balances = {stock_code: 0.0, quote_code: float(initial_balance)}
+        self.orders = []
+
+        self.current_price = None
+        self.current_time = 0
+        self._next_order_id = 1
+
+    def setMarket(self, price, timestamp=0):
+        """Atualiza o preço de execução e o horário (ms) usados pelas próximas ordens."""
+        self.current_price = price
+        self.current_time = timestamp
+
+    def create_order(self, symbol, side, type, quantity, **kwargs):
+        """
+        Executa uma ordem a mercado no preço atual.
+
+        :return: Dicionário no formato de resposta da Binance (com 'fills').
+        """
+        quantity = float(quantity)
+        price = self.current_price
+        quote_amount = quantity * price
+        fee = quote_amount * self.fee_rate
+
+        if side == "BUY":
+            if quote_amount + fee > self.balances[self.quote_code] * (1 + 1e-12):
+                raise ValueError(f"Saldo insuficiente de {self.quote_code} para comprar {quantity} {self.stock_code}.")
+            self.balances[self.quote_code] -= quote_amount + fee
+            self.balances[self.stock_code] += quantity
+        else:
+            if quantity > self.balances[self.stock_code] * (1 + 1e-12):
+                raise ValueError(f"Saldo insuficiente de {self.stock_code} para vender {quantity}.")
+            self.balances[self.stock_code] = max(0.0, self.balances[self.stock_code] - quantity)
+            self.balances[self.quote_code] += quote_amount - fee
+
+        order = {
+            "symbol": symbol,
+            "orderId": self._next_order_id,
+            "side": side,
+            "type": type,
+            "status": "FILLED",
+            "time": self.current_time,
+            "transactTime": self.current_time,
+            "origQty": str(quantity),
+            "executedQty": str(quantity),
+            "cummulativeQuoteQty": str(quote_amount),
+            "price": "0",
+            "fills": [{"price": str(price), "qty": str(quantity), "commission": str(fee), "commissionAsset": self.quote_code}],
+        }
+        self._next_order_id += 1
+        self.orders.append(order)
+        return order
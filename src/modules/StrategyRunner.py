@@ -1,3 +1,6 @@
+from indicators.ohlcv_view import ohlcvView
+
+
 class StrategyRunner:
 
     @staticmethod
@@ -7,6 +10,10 @@ class StrategyRunner:
         """
         Executa a estratégia principal e, se necessário, a estratégia de fallback.
 
+        As estratégias recebem os candles somente leitura (ohlcvView(read_only=True)), cada uma em um DataFrame
+        próprio que divide os arrays com stock_data: não há cópia e uma estratégia não altera os dados da outra.
+        Os dicionários de argumentos não são alterados (não guardam o stock_data do ciclo anterior).
+
         :param main_strategy: Função da estratégia principal.
         :param fallback_strategy: Função da estratégia secundária (fallback).
         :param stock_data: Dados do ativo.
@@ -14,23 +21,16 @@ class StrategyRunner:
         :param fallback_strategy_args: Dicionário com argumentos extras para a estratégia de fallback.
         :return: Decisão final da estratégia.
         """
-        # Define argumentos básicos para a estratégia principal
-        main_strategy_args = main_strategy_args or {}  # Se não for passado, usa um dicionário vazio
-        main_strategy_args["stock_data"] = stock_data  # stock_data sempre será passado
-        main_strategy_args["verbose"] = verbose
+        candles = ohlcvView(stock_data, read_only=True)
 
-        # Executa a estratégia principal
-        final_decision = main_strategy(**main_strategy_args)
+        # Executa a estratégia principal (stock_data e verbose sempre são passados)
+        final_decision = main_strategy(**dict(main_strategy_args or {}, stock_data=candles, verbose=verbose))
 
         # Se a estratégia principal for inconclusiva e a fallback estiver ativada
         if final_decision is None and self.fallback_activated:
             print("Estratégia principal inconclusiva\nExecutando estratégia de fallback...")
 
-            # Define argumentos básicos para a fallback
-            fallback_strategy_args = fallback_strategy_args or {}  # Se não for passado, usa um dicionário vazio
-            fallback_strategy_args["stock_data"] = stock_data  # stock_data sempre será passado
-            fallback_strategy_args["verbose"] = verbose
-
-            final_decision = fallback_strategy(**fallback_strategy_args)
+            fallback_candles = ohlcvView(candles, read_only=True)  # Cópia rasa: colunas criadas pela principal não aparecem
+            final_decision = fallback_strategy(**dict(fallback_strategy_args or {}, stock_data=fallback_candles, verbose=verbose))
 
         return final_decision
@@ -0,0 +1,9 @@
+"""
+Parâmetros do trailing stop loss do BinanceTraderBot.
+
+Ficam em um módulo próprio (sem dependências) para que o bot e o simulador orientado a eventos
+(tests/eventBacktestRunner.py) usem sempre os mesmos valores.
+"""
+
+TRAILING_ACTIVATION_PERCENTAGE = 0.03  # 3% de alta sobre o preço de compra ativa o trailing
+TRAILING_GAP = 0.01  # Trailing stop 1% abaixo do pico
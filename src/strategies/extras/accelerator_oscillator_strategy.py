@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionChain, prefixLength
+
 def getAcceleratorOscillatorTradeStrategy(
     stock_data: pd.DataFrame,
     sma_period: int = 5,
@@ -31,7 +34,7 @@ def getAcceleratorOscillatorTradeStrategy(
     - signal_lookback: Períodos para análise de tendência do AC
     - use_zero_cross: Usar cruzamento do zero como sinal adicional
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se as colunas necessárias existem
     required_cols = ['high', 'low']
@@ -132,4 +135,56 @@ def getAcceleratorOscillatorTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getAcceleratorOscillatorTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    sma_period: int = 5,
+    ao_period_fast: int = 5,
+    ao_period_slow: int = 34,
+    signal_lookback: int = 3,
+    use_zero_cross: bool = True,
+    verbose: bool = False
+):
+    """
+    Versão em série de getAcceleratorOscillatorTradeStrategy: calcula o AC uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    median_price = (stock_data['high'] + stock_data['low']) / 2
+    awesome_oscillator = (
+        median_price.rolling(window=ao_period_fast).mean() - median_price.rolling(window=ao_period_slow).mean()
+    )
+    accelerator_oscillator = awesome_oscillator - awesome_oscillator.rolling(window=sma_period).mean()
+    sign_change = np.sign(accelerator_oscillator).diff()
+    
+    # Quantos dos últimos 'signal_lookback' candles tiveram AC crescente (com sinal negativo quando AC <= 0)
+    ac_increasing = (accelerator_oscillator > accelerator_oscillator.shift(1)).astype(int)
+    increases = ac_increasing.rolling(window=signal_lookback, min_periods=1).sum()
+    ac_trend_pattern = np.where(accelerator_oscillator > 0, increases, -increases)
+    
+    previous_ac = accelerator_oscillator.shift(1)
+    zero_cross_up = use_zero_cross & (previous_ac <= 0) & (accelerator_oscillator > 0)
+    zero_cross_down = use_zero_cross & (previous_ac >= 0) & (accelerator_oscillator < 0)
+    
+    # Variação do sinal do AC: +2 / -2 decidem; NaN (AC ainda indefinido) ou +1 / -1 não decidem
+    sign_changed = sign_change != 0
+    sign_decision = np.where(sign_change == 2, True, np.where(sign_change == -2, False, None))
+    
+    min_periods = max(sma_period, ao_period_fast, ao_period_slow) + signal_lookback
+    return decisionChain(
+        [
+            (zero_cross_up, True),
+            (zero_cross_down, False),
+            (sign_changed, sign_decision),
+            (ac_trend_pattern > 0, True),
+            (ac_trend_pattern < 0, False),
+            (accelerator_oscillator > 0, True),
+            (accelerator_oscillator < 0, False),
+        ],
+        stock_data.index,
+        valid=prefixLength(stock_data) > min_periods,
+    )
+
+
+getAcceleratorOscillatorTradeStrategy.signal_series = getAcceleratorOscillatorTradeStrategySeries
@@ -12,6 +12,10 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.weighted_windows import almaWeights, weightedMovingAverage
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, previousValue
+
 def getALMATradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -32,46 +36,14 @@ def getALMATradeStrategy(
     - offset: Controla a localização da gaussiana (0.5-1.0, default 0.85)
     - signal_period: Período para a linha de sinal (média móvel do ALMA)
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos a coluna 'close'
     if 'close' not in stock_data.columns:
-        # Tentar converter para minúsculas
-        stock_data.columns = [col.lower() for col in stock_data.columns]
-        if 'close' not in stock_data.columns:
-            raise ValueError("Coluna 'close' não encontrada nos dados.")
-    
-    # Calcular o ALMA
-    def calculate_alma(series, period, sigma, offset):
-        # Verificar se temos dados suficientes
-        if len(series) < period:
-            return np.full_like(series, np.nan)
-        
-        # Inicializar o resultado com NaN
-        result = np.full_like(series, np.nan)
-        
-        # Calcular os parâmetros
-        m = np.floor(offset * (period - 1))
-        s = period / sigma
-        
-        # Calcular os pesos para o ALMA
-        weights = np.zeros(period)
-        for i in range(period):
-            weights[i] = np.exp(-((i - m) ** 2) / (2 * s * s))
-        
-        # Normalizar os pesos
-        weights = weights / np.sum(weights)
-        
-        # Aplicar a média ponderada
-        for i in range(period - 1, len(series)):
-            window = series.iloc[i - period + 1 : i + 1].values
-            result[i] = np.sum(window * weights)
-        
-        return result
+        raise ValueError("Coluna 'close' não encontrada nos dados.")
     
     # Aplicar o ALMA aos preços de fechamento
-    alma_values = calculate_alma(stock_data['close'], period, sigma, offset)
-    stock_data['alma'] = alma_values
+    stock_data['alma'] = weightedMovingAverage(stock_data['close'], almaWeights(period, sigma, offset))
     
     # Calcular a linha de sinal (média móvel do ALMA)
     stock_data['alma_signal'] = stock_data['alma'].rolling(window=signal_period).mean()
@@ -141,4 +113,39 @@ def getALMATradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getALMATradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    sigma: float = 6.0,
+    offset: float = 0.85,
+    signal_period: int = 9,
+    verbose: bool = False
+):
+    """
+    Versão em série de getALMATradeStrategy: calcula o ALMA e a linha de sinal uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    close = stock_data['close']
+    alma = weightedMovingAverage(close, almaWeights(period, sigma, offset))
+    alma_signal = alma.rolling(window=signal_period).mean()
+    is_uptrend = alma.diff() > 0
+    
+    # Valores do candle anterior (o próprio candle no primeiro prefixo)
+    prev_close = previousValue(close)
+    prev_alma = previousValue(alma)
+    prev_signal = previousValue(alma_signal)
+    
+    price_cross_up = (close > alma) & (prev_close <= prev_alma)
+    price_cross_down = (close < alma) & (prev_close >= prev_alma)
+    alma_cross_up = (alma > alma_signal) & (prev_alma <= prev_signal)
+    alma_cross_down = (alma < alma_signal) & (prev_alma >= prev_signal)
+    
+    buy_signal = (price_cross_up & is_uptrend) | alma_cross_up
+    sell_signal = (price_cross_down & ~is_uptrend) | alma_cross_down
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getALMATradeStrategy.signal_series = getALMATradeStrategySeries
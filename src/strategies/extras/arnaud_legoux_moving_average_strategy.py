@@ -12,6 +12,10 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.weighted_windows import almaWeights, weightedMovingAverageBatch
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries
+
 def getArnaudLegouxMovingAverageTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -33,42 +37,18 @@ def getArnaudLegouxMovingAverageTradeStrategy(
     - slow_period: Período para ALMA lenta
     - use_close: Usar preço de fechamento para cálculos
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se a coluna de preço existe
     price_col = 'close' if use_close else 'open'
     if price_col not in stock_data.columns:
         raise ValueError(f"Coluna '{price_col}' não encontrada nos dados")
     
-    # Função para calcular ALMA
-    def alma(series, period, sigma, offset):
-        m = np.floor(offset * (period - 1))
-        s = period / sigma
-        weights = np.zeros(period)
-        
-        # Calcular pesos de acordo com a distribuição de Gauss
-        for i in range(period):
-            weights[i] = np.exp(-((i - m) ** 2) / (2 * s * s))
-            
-        # Normalizar pesos
-        weights = weights / np.sum(weights)
-        
-        # Aplicar os pesos para calcular o ALMA
-        result = np.zeros(len(series))
-        result[:] = np.NaN
-        
-        for i in range(period - 1, len(series)):
-            window = series.iloc[i - period + 1:i + 1].values
-            result[i] = np.sum(window * weights[::-1])  # Inverter pesos para corresponder ao janelamento correto
-            
-        return pd.Series(result, index=series.index)
-    
-    # Calcular ALMA principal
-    stock_data['alma'] = alma(stock_data[price_col], period, sigma, offset)
-    
-    # Calcular ALMA rápida e lenta para sinais de cruzamento
-    stock_data['fast_alma'] = alma(stock_data[price_col], fast_period, sigma, offset)
-    stock_data['slow_alma'] = alma(stock_data[price_col], slow_period, sigma, offset)
+    # Calcular ALMA principal, rápida e lenta (pesos invertidos para corresponder ao janelamento correto)
+    stock_data['alma'], stock_data['fast_alma'], stock_data['slow_alma'] = weightedMovingAverageBatch(
+        stock_data[price_col],
+        [almaWeights(p, sigma, offset)[::-1] for p in (period, fast_period, slow_period)],
+    )
     
     # Gerar sinais de negociação
     stock_data['signal'] = np.where(
@@ -116,4 +96,36 @@ def getArnaudLegouxMovingAverageTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getArnaudLegouxMovingAverageTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    sigma: float = 6.0,
+    offset: float = 0.85,
+    fast_period: int = 9,
+    slow_period: int = 21,
+    use_close: bool = True,
+    verbose: bool = False
+):
+    """
+    Versão em série de getArnaudLegouxMovingAverageTradeStrategy: calcula as ALMAs uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    price_col = 'close' if use_close else 'open'
+    price = stock_data[price_col]
+    alma, fast_alma, slow_alma = weightedMovingAverageBatch(
+        price,
+        [almaWeights(p, sigma, offset)[::-1] for p in (period, fast_period, slow_period)],
+    )
+    signal = pd.Series(np.where(fast_alma > slow_alma, 1, np.where(fast_alma < slow_alma, -1, 0)), index=stock_data.index)
+    signal_change = signal.diff()
+    
+    # Mudança de sinal primeiro; sem mudança, segue o sinal confirmado pelo preço em relação ao ALMA
+    buy_signal = (signal_change > 0) | (~(signal_change < 0) & (signal > 0) & (price > alma))
+    sell_signal = (signal_change < 0) | (~(signal_change > 0) & (signal < 0) & (price < alma))
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getArnaudLegouxMovingAverageTradeStrategy.signal_series = getArnaudLegouxMovingAverageTradeStrategySeries
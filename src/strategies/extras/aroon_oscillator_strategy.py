@@ -12,6 +12,10 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.rolling_extrema import rollingExtrema
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionChain
+
 def getAroonOscillatorTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -29,7 +33,7 @@ def getAroonOscillatorTradeStrategy(
     - oversold: Nível de sobrevenda
     - zero_cross_signal: Usar cruzamento do zero como sinal adicional
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se as colunas necessárias existem
     if 'high' not in stock_data.columns or 'low' not in stock_data.columns:
@@ -37,8 +41,9 @@ def getAroonOscillatorTradeStrategy(
     
     # Função para calcular Aroon
     def calculate_aroon(data, period):
-        high_idx = data['high'].rolling(window=period).apply(lambda x: x.argmax(), raw=True)
-        low_idx = data['low'].rolling(window=period).apply(lambda x: x.argmin(), raw=True)
+        # Posição do máximo/mínimo dentro da janela (0 = candle mais antigo), como o argmax/argmin da janela
+        high_idx = period - 1 - rollingExtrema(data['high'], period, find_max=True)['bars_since']
+        low_idx = period - 1 - rollingExtrema(data['low'], period, find_max=False)['bars_since']
         
         aroon_up = 100 * (period - high_idx) / period
         aroon_down = 100 * (period - low_idx) / period
@@ -93,4 +98,40 @@ def getAroonOscillatorTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getAroonOscillatorTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    overbought: int = 50,
+    oversold: int = -50,
+    zero_cross_signal: bool = True,
+    verbose: bool = False
+):
+    """
+    Versão em série de getAroonOscillatorTradeStrategy: calcula o oscilador uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    high_idx = period - 1 - rollingExtrema(stock_data['high'], period, find_max=True)['bars_since']
+    low_idx = period - 1 - rollingExtrema(stock_data['low'], period, find_max=False)['bars_since']
+    aroon_oscillator = 100 * (period - high_idx) / period - 100 * (period - low_idx) / period
+    
+    previous_oscillator = aroon_oscillator.shift(1)
+    zero_cross_up = zero_cross_signal & (previous_oscillator <= 0) & (aroon_oscillator > 0)
+    zero_cross_down = zero_cross_signal & (previous_oscillator >= 0) & (aroon_oscillator < 0)
+    
+    return decisionChain(
+        [
+            (zero_cross_up, True),
+            (zero_cross_down, False),
+            (aroon_oscillator > overbought, True),
+            (aroon_oscillator < oversold, False),
+            (aroon_oscillator > 0, True),
+            (aroon_oscillator < 0, False),
+        ],
+        stock_data.index,
+    )
+
+
+getAroonOscillatorTradeStrategy.signal_series = getAroonOscillatorTradeStrategySeries
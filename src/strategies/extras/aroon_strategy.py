@@ -12,6 +12,10 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.rolling_extrema import rollingExtrema
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionChain, prefixLength
+
 def getAroonTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -29,7 +33,7 @@ def getAroonTradeStrategy(
     - bearish_threshold: Limite para identificar tendência de baixa
     - crossover_signal: Usar cruzamento como sinal adicional
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se as colunas necessárias existem
     if 'high' not in stock_data.columns or 'low' not in stock_data.columns:
@@ -42,8 +46,9 @@ def getAroonTradeStrategy(
     # Calcular Aroon Up e Aroon Down
     # Função para calcular índices dos máximos/mínimos em um período
     def calculate_aroon(data, period):
-        high_idx = data['high'].rolling(window=period).apply(lambda x: x.argmax(), raw=True)
-        low_idx = data['low'].rolling(window=period).apply(lambda x: x.argmin(), raw=True)
+        # Posição do máximo/mínimo dentro da janela (0 = candle mais antigo), como o argmax/argmin da janela
+        high_idx = period - 1 - rollingExtrema(data['high'], period, find_max=True)['bars_since']
+        low_idx = period - 1 - rollingExtrema(data['low'], period, find_max=False)['bars_since']
         
         # Calcular Aroon Up: ((period - períodos desde o máximo) / period) * 100
         aroon_up = ((period - high_idx - 1) / period) * 100
@@ -114,4 +119,44 @@ def getAroonTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getAroonTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    bullish_threshold: int = 70,
+    bearish_threshold: int = 30,
+    crossover_signal: bool = True,
+    verbose: bool = False
+):
+    """
+    Versão em série de getAroonTradeStrategy: calcula o Aroon uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    high_idx = period - 1 - rollingExtrema(stock_data['high'], period, find_max=True)['bars_since']
+    low_idx = period - 1 - rollingExtrema(stock_data['low'], period, find_max=False)['bars_since']
+    aroon_up = ((period - high_idx - 1) / period) * 100
+    aroon_down = ((period - low_idx - 1) / period) * 100
+    aroon_oscillator = aroon_up - aroon_down
+    
+    bullish = (aroon_up > bullish_threshold) & (aroon_down < bearish_threshold)
+    bearish = (aroon_up < bearish_threshold) & (aroon_down > bullish_threshold)
+    cross_up = crossover_signal & (aroon_up.shift(1) <= aroon_down.shift(1)) & (aroon_up > aroon_down)
+    cross_down = crossover_signal & (aroon_up.shift(1) >= aroon_down.shift(1)) & (aroon_up < aroon_down)
+    
+    return decisionChain(
+        [
+            (cross_up, True),
+            (cross_down, False),
+            (bullish, True),
+            (bearish, False),
+            (aroon_oscillator > 0, True),
+            (aroon_oscillator < 0, False),
+        ],
+        stock_data.index,
+        valid=prefixLength(stock_data) > period,
+    )
+
+
+getAroonTradeStrategy.signal_series = getAroonTradeStrategySeries
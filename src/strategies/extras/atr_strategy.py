@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries
+
 def getATRTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -35,7 +38,7 @@ def getATRTradeStrategy(
     - atr_threshold: Limite percentual de variação do ATR para gerar sinais
     - lookback_period: Período para verificar a tendência recente do preço
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos os dados necessários
     required_columns = ['high', 'low', 'close']
@@ -43,9 +46,6 @@ def getATRTradeStrategy(
         if col not in stock_data.columns:
             raise ValueError(f"Coluna {col} não encontrada nos dados.")
     
-    # Converter nomes de colunas para minúsculas se necessário
-    stock_data.columns = [col.lower() for col in stock_data.columns]
-    
     # Calcular o ATR
     # Primeiro, calcular o True Range (TR)
     stock_data['high_low'] = stock_data['high'] - stock_data['low']
@@ -95,4 +95,30 @@ def getATRTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getATRTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    atr_threshold: float = 1.5,
+    lookback_period: int = 5,
+    verbose: bool = False
+):
+    """
+    Versão em série de getATRTradeStrategy: calcula o ATR uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    high_low = stock_data['high'] - stock_data['low']
+    high_close = np.abs(stock_data['high'] - stock_data['close'].shift(1))
+    low_close = np.abs(stock_data['low'] - stock_data['close'].shift(1))
+    tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
+    atr_change = tr.rolling(window=period).mean().pct_change(periods=1) * 100
+    price_direction = stock_data['close'].diff(periods=lookback_period)
+    
+    buy_signal = (atr_change > atr_threshold) & (price_direction > 0)
+    sell_signal = atr_change < -atr_threshold
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getATRTradeStrategy.signal_series = getATRTradeStrategySeries
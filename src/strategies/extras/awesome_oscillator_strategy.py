@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, prefixLength
+
 def getAwesomeOscillatorTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -30,14 +33,11 @@ def getAwesomeOscillatorTradeStrategy(
     - fast_period: Período para a média móvel rápida
     - slow_period: Período para a média móvel lenta
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos os dados necessários
     required_columns = ['high', 'low']
     
-    # Converter nomes de colunas para minúsculas se necessário
-    stock_data.columns = [col.lower() for col in stock_data.columns]
-    
     for col in required_columns:
         if col not in stock_data.columns:
             raise ValueError(f"Coluna {col} não encontrada nos dados.")
@@ -123,4 +123,41 @@ def getAwesomeOscillatorTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getAwesomeOscillatorTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    fast_period: int = 5,
+    slow_period: int = 34,
+    verbose: bool = False
+):
+    """
+    Versão em série de getAwesomeOscillatorTradeStrategy: calcula o AO uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    midpoint = (stock_data['high'] + stock_data['low']) / 2
+    ao = midpoint.rolling(window=fast_period).mean() - midpoint.rolling(window=slow_period).mean()
+    prev_ao = ao.shift(1)
+    prev2_ao = ao.shift(2)
+    
+    zero_cross_up = (ao > 0) & (prev_ao < 0)
+    zero_cross_down = (ao < 0) & (prev_ao > 0)
+    saucer_buy = (ao > 0) & (ao > prev_ao) & (prev_ao < prev2_ao)
+    saucer_sell = (ao < 0) & (ao < prev_ao) & (prev_ao > prev2_ao)
+    
+    # Twin peaks: variações dos últimos 5 valores do AO (4 diferenças), só com mais de 5 candles
+    ao_diff = ao.diff()
+    enough_data = prefixLength(stock_data) > 5
+    rising_count = (ao_diff > 0).astype(int).rolling(window=4, min_periods=1).sum()
+    falling_count = (ao_diff < 0).astype(int).rolling(window=4, min_periods=1).sum()
+    twin_peaks_buy = enough_data & (ao < 0) & (rising_count >= 3)
+    twin_peaks_sell = enough_data & (ao > 0) & (falling_count >= 3)
+    
+    buy_signal = zero_cross_up | saucer_buy | twin_peaks_buy
+    sell_signal = zero_cross_down | saucer_sell | twin_peaks_sell
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getAwesomeOscillatorTradeStrategy.signal_series = getAwesomeOscillatorTradeStrategySeries
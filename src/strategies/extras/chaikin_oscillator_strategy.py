@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, prefixLength, previousValue
+
 def getChaikinOscillatorTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -30,14 +33,11 @@ def getChaikinOscillatorTradeStrategy(
     - fast_period: Período para a EMA rápida da ADL
     - slow_period: Período para a EMA lenta da ADL
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos os dados necessários
     required_columns = ['high', 'low', 'close', 'volume']
     
-    # Converter nomes de colunas para minúsculas se necessário
-    stock_data.columns = [col.lower() for col in stock_data.columns]
-    
     for col in required_columns:
         if col not in stock_data.columns:
             raise ValueError(f"Coluna {col} não encontrada nos dados.")
@@ -117,4 +117,43 @@ def getChaikinOscillatorTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getChaikinOscillatorTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    fast_period: int = 3,
+    slow_period: int = 10,
+    verbose: bool = False
+):
+    """
+    Versão em série de getChaikinOscillatorTradeStrategy: calcula o oscilador uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    close = stock_data['close']
+    mf_multiplier = ((close - stock_data['low']) - (stock_data['high'] - close)) / (stock_data['high'] - stock_data['low'])
+    mf_multiplier = mf_multiplier.replace([np.inf, -np.inf], 0).fillna(0)
+    adl = (mf_multiplier * stock_data['volume']).cumsum()
+    chaikin_osc = adl.ewm(span=fast_period, adjust=False).mean() - adl.ewm(span=slow_period, adjust=False).mean()
+    
+    # Valor do candle anterior (o próprio candle no primeiro prefixo)
+    prev_chaikin = previousValue(chaikin_osc)
+    is_positive = chaikin_osc > 0
+    is_rising = chaikin_osc > prev_chaikin
+    zero_cross_up = (chaikin_osc > 0) & (prev_chaikin < 0)
+    zero_cross_down = (chaikin_osc < 0) & (prev_chaikin > 0)
+    
+    # Divergência contra o candle de 'period' candles atrás, só com pelo menos 'period' candles
+    enough_data = prefixLength(stock_data) >= period
+    price_rising = close > close.shift(period - 1)
+    chaikin_rising = chaikin_osc > chaikin_osc.shift(period - 1)
+    divergence_sell = enough_data & price_rising & ~chaikin_rising
+    divergence_buy = enough_data & ~price_rising & chaikin_rising
+    
+    buy_signal = zero_cross_up | (is_positive & is_rising) | divergence_buy
+    sell_signal = zero_cross_down | (~is_positive & ~is_rising) | divergence_sell
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getChaikinOscillatorTradeStrategy.signal_series = getChaikinOscillatorTradeStrategySeries
@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, prefixLength, previousValue
+
 def getChandeMomentumOscillatorTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -30,14 +33,11 @@ def getChandeMomentumOscillatorTradeStrategy(
     - overbought: Nível que indica condição de sobrecompra
     - oversold: Nível que indica condição de sobrevenda
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos a coluna 'close'
     if 'close' not in stock_data.columns:
-        # Tentar converter para minúsculas
-        stock_data.columns = [col.lower() for col in stock_data.columns]
-        if 'close' not in stock_data.columns:
-            raise ValueError("Coluna 'close' não encontrada nos dados.")
+        raise ValueError("Coluna 'close' não encontrada nos dados.")
     
     # Calcular variação diária
     stock_data['price_change'] = stock_data['close'].diff()
@@ -113,4 +113,41 @@ def getChandeMomentumOscillatorTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getChandeMomentumOscillatorTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    overbought: int = 50,
+    oversold: int = -50,
+    verbose: bool = False
+):
+    """
+    Versão em série de getChandeMomentumOscillatorTradeStrategy: calcula o CMO uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    close = stock_data['close']
+    price_change = close.diff()
+    sum_gains = price_change.where(price_change > 0, 0).rolling(window=period).sum()
+    sum_losses = (-price_change).where(price_change < 0, 0).rolling(window=period).sum()
+    cmo = (100 * ((sum_gains - sum_losses) / (sum_gains + sum_losses))).fillna(0)
+    
+    # Valor do candle anterior (o próprio candle no primeiro prefixo)
+    prev_cmo = previousValue(cmo)
+    zero_cross_up = (cmo > 0) & (prev_cmo < 0)
+    zero_cross_down = (cmo < 0) & (prev_cmo > 0)
+    
+    # Divergência contra o candle de 'period' candles atrás, só com pelo menos 'period' candles
+    enough_data = prefixLength(stock_data) >= period
+    price_rising = close > close.shift(period - 1)
+    cmo_rising = cmo > cmo.shift(period - 1)
+    divergence_sell = enough_data & price_rising & ~cmo_rising
+    divergence_buy = enough_data & ~price_rising & cmo_rising
+    
+    buy_signal = (cmo <= oversold) | zero_cross_up | divergence_buy
+    sell_signal = (cmo >= overbought) | zero_cross_down | divergence_sell
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getChandeMomentumOscillatorTradeStrategy.signal_series = getChandeMomentumOscillatorTradeStrategySeries
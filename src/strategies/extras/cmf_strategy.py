@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, prefixLength, previousValue
+
 def getCmfTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -28,14 +31,11 @@ def getCmfTradeStrategy(
     - period: Período para cálculo do CMF
     - zero_cross_threshold: Limiar para confirmar cruzamento de zero
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos os dados necessários
     required_columns = ['high', 'low', 'close', 'volume']
     
-    # Converter nomes de colunas para minúsculas se necessário
-    stock_data.columns = [col.lower() for col in stock_data.columns]
-    
     for col in required_columns:
         if col not in stock_data.columns:
             raise ValueError(f"Coluna {col} não encontrada nos dados.")
@@ -108,4 +108,41 @@ def getCmfTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getCmfTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    zero_cross_threshold: float = 0.05,
+    verbose: bool = False
+):
+    """
+    Versão em série de getCmfTradeStrategy: calcula o CMF uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    close = stock_data['close']
+    mf_multiplier = ((close - stock_data['low']) - (stock_data['high'] - close)) / (stock_data['high'] - stock_data['low'])
+    mf_multiplier = mf_multiplier.replace([np.inf, -np.inf], 0).fillna(0)
+    cmf = (mf_multiplier * stock_data['volume']).rolling(window=period).sum() / stock_data['volume'].rolling(window=period).sum()
+    
+    # Valor do candle anterior (o próprio candle no primeiro prefixo)
+    prev_cmf = previousValue(cmf)
+    is_positive = cmf > 0
+    is_rising = cmf > prev_cmf
+    zero_cross_up = (cmf > zero_cross_threshold) & (prev_cmf < -zero_cross_threshold)
+    zero_cross_down = (cmf < -zero_cross_threshold) & (prev_cmf > zero_cross_threshold)
+    
+    # Divergência contra o candle de 'period' candles atrás, só com pelo menos 'period' candles
+    enough_data = prefixLength(stock_data) >= period
+    price_rising = close > close.shift(period - 1)
+    cmf_rising = cmf > cmf.shift(period - 1)
+    divergence_sell = enough_data & price_rising & ~cmf_rising
+    divergence_buy = enough_data & ~price_rising & cmf_rising
+    
+    buy_signal = zero_cross_up | (is_positive & is_rising) | divergence_buy
+    sell_signal = zero_cross_down | (~is_positive & ~is_rising) | divergence_sell
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getCmfTradeStrategy.signal_series = getCmfTradeStrategySeries
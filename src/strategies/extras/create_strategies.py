@@ -109,6 +109,8 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+
 def {function_name}(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -121,7 +123,7 @@ def {function_name}(
     Parâmetros:
     - period: Período para cálculo do indicador
     \"\"\"
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # TODO: Implementar a lógica da estratégia {display_name}
     
@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, previousValue
+
 def getDetrendedPriceOscillatorTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -29,14 +32,11 @@ def getDetrendedPriceOscillatorTradeStrategy(
     - period: Período para cálculo do DPO
     - ma_type: Tipo de média móvel ('sma' ou 'ema')
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos a coluna 'close'
     if 'close' not in stock_data.columns:
-        # Tentar converter para minúsculas
-        stock_data.columns = [col.lower() for col in stock_data.columns]
-        if 'close' not in stock_data.columns:
-            raise ValueError("Coluna 'close' não encontrada nos dados.")
+        raise ValueError("Coluna 'close' não encontrada nos dados.")
     
     # Calcular a média móvel
     if ma_type.lower() == 'ema':
@@ -98,4 +98,35 @@ def getDetrendedPriceOscillatorTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getDetrendedPriceOscillatorTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    ma_type: str = 'sma',
+    verbose: bool = False
+):
+    """
+    Versão em série de getDetrendedPriceOscillatorTradeStrategy: calcula o DPO uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    close = stock_data['close']
+    if ma_type.lower() == 'ema':
+        ma = close.ewm(span=period, adjust=False).mean()
+    else:  # default to SMA
+        ma = close.rolling(window=period).mean()
+    dpo = close - ma.shift(int(period / 2 + 1))
+    dpo_ma = dpo.rolling(window=period//2).mean()
+    
+    # Valor do candle anterior (o próprio candle no primeiro prefixo)
+    prev_dpo = previousValue(dpo)
+    zero_cross_up = (dpo > 0) & (prev_dpo < 0)
+    zero_cross_down = (dpo < 0) & (prev_dpo > 0)
+    ma_cross_up = (dpo > dpo_ma) & (dpo.shift(1) <= dpo_ma.shift(1))
+    ma_cross_down = (dpo < dpo_ma) & (dpo.shift(1) >= dpo_ma.shift(1))
+    
+    return decisionSeries(zero_cross_up | ma_cross_up, zero_cross_down | ma_cross_down)
+
+
+getDetrendedPriceOscillatorTradeStrategy.signal_series = getDetrendedPriceOscillatorTradeStrategySeries
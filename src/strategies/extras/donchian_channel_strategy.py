@@ -12,6 +12,10 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.rolling_extrema import highLowChannels
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionChain, previousValue
+
 def getDonchianChannelTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -30,26 +34,24 @@ def getDonchianChannelTradeStrategy(
     - period: Período para cálculo do canal Donchian
     - exit_period: Período menor para o canal de saída
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos os dados necessários
     required_columns = ['high', 'low', 'close']
     
-    # Converter nomes de colunas para minúsculas se necessário
-    stock_data.columns = [col.lower() for col in stock_data.columns]
-    
     for col in required_columns:
         if col not in stock_data.columns:
             raise ValueError(f"Coluna {col} não encontrada nos dados.")
     
+    # Canal Donchian e canal de saída calculados juntos
+    channels = highLowChannels(stock_data['high'], stock_data['low'], [period, exit_period])
+    
     # Calcular o Canal Donchian
-    stock_data['upper_band'] = stock_data['high'].rolling(window=period).max()
-    stock_data['lower_band'] = stock_data['low'].rolling(window=period).min()
+    stock_data['upper_band'], stock_data['lower_band'] = channels[period]
     stock_data['middle_band'] = (stock_data['upper_band'] + stock_data['lower_band']) / 2
     
     # Calcular canal de saída (para reduzir o risco de perda)
-    stock_data['exit_upper'] = stock_data['high'].rolling(window=exit_period).max()
-    stock_data['exit_lower'] = stock_data['low'].rolling(window=exit_period).min()
+    stock_data['exit_upper'], stock_data['exit_lower'] = channels[exit_period]
     
     # Extrair valores atuais
     current_close = stock_data['close'].iloc[-1]
@@ -114,4 +116,39 @@ def getDonchianChannelTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getDonchianChannelTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    exit_period: int = 5,
+    verbose: bool = False
+):
+    """
+    Versão em série de getDonchianChannelTradeStrategy: calcula os canais uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    close = stock_data['close']
+    channels = highLowChannels(stock_data['high'], stock_data['low'], [period, exit_period])
+    upper_band, lower_band = channels[period]
+    exit_upper, exit_lower = channels[exit_period]
+    
+    # Valores do candle anterior (o próprio candle no primeiro prefixo)
+    prev_close = previousValue(close)
+    breakout_up = (close > upper_band) & (prev_close <= previousValue(upper_band))
+    breakout_down = (close < lower_band) & (prev_close >= previousValue(lower_band))
+    
+    # O canal de saída (trailing stop) prevalece sobre o rompimento do canal principal
+    return decisionChain(
+        [
+            ((close < exit_lower) & ~breakout_up, False),
+            ((close > exit_upper) & ~breakout_down, True),
+            (breakout_up, True),
+            (breakout_down, False),
+        ],
+        stock_data.index,
+    )
+
+
+getDonchianChannelTradeStrategy.signal_series = getDonchianChannelTradeStrategySeries
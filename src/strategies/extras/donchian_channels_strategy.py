@@ -12,6 +12,10 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.rolling_extrema import highLowChannels
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionChain, prefixLength
+
 def getDonchianChannelsTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -27,7 +31,7 @@ def getDonchianChannelsTradeStrategy(
     - breakout_mode: Usar modo de breakout (True) ou modo de reversão (False)
     - use_midline: Usar linha do meio para sinais adicionais
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se as colunas necessárias existem
     if 'high' not in stock_data.columns or 'low' not in stock_data.columns or 'close' not in stock_data.columns:
@@ -38,8 +42,7 @@ def getDonchianChannelsTradeStrategy(
         return None  # Dados insuficientes para cálculo
     
     # Calcular Donchian Channels
-    stock_data['upper_band'] = stock_data['high'].rolling(window=period).max()
-    stock_data['lower_band'] = stock_data['low'].rolling(window=period).min()
+    stock_data['upper_band'], stock_data['lower_band'] = highLowChannels(stock_data['high'], stock_data['low'], [period])[period]
     stock_data['middle_band'] = (stock_data['upper_band'] + stock_data['lower_band']) / 2
     
     # Cálculo para detectar novos máximos/mínimos no período
@@ -112,4 +115,46 @@ def getDonchianChannelsTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getDonchianChannelsTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    breakout_mode: bool = True,
+    use_midline: bool = True,
+    verbose: bool = False
+):
+    """
+    Versão em série de getDonchianChannelsTradeStrategy: calcula os canais uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    close = stock_data['close']
+    upper_band, lower_band = highLowChannels(stock_data['high'], stock_data['low'], [period])[period]
+    middle_band = (upper_band + lower_band) / 2
+    
+    if breakout_mode:
+        signal_buy = stock_data['high'] >= upper_band.shift(1)
+        signal_sell = stock_data['low'] <= lower_band.shift(1)
+    else:
+        signal_buy = close <= lower_band
+        signal_sell = close >= upper_band
+    
+    mid_cross_up = use_midline & (close.shift(1) < middle_band.shift(1)) & (close > middle_band)
+    mid_cross_down = use_midline & (close.shift(1) > middle_band.shift(1)) & (close < middle_band)
+    
+    return decisionChain(
+        [
+            (signal_buy, True),
+            (signal_sell, False),
+            (mid_cross_up, True),
+            (mid_cross_down, False),
+            (use_midline & (close > middle_band), True),
+            (use_midline & (close < middle_band), False),
+        ],
+        stock_data.index,
+        valid=prefixLength(stock_data) > period,
+    )
+
+
+getDonchianChannelsTradeStrategy.signal_series = getDonchianChannelsTradeStrategySeries
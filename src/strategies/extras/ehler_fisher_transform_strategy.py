@@ -12,6 +12,10 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.kernels import ehlerRangeKernel
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, previousValue
+
 def getEhlerFisherTransformTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -28,14 +32,11 @@ def getEhlerFisherTransformTradeStrategy(
     - period: Período para cálculo do Ehler Fisher Transform
     - signal_period: Período para a linha de sinal (valor defasado)
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos os dados necessários
     required_columns = ['high', 'low']
     
-    # Converter nomes de colunas para minúsculas se necessário
-    stock_data.columns = [col.lower() for col in stock_data.columns]
-    
     for col in required_columns:
         if col not in stock_data.columns:
             raise ValueError(f"Coluna {col} não encontrada nos dados.")
@@ -43,47 +44,18 @@ def getEhlerFisherTransformTradeStrategy(
     # Calcular o valor médio (midpoint) do período
     stock_data['price_mid'] = (stock_data['high'] + stock_data['low']) / 2
     
-    # Iniciar valores
-    stock_data['max_h'] = np.nan
-    stock_data['min_l'] = np.nan
-    
-    # Preencher a primeira linha com valores iniciais para evitar NaN
-    if len(stock_data) > 0:
-        stock_data.loc[0, 'max_h'] = stock_data.loc[0, 'price_mid']
-        stock_data.loc[0, 'min_l'] = stock_data.loc[0, 'price_mid']
-    
     # Calcular máximos e mínimos com um método adaptativo (Ehlers)
     # Isso usa uma técnica de alisamento que é mais responsiva a mudanças recentes
-    alpha = 2.0 / (period + 1.0)
-    
-    for i in range(1, len(stock_data)):
-        # Atualizar máximo
-        max_value = stock_data.loc[i-1, 'max_h']
-        if stock_data.loc[i, 'price_mid'] > max_value:
-            max_value = stock_data.loc[i, 'price_mid']
-        else:
-            max_value = max_value - alpha * (max_value - stock_data.loc[i, 'price_mid'])
-        stock_data.loc[i, 'max_h'] = max_value
-        
-        # Atualizar mínimo
-        min_value = stock_data.loc[i-1, 'min_l']
-        if stock_data.loc[i, 'price_mid'] < min_value:
-            min_value = stock_data.loc[i, 'price_mid']
-        else:
-            min_value = min_value + alpha * (stock_data.loc[i, 'price_mid'] - min_value)
-        stock_data.loc[i, 'min_l'] = min_value
-    
-    # Normalizar os preços para o intervalo [-1, 1]
-    stock_data['value'] = np.nan
-    
-    # Calcular o valor normalizado
-    for i in range(1, len(stock_data)):
-        price_range = stock_data.loc[i, 'max_h'] - stock_data.loc[i, 'min_l']
-        if price_range == 0:
-            stock_data.loc[i, 'value'] = 0
-        else:
-            # Fórmula de Ehlers para normalização
-            stock_data.loc[i, 'value'] = 2 * ((stock_data.loc[i, 'price_mid'] - stock_data.loc[i, 'min_l']) / price_range - 0.5)
+    max_h, min_l = ehlerRangeKernel(stock_data['price_mid'], period)
+    stock_data['max_h'] = max_h
+    stock_data['min_l'] = min_l
+    
+    # Normalizar os preços para o intervalo [-1, 1] com a fórmula de Ehlers (amplitude zero = 0)
+    price_range = max_h - min_l
+    with np.errstate(divide='ignore', invalid='ignore'):
+        value = np.where(price_range == 0, 0.0, 2 * ((stock_data['price_mid'].to_numpy() - min_l) / price_range - 0.5))
+    value[:1] = np.nan  # O primeiro candle não é normalizado
+    stock_data['value'] = value
     
     # Suavizar o valor normalizado com uma média móvel
     stock_data['smooth_value'] = stock_data['value'].rolling(window=period).mean().fillna(0)
@@ -152,4 +124,44 @@ def getEhlerFisherTransformTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getEhlerFisherTransformTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    signal_period: int = 3,
+    verbose: bool = False
+):
+    """
+    Versão em série de getEhlerFisherTransformTradeStrategy: calcula o Fisher uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    price_mid = (stock_data['high'] + stock_data['low']) / 2
+    max_h, min_l = ehlerRangeKernel(price_mid, period)
+    price_range = max_h - min_l
+    with np.errstate(divide='ignore', invalid='ignore'):
+        value = np.where(price_range == 0, 0.0, 2 * ((price_mid.to_numpy() - min_l) / price_range - 0.5))
+    value[:1] = np.nan  # O primeiro candle não é normalizado
+    smooth_value = np.clip(pd.Series(value, index=stock_data.index).rolling(window=period).mean().fillna(0), -0.999, 0.999)
+    fisher = 0.5 * np.log((1 + smooth_value) / (1 - smooth_value))
+    fisher_signal = fisher.shift(signal_period)
+    
+    # Valores do candle anterior (o próprio candle no primeiro prefixo)
+    prev_fisher = previousValue(fisher)
+    prev_signal = previousValue(fisher_signal)
+    is_rising = fisher > prev_fisher
+    
+    zero_cross_up = (fisher > 0) & (prev_fisher < 0)
+    zero_cross_down = (fisher < 0) & (prev_fisher > 0)
+    signal_cross_up = (fisher > fisher_signal) & (prev_fisher <= prev_signal)
+    signal_cross_down = (fisher < fisher_signal) & (prev_fisher >= prev_signal)
+    extreme_high = (fisher > 1.5) & ~is_rising
+    extreme_low = (fisher < -1.5) & is_rising
+    
+    buy_signal = zero_cross_up | signal_cross_up | extreme_low
+    sell_signal = zero_cross_down | signal_cross_down | extreme_high
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getEhlerFisherTransformTradeStrategy.signal_series = getEhlerFisherTransformTradeStrategySeries
@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, previousValue
+
 def getElderForceIndexTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -30,14 +33,11 @@ def getElderForceIndexTradeStrategy(
     - short_period: Período para o EMA curto do Force Index
     - long_period: Período para o EMA longo do Force Index
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos os dados necessários
     required_columns = ['close', 'volume']
     
-    # Converter nomes de colunas para minúsculas se necessário
-    stock_data.columns = [col.lower() for col in stock_data.columns]
-    
     for col in required_columns:
         if col not in stock_data.columns:
             raise ValueError(f"Coluna {col} não encontrada nos dados.")
@@ -102,4 +102,35 @@ def getElderForceIndexTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getElderForceIndexTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    short_period: int = 2,
+    long_period: int = 13,
+    verbose: bool = False
+):
+    """
+    Versão em série de getElderForceIndexTradeStrategy: calcula o Force Index uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    force_index_raw = stock_data['close'].diff(1) * stock_data['volume']
+    fi_short = force_index_raw.ewm(span=short_period, adjust=False).mean()
+    fi_long = force_index_raw.ewm(span=long_period, adjust=False).mean()
+    
+    # Valores do candle anterior (o próprio candle no primeiro prefixo)
+    prev_fi_short = previousValue(fi_short)
+    prev_fi_long = previousValue(fi_long)
+    is_short_positive = fi_short > 0
+    is_long_positive = fi_long > 0
+    
+    zero_cross_up = ((fi_short > 0) & (prev_fi_short < 0)) | ((fi_long > 0) & (prev_fi_long < 0))
+    zero_cross_down = ((fi_short < 0) & (prev_fi_short > 0)) | ((fi_long < 0) & (prev_fi_long > 0))
+    divergence_buy = is_short_positive & ~is_long_positive
+    divergence_sell = ~is_short_positive & is_long_positive
+    return decisionSeries(zero_cross_up | divergence_buy, zero_cross_down | divergence_sell)
+
+
+getElderForceIndexTradeStrategy.signal_series = getElderForceIndexTradeStrategySeries
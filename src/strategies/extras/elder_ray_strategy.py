@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, previousValue
+
 def getElderRayTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -33,14 +36,11 @@ def getElderRayTradeStrategy(
     - bull_power_threshold: Limiar para o Bull Power considerar um sinal
     - bear_power_threshold: Limiar para o Bear Power considerar um sinal
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos os dados necessários
     required_columns = ['high', 'low', 'close']
     
-    # Converter nomes de colunas para minúsculas se necessário
-    stock_data.columns = [col.lower() for col in stock_data.columns]
-    
     for col in required_columns:
         if col not in stock_data.columns:
             raise ValueError(f"Coluna {col} não encontrada nos dados.")
@@ -108,4 +108,41 @@ def getElderRayTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getElderRayTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    ma_type: str = 'ema',
+    bull_power_threshold: float = 0.0,
+    bear_power_threshold: float = 0.0,
+    verbose: bool = False
+):
+    """
+    Versão em série de getElderRayTradeStrategy: calcula o Bull/Bear Power uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    close = stock_data['close']
+    if ma_type.lower() == 'ema':
+        ma = close.ewm(span=period, adjust=False).mean()
+    else:  # default to SMA
+        ma = close.rolling(window=period).mean()
+    bull_power = stock_data['high'] - ma
+    bear_power = stock_data['low'] - ma
+    
+    # Valores do candle anterior (o próprio candle no primeiro prefixo)
+    is_bull_power_rising = bull_power > previousValue(bull_power)
+    is_bear_power_rising = bear_power > previousValue(bear_power)
+    ma_trend_up = ma.diff() > 0
+    
+    buy_signal = (
+        ma_trend_up & (bear_power < bear_power_threshold) & is_bear_power_rising & (bull_power > bull_power_threshold)
+    )
+    sell_signal = (
+        ~ma_trend_up & (bull_power > bull_power_threshold) & ~is_bull_power_rising & (bear_power < bear_power_threshold)
+    )
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getElderRayTradeStrategy.signal_series = getElderRayTradeStrategySeries
@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, previousValue
+
 def getFisherTransformTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -28,14 +31,11 @@ def getFisherTransformTradeStrategy(
     - period: Período para cálculo do Fisher Transform
     - signal_period: Período para a linha de sinal (média móvel do Fisher Transform)
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos os dados necessários
     required_columns = ['high', 'low']
     
-    # Converter nomes de colunas para minúsculas se necessário
-    stock_data.columns = [col.lower() for col in stock_data.columns]
-    
     for col in required_columns:
         if col not in stock_data.columns:
             raise ValueError(f"Coluna {col} não encontrada nos dados.")
@@ -47,16 +47,11 @@ def getFisherTransformTradeStrategy(
     stock_data['period_high'] = stock_data['price_mid'].rolling(window=period).max()
     stock_data['period_low'] = stock_data['price_mid'].rolling(window=period).min()
     
-    # Normalizar os preços para o intervalo [-1, 1]
-    stock_data['value'] = np.nan
-    
-    # Evitar divisão por zero
-    for i in range(period-1, len(stock_data)):
-        price_range = stock_data['period_high'].iloc[i] - stock_data['period_low'].iloc[i]
-        if price_range == 0:
-            stock_data.loc[i, 'value'] = 0
-        else:
-            stock_data.loc[i, 'value'] = 2 * ((stock_data['price_mid'].iloc[i] - stock_data['period_low'].iloc[i]) / price_range - 0.5)
+    # Normalizar os preços para o intervalo [-1, 1] (amplitude zero = 0, evitando divisão por zero)
+    price_range = (stock_data['period_high'] - stock_data['period_low']).to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        normalized = 2 * ((stock_data['price_mid'].to_numpy() - stock_data['period_low'].to_numpy()) / price_range - 0.5)
+    stock_data['value'] = np.where(price_range == 0, 0.0, normalized)
     
     # Calcular o Fisher Transform
     stock_data['fisher_input'] = stock_data['value'].rolling(window=period).mean()
@@ -125,4 +120,45 @@ def getFisherTransformTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getFisherTransformTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    signal_period: int = 3,
+    verbose: bool = False
+):
+    """
+    Versão em série de getFisherTransformTradeStrategy: calcula o Fisher uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    price_mid = (stock_data['high'] + stock_data['low']) / 2
+    period_high = price_mid.rolling(window=period).max()
+    period_low = price_mid.rolling(window=period).min()
+    price_range = (period_high - period_low).to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        normalized = 2 * ((price_mid.to_numpy() - period_low.to_numpy()) / price_range - 0.5)
+    value = pd.Series(np.where(price_range == 0, 0.0, normalized), index=stock_data.index)
+    fisher_input = np.clip(value.rolling(window=period).mean(), -0.999, 0.999)
+    fisher = 0.5 * np.log((1 + fisher_input) / (1 - fisher_input))
+    fisher_signal = fisher.rolling(window=signal_period).mean()
+    
+    # Valores do candle anterior (o próprio candle no primeiro prefixo)
+    prev_fisher = previousValue(fisher)
+    prev_signal = previousValue(fisher_signal)
+    is_rising = fisher > prev_fisher
+    
+    zero_cross_up = (fisher > 0) & (prev_fisher < 0)
+    zero_cross_down = (fisher < 0) & (prev_fisher > 0)
+    signal_cross_up = (fisher > fisher_signal) & (prev_fisher <= prev_signal)
+    signal_cross_down = (fisher < fisher_signal) & (prev_fisher >= prev_signal)
+    extreme_high = (fisher > 2.0) & ~is_rising
+    extreme_low = (fisher < -2.0) & is_rising
+    
+    buy_signal = zero_cross_up | signal_cross_up | extreme_low
+    sell_signal = zero_cross_down | signal_cross_down | extreme_high
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getFisherTransformTradeStrategy.signal_series = getFisherTransformTradeStrategySeries
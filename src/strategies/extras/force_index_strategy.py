@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, previousValue
+
 def getForceIndexTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -28,14 +31,11 @@ def getForceIndexTradeStrategy(
     - period: Período para o EMA do Force Index (longo prazo)
     - short_period: Período para o EMA do Force Index (curto prazo)
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos os dados necessários
     required_columns = ['close', 'volume']
     
-    # Converter nomes de colunas para minúsculas se necessário
-    stock_data.columns = [col.lower() for col in stock_data.columns]
-    
     for col in required_columns:
         if col not in stock_data.columns:
             raise ValueError(f"Coluna {col} não encontrada nos dados.")
@@ -116,4 +116,39 @@ def getForceIndexTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getForceIndexTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    short_period: int = 2,
+    verbose: bool = False
+):
+    """
+    Versão em série de getForceIndexTradeStrategy: calcula o Force Index uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    close = stock_data['close']
+    force_index = close.diff() * stock_data['volume']
+    fi_short = force_index.ewm(span=short_period, adjust=False).mean()
+    fi_long = force_index.ewm(span=period, adjust=False).mean()
+    ema_13 = close.ewm(span=13, adjust=False).mean()
+    
+    # Valores do candle anterior (o próprio candle no primeiro prefixo)
+    prev_fi_short = previousValue(fi_short)
+    prev_fi_long = previousValue(fi_long)
+    ema_trend_up = ema_13 > previousValue(ema_13)
+    
+    zero_cross_up_short = (fi_short > 0) & (prev_fi_short < 0)
+    zero_cross_down_short = (fi_short < 0) & (prev_fi_short > 0)
+    zero_cross_up_long = (fi_long > 0) & (prev_fi_long < 0)
+    zero_cross_down_long = (fi_long < 0) & (prev_fi_long > 0)
+    
+    # Em alta: compra pelo Force Index curto e vende pelo longo; em baixa, o contrário
+    buy_signal = np.where(ema_trend_up, zero_cross_up_short, zero_cross_up_long)
+    sell_signal = np.where(ema_trend_up, zero_cross_down_long, zero_cross_down_short)
+    return decisionSeries(pd.Series(buy_signal, index=stock_data.index), sell_signal)
+
+
+getForceIndexTradeStrategy.signal_series = getForceIndexTradeStrategySeries
@@ -12,6 +12,10 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.price_action import fractalPoints
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries
+
 def getFractalsTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -31,33 +35,17 @@ def getFractalsTradeStrategy(
     - window_size: Tamanho da janela para identificar fractais (normalmente 5)
     - confirmation_bars: Número de barras para confirmar um fractal
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos os dados necessários
     required_columns = ['high', 'low', 'close']
     
-    # Converter nomes de colunas para minúsculas se necessário
-    stock_data.columns = [col.lower() for col in stock_data.columns]
-    
     for col in required_columns:
         if col not in stock_data.columns:
             raise ValueError(f"Coluna {col} não encontrada nos dados.")
     
-    # Adicionar colunas para identificar fractals
-    stock_data['fractal_high'] = False
-    stock_data['fractal_low'] = False
-    
-    # Identificar fractals
-    for i in range(window_size // 2, len(stock_data) - window_size // 2):
-        # Verificar se o ponto central é o mais alto na janela (fractal de alta)
-        if stock_data['high'].iloc[i] > max(stock_data['high'].iloc[i - window_size // 2:i]) and \
-           stock_data['high'].iloc[i] > max(stock_data['high'].iloc[i + 1:i + window_size // 2 + 1]):
-            stock_data.loc[stock_data.index[i], 'fractal_high'] = True
-        
-        # Verificar se o ponto central é o mais baixo na janela (fractal de baixa)
-        if stock_data['low'].iloc[i] < min(stock_data['low'].iloc[i - window_size // 2:i]) and \
-           stock_data['low'].iloc[i] < min(stock_data['low'].iloc[i + 1:i + window_size // 2 + 1]):
-            stock_data.loc[stock_data.index[i], 'fractal_low'] = True
+    # Identificar fractals (ponto central mais alto/mais baixo que os vizinhos da janela)
+    stock_data['fractal_high'], stock_data['fractal_low'] = fractalPoints(stock_data['high'], stock_data['low'], window_size // 2)
     
     # Identificar os valores dos fractals mais recentes
     last_high_fractal_idx = stock_data[stock_data['fractal_high']].index[-1] if any(stock_data['fractal_high']) else None
@@ -126,4 +114,48 @@ def getFractalsTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getFractalsTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    window_size: int = 5,
+    confirmation_bars: int = 2,
+    verbose: bool = False
+):
+    """
+    Versão em série de getFractalsTradeStrategy: marca os fractais uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    
+    Um fractal na posição j só aparece nos prefixos que já têm os 'window_size // 2' candles seguintes a ele, e fica
+    confirmado quando o prefixo vai além de j + confirmation_bars.
+    """
+    window = window_size // 2
+    close = stock_data['close'].to_numpy(dtype=np.float64)
+    fractal_high, fractal_low = fractalPoints(stock_data['high'], stock_data['low'], window)
+    positions = np.arange(len(close))
+    
+    def lastFractal(fractals):
+        # Posição do último fractal visível em cada prefixo (-1 = nenhum)
+        last = np.maximum.accumulate(np.where(fractals, positions, -1))
+        visible = np.full(len(last), -1)
+        visible[window:] = last[: len(last) - window]
+        return visible
+    
+    last_high, last_low = lastFractal(fractal_high), lastFractal(fractal_low)
+    high_prices = stock_data['high'].to_numpy(dtype=np.float64)
+    low_prices = stock_data['low'].to_numpy(dtype=np.float64)
+    
+    # O índice do fractal também precisa ser verdadeiro (a estratégia ao vivo testa `if last_high_fractal_idx`)
+    labels = np.array([bool(label) for label in stock_data.index], dtype=bool)
+    high_confirmed = (last_high >= 0) & labels[last_high] & (last_high + confirmation_bars < positions + 1)
+    low_confirmed = (last_low >= 0) & labels[last_low] & (last_low + confirmation_bars < positions + 1)
+    
+    is_uptrend = close > stock_data['close'].rolling(window=period).mean().to_numpy()
+    buy_signal = high_confirmed & is_uptrend & (close > high_prices[last_high])
+    sell_signal = low_confirmed & ~is_uptrend & (close < low_prices[last_low])
+    return decisionSeries(pd.Series(buy_signal, index=stock_data.index), sell_signal)
+
+
+getFractalsTradeStrategy.signal_series = getFractalsTradeStrategySeries
@@ -12,6 +12,10 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.kernels import smmaKernel
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, previousValue
+
 def getGatorOscillatorTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -39,14 +43,11 @@ def getGatorOscillatorTradeStrategy(
     - teeth_shift: Deslocamento para a linha Teeth
     - lips_shift: Deslocamento para a linha Lips
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos os dados necessários
     required_columns = ['high', 'low']
     
-    # Converter nomes de colunas para minúsculas se necessário
-    stock_data.columns = [col.lower() for col in stock_data.columns]
-    
     for col in required_columns:
         if col not in stock_data.columns:
             raise ValueError(f"Coluna {col} não encontrada nos dados.")
@@ -59,24 +60,10 @@ def getGatorOscillatorTradeStrategy(
     # Teeth (Dentes) - Linha Vermelha - SMMA 8 deslocada 5 períodos para frente
     # Lips (Lábios) - Linha Verde - SMMA 5 deslocada 3 períodos para frente
     
-    # Implementar SMMA (Smoothed Moving Average)
-    def calculate_smma(data, period):
-        smma = np.zeros_like(data)
-        smma[:period] = np.nan
-        
-        # Inicializar com a média dos primeiros 'period' elementos
-        smma[period - 1] = np.mean(data[:period])
-        
-        # Calcular o SMMA para os elementos restantes
-        for i in range(period, len(data)):
-            smma[i] = (smma[i - 1] * (period - 1) + data[i]) / period
-        
-        return smma
-    
     # Calcular SMMA para as linhas do Alligator
-    stock_data['jaw'] = calculate_smma(stock_data['median_price'].values, jaw_period)
-    stock_data['teeth'] = calculate_smma(stock_data['median_price'].values, teeth_period)
-    stock_data['lips'] = calculate_smma(stock_data['median_price'].values, lips_period)
+    stock_data['jaw'] = smmaKernel(stock_data['median_price'], jaw_period)
+    stock_data['teeth'] = smmaKernel(stock_data['median_price'], teeth_period)
+    stock_data['lips'] = smmaKernel(stock_data['median_price'], lips_period)
     
     # Aplicar os deslocamentos
     stock_data['jaw_shifted'] = stock_data['jaw'].shift(jaw_shift)
@@ -146,4 +133,43 @@ def getGatorOscillatorTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getGatorOscillatorTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    jaw_period: int = 13,
+    teeth_period: int = 8,
+    lips_period: int = 5,
+    jaw_shift: int = 8,
+    teeth_shift: int = 5,
+    lips_shift: int = 3,
+    verbose: bool = False
+):
+    """
+    Versão em série de getGatorOscillatorTradeStrategy: calcula as linhas do Alligator uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    median_price = (stock_data['high'] + stock_data['low']) / 2
+    jaw = pd.Series(smmaKernel(median_price, jaw_period), index=stock_data.index).shift(jaw_shift)
+    teeth = pd.Series(smmaKernel(median_price, teeth_period), index=stock_data.index).shift(teeth_shift)
+    lips = pd.Series(smmaKernel(median_price, lips_period), index=stock_data.index).shift(lips_shift)
+    gator_up = np.abs(jaw - teeth)
+    gator_down = -np.abs(teeth - lips)
+    
+    # Valores do candle anterior (o próprio candle no primeiro prefixo)
+    prev_gator_up = previousValue(gator_up)
+    prev_gator_down = previousValue(gator_down)
+    is_gator_expanding = (gator_up > prev_gator_up) & (gator_down < prev_gator_down)
+    is_gator_contracting = (gator_up < prev_gator_up) & (gator_down > prev_gator_down)
+    is_alligator_eating = (lips > teeth) & (teeth > jaw)
+    is_alligator_sated = (lips < teeth) & (teeth < jaw)
+    
+    # O "despertar" da estratégia ao vivo nunca é verdadeiro (expandindo e não expandindo ao mesmo tempo)
+    buy_signal = is_gator_expanding & is_alligator_eating
+    sell_signal = is_alligator_sated | (is_gator_contracting & is_alligator_eating)
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getGatorOscillatorTradeStrategy.signal_series = getGatorOscillatorTradeStrategySeries
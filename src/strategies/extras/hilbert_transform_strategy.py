@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionChain
+
 def getHilbertTransformTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -23,7 +26,7 @@ def getHilbertTransformTradeStrategy(
     Parâmetros:
     - period: Período para cálculo do indicador
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se as colunas necessárias existem
     if 'close' not in stock_data.columns:
@@ -91,4 +94,38 @@ def getHilbertTransformTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getHilbertTransformTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    verbose: bool = False
+):
+    """
+    Versão em série de getHilbertTransformTradeStrategy: calcula as componentes uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    close = stock_data['close']
+    ht_trend = close.rolling(window=period).mean()
+    ht_sine = np.sin(np.arange(len(stock_data)) * 2 * np.pi / period)
+    smooth_inphase = (close * ht_sine).rolling(window=period).mean()
+    prev_inphase = smooth_inphase.shift(1)
+    
+    signal_up = (smooth_inphase > 0) & (prev_inphase <= 0)
+    signal_down = (smooth_inphase < 0) & (prev_inphase >= 0)
+    trend_up = close > ht_trend
+    trend_down = close < ht_trend
+    
+    return decisionChain(
+        [
+            (signal_up & trend_up, True),  # Forte sinal de compra
+            (signal_down & trend_down, False),  # Forte sinal de venda
+            (signal_up | trend_up, True),  # Sinal moderado de compra
+            (signal_down | trend_down, False),  # Sinal moderado de venda
+        ],
+        stock_data.index,
+    )
+
+
+getHilbertTransformTradeStrategy.signal_series = getHilbertTransformTradeStrategySeries
@@ -12,6 +12,10 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.weighted_windows import hullWeights, weightedMovingAverageBatch
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, previousValue
+
 def getHullMovingAverageTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -28,37 +32,16 @@ def getHullMovingAverageTradeStrategy(
     - period: Período principal para cálculo do HMA
     - fast_period: Período menor para o HMA rápido (para crossover)
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos a coluna 'close'
     if 'close' not in stock_data.columns:
-        # Tentar converter para minúsculas
-        stock_data.columns = [col.lower() for col in stock_data.columns]
-        if 'close' not in stock_data.columns:
-            raise ValueError("Coluna 'close' não encontrada nos dados.")
-    
-    # Função para calcular o HMA
-    def calculate_hma(data, n):
-        # Calcular as duas WMAs (Weighted Moving Average)
-        wma_n = data.rolling(window=n, min_periods=n).apply(
-            lambda x: sum([(i+1) * x[i] for i in range(len(x))]) / sum([(i+1) for i in range(len(x))]), raw=True)
-        
-        wma_n_half = data.rolling(window=n//2, min_periods=n//2).apply(
-            lambda x: sum([(i+1) * x[i] for i in range(len(x))]) / sum([(i+1) for i in range(len(x))]), raw=True)
-        
-        # Calcular o raw HMA
-        raw_hma = 2 * wma_n_half - wma_n
-        
-        # Calcular o HMA final
-        sqrt_n = int(np.sqrt(n))
-        hma = raw_hma.rolling(window=sqrt_n, min_periods=sqrt_n).apply(
-            lambda x: sum([(i+1) * x[i] for i in range(len(x))]) / sum([(i+1) for i in range(len(x))]), raw=True)
-        
-        return hma
+        raise ValueError("Coluna 'close' não encontrada nos dados.")
     
     # Calcular o HMA principal e o HMA rápido
-    stock_data['hma'] = calculate_hma(stock_data['close'], period)
-    stock_data['hma_fast'] = calculate_hma(stock_data['close'], fast_period)
+    stock_data['hma'], stock_data['hma_fast'] = weightedMovingAverageBatch(
+        stock_data['close'], [hullWeights(period), hullWeights(fast_period)]
+    )
     
     # Calcular a direção do HMA (slope)
     stock_data['hma_slope'] = stock_data['hma'].diff()
@@ -120,4 +103,36 @@ def getHullMovingAverageTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getHullMovingAverageTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    fast_period: int = 9,
+    verbose: bool = False
+):
+    """
+    Versão em série de getHullMovingAverageTradeStrategy: calcula os HMAs uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    close = stock_data['close']
+    hma, hma_fast = weightedMovingAverageBatch(close, [hullWeights(period), hullWeights(fast_period)])
+    is_hma_rising = hma.diff() > 0
+    
+    # Valores do candle anterior (o próprio candle no primeiro prefixo)
+    prev_close = previousValue(close)
+    prev_hma = previousValue(hma)
+    prev_hma_fast = previousValue(hma_fast)
+    
+    price_cross_up = (close > hma) & (prev_close <= prev_hma)
+    price_cross_down = (close < hma) & (prev_close >= prev_hma)
+    hma_cross_up = (hma_fast > hma) & (prev_hma_fast <= prev_hma)
+    hma_cross_down = (hma_fast < hma) & (prev_hma_fast >= prev_hma)
+    
+    buy_signal = (is_hma_rising & price_cross_up) | hma_cross_up
+    sell_signal = (~is_hma_rising & price_cross_down) | hma_cross_down
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getHullMovingAverageTradeStrategy.signal_series = getHullMovingAverageTradeStrategySeries
@@ -12,6 +12,10 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.rolling_extrema import highLowChannels
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionChain, prefixLength
+
 def getIchimokuCloudTradeStrategy(
     stock_data: pd.DataFrame,
     tenkan_period: int = 9,
@@ -31,7 +35,7 @@ def getIchimokuCloudTradeStrategy(
     - displacement: Período de deslocamento para o Senkou Span (Nuvem)
     - require_confirmation: Exigir confirmação completa (preço e TK cross) para sinais
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se as colunas necessárias existem
     required_cols = ['high', 'low', 'close']
@@ -44,21 +48,25 @@ def getIchimokuCloudTradeStrategy(
     if len(stock_data) <= min_periods:
         return None  # Dados insuficientes para cálculo
     
+    # Altos/baixos dos três períodos de uma vez
+    channels = highLowChannels(stock_data['high'], stock_data['low'], [tenkan_period, kijun_period, senkou_span_b_period])
+    
     # Função para calcular a média dos altos/baixos de um período
-    def donchian(high, low, period):
-        return (high.rolling(window=period).max() + low.rolling(window=period).min()) / 2
+    def donchian(period):
+        highest, lowest = channels[period]
+        return (highest + lowest) / 2
     
     # Cálculo do Tenkan-sen (Linha de Conversão)
-    stock_data['tenkan_sen'] = donchian(stock_data['high'], stock_data['low'], tenkan_period)
+    stock_data['tenkan_sen'] = donchian(tenkan_period)
     
     # Cálculo do Kijun-sen (Linha Base)
-    stock_data['kijun_sen'] = donchian(stock_data['high'], stock_data['low'], kijun_period)
+    stock_data['kijun_sen'] = donchian(kijun_period)
     
     # Cálculo do Senkou Span A (Primeira linha da nuvem)
     stock_data['senkou_span_a'] = ((stock_data['tenkan_sen'] + stock_data['kijun_sen']) / 2).shift(displacement)
     
     # Cálculo do Senkou Span B (Segunda linha da nuvem)
-    stock_data['senkou_span_b'] = donchian(stock_data['high'], stock_data['low'], senkou_span_b_period).shift(displacement)
+    stock_data['senkou_span_b'] = donchian(senkou_span_b_period).shift(displacement)
     
     # Cálculo do Chikou Span (Linha de Atraso)
     stock_data['chikou_span'] = stock_data['close'].shift(-displacement)
@@ -147,4 +155,61 @@ def getIchimokuCloudTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getIchimokuCloudTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    tenkan_period: int = 9,
+    kijun_period: int = 26,
+    senkou_span_b_period: int = 52,
+    displacement: int = 26,
+    require_confirmation: bool = True,
+    verbose: bool = False
+):
+    """
+    Versão em série de getIchimokuCloudTradeStrategy: calcula as linhas uma única vez e devolve a decisão
+    (True / False / None) de cada candle. A Chikou Span (deslocada para trás) não entra na decisão.
+    """
+    close = stock_data['close']
+    channels = highLowChannels(stock_data['high'], stock_data['low'], [tenkan_period, kijun_period, senkou_span_b_period])
+    
+    def donchian(period):
+        highest, lowest = channels[period]
+        return (highest + lowest) / 2
+    
+    tenkan_sen = donchian(tenkan_period)
+    kijun_sen = donchian(kijun_period)
+    senkou_span_a = ((tenkan_sen + kijun_sen) / 2).shift(displacement)
+    senkou_span_b = donchian(senkou_span_b_period).shift(displacement)
+    
+    tk_cross_up = (tenkan_sen.shift(1) <= kijun_sen.shift(1)) & (tenkan_sen > kijun_sen)
+    tk_cross_down = (tenkan_sen.shift(1) >= kijun_sen.shift(1)) & (tenkan_sen < kijun_sen)
+    breakout_up = (close > senkou_span_a) & (close > senkou_span_b)
+    breakout_down = (close < senkou_span_a) & (close < senkou_span_b)
+    
+    if require_confirmation:
+        cloud_up = senkou_span_a > senkou_span_b
+        cloud_down = senkou_span_a < senkou_span_b
+        rules = [
+            (tk_cross_up & breakout_up & cloud_up, True),
+            (tk_cross_down & breakout_down & cloud_down, False),
+        ]
+    else:
+        # max()/min() do Python: com NaN no primeiro argumento o resultado é NaN; no segundo, vale o primeiro
+        cloud_top = senkou_span_b.where(senkou_span_b > senkou_span_a, senkou_span_a)
+        cloud_bottom = senkou_span_b.where(senkou_span_b < senkou_span_a, senkou_span_a)
+        rules = [
+            (tk_cross_up, True),
+            (tk_cross_down, False),
+            (breakout_up & (tenkan_sen > kijun_sen), True),
+            (breakout_down & (tenkan_sen < kijun_sen), False),
+            ((close > cloud_top) & (tenkan_sen > kijun_sen), True),
+            ((close < cloud_bottom) & (tenkan_sen < kijun_sen), False),
+        ]
+    
+    min_periods = max(tenkan_period, kijun_period, senkou_span_b_period) + displacement
+    return decisionChain(rules, stock_data.index, valid=prefixLength(stock_data) > min_periods)
+
+
+getIchimokuCloudTradeStrategy.signal_series = getIchimokuCloudTradeStrategySeries
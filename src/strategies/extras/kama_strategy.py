@@ -12,6 +12,10 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.kernels import adaptiveAverageKernel
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, prefixLength, previousValue
+
 def getKAMATradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -33,14 +37,11 @@ def getKAMATradeStrategy(
     - slow_efr: Período lento para o Efficiency Ratio (geralmente 30)
     - signal_period: Período para o KAMA de sinal (para crossover)
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos a coluna 'close'
     if 'close' not in stock_data.columns:
-        # Tentar converter para minúsculas
-        stock_data.columns = [col.lower() for col in stock_data.columns]
-        if 'close' not in stock_data.columns:
-            raise ValueError("Coluna 'close' não encontrada nos dados.")
+        raise ValueError("Coluna 'close' não encontrada nos dados.")
     
     # Calcular a mudança de preço direta
     stock_data['price_change'] = stock_data['close'].diff(1)
@@ -61,23 +62,9 @@ def getKAMATradeStrategy(
     # Calcular o fator de suavização
     stock_data['smooth_factor'] = (stock_data['efficiency_ratio'] * (fast_sc - slow_sc) + slow_sc) ** 2
     
-    # Inicializar o KAMA
-    stock_data['kama'] = np.nan
-    
-    # Definir o primeiro valor KAMA
-    # Normalmente, seria a média dos primeiros 'period' valores
-    if len(stock_data) > period:
-        stock_data.loc[stock_data.index[period-1], 'kama'] = stock_data.loc[stock_data.index[period-1], 'close']
-    
-    # Calcular o KAMA para os pontos restantes
-    for i in range(period, len(stock_data)):
-        prev_kama = stock_data.loc[stock_data.index[i-1], 'kama']
-        if np.isnan(prev_kama):
-            stock_data.loc[stock_data.index[i], 'kama'] = stock_data.loc[stock_data.index[i], 'close']
-        else:
-            current_sf = stock_data.loc[stock_data.index[i], 'smooth_factor']
-            current_close = stock_data.loc[stock_data.index[i], 'close']
-            stock_data.loc[stock_data.index[i], 'kama'] = prev_kama + current_sf * (current_close - prev_kama)
+    # Calcular o KAMA (semente no preço do candle period-1; recomeça do preço enquanto o KAMA for NaN)
+    start = period - 1 if len(stock_data) > period else len(stock_data)
+    stock_data['kama'] = adaptiveAverageKernel(stock_data['close'], stock_data['smooth_factor'], start=start, reseed_nan=True)
     
     # Calcular o KAMA de sinal (média móvel do KAMA)
     stock_data['kama_signal'] = stock_data['kama'].rolling(window=signal_period).mean()
@@ -141,4 +128,51 @@ def getKAMATradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getKAMATradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    fast_efr: int = 2,
+    slow_efr: int = 30,
+    signal_period: int = 9,
+    verbose: bool = False
+):
+    """
+    Versão em série de getKAMATradeStrategy: calcula o KAMA uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    
+    Com até 'period' candles a estratégia ao vivo não semeia o KAMA (fica todo NaN) e não decide; a partir daí a
+    semente fica sempre em period - 1, a mesma do histórico inteiro.
+    """
+    close = stock_data['close']
+    price_change = close.diff(1)
+    direction = abs(close - close.shift(period))
+    volatility = abs(price_change).rolling(window=period).sum()
+    efficiency_ratio = (direction / volatility).replace([np.inf, -np.inf], np.nan).fillna(0)
+    fast_sc = 2.0 / (fast_efr + 1.0)
+    slow_sc = 2.0 / (slow_efr + 1.0)
+    smooth_factor = (efficiency_ratio * (fast_sc - slow_sc) + slow_sc) ** 2
+    
+    start = period - 1 if len(stock_data) > period else len(stock_data)
+    kama = pd.Series(adaptiveAverageKernel(close, smooth_factor, start=start, reseed_nan=True), index=stock_data.index)
+    kama_signal = kama.rolling(window=signal_period).mean()
+    is_kama_rising = kama.diff() > 0
+    
+    # Valores do candle anterior (o próprio candle no primeiro prefixo)
+    prev_close = previousValue(close)
+    prev_kama = previousValue(kama)
+    prev_kama_signal = previousValue(kama_signal)
+    
+    price_cross_up = (close > kama) & (prev_close <= prev_kama)
+    price_cross_down = (close < kama) & (prev_close >= prev_kama)
+    kama_cross_up = (kama > kama_signal) & (prev_kama <= prev_kama_signal)
+    kama_cross_down = (kama < kama_signal) & (prev_kama >= prev_kama_signal)
+    
+    buy_signal = (is_kama_rising & price_cross_up) | kama_cross_up
+    sell_signal = (~is_kama_rising & price_cross_down) | kama_cross_down
+    return decisionSeries(buy_signal, sell_signal, valid=prefixLength(stock_data) > period)
+
+
+getKAMATradeStrategy.signal_series = getKAMATradeStrategySeries
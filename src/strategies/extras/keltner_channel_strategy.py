@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, previousValue
+
 def getKeltnerChannelTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -32,14 +35,11 @@ def getKeltnerChannelTradeStrategy(
     - atr_period: Período para cálculo do ATR
     - multiplier: Multiplicador para determinar a largura do canal
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos os dados necessários
     required_columns = ['high', 'low', 'close']
     
-    # Converter nomes de colunas para minúsculas se necessário
-    stock_data.columns = [col.lower() for col in stock_data.columns]
-    
     for col in required_columns:
         if col not in stock_data.columns:
             raise ValueError(f"Coluna {col} não encontrada nos dados.")
@@ -133,4 +133,45 @@ def getKeltnerChannelTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getKeltnerChannelTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    atr_period: int = 10,
+    multiplier: float = 2.0,
+    verbose: bool = False
+):
+    """
+    Versão em série de getKeltnerChannelTradeStrategy: calcula o canal uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    close = stock_data['close']
+    ema = close.ewm(span=period, adjust=False).mean()
+    high_low = stock_data['high'] - stock_data['low']
+    high_close = np.abs(stock_data['high'] - close.shift(1))
+    low_close = np.abs(stock_data['low'] - close.shift(1))
+    atr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1).rolling(window=atr_period).mean()
+    upper_band = ema + (multiplier * atr)
+    lower_band = ema - (multiplier * atr)
+    
+    # Valores do candle anterior (o próprio candle no primeiro prefixo)
+    prev_close = previousValue(close)
+    prev_upper = previousValue(upper_band)
+    prev_lower = previousValue(lower_band)
+    is_above_upper = close > upper_band
+    is_below_lower = close < lower_band
+    is_ema_rising = ema.diff() > 0
+    
+    upper_cross_up = is_above_upper & (prev_close <= prev_upper)
+    upper_cross_down = ~is_above_upper & (prev_close > prev_upper)
+    lower_cross_down = is_below_lower & (prev_close >= prev_lower)
+    lower_cross_up = ~is_below_lower & (prev_close < prev_lower)
+    
+    buy_signal = (lower_cross_up & is_ema_rising) | (upper_cross_up & is_ema_rising)
+    sell_signal = (upper_cross_down & ~is_ema_rising) | (lower_cross_down & ~is_ema_rising)
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getKeltnerChannelTradeStrategy.signal_series = getKeltnerChannelTradeStrategySeries
@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionChain
+
 def getKeltnerChannelsTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -29,7 +32,7 @@ def getKeltnerChannelsTradeStrategy(
     - multiplier: Multiplicador para definir a largura das bandas
     - use_ema: Usar EMA (True) ou SMA (False) para a linha central
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se as colunas necessárias existem
     required_cols = ['high', 'low', 'close']
@@ -100,4 +103,42 @@ def getKeltnerChannelsTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getKeltnerChannelsTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    atr_period: int = 10,
+    multiplier: float = 2.0,
+    use_ema: bool = True,
+    verbose: bool = False
+):
+    """
+    Versão em série de getKeltnerChannelsTradeStrategy: calcula as bandas uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    close = stock_data['close']
+    tr1 = abs(stock_data['high'] - stock_data['low'])
+    tr2 = abs(stock_data['high'] - close.shift(1))
+    tr3 = abs(stock_data['low'] - close.shift(1))
+    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    if use_ema:
+        atr = true_range.ewm(span=atr_period, adjust=False).mean()
+        middle_line = close.ewm(span=period, adjust=False).mean()
+    else:
+        atr = true_range.rolling(window=atr_period).mean()
+        middle_line = close.rolling(window=period).mean()
+    
+    return decisionChain(
+        [
+            (close < middle_line - (multiplier * atr), True),  # Abaixo da banda inferior
+            (close > middle_line + (multiplier * atr), False),  # Acima da banda superior
+            (close < middle_line, True),
+            (close > middle_line, False),
+        ],
+        stock_data.index,
+    )
+
+
+getKeltnerChannelsTradeStrategy.signal_series = getKeltnerChannelsTradeStrategySeries
@@ -3,7 +3,6 @@ import numpy as np
 import os
 import sys
 from datetime import datetime
-from scipy import stats # Importar stats do SciPy para regressão linear  | pip install scipy
 
 # Configuração de caminhos para importações
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
@@ -13,6 +12,10 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.rolling_regression import rollingRegression
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, previousValue
+
 def getLinearRegressionTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -31,72 +34,20 @@ def getLinearRegressionTradeStrategy(
     - deviation_mult: Multiplicador para determinar a largura do canal de desvio
     - forecast_periods: Número de períodos para prever no futuro
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos a coluna 'close'
     if 'close' not in stock_data.columns:
-        # Tentar converter para minúsculas
-        stock_data.columns = [col.lower() for col in stock_data.columns]
-        if 'close' not in stock_data.columns:
-            raise ValueError("Coluna 'close' não encontrada nos dados.")
-    
-    # Adicionar uma coluna de tempo (índice sequencial)
-    stock_data['time_index'] = range(len(stock_data))
-    
-    # Função para calcular a regressão linear e os canais
-    def calculate_regression(data, period, x_col, y_col, dev_mult):
-        result = pd.DataFrame(index=data.index)
-        result['regression'] = np.nan
-        result['upper_channel'] = np.nan
-        result['lower_channel'] = np.nan
-        result['slope'] = np.nan
-        result['r_squared'] = np.nan
-        result['forecast'] = np.nan
-        
-        for i in range(period-1, len(data)):
-            # Dados para regressão
-            x = data[x_col].iloc[i-period+1:i+1].values
-            y = data[y_col].iloc[i-period+1:i+1].values
-            
-            # Calcular regressão linear
-            slope, intercept, r_value, p_value, std_err = stats.linregress(x, y)
-            
-            # Valores previstos
-            predicted = intercept + slope * x
-            
-            # Desvio padrão dos resíduos
-            residuals = y - predicted
-            std_dev = np.std(residuals)
-            
-            # Valor da regressão no ponto atual
-            current_x = data[x_col].iloc[i]
-            regression_value = intercept + slope * current_x
-            
-            # Canais de desvio padrão
-            upper_channel = regression_value + dev_mult * std_dev
-            lower_channel = regression_value - dev_mult * std_dev
-            
-            # Valor previsto para períodos futuros
-            forecast_x = current_x + forecast_periods
-            forecast_value = intercept + slope * forecast_x
-            
-            # Armazenar resultados
-            result.loc[data.index[i], 'regression'] = regression_value
-            result.loc[data.index[i], 'upper_channel'] = upper_channel
-            result.loc[data.index[i], 'lower_channel'] = lower_channel
-            result.loc[data.index[i], 'slope'] = slope
-            result.loc[data.index[i], 'r_squared'] = r_value ** 2
-            result.loc[data.index[i], 'forecast'] = forecast_value
-        
-        return result
-    
-    # Calcular regressão linear e canais
-    regression_data = calculate_regression(
-        stock_data, period, 'time_index', 'close', deviation_mult
-    )
+        raise ValueError("Coluna 'close' não encontrada nos dados.")
     
-    # Mesclar os resultados com os dados originais
-    stock_data = pd.concat([stock_data, regression_data], axis=1)
+    # Calcular regressão linear e canais de desvio padrão dos resíduos
+    regression = rollingRegression(stock_data['close'], period, forecast_periods)
+    stock_data['regression'] = regression['fitted']
+    stock_data['upper_channel'] = regression['fitted'] + deviation_mult * regression['residual_std']
+    stock_data['lower_channel'] = regression['fitted'] - deviation_mult * regression['residual_std']
+    stock_data['slope'] = regression['slope']
+    stock_data['r_squared'] = regression['r_squared']
+    stock_data['forecast'] = regression['forecast']
     
     # Extrair valores atuais
     current_close = stock_data['close'].iloc[-1]
@@ -185,4 +136,54 @@ def getLinearRegressionTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getLinearRegressionTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    deviation_mult: float = 2.0,
+    forecast_periods: int = 3,
+    verbose: bool = False
+):
+    """
+    Versão em série de getLinearRegressionTradeStrategy: calcula a regressão móvel uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    close = stock_data['close']
+    regression = rollingRegression(close, period, forecast_periods)
+    fitted = regression['fitted']
+    upper_channel = fitted + deviation_mult * regression['residual_std']
+    lower_channel = fitted - deviation_mult * regression['residual_std']
+    
+    # Valores do candle anterior (o próprio candle no primeiro prefixo)
+    prev_close = previousValue(close)
+    prev_regression = previousValue(fitted)
+    prev_upper = previousValue(upper_channel)
+    prev_lower = previousValue(lower_channel)
+    
+    is_inside_channel = ~(close > upper_channel) & ~(close < lower_channel)
+    upper_cross_down = (close < upper_channel) & (prev_close >= prev_upper)
+    lower_cross_up = (close > lower_channel) & (prev_close <= prev_lower)
+    regression_cross_up = (close > fitted) & (prev_close <= prev_regression)
+    regression_cross_down = (close < fitted) & (prev_close >= prev_regression)
+    
+    is_uptrend = regression['slope'] > 0
+    is_strong_uptrend = is_uptrend & (regression['r_squared'] > 0.7)
+    is_strong_downtrend = (regression['slope'] < 0) & (regression['r_squared'] > 0.7)
+    is_forecast_higher = regression['forecast'] > close
+    
+    buy_signal = (
+        (regression_cross_up & is_uptrend)
+        | (lower_cross_up & is_strong_uptrend)
+        | (is_inside_channel & is_strong_uptrend & is_forecast_higher)
+    )
+    sell_signal = (
+        (regression_cross_down & ~is_uptrend)
+        | (upper_cross_down & is_strong_downtrend)
+        | (is_inside_channel & is_strong_downtrend & ~is_forecast_higher)
+    )
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getLinearRegressionTradeStrategy.signal_series = getLinearRegressionTradeStrategySeries
@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries
+
 def getMarketFacilitationIndexTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -27,14 +30,11 @@ def getMarketFacilitationIndexTradeStrategy(
     Parâmetros:
     - period: Período para cálculo de médias móveis para suavização
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos os dados necessários
     required_columns = ['high', 'low', 'volume']
     
-    # Converter nomes de colunas para minúsculas se necessário
-    stock_data.columns = [col.lower() for col in stock_data.columns]
-    
     for col in required_columns:
         if col not in stock_data.columns:
             raise ValueError(f"Coluna {col} não encontrada nos dados.")
@@ -129,4 +129,35 @@ def getMarketFacilitationIndexTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getMarketFacilitationIndexTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    verbose: bool = False
+):
+    """
+    Versão em série de getMarketFacilitationIndexTradeStrategy: calcula o MFI uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    mfi = ((stock_data['high'] - stock_data['low']) / stock_data['volume']).replace([np.inf, -np.inf], np.nan).ffill()
+    mfi_change = mfi.rolling(window=period).mean().diff()
+    volume_change = stock_data['volume'].diff()
+    
+    # Quantos dos últimos 3 candles tiveram cada combinação (só com pelo menos 3 candles)
+    def sequence(condition):
+        return condition.astype(int).rolling(window=3).sum()
+    
+    green_sequence = sequence((mfi_change > 0) & (volume_change > 0))
+    fade_sequence = sequence((mfi_change < 0) & (volume_change < 0))
+    fake_sequence = sequence((mfi_change > 0) & (volume_change < 0))
+    squat_sequence = sequence((mfi_change < 0) & (volume_change > 0))
+    
+    # Dois candles "fake" anulam a compra
+    buy_signal = (green_sequence >= 2) & ~(fake_sequence >= 2)
+    sell_signal = (fade_sequence >= 2) | (squat_sequence >= 2)
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getMarketFacilitationIndexTradeStrategy.signal_series = getMarketFacilitationIndexTradeStrategySeries
@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, previousValue
+
 def getMfiTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -30,14 +33,11 @@ def getMfiTradeStrategy(
     - overbought: Nível que indica condição de sobrecompra
     - oversold: Nível que indica condição de sobrevenda
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos os dados necessários
     required_columns = ['high', 'low', 'close', 'volume']
     
-    # Converter nomes de colunas para minúsculas se necessário
-    stock_data.columns = [col.lower() for col in stock_data.columns]
-    
     for col in required_columns:
         if col not in stock_data.columns:
             raise ValueError(f"Coluna {col} não encontrada nos dados.")
@@ -100,4 +100,33 @@ def getMfiTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getMfiTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    overbought: int = 80,
+    oversold: int = 20,
+    verbose: bool = False
+):
+    """
+    Versão em série de getMfiTradeStrategy: calcula o MFI uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    typical_price = (stock_data['high'] + stock_data['low'] + stock_data['close']) / 3
+    money_flow = typical_price * stock_data['volume']
+    price_change = typical_price.diff()
+    positive_flow_sum = money_flow.where(price_change > 0, 0).rolling(window=period).sum()
+    negative_flow_sum = money_flow.where(price_change < 0, 0).rolling(window=period).sum()
+    mfi = 100 - (100 / (1 + positive_flow_sum / negative_flow_sum))
+    
+    # Valor do candle anterior (o próprio candle no primeiro prefixo)
+    is_rising = mfi > previousValue(mfi)
+    
+    buy_signal = (mfi <= oversold) & is_rising
+    sell_signal = (mfi >= overbought) & ~is_rising
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getMfiTradeStrategy.signal_series = getMfiTradeStrategySeries
@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, previousValue
+
 def getMovingAverageEnvelopeTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -30,14 +33,11 @@ def getMovingAverageEnvelopeTradeStrategy(
     - envelope_percentage: Percentual para determinar as bandas superior e inferior
     - ma_type: Tipo de média móvel ('sma' ou 'ema')
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos a coluna 'close'
     if 'close' not in stock_data.columns:
-        # Tentar converter para minúsculas
-        stock_data.columns = [col.lower() for col in stock_data.columns]
-        if 'close' not in stock_data.columns:
-            raise ValueError("Coluna 'close' não encontrada nos dados.")
+        raise ValueError("Coluna 'close' não encontrada nos dados.")
     
     # Calcular a média móvel
     if ma_type.lower() == 'ema':
@@ -120,4 +120,39 @@ def getMovingAverageEnvelopeTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getMovingAverageEnvelopeTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    envelope_percentage: float = 2.5,
+    ma_type: str = 'sma',
+    verbose: bool = False
+):
+    """
+    Versão em série de getMovingAverageEnvelopeTradeStrategy: calcula o envelope uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    close = stock_data['close']
+    if ma_type.lower() == 'ema':
+        ma = close.ewm(span=period, adjust=False).mean()
+    else:  # default to SMA
+        ma = close.rolling(window=period).mean()
+    envelope_factor = envelope_percentage / 100.0
+    upper_envelope = ma * (1 + envelope_factor)
+    lower_envelope = ma * (1 - envelope_factor)
+    
+    # Valores do candle anterior (o próprio candle no primeiro prefixo)
+    prev_close = previousValue(close)
+    upper_cross_down = (close < upper_envelope) & (prev_close >= previousValue(upper_envelope))
+    lower_cross_up = (close > lower_envelope) & (prev_close <= previousValue(lower_envelope))
+    is_ma_rising = ma.diff() > 0
+    
+    # Cruzamento a favor da média ou reversão à média (preço fora do envelope)
+    buy_signal = (lower_cross_up & is_ma_rising) | (close < lower_envelope)
+    sell_signal = (upper_cross_down & ~is_ma_rising) | (close > upper_envelope)
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getMovingAverageEnvelopeTradeStrategy.signal_series = getMovingAverageEnvelopeTradeStrategySeries
@@ -12,6 +12,10 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.price_action import onBalanceVolume
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, prefixLength
+
 def getOBVTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -30,37 +34,18 @@ def getOBVTradeStrategy(
     - period: Período para cálculo da média móvel do OBV
     - signal_period: Período para cálculo da linha de sinal do OBV
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos os dados necessários
     required_columns = ['close', 'volume']
     
-    # Converter nomes de colunas para minúsculas se necessário
-    stock_data.columns = [col.lower() for col in stock_data.columns]
-    
     for col in required_columns:
         if col not in stock_data.columns:
             raise ValueError(f"Coluna {col} não encontrada nos dados.")
     
-    # Calcular OBV
+    # Calcular OBV (soma acumulada do volume com o sinal da variação do preço)
     stock_data['price_change'] = stock_data['close'].diff()
-    stock_data['obv'] = 0
-    
-    # Inicialização do OBV
-    stock_data.loc[1:, 'obv'] = np.nan
-    
-    # Para o primeiro dia, OBV é igual ao volume
-    if len(stock_data) > 0:
-        stock_data.loc[0, 'obv'] = stock_data.loc[0, 'volume']
-    
-    # Cálculo do OBV para os dias seguintes
-    for i in range(1, len(stock_data)):
-        if stock_data.loc[i, 'price_change'] > 0:
-            stock_data.loc[i, 'obv'] = stock_data.loc[i-1, 'obv'] + stock_data.loc[i, 'volume']
-        elif stock_data.loc[i, 'price_change'] < 0:
-            stock_data.loc[i, 'obv'] = stock_data.loc[i-1, 'obv'] - stock_data.loc[i, 'volume']
-        else:
-            stock_data.loc[i, 'obv'] = stock_data.loc[i-1, 'obv']
+    stock_data['obv'] = onBalanceVolume(stock_data['close'], stock_data['volume'])
     
     # Calcular média móvel do OBV
     stock_data['obv_ma'] = stock_data['obv'].rolling(window=period).mean()
@@ -113,4 +98,35 @@ def getOBVTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getOBVTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    signal_period: int = 9,
+    verbose: bool = False
+):
+    """
+    Versão em série de getOBVTradeStrategy: calcula o OBV e as médias uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    close = stock_data['close']
+    obv = onBalanceVolume(close, stock_data['volume'])
+    obv_signal = obv.rolling(window=signal_period).mean()
+    
+    cross_above = (obv > obv_signal) & (obv.shift(1) <= obv_signal.shift(1))
+    cross_below = (obv < obv_signal) & (obv.shift(1) >= obv_signal.shift(1))
+    
+    # Tendências contra o candle de 'period' candles atrás (iloc[-period] na estratégia ao vivo)
+    price_trend_up = close > close.shift(period - 1)
+    obv_trend_up = obv > obv.shift(period - 1)
+    divergence_sell = price_trend_up & ~obv_trend_up
+    divergence_buy = ~price_trend_up & obv_trend_up
+    
+    # Com menos de 'period' candles a estratégia ao vivo não tem o candle de referência (IndexError): sem decisão
+    enough_data = prefixLength(stock_data) >= period
+    return decisionSeries(cross_above | divergence_buy, cross_below | divergence_sell, valid=enough_data)
+
+
+getOBVTradeStrategy.signal_series = getOBVTradeStrategySeries
@@ -12,10 +12,15 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.pivot_levels import PIVOT_TYPES, pivotLevels, sessionKeys
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, previousValue
+
 def getPivotPointsTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
     method: str = 'standard',
+    session: str = None,
     verbose: bool = True
 ):
     """
@@ -27,15 +32,13 @@ def getPivotPointsTradeStrategy(
     Parâmetros:
     - period: Período para cálculo (mantido para compatibilidade)
     - method: Método de cálculo ('standard', 'fibonacci', 'woodie', 'camarilla', 'demark')
+    - session: None para usar o candle anterior, ou frequência da sessão ('D', 'W', 'M') para usar a sessão anterior
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos os dados necessários
     required_columns = ['high', 'low', 'close', 'open']
     
-    # Converter nomes de colunas para minúsculas se necessário
-    stock_data.columns = [col.lower() for col in stock_data.columns]
-    
     for col in required_columns:
         if col not in stock_data.columns:
             if col == 'open':  # 'open' pode ser opcional em alguns casos
@@ -43,105 +46,20 @@ def getPivotPointsTradeStrategy(
             else:
                 raise ValueError(f"Coluna {col} não encontrada nos dados.")
     
-    # Adicionar informações sobre o período anterior
-    stock_data['prev_high'] = stock_data['high'].shift(1)
-    stock_data['prev_low'] = stock_data['low'].shift(1)
-    stock_data['prev_close'] = stock_data['close'].shift(1)
-    stock_data['prev_open'] = stock_data['open'].shift(1)
-    
     # Calcular os Pivot Points com base no método selecionado
-    # 1. Standard Pivot Points
-    if method.lower() == 'standard':
-        # Pivot Point (PP) = (High + Low + Close) / 3
-        stock_data['pp'] = (stock_data['prev_high'] + stock_data['prev_low'] + stock_data['prev_close']) / 3
-        
-        # Primeira resistência e suporte
-        stock_data['r1'] = 2 * stock_data['pp'] - stock_data['prev_low']
-        stock_data['s1'] = 2 * stock_data['pp'] - stock_data['prev_high']
-        
-        # Segunda resistência e suporte
-        stock_data['r2'] = stock_data['pp'] + (stock_data['prev_high'] - stock_data['prev_low'])
-        stock_data['s2'] = stock_data['pp'] - (stock_data['prev_high'] - stock_data['prev_low'])
-        
-        # Terceira resistência e suporte
-        stock_data['r3'] = stock_data['r1'] + (stock_data['prev_high'] - stock_data['prev_low'])
-        stock_data['s3'] = stock_data['s1'] - (stock_data['prev_high'] - stock_data['prev_low'])
-    
-    # 2. Fibonacci Pivot Points
-    elif method.lower() == 'fibonacci':
-        stock_data['pp'] = (stock_data['prev_high'] + stock_data['prev_low'] + stock_data['prev_close']) / 3
-        
-        range_hl = stock_data['prev_high'] - stock_data['prev_low']
-        
-        # Resistências (usando níveis de Fibonacci)
-        stock_data['r1'] = stock_data['pp'] + 0.382 * range_hl
-        stock_data['r2'] = stock_data['pp'] + 0.618 * range_hl
-        stock_data['r3'] = stock_data['pp'] + 1.000 * range_hl
-        
-        # Suportes (usando níveis de Fibonacci)
-        stock_data['s1'] = stock_data['pp'] - 0.382 * range_hl
-        stock_data['s2'] = stock_data['pp'] - 0.618 * range_hl
-        stock_data['s3'] = stock_data['pp'] - 1.000 * range_hl
-    
-    # 3. Woodie's Pivot Points
-    elif method.lower() == 'woodie':
-        # Woodie dá mais peso ao preço de fechamento
-        stock_data['pp'] = (stock_data['prev_high'] + stock_data['prev_low'] + 2 * stock_data['prev_close']) / 4
-        
-        # Resistências e suportes
-        stock_data['r1'] = 2 * stock_data['pp'] - stock_data['prev_low']
-        stock_data['s1'] = 2 * stock_data['pp'] - stock_data['prev_high']
-        
-        stock_data['r2'] = stock_data['pp'] + (stock_data['prev_high'] - stock_data['prev_low'])
-        stock_data['s2'] = stock_data['pp'] - (stock_data['prev_high'] - stock_data['prev_low'])
-        
-        stock_data['r3'] = stock_data['pp'] + 2 * (stock_data['prev_high'] - stock_data['prev_low'])
-        stock_data['s3'] = stock_data['pp'] - 2 * (stock_data['prev_high'] - stock_data['prev_low'])
-    
-    # 4. Camarilla Pivot Points
-    elif method.lower() == 'camarilla':
-        stock_data['pp'] = (stock_data['prev_high'] + stock_data['prev_low'] + stock_data['prev_close']) / 3
-        
-        range_hl = stock_data['prev_high'] - stock_data['prev_low']
-        
-        # Resistências (usando multiplicadores específicos)
-        stock_data['r1'] = stock_data['prev_close'] + range_hl * 1.1 / 12
-        stock_data['r2'] = stock_data['prev_close'] + range_hl * 1.1 / 6
-        stock_data['r3'] = stock_data['prev_close'] + range_hl * 1.1 / 4
-        
-        # Suportes (usando multiplicadores específicos)
-        stock_data['s1'] = stock_data['prev_close'] - range_hl * 1.1 / 12
-        stock_data['s2'] = stock_data['prev_close'] - range_hl * 1.1 / 6
-        stock_data['s3'] = stock_data['prev_close'] - range_hl * 1.1 / 4
-    
-    # 5. DeMark's Pivot Points
-    elif method.lower() == 'demark':
-        # Condições para determinar o valor X
-        cond1 = stock_data['prev_close'] > stock_data['prev_open']
-        cond2 = stock_data['prev_close'] < stock_data['prev_open']
-        cond3 = stock_data['prev_close'] == stock_data['prev_open']
-        
-        # Calcular X com base nas condições
-        stock_data['x'] = np.where(cond1, stock_data['prev_high'] * 2 + stock_data['prev_low'] + stock_data['prev_close'],
-                        np.where(cond2, stock_data['prev_high'] + stock_data['prev_low'] * 2 + stock_data['prev_close'],
-                                stock_data['prev_high'] + stock_data['prev_low'] + stock_data['prev_close'] * 2))
-        
-        # Pivot Point DeMark
-        stock_data['pp'] = stock_data['x'] / 4
-        
-        # Resistência e suporte
-        stock_data['r1'] = stock_data['x'] / 2 - stock_data['prev_low']
-        stock_data['s1'] = stock_data['x'] / 2 - stock_data['prev_high']
-        
-        # Adicionar R2, R3, S2, S3 como NaN para manter a consistência com outros métodos
-        stock_data['r2'] = np.nan
-        stock_data['r3'] = np.nan
-        stock_data['s2'] = np.nan
-        stock_data['s3'] = np.nan
-    
-    else:
+    if method.lower() not in PIVOT_TYPES:
         raise ValueError(f"Método '{method}' não reconhecido. Use 'standard', 'fibonacci', 'woodie', 'camarilla' ou 'demark'.")
     
+    # Rótulo da sessão de cada candle (pivots diários, semanais...)
+    sessions = None
+    if session is not None:
+        sessions = sessionKeys(stock_data['open_time'] if 'open_time' in stock_data.columns else stock_data.index, session)
+    
+    levels = pivotLevels(stock_data['high'], stock_data['low'], stock_data['close'], stock_data['open'], method, sessions)
+    stock_data['pp'] = levels['pivot']
+    for column in ['r1', 's1', 'r2', 's2', 'r3', 's3']:
+        stock_data[column] = levels[column]
+    
     # Extrair valores atuais
     current_close = stock_data['close'].iloc[-1]
     current_pp = stock_data['pp'].iloc[-1]
@@ -219,4 +137,44 @@ def getPivotPointsTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getPivotPointsTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    method: str = 'standard',
+    session: str = None,
+    verbose: bool = False
+):
+    """
+    Versão em série de getPivotPointsTradeStrategy: calcula os níveis uma única vez e devolve a decisão
+    (True / False / None) de cada candle. Os níveis só dependem do candle (ou da sessão) anterior.
+    """
+    if method.lower() not in PIVOT_TYPES:
+        raise ValueError(f"Método '{method}' não reconhecido. Use 'standard', 'fibonacci', 'woodie', 'camarilla' ou 'demark'.")
+    
+    close = stock_data['close']
+    open_prices = stock_data['open'] if 'open' in stock_data.columns else close.shift(1)
+    sessions = None
+    if session is not None:
+        sessions = sessionKeys(stock_data['open_time'] if 'open_time' in stock_data.columns else stock_data.index, session)
+    levels = pivotLevels(stock_data['high'], stock_data['low'], close, open_prices, method, sessions)
+    
+    # Valores do candle anterior (o próprio candle no primeiro prefixo)
+    prev_close = previousValue(close)
+    prev_pp = previousValue(levels['pivot'])
+    prev_r1 = previousValue(levels['r1'])
+    prev_s1 = previousValue(levels['s1'])
+    
+    pp_cross_up = (close > levels['pivot']) & (prev_close <= prev_pp)
+    pp_cross_down = (close < levels['pivot']) & (prev_close >= prev_pp)
+    r1_cross_up = (close > levels['r1']) & (prev_close <= prev_r1)
+    s1_cross_down = (close < levels['s1']) & (prev_close >= prev_s1)
+    
+    buy_signal = pp_cross_up | ((close < levels['s1']) & ~s1_cross_down)
+    sell_signal = pp_cross_down | ((close > levels['r1']) & ~r1_cross_up)
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getPivotPointsTradeStrategy.signal_series = getPivotPointsTradeStrategySeries
@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, prefixLength, previousValue
+
 def getPPOTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -32,14 +35,11 @@ def getPPOTradeStrategy(
     - slow_period: Período para a EMA lenta
     - signal_period: Período para a linha de sinal
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos a coluna 'close'
     if 'close' not in stock_data.columns:
-        # Tentar converter para minúsculas
-        stock_data.columns = [col.lower() for col in stock_data.columns]
-        if 'close' not in stock_data.columns:
-            raise ValueError("Coluna 'close' não encontrada nos dados.")
+        raise ValueError("Coluna 'close' não encontrada nos dados.")
     
     # Calcular EMA rápida e lenta
     stock_data['ema_fast'] = stock_data['close'].ewm(span=fast_period, adjust=False).mean()
@@ -142,4 +142,50 @@ def getPPOTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getPPOTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    fast_period: int = 12,
+    slow_period: int = 26,
+    signal_period: int = 9,
+    verbose: bool = False
+):
+    """
+    Versão em série de getPPOTradeStrategy: calcula o PPO uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    close = stock_data['close']
+    ema_fast = close.ewm(span=fast_period, adjust=False).mean()
+    ema_slow = close.ewm(span=slow_period, adjust=False).mean()
+    ppo = ((ema_fast - ema_slow) / ema_slow) * 100
+    ppo_signal = ppo.ewm(span=signal_period, adjust=False).mean()
+    ppo_histogram = ppo - ppo_signal
+    
+    # Valores do candle anterior (o próprio candle no primeiro prefixo)
+    prev_ppo = previousValue(ppo)
+    prev_signal = previousValue(ppo_signal)
+    prev_histogram = previousValue(ppo_histogram)
+    
+    # Divergência contra o candle de 'period' candles atrás, só com pelo menos 'period' candles
+    enough_data = prefixLength(stock_data) >= period
+    price_up = close > close.shift(period - 1)
+    ppo_up = ppo > ppo.shift(period - 1)
+    divergence_buy = enough_data & ~price_up & ppo_up
+    divergence_sell = enough_data & price_up & ~ppo_up
+    
+    zero_cross_up = (ppo > 0) & (prev_ppo < 0)
+    zero_cross_down = (ppo < 0) & (prev_ppo > 0)
+    signal_cross_up = (ppo > ppo_signal) & (prev_ppo <= prev_signal)
+    signal_cross_down = (ppo < ppo_signal) & (prev_ppo >= prev_signal)
+    histogram_reversal_up = (ppo_histogram > 0) & (prev_histogram < 0)
+    histogram_reversal_down = (ppo_histogram < 0) & (prev_histogram > 0)
+    
+    buy_signal = signal_cross_up | zero_cross_up | histogram_reversal_up | divergence_buy
+    sell_signal = signal_cross_down | zero_cross_down | histogram_reversal_down | divergence_sell
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getPPOTradeStrategy.signal_series = getPPOTradeStrategySeries
@@ -12,6 +12,10 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.rolling_extrema import highLowChannels
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries
+
 def getPriceChannelsTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -28,21 +32,19 @@ def getPriceChannelsTradeStrategy(
     - period: Período para cálculo dos canais de preço
     - confirm_periods: Número de períodos para confirmar um breakout
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos os dados necessários
     required_columns = ['high', 'low', 'close']
     
-    # Converter nomes de colunas para minúsculas se necessário
-    stock_data.columns = [col.lower() for col in stock_data.columns]
-    
     for col in required_columns:
         if col not in stock_data.columns:
             raise ValueError(f"Coluna {col} não encontrada nos dados.")
     
     # Calcular o Price Channel
-    stock_data['upper_channel'] = stock_data['high'].rolling(window=period).max()
-    stock_data['lower_channel'] = stock_data['low'].rolling(window=period).min()
+    upper_channel, lower_channel = highLowChannels(stock_data['high'], stock_data['low'], [period])[period]
+    stock_data['upper_channel'] = upper_channel
+    stock_data['lower_channel'] = lower_channel
     stock_data['mid_channel'] = (stock_data['upper_channel'] + stock_data['lower_channel']) / 2
     
     # Calcular a largura do canal
@@ -138,4 +140,36 @@ def getPriceChannelsTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getPriceChannelsTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    confirm_periods: int = 2,
+    verbose: bool = False
+):
+    """
+    Versão em série de getPriceChannelsTradeStrategy: calcula o canal uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    close = stock_data['close']
+    upper_channel, lower_channel = highLowChannels(stock_data['high'], stock_data['low'], [period])[period]
+    above_upper = (close > upper_channel).to_numpy()
+    below_lower = (close < lower_channel).to_numpy()
+    
+    # Candles acima/abaixo do canal entre os últimos 'confirm_periods' (o primeiro candle do prefixo não conta)
+    positions = np.arange(len(close))
+    confirm_upper_breakout = np.zeros(len(close), dtype=int)
+    confirm_lower_breakout = np.zeros(len(close), dtype=int)
+    for lag in range(confirm_periods):
+        counted = positions > lag
+        confirm_upper_breakout[counted] += above_upper[positions[counted] - lag]
+        confirm_lower_breakout[counted] += below_lower[positions[counted] - lag]
+    
+    buy_signal = pd.Series(confirm_upper_breakout >= confirm_periods, index=stock_data.index)
+    sell_signal = confirm_lower_breakout >= confirm_periods
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getPriceChannelsTradeStrategy.signal_series = getPriceChannelsTradeStrategySeries
@@ -12,6 +12,10 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.kernels import psarKernel
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries
+
 def getPSARTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -32,95 +36,19 @@ def getPSARTradeStrategy(
     - af_increment: Incremento do fator de aceleração
     - af_max: Fator de aceleração máximo
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos os dados necessários
     required_columns = ['high', 'low', 'close']
     
-    # Converter nomes de colunas para minúsculas se necessário
-    stock_data.columns = [col.lower() for col in stock_data.columns]
-    
     for col in required_columns:
         if col not in stock_data.columns:
             raise ValueError(f"Coluna {col} não encontrada nos dados.")
     
-    # Inicializar colunas
-    stock_data['psar'] = np.nan
-    stock_data['trend'] = np.nan  # 1 para tendência de alta, -1 para tendência de baixa
-    stock_data['af'] = af_start  # Fator de aceleração
-    stock_data['ep'] = np.nan  # Extreme point
-    
-    # Determinar tendência inicial
-    # Vamos usar a inclinação dos primeiros preços para determinar a tendência inicial
-    if len(stock_data) > 1:
-        if stock_data['close'].iloc[1] > stock_data['close'].iloc[0]:
-            initial_trend = 1  # Tendência de alta
-            stock_data.loc[1, 'psar'] = stock_data['low'].iloc[0]  # PSAR inicial abaixo do primeiro low
-            stock_data.loc[1, 'ep'] = stock_data['high'].iloc[1]  # Primeiro EP é o high atual
-        else:
-            initial_trend = -1  # Tendência de baixa
-            stock_data.loc[1, 'psar'] = stock_data['high'].iloc[0]  # PSAR inicial acima do primeiro high
-            stock_data.loc[1, 'ep'] = stock_data['low'].iloc[1]  # Primeiro EP é o low atual
-        
-        stock_data.loc[1, 'trend'] = initial_trend
-    
-    # Calcular o PSAR para o restante dos dados
-    for i in range(2, len(stock_data)):
-        prev_psar = stock_data.loc[stock_data.index[i-1], 'psar']
-        prev_trend = stock_data.loc[stock_data.index[i-1], 'trend']
-        prev_af = stock_data.loc[stock_data.index[i-1], 'af']
-        prev_ep = stock_data.loc[stock_data.index[i-1], 'ep']
-        
-        # Calcular o novo PSAR
-        current_psar = prev_psar + prev_af * (prev_ep - prev_psar)
-        
-        # Tendência de alta
-        if prev_trend == 1:
-            # Limitar o PSAR pelos mínimos anteriores
-            current_psar = min(current_psar, stock_data['low'].iloc[i-2], stock_data['low'].iloc[i-1])
-            
-            # Verificar se o PSAR é ultrapassado (tendência invertida)
-            if current_psar > stock_data['low'].iloc[i]:
-                current_trend = -1
-                current_psar = max(stock_data['high'].iloc[i-2], stock_data['high'].iloc[i-1], stock_data['high'].iloc[i])
-                current_ep = stock_data['low'].iloc[i]
-                current_af = af_start
-            else:
-                current_trend = 1
-                # Atualizar EP se tiver novo máximo
-                if stock_data['high'].iloc[i] > prev_ep:
-                    current_ep = stock_data['high'].iloc[i]
-                    current_af = min(prev_af + af_increment, af_max)
-                else:
-                    current_ep = prev_ep
-                    current_af = prev_af
-        
-        # Tendência de baixa
-        else:
-            # Limitar o PSAR pelos máximos anteriores
-            current_psar = max(current_psar, stock_data['high'].iloc[i-2], stock_data['high'].iloc[i-1])
-            
-            # Verificar se o PSAR é ultrapassado (tendência invertida)
-            if current_psar < stock_data['high'].iloc[i]:
-                current_trend = 1
-                current_psar = min(stock_data['low'].iloc[i-2], stock_data['low'].iloc[i-1], stock_data['low'].iloc[i])
-                current_ep = stock_data['high'].iloc[i]
-                current_af = af_start
-            else:
-                current_trend = -1
-                # Atualizar EP se tiver novo mínimo
-                if stock_data['low'].iloc[i] < prev_ep:
-                    current_ep = stock_data['low'].iloc[i]
-                    current_af = min(prev_af + af_increment, af_max)
-                else:
-                    current_ep = prev_ep
-                    current_af = prev_af
-        
-        # Armazenar valores
-        stock_data.loc[stock_data.index[i], 'psar'] = current_psar
-        stock_data.loc[stock_data.index[i], 'trend'] = current_trend
-        stock_data.loc[stock_data.index[i], 'af'] = current_af
-        stock_data.loc[stock_data.index[i], 'ep'] = current_ep
+    # Calcular o PSAR (kernel compartilhado, ver indicators/kernels.py)
+    stock_data['psar'], stock_data['trend'], stock_data['af'], stock_data['ep'] = psarKernel(
+        stock_data['high'], stock_data['low'], stock_data['close'], af_start, af_increment, af_max
+    )
     
     # Extrair valores atuais
     current_close = stock_data['close'].iloc[-1]
@@ -157,4 +85,24 @@ def getPSARTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getPSARTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    af_start: float = 0.02,
+    af_increment: float = 0.02,
+    af_max: float = 0.2,
+    verbose: bool = False
+):
+    """
+    Versão em série de getPSARTradeStrategy: calcula o SAR uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    _, trend, _, _ = psarKernel(stock_data['high'], stock_data['low'], stock_data['close'], af_start, af_increment, af_max)
+    trend_changes = pd.Series(trend, index=stock_data.index).diff().fillna(0)
+    return decisionSeries(trend_changes > 0, trend_changes < 0)
+
+
+getPSARTradeStrategy.signal_series = getPSARTradeStrategySeries
@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, prefixLength, previousValue
+
 def getROCTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -32,14 +35,11 @@ def getROCTradeStrategy(
     - overbought: Nível que indica condição de sobrecompra
     - oversold: Nível que indica condição de sobrevenda
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos a coluna 'close'
     if 'close' not in stock_data.columns:
-        # Tentar converter para minúsculas
-        stock_data.columns = [col.lower() for col in stock_data.columns]
-        if 'close' not in stock_data.columns:
-            raise ValueError("Coluna 'close' não encontrada nos dados.")
+        raise ValueError("Coluna 'close' não encontrada nos dados.")
     
     # Calcular o ROC
     # ROC = ((Preço atual / Preço n períodos atrás) - 1) * 100
@@ -142,4 +142,49 @@ def getROCTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getROCTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    signal_period: int = 9,
+    overbought: int = 10,
+    oversold: int = -10,
+    verbose: bool = False
+):
+    """
+    Versão em série de getROCTradeStrategy: calcula o ROC uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    close = stock_data['close']
+    roc = ((close / close.shift(period)) - 1) * 100
+    roc_signal = roc.rolling(window=signal_period).mean()
+    roc_histogram = roc - roc_signal
+    
+    # Valores do candle anterior (o próprio candle no primeiro prefixo)
+    prev_roc = previousValue(roc)
+    prev_signal = previousValue(roc_signal)
+    prev_histogram = previousValue(roc_histogram)
+    is_rising = roc > prev_roc
+    
+    # Divergência contra o candle de 'period' candles atrás, só com pelo menos 'period' candles
+    enough_data = prefixLength(stock_data) >= period
+    price_up = close > close.shift(period - 1)
+    roc_up = roc > roc.shift(period - 1)
+    divergence_buy = enough_data & ~price_up & roc_up
+    divergence_sell = enough_data & price_up & ~roc_up
+    
+    zero_cross_up = (roc > 0) & (prev_roc < 0)
+    zero_cross_down = (roc < 0) & (prev_roc > 0)
+    signal_cross_up = (roc > roc_signal) & (prev_roc <= prev_signal)
+    signal_cross_down = (roc < roc_signal) & (prev_roc >= prev_signal)
+    histogram_reversal_up = (roc_histogram > 0) & (prev_histogram < 0)
+    histogram_reversal_down = (roc_histogram < 0) & (prev_histogram > 0)
+    
+    buy_signal = signal_cross_up | zero_cross_up | ((roc < oversold) & is_rising) | divergence_buy
+    sell_signal = signal_cross_down | zero_cross_down | ((roc > overbought) & ~is_rising) | divergence_sell
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getROCTradeStrategy.signal_series = getROCTradeStrategySeries
@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionChain, prefixLength
+
 def getSchaffTrendCycleTradeStrategy(
     stock_data: pd.DataFrame,
     stc_fast: int = 23,
@@ -33,7 +36,7 @@ def getSchaffTrendCycleTradeStrategy(
     - stc_lower: Limite inferior para sobrecompra (padrão=25)
     - use_close: Usar preço de fechamento para cálculos
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se a coluna de preço existe
     price_col = 'close' if use_close else 'open'
@@ -119,4 +122,48 @@ def getSchaffTrendCycleTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getSchaffTrendCycleTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    stc_fast: int = 23,
+    stc_slow: int = 50,
+    stc_cycle: int = 10,
+    stc_upper: int = 75,
+    stc_lower: int = 25,
+    use_close: bool = True,
+    verbose: bool = False
+):
+    """
+    Versão em série de getSchaffTrendCycleTradeStrategy: calcula o STC uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    price = stock_data['close' if use_close else 'open']
+    macd = price.ewm(span=stc_fast, adjust=False).mean() - price.ewm(span=stc_slow, adjust=False).mean()
+    macd_max = macd.rolling(window=stc_cycle).max()
+    macd_min = macd.rolling(window=stc_cycle).min()
+    macd_k = 100 * (macd - macd_min) / (macd_max - macd_min).replace(0, 1)  # Evitar divisão por zero
+    macd_d = macd_k.ewm(span=stc_cycle, adjust=False).mean()
+    macd_d_max = macd_d.rolling(window=stc_cycle).max()
+    macd_d_min = macd_d.rolling(window=stc_cycle).min()
+    stc = 100 * (macd_d - macd_d_min) / (macd_d_max - macd_d_min).replace(0, 1)  # Evitar divisão por zero
+    stc_smooth = stc.ewm(span=3, adjust=False).mean()
+    
+    cross_lower = (stc_smooth.shift(1) <= stc_lower) & (stc_smooth > stc_lower)
+    cross_upper = (stc_smooth.shift(1) >= stc_upper) & (stc_smooth < stc_upper)
+    
+    min_periods = max(stc_fast, stc_slow) + stc_cycle
+    return decisionChain(
+        [
+            ((stc_smooth < stc_lower) | cross_lower, True),
+            ((stc_smooth > stc_upper) | cross_upper, False),
+            (stc_smooth < 50, True),
+            (stc_smooth > 50, False),
+        ],
+        stock_data.index,
+        valid=prefixLength(stock_data) > min_periods,
+    )
+
+
+getSchaffTrendCycleTradeStrategy.signal_series = getSchaffTrendCycleTradeStrategySeries
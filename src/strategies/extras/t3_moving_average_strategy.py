@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, prefixLength
+
 def getT3MovingAverageTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -31,7 +34,7 @@ def getT3MovingAverageTradeStrategy(
     - slow_period: Período para T3 lenta
     - use_close: Usar preço de fechamento para cálculos
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se a coluna de preço existe
     price_col = 'close' if use_close else 'open'
@@ -124,4 +127,47 @@ def getT3MovingAverageTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getT3MovingAverageTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    volume_factor: float = 0.7,
+    fast_period: int = 7,
+    slow_period: int = 21,
+    use_close: bool = True,
+    verbose: bool = False
+):
+    """
+    Versão em série de getT3MovingAverageTradeStrategy: calcula as T3 uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    price = stock_data['close' if use_close else 'open']
+    
+    def calculate_t3(data, period, vfactor):
+        c1 = -vfactor * vfactor * vfactor
+        e1 = data.ewm(span=period, adjust=False).mean()
+        e2 = e1.ewm(span=period, adjust=False).mean()
+        e3 = e2.ewm(span=period, adjust=False).mean()
+        e4 = e3.ewm(span=period, adjust=False).mean()
+        e5 = e4.ewm(span=period, adjust=False).mean()
+        e6 = e5.ewm(span=period, adjust=False).mean()
+        return c1 * e6 + 3 * vfactor * c1 * e5 + 3 * vfactor * vfactor * c1 * e4 + vfactor * vfactor * vfactor * e3
+    
+    fast_t3 = calculate_t3(price, fast_period, volume_factor)
+    slow_t3 = calculate_t3(price, slow_period, volume_factor)
+    t3_slope = calculate_t3(price, period, volume_factor).diff(3)  # Diferença com 3 períodos para suavizar
+    signal = pd.Series(np.where(fast_t3 > slow_t3, 1, np.where(fast_t3 < slow_t3, -1, 0)), index=stock_data.index)
+    signal_change = signal.diff()
+    
+    # Mudança de sinal primeiro; sem mudança, segue o sinal confirmado pela inclinação da T3 principal
+    buy_signal = (signal_change > 0) | (~(signal_change < 0) & (signal > 0) & (t3_slope > 0))
+    sell_signal = (signal_change < 0) | (~(signal_change > 0) & (signal < 0) & (t3_slope < 0))
+    
+    # T3 requer mais dados (6 EMAs)
+    enough_data = prefixLength(stock_data) > max(period, fast_period, slow_period) * 6
+    return decisionSeries(buy_signal, sell_signal, valid=enough_data)
+
+
+getT3MovingAverageTradeStrategy.signal_series = getT3MovingAverageTradeStrategySeries
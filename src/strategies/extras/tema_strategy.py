@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, previousValue
+
 def getTEMATradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -30,14 +33,11 @@ def getTEMATradeStrategy(
     - short_period: Período para TEMA curto (para cruzamento)
     - long_period: Período para TEMA longo (para cruzamento)
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos a coluna 'close'
     if 'close' not in stock_data.columns:
-        # Tentar converter para minúsculas
-        stock_data.columns = [col.lower() for col in stock_data.columns]
-        if 'close' not in stock_data.columns:
-            raise ValueError("Coluna 'close' não encontrada nos dados.")
+        raise ValueError("Coluna 'close' não encontrada nos dados.")
     
     # Função para calcular o TEMA
     def calculate_tema(data, period):
@@ -129,4 +129,47 @@ def getTEMATradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getTEMATradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    short_period: int = 7,
+    long_period: int = 21,
+    verbose: bool = False
+):
+    """
+    Versão em série de getTEMATradeStrategy: calcula as TEMAs uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    close = stock_data['close']
+    
+    def calculate_tema(data, period):
+        ema1 = data.ewm(span=period, adjust=False).mean()
+        ema2 = ema1.ewm(span=period, adjust=False).mean()
+        ema3 = ema2.ewm(span=period, adjust=False).mean()
+        return 3 * ema1 - 3 * ema2 + ema3
+    
+    tema = calculate_tema(close, period)
+    tema_short = calculate_tema(close, short_period)
+    tema_long = calculate_tema(close, long_period)
+    is_uptrend = tema.diff() > 0
+    
+    # Valores do candle anterior (o próprio candle no primeiro prefixo)
+    prev_close = previousValue(close)
+    prev_tema = previousValue(tema)
+    prev_tema_short = previousValue(tema_short)
+    prev_tema_long = previousValue(tema_long)
+    
+    price_cross_up = (close > tema) & (prev_close <= prev_tema)
+    price_cross_down = (close < tema) & (prev_close >= prev_tema)
+    short_cross_up = (tema_short > tema_long) & (prev_tema_short <= prev_tema_long)
+    short_cross_down = (tema_short < tema_long) & (prev_tema_short >= prev_tema_long)
+    
+    buy_signal = (price_cross_up & is_uptrend) | short_cross_up
+    sell_signal = (price_cross_down & ~is_uptrend) | short_cross_down
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getTEMATradeStrategy.signal_series = getTEMATradeStrategySeries
@@ -12,6 +12,10 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.rolling_regression import rollingRegression
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionChain, prefixLength
+
 def getTimeSeriesForecastTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -29,7 +33,7 @@ def getTimeSeriesForecastTradeStrategy(
     - forecast_periods: Períodos à frente para previsão
     - use_close: Usar preço de fechamento para cálculos
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se a coluna de preço existe
     price_col = 'close' if use_close else 'open'
@@ -40,45 +44,10 @@ def getTimeSeriesForecastTradeStrategy(
     if len(stock_data) <= period:
         return None  # Dados insuficientes para cálculo
     
-    # Função para calcular a previsão de regressão linear para um ponto no futuro
-    def linear_regression_forecast(series, period, forecast_periods=1):
-        # Criar array de índices (x) para a regressão
-        x = np.arange(period)
-        # Inicializar array para os resultados
-        result = np.zeros(len(series))
-        result[:] = np.nan
-        
-        # Percorrer a série para calcular a regressão para cada janela
-        for i in range(period - 1, len(series)):
-            # Obter os últimos 'period' valores (y)
-            y = series.iloc[i - period + 1:i + 1].values
-            
-            # Calcular a regressão linear (mx + b)
-            m, b = np.polyfit(x, y, 1)
-            
-            # Calcular o valor previsto para 'forecast_periods' à frente
-            forecast = m * (period - 1 + forecast_periods) + b
-            result[i] = forecast
-        
-        return pd.Series(result, index=series.index)
-    
-    # Calcular o Time Series Forecast (previsão n períodos à frente)
-    stock_data['tsf'] = linear_regression_forecast(stock_data[price_col], period, forecast_periods)
-    
-    # Calcular a inclinação da linha de regressão (tendência)
-    def calculate_slope(series, period):
-        slope = np.zeros(len(series))
-        slope[:] = np.nan
-        
-        for i in range(period - 1, len(series)):
-            y = series.iloc[i - period + 1:i + 1].values
-            x = np.arange(period)
-            m, b = np.polyfit(x, y, 1)
-            slope[i] = m
-        
-        return pd.Series(slope, index=series.index)
-    
-    stock_data['tsf_slope'] = calculate_slope(stock_data[price_col], period)
+    # Regressão linear móvel: previsão 'forecast_periods' à frente (TSF) e inclinação da reta (tendência)
+    regression = rollingRegression(stock_data[price_col], period, forecast_periods)
+    stock_data['tsf'] = regression['forecast']
+    stock_data['tsf_slope'] = regression['slope']
     
     # Calcular a média móvel do TSF
     stock_data['tsf_ma'] = stock_data['tsf'].rolling(window=ma_period).mean()
@@ -140,4 +109,42 @@ def getTimeSeriesForecastTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getTimeSeriesForecastTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    ma_period: int = 9,
+    forecast_periods: int = 1,
+    use_close: bool = True,
+    verbose: bool = False
+):
+    """
+    Versão em série de getTimeSeriesForecastTradeStrategy: calcula a previsão uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    price = stock_data['close' if use_close else 'open']
+    regression = rollingRegression(price, period, forecast_periods)
+    tsf = regression['forecast']
+    tsf_slope = regression['slope']
+    tsf_ma = tsf.rolling(window=ma_period).mean()
+    
+    cross_up = (tsf.shift(1) <= tsf_ma.shift(1)) & (tsf > tsf_ma)
+    cross_down = (tsf.shift(1) >= tsf_ma.shift(1)) & (tsf < tsf_ma)
+    
+    return decisionChain(
+        [
+            (cross_up, True),
+            (cross_down, False),
+            ((tsf > price) & (tsf_slope > 0), True),
+            ((tsf < price) & (tsf_slope < 0), False),
+            (tsf_slope > 0, True),
+            (tsf_slope < 0, False),
+        ],
+        stock_data.index,
+        valid=prefixLength(stock_data) > period,
+    )
+
+
+getTimeSeriesForecastTradeStrategy.signal_series = getTimeSeriesForecastTradeStrategySeries
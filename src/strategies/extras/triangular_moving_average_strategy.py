@@ -12,6 +12,10 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.weighted_windows import triangularWeights, weightedMovingAverageBatch
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, prefixLength
+
 def getTriangularMovingAverageTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -29,7 +33,7 @@ def getTriangularMovingAverageTradeStrategy(
     - slow_period: Período para TMA lenta
     - use_close: Usar preço de fechamento para cálculos
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se a coluna de preço existe
     price_col = 'close' if use_close else 'open'
@@ -41,19 +45,10 @@ def getTriangularMovingAverageTradeStrategy(
         return None  # Dados insuficientes para cálculo
     
     # Cálculo do Triangular Moving Average (TMA)
-    # TMA é uma média móvel dupla, ou seja, uma SMA de uma SMA
-    # Primeiro, calculamos a SMA
-    stock_data['sma'] = stock_data[price_col].rolling(window=period).mean()
-    
-    # Em seguida, calculamos a SMA da SMA para obter o TMA
-    stock_data['tma'] = stock_data['sma'].rolling(window=period).mean()
-    
-    # Calcular TMA rápida e lenta para sinais de cruzamento
-    stock_data['fast_sma'] = stock_data[price_col].rolling(window=fast_period).mean()
-    stock_data['fast_tma'] = stock_data['fast_sma'].rolling(window=fast_period).mean()
-    
-    stock_data['slow_sma'] = stock_data[price_col].rolling(window=slow_period).mean()
-    stock_data['slow_tma'] = stock_data['slow_sma'].rolling(window=slow_period).mean()
+    # TMA é uma média móvel dupla (SMA de uma SMA), aplicada como um único vetor de pesos triangular
+    stock_data['tma'], stock_data['fast_tma'], stock_data['slow_tma'] = weightedMovingAverageBatch(
+        stock_data[price_col], [triangularWeights(period), triangularWeights(fast_period), triangularWeights(slow_period)]
+    )
     
     # Gerar sinais de negociação baseados no cruzamento do TMA rápido e lento
     # Quando o TMA rápido cruza o TMA lento para cima, é um sinal de compra
@@ -99,4 +94,37 @@ def getTriangularMovingAverageTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getTriangularMovingAverageTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    fast_period: int = 7,
+    slow_period: int = 21,
+    use_close: bool = True,
+    verbose: bool = False
+):
+    """
+    Versão em série de getTriangularMovingAverageTradeStrategy: calcula as TMAs uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    price_col = 'close' if use_close else 'open'
+    
+    # A TMA principal não entra na decisão; só as TMAs rápida e lenta
+    fast_tma, slow_tma = weightedMovingAverageBatch(
+        stock_data[price_col], [triangularWeights(fast_period), triangularWeights(slow_period)]
+    )
+    signal = pd.Series(np.where(fast_tma > slow_tma, 1, np.where(fast_tma < slow_tma, -1, 0)), index=stock_data.index)
+    signal_change = signal.diff()
+    
+    # Mudança de sinal primeiro; sem mudança, segue o sinal atual
+    buy_signal = (signal_change > 0) | (~(signal_change < 0) & (signal > 0))
+    sell_signal = (signal_change < 0) | (~(signal_change > 0) & (signal < 0))
+    
+    # A estratégia ao vivo devolve None com menos candles que o maior período
+    enough_data = prefixLength(stock_data) >= max(period, fast_period, slow_period)
+    return decisionSeries(buy_signal, sell_signal, valid=enough_data)
+
+
+getTriangularMovingAverageTradeStrategy.signal_series = getTriangularMovingAverageTradeStrategySeries
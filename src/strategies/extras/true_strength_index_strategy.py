@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionChain, prefixLength
+
 def getTrueStrengthIndexTradeStrategy(
     stock_data: pd.DataFrame,
     r_period: int = 25,
@@ -33,7 +36,7 @@ def getTrueStrengthIndexTradeStrategy(
     - oversold: Nível de sobrevenda (padrão=-25)
     - use_close: Usar preço de fechamento para cálculos
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se a coluna de preço existe
     price_col = 'close' if use_close else 'open'
@@ -142,4 +145,48 @@ def getTrueStrengthIndexTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getTrueStrengthIndexTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    r_period: int = 25,
+    s_period: int = 13,
+    signal_period: int = 7,
+    overbought: float = 25.0,
+    oversold: float = -25.0,
+    use_close: bool = True,
+    verbose: bool = False
+):
+    """
+    Versão em série de getTrueStrengthIndexTradeStrategy: calcula o TSI uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    price_change = stock_data['close' if use_close else 'open'].diff()
+    pc_ema_r_s = price_change.ewm(span=r_period, adjust=False).mean().ewm(span=s_period, adjust=False).mean()
+    abs_pc_ema_r_s = price_change.abs().ewm(span=r_period, adjust=False).mean().ewm(span=s_period, adjust=False).mean()
+    tsi = 100 * (pc_ema_r_s / abs_pc_ema_r_s)
+    tsi_signal = tsi.ewm(span=signal_period, adjust=False).mean()
+    tsi_histogram = tsi - tsi_signal
+    
+    previous_tsi = tsi.shift(1)
+    previous_signal = tsi_signal.shift(1)
+    
+    min_periods = r_period + s_period
+    return decisionChain(
+        [
+            (tsi < oversold, True),
+            (tsi > overbought, False),
+            ((previous_tsi <= previous_signal) & (tsi > tsi_signal), True),
+            ((previous_tsi >= previous_signal) & (tsi < tsi_signal), False),
+            ((previous_tsi <= 0) & (tsi > 0), True),
+            ((previous_tsi >= 0) & (tsi < 0), False),
+            ((tsi > 0) & (tsi_histogram > 0), True),
+            ((tsi < 0) & (tsi_histogram < 0), False),
+        ],
+        stock_data.index,
+        valid=prefixLength(stock_data) > min_periods,
+    )
+
+
+getTrueStrengthIndexTradeStrategy.signal_series = getTrueStrengthIndexTradeStrategySeries
@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, prefixLength, previousValue
+
 def getUltimateOscillatorTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -42,14 +45,11 @@ def getUltimateOscillatorTradeStrategy(
     - overbought: Nível que indica condição de sobrecompra
     - oversold: Nível que indica condição de sobrevenda
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos os dados necessários
     required_columns = ['high', 'low', 'close']
     
-    # Converter nomes de colunas para minúsculas se necessário
-    stock_data.columns = [col.lower() for col in stock_data.columns]
-    
     for col in required_columns:
         if col not in stock_data.columns:
             raise ValueError(f"Coluna {col} não encontrada nos dados.")
@@ -201,4 +201,87 @@ def getUltimateOscillatorTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getUltimateOscillatorTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    period1: int = 7,
+    period2: int = 14,
+    period3: int = 28,
+    weight1: float = 4.0,
+    weight2: float = 2.0,
+    weight3: float = 1.0,
+    overbought: int = 70,
+    oversold: int = 30,
+    verbose: bool = False
+):
+    """
+    Versão em série de getUltimateOscillatorTradeStrategy: calcula o Ultimate Oscillator e as divergências uma única
+    vez e devolve a decisão (True / False / None) de cada candle.
+    """
+    close = stock_data['close']
+    prev_close = close.shift(1)
+    has_prev = prev_close.notna()
+    
+    # True Range e Buying Pressure (no primeiro candle, sem fechamento anterior, usam a máxima e a mínima do candle)
+    true_high = stock_data['high'].where(~has_prev | ~(prev_close > stock_data['high']), prev_close)
+    true_low = stock_data['low'].where(~has_prev | ~(prev_close < stock_data['low']), prev_close)
+    tr = true_high - true_low
+    bp = close - true_low
+    
+    avg1 = bp.rolling(window=period1).sum() / tr.rolling(window=period1).sum()
+    avg2 = bp.rolling(window=period2).sum() / tr.rolling(window=period2).sum()
+    avg3 = bp.rolling(window=period3).sum() / tr.rolling(window=period3).sum()
+    total_weight = weight1 + weight2 + weight3
+    uo = 100 * ((weight1 * avg1 + weight2 * avg2 + weight3 * avg3) / total_weight)
+    
+    # Divergências na janela dos últimos 'lookback' candles (só avaliadas com dados suficientes)
+    lookback = period3 + 5
+    length = prefixLength(stock_data).to_numpy()
+    window_ready = (length >= period) & (length > lookback)
+    close_values = close.to_numpy(dtype=float)
+    uo_values = uo.to_numpy(dtype=float)
+    
+    def extremePositions(values, find_max):
+        # Posição do primeiro mínimo/máximo (ignorando NaN) da janela que termina em cada candle; -1 se não houver
+        positions = np.full(len(values), -1)
+        if len(values) < lookback:
+            return positions
+        windows = np.lib.stride_tricks.sliding_window_view(values, lookback)
+        filled = np.where(np.isnan(windows), -np.inf if find_max else np.inf, windows)
+        offsets = filled.argmax(axis=1) if find_max else filled.argmin(axis=1)
+        found = ~np.isnan(windows).all(axis=1)
+        positions[lookback - 1:] = np.where(found, offsets + np.arange(len(windows)), -1)
+        return positions
+    
+    def divergence(find_max):
+        price_pos = extremePositions(close_values, find_max)
+        uo_pos = extremePositions(uo_values, find_max)
+        found = window_ready & (price_pos >= 0) & (uo_pos >= 0) & (price_pos > uo_pos)
+        price_at_price, price_at_uo = close_values[price_pos], close_values[uo_pos]
+        uo_at_price, uo_at_uo = uo_values[price_pos], uo_values[uo_pos]
+        with np.errstate(invalid='ignore'):
+            if find_max:
+                return found & (price_at_price > price_at_uo) & (uo_at_price < uo_at_uo)
+            return found & (price_at_price < price_at_uo) & (uo_at_price > uo_at_uo)
+    
+    bullish_divergence = pd.Series(divergence(False), index=stock_data.index)
+    bearish_divergence = pd.Series(divergence(True), index=stock_data.index)
+    
+    is_rising = uo > previousValue(uo)
+    is_overbought = uo > overbought
+    is_oversold = uo < oversold
+    
+    buy_signal = is_oversold & bullish_divergence & is_rising
+    sell_signal = is_overbought & bearish_divergence & ~is_rising
+    
+    # Sem sinal principal, valem os sinais simplificados
+    no_main_signal = ~buy_signal & ~sell_signal
+    buy_signal = buy_signal | (no_main_signal & is_oversold & is_rising)
+    sell_signal = sell_signal | (no_main_signal & is_overbought & ~is_rising)
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getUltimateOscillatorTradeStrategy.signal_series = getUltimateOscillatorTradeStrategySeries
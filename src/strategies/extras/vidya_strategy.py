@@ -12,6 +12,10 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.kernels import adaptiveAverageKernel
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionChain, prefixLength
+
 def getVIDYATradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -31,7 +35,7 @@ def getVIDYATradeStrategy(
     - chande_period: Período para cálculo do Chande Momentum Oscillator
     - use_close: Usar preço de fechamento para cálculos
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se a coluna de preço existe
     price_col = 'close' if use_close else 'open'
@@ -77,23 +81,8 @@ def getVIDYATradeStrategy(
         # O CMO normalizado para o range 0-1
         k = abs(data[cmo_col]) / 100
         
-        # Inicializar VIDYA como o primeiro valor válido de preço
-        vidya = np.zeros(len(data))
-        vidya[:] = np.nan
-        
-        # Encontrar o primeiro índice válido (onde CMO não é NaN)
-        first_valid = data[cmo_col].first_valid_index()
-        if first_valid is not None:
-            idx = data.index.get_loc(first_valid)
-            # Inicializar VIDYA com o primeiro valor de preço
-            vidya[idx] = data[price_col].iloc[idx]
-            
-            # Calcular VIDYA para os valores restantes
-            for i in range(idx + 1, len(data)):
-                # Fator de suavização ajustado pela volatilidade (k)
-                alpha = sc * k.iloc[i]
-                # VIDYA(i) = VIDYA(i-1) + α * (Price(i) - VIDYA(i-1))
-                vidya[i] = vidya[i-1] + alpha * (data[price_col].iloc[i] - vidya[i-1])
+        # VIDYA(i) = VIDYA(i-1) + α * (Price(i) - VIDYA(i-1)), com α = sc * k e semente no primeiro CMO válido
+        vidya = adaptiveAverageKernel(data[price_col], sc * k)
         
         return pd.Series(vidya, index=data.index)
     
@@ -155,4 +144,53 @@ def getVIDYATradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getVIDYATradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    fast_period: int = 9,
+    slow_period: int = 21,
+    chande_period: int = 10,
+    use_close: bool = True,
+    verbose: bool = False
+):
+    """
+    Versão em série de getVIDYATradeStrategy: calcula o CMO e as VIDYAs uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    price = stock_data['close' if use_close else 'open']
+    
+    # CMO: 100 * (soma das altas - soma das baixas) / (soma das altas + soma das baixas)
+    price_change = price.diff(1)
+    su_roll = price_change.clip(lower=0).rolling(window=chande_period).sum()
+    sd_roll = (-price_change).clip(lower=0).rolling(window=chande_period).sum()
+    cmo = 100 * ((su_roll - sd_roll) / (su_roll + sd_roll))
+    k = cmo.abs() / 100
+    
+    def calculate_vidya(period):
+        return pd.Series(adaptiveAverageKernel(price, 2 / (period + 1) * k), index=stock_data.index)
+    
+    vidya = calculate_vidya(period)
+    fast_vidya = calculate_vidya(fast_period)
+    slow_vidya = calculate_vidya(slow_period)
+    
+    signal = pd.Series(np.where(fast_vidya > slow_vidya, 1, np.where(fast_vidya < slow_vidya, -1, 0)), index=stock_data.index)
+    price_trend = pd.Series(np.where(price > vidya, 1, np.where(price < vidya, -1, 0)), index=stock_data.index)
+    signal_change = signal.diff()
+    
+    min_periods = max(period, fast_period, slow_period, chande_period)
+    return decisionChain(
+        [
+            (signal_change > 0, True),
+            (signal_change < 0, False),
+            ((signal > 0) & (price_trend > 0), True),
+            ((signal < 0) & (price_trend < 0), False),
+        ],
+        stock_data.index,
+        valid=prefixLength(stock_data) > min_periods,
+    )
+
+
+getVIDYATradeStrategy.signal_series = getVIDYATradeStrategySeries
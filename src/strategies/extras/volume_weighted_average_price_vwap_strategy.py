@@ -12,6 +12,10 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.session_vwap import sessionIds, sessionVWAP
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionChain
+
 def getVolumeWeightedAveragePriceTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -27,47 +31,40 @@ def getVolumeWeightedAveragePriceTradeStrategy(
     - std_dev_multiplier: Multiplicador para as bandas de desvio padrão
     - reset_daily: Resetar cálculos diariamente (padrão para VWAP)
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se as colunas necessárias existem
-    required_cols = ['high', 'low', 'close', 'volume', 'date']
+    required_cols = ['high', 'low', 'close', 'volume']
     for col in required_cols:
         if col not in stock_data.columns:
             raise ValueError(f"Coluna '{col}' não encontrada nos dados")
     
-    # Converter a coluna de data para datetime se ainda não estiver
-    if not pd.api.types.is_datetime64_any_dtype(stock_data['date']):
-        stock_data['date'] = pd.to_datetime(stock_data['date'])
-    
-    # Adicionar coluna de dia para reset diário se necessário
-    if reset_daily:
-        stock_data['day'] = stock_data['date'].dt.date
+    # Horário dos candles: coluna 'date', senão open_time (getStockData e CandleStore), senão o índice
+    if 'date' in stock_data.columns:
+        candle_times = stock_data['date']
+    elif 'open_time' in stock_data.columns:
+        candle_times = stock_data['open_time']
+    else:
+        candle_times = stock_data.index
     
     # Calcular preço típico (TP): (high + low + close) / 3
     stock_data['typical_price'] = (stock_data['high'] + stock_data['low'] + stock_data['close']) / 3
     
     # Calcular VWAP
     if reset_daily:
-        # Resetar cálculos para cada dia
-        stock_data['cum_tp_vol'] = stock_data.groupby('day')['typical_price'].apply(
-            lambda x: x * stock_data.loc[x.index, 'volume']).cumsum()
-        stock_data['cum_vol'] = stock_data.groupby('day')['volume'].cumsum()
-        stock_data['vwap'] = stock_data['cum_tp_vol'] / stock_data['cum_vol']
+        # Resetar cálculos para cada dia; desvio padrão do preço típico ponderado pelo volume desde o início do dia
+        sessions = sessionIds(candle_times)
+        vwap_data = sessionVWAP(
+            stock_data['high'], stock_data['low'], stock_data['close'], stock_data['volume'], sessions, period
+        )
+        stock_data['vwap'] = vwap_data['vwap']
+        stock_data['std_dev'] = vwap_data['weighted_std']
     else:
         # Janela móvel para o período especificado
         rolling_tp_vol = (stock_data['typical_price'] * stock_data['volume']).rolling(window=period).sum()
         rolling_vol = stock_data['volume'].rolling(window=period).sum()
         stock_data['vwap'] = rolling_tp_vol / rolling_vol
-    
-    # Calcular bandas de desvio padrão ao redor do VWAP
-    if reset_daily:
-        # Cálculo do desvio padrão para cada dia
-        stock_data['tp_vwap_diff'] = stock_data['typical_price'] - stock_data['vwap']
-        stock_data['tp_vwap_diff_sq'] = stock_data['tp_vwap_diff'] ** 2
         
-        stock_data['cum_diff_sq'] = stock_data.groupby('day')['tp_vwap_diff_sq'].cumsum()
-        stock_data['std_dev'] = np.sqrt(stock_data['cum_diff_sq'] / stock_data['cum_vol'])
-    else:
         # Janela móvel para o desvio padrão
         tp_vwap_diff = stock_data['typical_price'] - stock_data['vwap']
         stock_data['std_dev'] = tp_vwap_diff.rolling(window=period).std()
@@ -118,4 +115,49 @@ def getVolumeWeightedAveragePriceTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getVolumeWeightedAveragePriceTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    std_dev_multiplier: float = 1.0,
+    reset_daily: bool = True,
+    verbose: bool = False
+):
+    """
+    Versão em série de getVolumeWeightedAveragePriceTradeStrategy: calcula o VWAP e as bandas uma única vez e devolve
+    a decisão (True / False / None) de cada candle.
+    """
+    if 'date' in stock_data.columns:
+        candle_times = stock_data['date']
+    elif 'open_time' in stock_data.columns:
+        candle_times = stock_data['open_time']
+    else:
+        candle_times = stock_data.index
+    
+    high, low, close, volume = stock_data['high'], stock_data['low'], stock_data['close'], stock_data['volume']
+    if reset_daily:
+        vwap_data = sessionVWAP(high, low, close, volume, sessionIds(candle_times), period)
+        vwap = vwap_data['vwap']
+        std_dev = vwap_data['weighted_std']
+    else:
+        typical_price = (high + low + close) / 3
+        vwap = (typical_price * volume).rolling(window=period).sum() / volume.rolling(window=period).sum()
+        std_dev = (typical_price - vwap).rolling(window=period).std()
+    
+    upper_band = vwap + (std_dev * std_dev_multiplier)
+    lower_band = vwap - (std_dev * std_dev_multiplier)
+    
+    return decisionChain(
+        [
+            (close < lower_band, True),
+            (close > upper_band, False),
+            (close < vwap, True),
+            (close > vwap, False),
+        ],
+        stock_data.index,
+    )
+
+
+getVolumeWeightedAveragePriceTradeStrategy.signal_series = getVolumeWeightedAveragePriceTradeStrategySeries
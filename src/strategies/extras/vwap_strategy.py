@@ -12,6 +12,10 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.session_vwap import sessionIds, sessionVWAP
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, previousValue
+
 def getVolumeWeightedAveragePriceTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -30,14 +34,11 @@ def getVolumeWeightedAveragePriceTradeStrategy(
     - std_dev_multiplier: Multiplicador para as bandas de desvio padrão
     - reset_daily: Se True, reseta os cálculos a cada dia de negociação
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos os dados necessários
     required_columns = ['high', 'low', 'close', 'volume']
     
-    # Converter nomes de colunas para minúsculas se necessário
-    stock_data.columns = [col.lower() for col in stock_data.columns]
-    
     for col in required_columns:
         if col not in stock_data.columns:
             raise ValueError(f"Coluna {col} não encontrada nos dados.")
@@ -49,56 +50,23 @@ def getVolumeWeightedAveragePriceTradeStrategy(
             date_column = col
             break
     
-    # Calcular o preço típico (high + low + close) / 3
-    stock_data['typical_price'] = (stock_data['high'] + stock_data['low'] + stock_data['close']) / 3
-    
-    # Calcular o valor negociado (preço típico * volume)
-    stock_data['tp_volume'] = stock_data['typical_price'] * stock_data['volume']
-    
+    # Número da sessão (dia) de cada candle, a partir dos segundos desde a época
+    sessions = None
     if reset_daily and date_column:
-        # Extrair apenas a data (sem hora) para agrupar por dia
-        if pd.api.types.is_datetime64_any_dtype(stock_data[date_column]):
-            stock_data['day'] = stock_data[date_column].dt.date
-        else:
-            # Tentar converter para datetime
-            try:
-                stock_data['day'] = pd.to_datetime(stock_data[date_column]).dt.date
-            except:
-                # Se não conseguir converter, usar o dia do index (se for datetime)
-                if pd.api.types.is_datetime64_any_dtype(stock_data.index):
-                    stock_data['day'] = stock_data.index.date
-                else:
-                    # Se tudo falhar, não resetar diariamente
-                    reset_daily = False
-    
-    # Calcular o VWAP
-    if reset_daily and 'day' in stock_data.columns:
-        # Resetar os cálculos por dia
-        stock_data['cum_tp_volume'] = stock_data.groupby('day')['tp_volume'].cumsum()
-        stock_data['cum_volume'] = stock_data.groupby('day')['volume'].cumsum()
-    else:
-        # Acumular continuamente
-        stock_data['cum_tp_volume'] = stock_data['tp_volume'].cumsum()
-        stock_data['cum_volume'] = stock_data['volume'].cumsum()
-    
-    # Evitar divisão por zero
-    stock_data['vwap'] = np.where(
-        stock_data['cum_volume'] > 0,
-        stock_data['cum_tp_volume'] / stock_data['cum_volume'],
-        stock_data['typical_price']
-    )
-    
-    # Calcular desvio do preço em relação ao VWAP
-    stock_data['price_dev'] = stock_data['typical_price'] - stock_data['vwap']
-    
-    # Calcular desvio padrão do preço em relação ao VWAP
-    if reset_daily and 'day' in stock_data.columns:
-        stock_data['std_dev'] = stock_data.groupby('day')['price_dev'].rolling(window=period).std().reset_index(level=0, drop=True)
-    else:
-        stock_data['std_dev'] = stock_data['price_dev'].rolling(window=period).std()
-    
-    # Preencher valores NaN
-    stock_data['std_dev'] = stock_data['std_dev'].fillna(0)
+        try:
+            sessions = sessionIds(stock_data[date_column])
+        except:
+            # Se não conseguir converter, usar o dia do index (se for datetime)
+            if pd.api.types.is_datetime64_any_dtype(stock_data.index):
+                sessions = sessionIds(stock_data.index)
+            else:
+                # Se tudo falhar, não resetar diariamente
+                reset_daily = False
+    
+    # Calcular o VWAP (acumulado por dia ou contínuo) e o desvio padrão do preço em relação a ele
+    vwap_data = sessionVWAP(stock_data['high'], stock_data['low'], stock_data['close'], stock_data['volume'], sessions, period)
+    stock_data['vwap'] = vwap_data['vwap']
+    stock_data['std_dev'] = vwap_data['std_dev'].fillna(0)
     
     # Calcular bandas de desvio padrão
     stock_data['upper_band'] = stock_data['vwap'] + (stock_data['std_dev'] * std_dev_multiplier)
@@ -175,4 +143,59 @@ def getVolumeWeightedAveragePriceTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getVolumeWeightedAveragePriceTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    std_dev_multiplier: float = 1.5,
+    reset_daily: bool = True,
+    verbose: bool = False
+):
+    """
+    Versão em série de getVolumeWeightedAveragePriceTradeStrategy: calcula o VWAP e as bandas uma única vez e devolve
+    a decisão (True / False / None) de cada candle.
+    """
+    date_column = None
+    for col in ['date', 'datetime', 'timestamp']:
+        if col in stock_data.columns:
+            date_column = col
+            break
+    
+    sessions = None
+    if reset_daily and date_column:
+        try:
+            sessions = sessionIds(stock_data[date_column])
+        except:
+            if pd.api.types.is_datetime64_any_dtype(stock_data.index):
+                sessions = sessionIds(stock_data.index)
+    
+    close = stock_data['close']
+    vwap_data = sessionVWAP(stock_data['high'], stock_data['low'], close, stock_data['volume'], sessions, period)
+    vwap = vwap_data['vwap']
+    std_dev = vwap_data['std_dev'].fillna(0)
+    upper_band = vwap + (std_dev * std_dev_multiplier)
+    lower_band = vwap - (std_dev * std_dev_multiplier)
+    
+    # Valores do candle anterior (o próprio candle no primeiro prefixo)
+    prev_close = previousValue(close)
+    prev_vwap = previousValue(vwap)
+    prev_upper = previousValue(upper_band)
+    prev_lower = previousValue(lower_band)
+    
+    vwap_cross_up = (close > vwap) & (prev_close <= prev_vwap)
+    vwap_cross_down = (close < vwap) & (prev_close >= prev_vwap)
+    upper_cross_down = (close < upper_band) & (prev_close >= prev_upper)
+    lower_cross_up = (close > lower_band) & (prev_close <= prev_lower)
+    
+    # Retorno ao VWAP: em algum candle anterior do prefixo o preço esteve fora da banda
+    was_above_upper = (close.shift(1) > upper_band.shift(1)).cummax()
+    was_below_lower = (close.shift(1) < lower_band.shift(1)).cummax()
+    
+    buy_signal = vwap_cross_up | ((close < lower_band) & lower_cross_up) | (vwap_cross_up & was_below_lower)
+    sell_signal = vwap_cross_down | ((close > upper_band) & upper_cross_down) | (vwap_cross_down & was_above_upper)
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getVolumeWeightedAveragePriceTradeStrategy.signal_series = getVolumeWeightedAveragePriceTradeStrategySeries
@@ -12,6 +12,10 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.kernels import smmaKernel
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, previousValue
+
 def getWilliamsAlligatorTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -38,14 +42,11 @@ def getWilliamsAlligatorTradeStrategy(
     - teeth_shift: Deslocamento para a linha Teeth
     - lips_shift: Deslocamento para a linha Lips
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos os dados necessários
     required_columns = ['high', 'low', 'close']
     
-    # Converter nomes de colunas para minúsculas se necessário
-    stock_data.columns = [col.lower() for col in stock_data.columns]
-    
     for col in required_columns:
         if col not in stock_data.columns:
             raise ValueError(f"Coluna {col} não encontrada nos dados.")
@@ -53,29 +54,15 @@ def getWilliamsAlligatorTradeStrategy(
     # Calcular o preço médio
     stock_data['median_price'] = (stock_data['high'] + stock_data['low']) / 2
     
-    # Implementar SMMA (Smoothed Moving Average)
-    def calculate_smma(data, period):
-        smma = np.zeros_like(data)
-        smma[:period] = np.nan
-        
-        # Inicializar com a média dos primeiros 'period' elementos
-        smma[period - 1] = np.mean(data[:period])
-        
-        # Calcular o SMMA para os elementos restantes
-        for i in range(period, len(data)):
-            smma[i] = (smma[i - 1] * (period - 1) + data[i]) / period
-        
-        return smma
-    
     # Calcular as três linhas do Alligator:
     # Jaw (Mandíbula) - Linha Azul: SMMA de 13 períodos deslocada 8 barras para frente
     # Teeth (Dentes) - Linha Vermelha: SMMA de 8 períodos deslocada 5 barras para frente
     # Lips (Lábios) - Linha Verde: SMMA de 5 períodos deslocada 3 barras para frente
     
     # Calcular SMMAs
-    smma_jaw = calculate_smma(stock_data['median_price'].values, jaw_period)
-    smma_teeth = calculate_smma(stock_data['median_price'].values, teeth_period)
-    smma_lips = calculate_smma(stock_data['median_price'].values, lips_period)
+    smma_jaw = smmaKernel(stock_data['median_price'], jaw_period)
+    smma_teeth = smmaKernel(stock_data['median_price'], teeth_period)
+    smma_lips = smmaKernel(stock_data['median_price'], lips_period)
     
     # Criar as colunas do Alligator
     stock_data['jaw'] = pd.Series(smma_jaw, index=stock_data.index)
@@ -203,4 +190,75 @@ def getWilliamsAlligatorTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getWilliamsAlligatorTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    jaw_period: int = 13,
+    teeth_period: int = 8,
+    lips_period: int = 5,
+    jaw_shift: int = 8,
+    teeth_shift: int = 5,
+    lips_shift: int = 3,
+    verbose: bool = False
+):
+    """
+    Versão em série de getWilliamsAlligatorTradeStrategy: calcula as linhas do Alligator uma única vez e devolve a
+    decisão (True / False / None) de cada candle.
+    """
+    close = stock_data['close']
+    median_price = (stock_data['high'] + stock_data['low']) / 2
+    
+    def visibleLine(line, shift, lag):
+        # A estratégia ao vivo desloca a linha para o futuro (shift(-shift)) dentro do prefixo: o valor 'lag' candles
+        # antes do último só existe se vier de um candle já presente no prefixo (shift <= lag); senão é NaN
+        if shift > lag:
+            return pd.Series(np.nan, index=stock_data.index)
+        return line.shift(lag - shift)
+    
+    def lineValues(line_period, shift):
+        line = pd.Series(smmaKernel(median_price, line_period), index=stock_data.index)
+        current = visibleLine(line, shift, 0)
+        previous = visibleLine(line, shift, 1)
+        previous.iloc[:1] = current.iloc[:1]
+        return current, previous
+    
+    jaw, prev_jaw = lineValues(jaw_period, jaw_shift)
+    teeth, prev_teeth = lineValues(teeth_period, teeth_shift)
+    lips, prev_lips = lineValues(lips_period, lips_shift)
+    prev_close = previousValue(close)
+    
+    lines_entangled = ((jaw - teeth).abs() < 0.0001) & ((teeth - lips).abs() < 0.0001)
+    was_entangled = ((prev_jaw - prev_teeth).abs() < 0.0001) & ((prev_teeth - prev_lips).abs() < 0.0001)
+    is_separating = ~lines_entangled & was_entangled
+    
+    uptrend_eating = (lips > teeth) & (teeth > jaw)
+    downtrend_eating = (lips < teeth) & (teeth < jaw)
+    was_eating_up = (prev_lips > prev_teeth) & (prev_teeth > prev_jaw)
+    was_eating_down = (prev_lips < prev_teeth) & (prev_teeth < prev_jaw)
+    is_converging = (was_eating_up & ~uptrend_eating) | (was_eating_down & ~downtrend_eating)
+    
+    # max()/min() do Python com NaN: o primeiro valor é mantido a menos que um seguinte seja maior (menor)
+    highest = teeth.where(teeth > jaw, jaw)
+    highest = lips.where(lips > highest, highest)
+    lowest = teeth.where(teeth < jaw, jaw)
+    lowest = lips.where(lips < lowest, lowest)
+    price_above_all = close > highest
+    price_below_all = close < lowest
+    
+    cross_above_lips = (close > lips) & (prev_close <= prev_lips)
+    cross_below_lips = (close < lips) & (prev_close >= prev_lips)
+    
+    first_bite_buy = (lines_entangled | is_separating) & cross_above_lips & (lips >= teeth)
+    first_bite_sell = (lines_entangled | is_separating) & cross_below_lips & (lips <= teeth)
+    eating_buy = uptrend_eating & price_above_all
+    eating_sell = downtrend_eating & price_below_all
+    
+    buy_signal = first_bite_buy | eating_buy
+    sell_signal = first_bite_sell | eating_sell | (is_converging & was_eating_up)
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getWilliamsAlligatorTradeStrategy.signal_series = getWilliamsAlligatorTradeStrategySeries
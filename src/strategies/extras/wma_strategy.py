@@ -12,6 +12,10 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.weighted_windows import weightedMovingAverageBatch, wmaWeights
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, previousValue
+
 def getWMATradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -30,27 +34,16 @@ def getWMATradeStrategy(
     - short_period: Período para WMA curto (para cruzamento)
     - long_period: Período para WMA longo (para cruzamento)
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se temos a coluna 'close'
     if 'close' not in stock_data.columns:
-        # Tentar converter para minúsculas
-        stock_data.columns = [col.lower() for col in stock_data.columns]
-        if 'close' not in stock_data.columns:
-            raise ValueError("Coluna 'close' não encontrada nos dados.")
-    
-    # Função para calcular o WMA
-    def calculate_wma(data, period):
-        weights = np.arange(1, period + 1)
-        wma = data.rolling(window=period).apply(
-            lambda x: np.sum(weights * x) / np.sum(weights), raw=True
-        )
-        return wma
+        raise ValueError("Coluna 'close' não encontrada nos dados.")
     
     # Calcular WMAs com diferentes períodos
-    stock_data['wma'] = calculate_wma(stock_data['close'], period)
-    stock_data['wma_short'] = calculate_wma(stock_data['close'], short_period)
-    stock_data['wma_long'] = calculate_wma(stock_data['close'], long_period)
+    stock_data['wma'], stock_data['wma_short'], stock_data['wma_long'] = weightedMovingAverageBatch(
+        stock_data['close'], [wmaWeights(period), wmaWeights(short_period), wmaWeights(long_period)]
+    )
     
     # Calcular a inclinação (slope) das WMAs para determinar tendência
     stock_data['wma_slope'] = stock_data['wma'].diff()
@@ -123,4 +116,40 @@ def getWMATradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getWMATradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    short_period: int = 7,
+    long_period: int = 21,
+    verbose: bool = False
+):
+    """
+    Versão em série de getWMATradeStrategy: calcula as WMAs uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    close = stock_data['close']
+    wma, wma_short, wma_long = weightedMovingAverageBatch(
+        close, [wmaWeights(period), wmaWeights(short_period), wmaWeights(long_period)]
+    )
+    is_uptrend = wma.diff() > 0
+    
+    # Valores do candle anterior (o próprio candle no primeiro prefixo)
+    prev_close = previousValue(close)
+    prev_wma = previousValue(wma)
+    prev_wma_short = previousValue(wma_short)
+    prev_wma_long = previousValue(wma_long)
+    
+    price_cross_up = (close > wma) & (prev_close <= prev_wma)
+    price_cross_down = (close < wma) & (prev_close >= prev_wma)
+    short_cross_up = (wma_short > wma_long) & (prev_wma_short <= prev_wma_long)
+    short_cross_down = (wma_short < wma_long) & (prev_wma_short >= prev_wma_long)
+    
+    buy_signal = (price_cross_up & is_uptrend) | short_cross_up
+    sell_signal = (price_cross_down & ~is_uptrend) | short_cross_down
+    return decisionSeries(buy_signal, sell_signal)
+
+
+getWMATradeStrategy.signal_series = getWMATradeStrategySeries
@@ -12,6 +12,9 @@ SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, PROJECT_ROOT)
 sys.path.insert(0, SRC_DIR)
 
+from indicators.ohlcv_view import ohlcvView
+from strategies.signal_series import decisionSeries, prefixLength
+
 def getZeroLagMovingAverageTradeStrategy(
     stock_data: pd.DataFrame,
     period: int = 14,
@@ -29,7 +32,7 @@ def getZeroLagMovingAverageTradeStrategy(
     - threshold: Limiar para decisão de compra/venda
     - use_close: Usar preço de fechamento para cálculos
     """
-    stock_data = stock_data.copy()
+    stock_data = ohlcvView(stock_data)
     
     # Verificar se a coluna de preço existe
     price_col = 'close' if use_close else 'open'
@@ -78,4 +81,26 @@ def getZeroLagMovingAverageTradeStrategy(
         print(f" | Decisão: {'Comprar' if trade_decision == True else 'Vender' if trade_decision == False else 'Nenhuma'}")
         print("-------")
     
-    return trade_decision
\ No newline at end of file
+    return trade_decision
+
+
+def getZeroLagMovingAverageTradeStrategySeries(
+    stock_data: pd.DataFrame,
+    period: int = 14,
+    signal_period: int = 9,
+    threshold: float = 0.0,
+    use_close: bool = True,
+    verbose: bool = False
+):
+    """
+    Versão em série de getZeroLagMovingAverageTradeStrategy: calcula o ZLEMA e a linha de sinal uma única vez e
+    devolve a decisão (True / False / None) de cada candle.
+    """
+    price = stock_data['close' if use_close else 'open']
+    lag = (period - 1) // 2
+    zlema = (2 * price - price.shift(lag)).ewm(span=period, adjust=False).mean()
+    zlema_diff = zlema - zlema.rolling(window=signal_period).mean()
+    return decisionSeries(zlema_diff > threshold, zlema_diff < -threshold, valid=prefixLength(stock_data) > lag)
+
+
+getZeroLagMovingAverageTradeStrategy.signal_series = getZeroLagMovingAverageTradeStrategySeries
@@ -1,4 +1,57 @@
 import pandas as pd
+from strategies.signal_series import decisionSeries, lastDecision, lastValid, validCount
+
+
+def _movingAverageRSIVolumeSignals(
+    stock_data: pd.DataFrame, fast_window, slow_window, rsi_window, rsi_overbought, rsi_oversold, volume_multiplier
+):
+    """
+    Calcula médias, RSI e média de volume uma única vez e devolve a decisão de cada candle
+    junto com os valores usados nela.
+    """
+    close = stock_data["close_price"]
+
+    # Calcula as Médias Móveis
+    ma_fast = close.rolling(window=fast_window).mean()
+    ma_slow = close.rolling(window=slow_window).mean()
+
+    # Calcula o RSI
+    delta = close.diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=rsi_window).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=rsi_window).mean()
+    rs = gain / loss
+    rsi = 100 - (100 / (1 + rs))
+
+    # Calcula a Média do Volume
+    volume_avg = stock_data["volume"].rolling(window=slow_window).mean()
+
+    # Linhas que sobrevivem ao dropna
+    valid = ma_fast.notna() & ma_slow.notna() & rsi.notna() & volume_avg.notna()
+    enough_data = validCount(valid) >= slow_window
+
+    # Últimos valores dos indicadores
+    last_ma_fast = lastValid(ma_fast, valid)
+    last_ma_slow = lastValid(ma_slow, valid)
+    last_rsi = lastValid(rsi, valid)
+    last_volume = lastValid(stock_data["volume"], valid)
+    last_volume_avg = lastValid(volume_avg, valid)
+
+    # Condições para compra
+    buy = (last_ma_fast > last_ma_slow) & (last_rsi > rsi_oversold) & (last_volume > (volume_multiplier * last_volume_avg))
+
+    # Condições para venda
+    sell = (last_ma_fast < last_ma_slow) | (last_rsi > rsi_overbought)
+
+    decisions = decisionSeries(buy, sell, valid=enough_data)
+    indicators = {
+        "ma_fast": last_ma_fast,
+        "ma_slow": last_ma_slow,
+        "rsi": last_rsi,
+        "volume": last_volume,
+        "volume_avg": last_volume_avg,
+        "enough_data": enough_data,
+    }
+    return decisions, indicators
 
 
 def getMovingAverageRSIVolumeStrategy(
@@ -17,56 +70,50 @@ def getMovingAverageRSIVolumeStrategy(
     - Compra quando a média rápida cruza acima da média lenta, RSI está acima da zona de sobrevenda e o volume está acima da média.
     - Venda quando a média rápida cruza abaixo da média lenta ou RSI está na zona de sobrecompra.
     """
-    stock_data = stock_data.copy()
-
-    # Calcula as Médias Móveis
-    stock_data["ma_fast"] = stock_data["close_price"].rolling(window=fast_window).mean()
-    stock_data["ma_slow"] = stock_data["close_price"].rolling(window=slow_window).mean()
-
-    # Calcula o RSI
-    delta = stock_data["close_price"].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=rsi_window).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=rsi_window).mean()
-    rs = gain / loss
-    stock_data["rsi"] = 100 - (100 / (1 + rs))
-
-    # Calcula a Média do Volume
-    stock_data["volume_avg"] = stock_data["volume"].rolling(window=slow_window).mean()
-
-    # Remove NaN
-    stock_data.dropna(subset=["ma_fast", "ma_slow", "rsi", "volume_avg"], inplace=True)
+    decisions, indicators = _movingAverageRSIVolumeSignals(
+        stock_data, fast_window, slow_window, rsi_window, rsi_overbought, rsi_oversold, volume_multiplier
+    )
 
-    if len(stock_data) < slow_window:
+    if len(stock_data) == 0 or not indicators["enough_data"].iloc[-1]:
         if verbose:
             print("⚠️ Dados insuficientes após remoção de NaN. Pulando período...")
         return None
 
-    # Últimos valores dos indicadores
-    last_ma_fast = stock_data["ma_fast"].iloc[-1]
-    last_ma_slow = stock_data["ma_slow"].iloc[-1]
-    last_rsi = stock_data["rsi"].iloc[-1]
-    last_volume = stock_data["volume"].iloc[-1]
-    last_volume_avg = stock_data["volume_avg"].iloc[-1]
-
-    # Condições para compra
-    buy_condition = (
-        (last_ma_fast > last_ma_slow) and (last_rsi > rsi_oversold) and (last_volume > (volume_multiplier * last_volume_avg))
-    )
-
-    # Condições para venda
-    sell_condition = (last_ma_fast < last_ma_slow) or (last_rsi > rsi_overbought)
-
-    trade_decision = True if buy_condition else False if sell_condition else None
+    # A decisão ao vivo é o último elemento da série
+    trade_decision = lastDecision(decisions)
 
     if verbose:
         print("-------")
         print("📊 Estratégia: Médias Móveis + RSI + Volume")
-        print(f" | Última Média Rápida: {last_ma_fast:.3f}")
-        print(f" | Última Média Lenta: {last_ma_slow:.3f}")
-        print(f" | Último RSI: {last_rsi:.3f}")
-        print(f" | Último Volume: {last_volume:.3f}")
-        print(f" | Média de Volume: {last_volume_avg:.3f}")
+        print(f" | Última Média Rápida: {indicators['ma_fast'].iloc[-1]:.3f}")
+        print(f" | Última Média Lenta: {indicators['ma_slow'].iloc[-1]:.3f}")
+        print(f" | Último RSI: {indicators['rsi'].iloc[-1]:.3f}")
+        print(f" | Último Volume: {indicators['volume'].iloc[-1]:.3f}")
+        print(f" | Média de Volume: {indicators['volume_avg'].iloc[-1]:.3f}")
         print(f' | Decisão: {"Comprar" if trade_decision == True else "Vender" if trade_decision == False else "Nenhuma"}')
         print("-------")
 
     return trade_decision
+
+
+def getMovingAverageRSIVolumeStrategySeries(
+    stock_data: pd.DataFrame,
+    fast_window: int = 7,
+    slow_window: int = 40,
+    rsi_window: int = 14,
+    rsi_overbought: int = 70,
+    rsi_oversold: int = 30,
+    volume_multiplier: float = 1.5,
+    verbose: bool = False,
+):
+    """
+    Versão em série de getMovingAverageRSIVolumeStrategy: calcula os indicadores uma única vez
+    e devolve a decisão (True / False / None) de cada candle.
+    """
+    decisions, _ = _movingAverageRSIVolumeSignals(
+        stock_data, fast_window, slow_window, rsi_window, rsi_overbought, rsi_oversold, volume_multiplier
+    )
+    return decisions
+
+
+getMovingAverageRSIVolumeStrategy.signal_series = getMovingAverageRSIVolumeStrategySeries
@@ -1,4 +1,25 @@
 import pandas as pd
+from strategies.signal_series import decisionSeries, lastDecision, lastValid, validCount
+
+
+def _movingAverageSignals(stock_data: pd.DataFrame, fast_window, slow_window):
+    """
+    Calcula as médias uma única vez e devolve a decisão de cada candle junto com os valores usados nela.
+    """
+    close = stock_data["close_price"]
+    ma_fast = close.rolling(window=fast_window).mean()
+    ma_slow = close.rolling(window=slow_window).mean()
+
+    # Linhas que sobrevivem ao dropna (períodos iniciais com NaN)
+    valid = ma_fast.notna() & ma_slow.notna()
+    enough_data = validCount(valid) >= slow_window
+
+    last_ma_fast = lastValid(ma_fast, valid)
+    last_ma_slow = lastValid(ma_slow, valid)
+
+    buy = last_ma_fast > last_ma_slow
+    decisions = decisionSeries(buy, ~buy, valid=enough_data)
+    return decisions, {"ma_fast": last_ma_fast, "ma_slow": last_ma_slow, "enough_data": enough_data}
 
 
 # Estratégia Simples de Médias Móveis
@@ -15,31 +36,20 @@ def getMovingAverageTradeStrategy(stock_data: pd.DataFrame, fast_window=7, slow_
     :param verbose: Se True, imprime logs.
     :return: True (compra) ou False (venda).
     """
-
-    # Criamos uma cópia para evitar o `SettingWithCopyWarning`
-    stock_data = stock_data.copy()
-
-    # Calcula as Médias Moveis Rápida e Lenta
-    stock_data["ma_fast"] = stock_data["close_price"].rolling(window=fast_window).mean()
-    stock_data["ma_slow"] = stock_data["close_price"].rolling(window=slow_window).mean()
-
-    # 🔹 REMOVE PERÍODOS INICIAIS COM NaN
-    stock_data.dropna(subset=["ma_fast", "ma_slow"], inplace=True)
+    decisions, indicators = _movingAverageSignals(stock_data, fast_window, slow_window)
 
     # Se não houver dados suficientes após remover os NaNs, retorna None
-    if len(stock_data) < slow_window:
+    if len(stock_data) == 0 or not indicators["enough_data"].iloc[-1]:
         if verbose:
             print("⚠️ Dados insuficientes após remoção de NaN. Pulando período...")
         return None
 
-    # Pega os últimos valores das médias móveis
-    last_ma_fast = stock_data["ma_fast"].iloc[-1]
-    last_ma_slow = stock_data["ma_slow"].iloc[-1]
-
-    # Toma a decisão com base na posição da média móvel
-    trade_decision = last_ma_fast > last_ma_slow  # True = Comprar, False = Vender
+    # A decisão ao vivo é o último elemento da série
+    trade_decision = lastDecision(decisions)  # True = Comprar, False = Vender
 
     if verbose:
+        last_ma_fast = indicators["ma_fast"].iloc[-1]
+        last_ma_slow = indicators["ma_slow"].iloc[-1]
         print("-------")
         print("📊 Estratégia: Moving Average Simples")
         print(f" | Última Média Rápida: {last_ma_fast:.3f}")
@@ -49,3 +59,16 @@ def getMovingAverageTradeStrategy(stock_data: pd.DataFrame, fast_window=7, slow_
         print("-------")
 
     return trade_decision
+
+
+def getMovingAverageTradeStrategySeries(stock_data: pd.DataFrame, fast_window=7, slow_window=40, verbose=False):
+    """
+    Versão em série de getMovingAverageTradeStrategy: calcula as médias uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    decisions, _ = _movingAverageSignals(stock_data, fast_window, slow_window)
+    return decisions
+
+
+getMovingAverageTradeStrategySeries.supports_panel = True
+getMovingAverageTradeStrategy.signal_series = getMovingAverageTradeStrategySeries
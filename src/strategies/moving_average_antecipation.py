@@ -1,4 +1,70 @@
+import numpy as np
 import pandas as pd
+from indicators.period_batch import rollingStdBatch, smaBatch
+from strategies.signal_series import batchParameters, decisionSeries, lastDecision, lastValid, shiftValid, validCount
+
+
+def _movingAverageAntecipationSignals(stock_data: pd.DataFrame, volatility_factor, fast_window, slow_window):
+    """
+    Calcula médias, volatilidade e gradientes uma única vez e devolve a decisão de cada candle
+    junto com os valores usados nela.
+    """
+    close = stock_data["close_price"]
+
+    # Calcula as Médias Moveis Rápida e Lenta
+    ma_fast = close.rolling(window=fast_window).mean()
+    ma_slow = close.rolling(window=slow_window).mean()
+
+    # Calcula a volatilidade (desvio padrão) dos preços
+    volatility_window = slow_window  # Normalmente é a mesma janela que slow_window da MA strategy.
+    volatility = close.rolling(window=volatility_window).std()
+    return _movingAverageAntecipationDecisions(ma_fast, ma_slow, volatility, volatility_factor, slow_window)
+
+
+def _movingAverageAntecipationDecisions(ma_fast, ma_slow, volatility, volatility_factor, slow_window):
+    """
+    Decisão de cada candle a partir das médias e da volatilidade: séries, ou DataFrames com uma coluna por
+    combinação (volatility_factor e slow_window com um valor por coluna).
+    """
+    # Linhas que sobrevivem ao dropna das médias
+    valid = ma_fast.notna() & ma_slow.notna()
+    rows = np.arange(1, len(ma_fast) + 1)
+    if ma_fast.ndim == 2:
+        rows = rows[:, None]
+    enough_data = (rows >= slow_window) & (validCount(valid) >= slow_window)
+
+    # Últimas Médias Móveis e as de 2 linhas válidas antes (iloc[-3]) para calcular o gradiente
+    last_ma_fast = lastValid(ma_fast, valid)
+    prev_ma_fast = shiftValid(ma_fast, valid, 2)
+    last_ma_slow = lastValid(ma_slow, valid)
+    prev_ma_slow = shiftValid(ma_slow, valid, 2)
+
+    # Penúltima volatilidade não nula (dropna().iloc[-2])
+    last_volatility = shiftValid(volatility, valid & volatility.notna(), 1)
+
+    # Calcula o gradiente (mudança) das médias móveis
+    fast_gradient = last_ma_fast - prev_ma_fast
+    slow_gradient = last_ma_slow - prev_ma_slow
+
+    # Calcula a diferença atual entre as médias
+    current_difference = (last_ma_fast - last_ma_slow).abs()
+
+    # Toma a decisão com base em volatilidade + gradiente
+    near_cross = current_difference < last_volatility * volatility_factor
+    buy = near_cross & (fast_gradient > 0) & (fast_gradient > slow_gradient)
+    sell = near_cross & (fast_gradient < 0) & (fast_gradient < slow_gradient)
+
+    decisions = decisionSeries(buy, sell, valid=enough_data & last_volatility.notna())
+    indicators = {
+        "ma_fast": last_ma_fast,
+        "ma_slow": last_ma_slow,
+        "volatility": last_volatility,
+        "difference": current_difference,
+        "fast_gradient": fast_gradient,
+        "slow_gradient": slow_gradient,
+        "enough_data": enough_data,
+    }
+    return decisions, indicators
 
 
 # Estratégia de Antecipação de Média Móvel
@@ -11,56 +77,29 @@ def getMovingAverageAntecipationTradeStrategy(
             print("❌ Dados insuficientes para calcular médias móveis. Pulando...")
         return None  # Retorna None para evitar erro
 
-    # Criamos cópias das colunas para evitar o warning de Pandas
-    stock_data = stock_data.copy()
-
-    # Calcula as Médias Moveis Rápida e Lenta
-    stock_data["ma_fast"] = stock_data["close_price"].rolling(window=fast_window).mean()
-    stock_data["ma_slow"] = stock_data["close_price"].rolling(window=slow_window).mean()
-
-    # Calcula a volatilidade (desvio padrão) dos preços
-    volatility_window = slow_window  # Normalmente é a mesma janela que slow_window da MA strategy.
-    stock_data["volatility"] = stock_data["close_price"].rolling(window=volatility_window).std()
-
-    # 🔹 REMOVE LINHAS INICIAIS COM NaN NAS MÉDIAS
-    stock_data.dropna(subset=["ma_fast", "ma_slow"], inplace=True)
+    decisions, indicators = _movingAverageAntecipationSignals(stock_data, volatility_factor, fast_window, slow_window)
 
     # Se ainda restam poucos dados após remover NaN, pula esse período
-    if len(stock_data) < slow_window:
+    if not indicators["enough_data"].iloc[-1]:
         if verbose:
             print("⚠️ Ainda há poucos dados após remover NaN. Pulando...")
         return None
 
-    # Pega as últimas Médias Móveis e as penúltimas para calcular o gradiente
-    last_ma_fast = stock_data["ma_fast"].iloc[-1]
-    prev_ma_fast = stock_data["ma_fast"].iloc[-3]
-    last_ma_slow = stock_data["ma_slow"].iloc[-1]
-    prev_ma_slow = stock_data["ma_slow"].iloc[-3]
-
     # Última volatilidade (evita erro se houver NaN)
-    last_volatility = stock_data["volatility"].dropna().iloc[-2] if not stock_data["volatility"].isna().all() else None
-    if last_volatility is None:
+    last_volatility = indicators["volatility"].iloc[-1]
+    if np.isnan(last_volatility):
         return None
 
-    # Calcula o gradiente (mudança) das médias móveis
-    fast_gradient = last_ma_fast - prev_ma_fast
-    slow_gradient = last_ma_slow - prev_ma_slow
-
-    # Calcula a diferença atual entre as médias
-    current_difference = abs(last_ma_fast - last_ma_slow)
-
-    # Inicializa a decisão
-    ma_trade_decision = None
-
-    # Toma a decisão com base em volatilidade + gradiente
-    if current_difference < last_volatility * volatility_factor:
-        if fast_gradient > 0 and fast_gradient > slow_gradient:
-            ma_trade_decision = True  # Comprar
-        elif fast_gradient < 0 and fast_gradient < slow_gradient:
-            ma_trade_decision = False  # Vender
+    # A decisão ao vivo é o último elemento da série
+    ma_trade_decision = lastDecision(decisions)
 
     # Log da estratégia e decisão
     if verbose:
+        last_ma_fast = indicators["ma_fast"].iloc[-1]
+        last_ma_slow = indicators["ma_slow"].iloc[-1]
+        current_difference = indicators["difference"].iloc[-1]
+        fast_gradient = indicators["fast_gradient"].iloc[-1]
+        slow_gradient = indicators["slow_gradient"].iloc[-1]
         print("-------")
         print("📊 Estratégia: Moving Average Antecipation")
         print(f" | Última Média Rápida: {last_ma_fast:.3f}")
@@ -74,3 +113,39 @@ def getMovingAverageAntecipationTradeStrategy(
         print("-------")
 
     return ma_trade_decision
+
+
+def getMovingAverageAntecipationTradeStrategySeries(
+    stock_data: pd.DataFrame, volatility_factor: float, fast_window=7, slow_window=40, verbose=False
+):
+    """
+    Versão em série de getMovingAverageAntecipationTradeStrategy: calcula médias e volatilidade uma única vez
+    e devolve a decisão (True / False / None) de cada candle.
+    """
+    decisions, _ = _movingAverageAntecipationSignals(stock_data, volatility_factor, fast_window, slow_window)
+    return decisions
+
+
+def getMovingAverageAntecipationTradeStrategyBatch(stock_data: pd.DataFrame, combinations):
+    """
+    Versão em lote de getMovingAverageAntecipationTradeStrategy para varreduras: decisões de várias combinações
+    de parâmetros (uma coluna por combinação), com as médias e volatilidades de todas as janelas calculadas de uma vez.
+    """
+    params = batchParameters(getMovingAverageAntecipationTradeStrategySeries, combinations)
+    close = stock_data["close_price"]
+    fast_window, slow_window = params["fast_window"], params["slow_window"]
+
+    averages = smaBatch(close, fast_window + slow_window)
+    ma_fast = pd.DataFrame(averages[:, : len(fast_window)], index=close.index)
+    ma_slow = pd.DataFrame(averages[:, len(fast_window) :], index=close.index)
+    volatility = pd.DataFrame(rollingStdBatch(close, slow_window), index=close.index)
+
+    decisions, _ = _movingAverageAntecipationDecisions(
+        ma_fast, ma_slow, volatility, np.asarray(params["volatility_factor"]), np.asarray(slow_window)
+    )
+    return decisions
+
+
+getMovingAverageAntecipationTradeStrategySeries.supports_panel = True
+getMovingAverageAntecipationTradeStrategy.signal_series = getMovingAverageAntecipationTradeStrategySeries
+getMovingAverageAntecipationTradeStrategy.signal_batch = getMovingAverageAntecipationTradeStrategyBatch
@@ -1,39 +1,56 @@
 import pandas as pd
 from indicators import Indicators
+from strategies.signal_series import decisionSeries, lastDecision
 
 
-def getRsiTradeStrategy(stock_data: pd.DataFrame, low=30, high=70, verbose=True):
+def _isSet(labels: pd.Series):
+    """
+    Reproduz o teste `if last_valley` / `if last_peak` da versão original: o rótulo precisa existir e,
+    quando o índice é numérico, o rótulo 0 conta como ausente.
+    """
+    is_set = labels.notna()
+    if pd.api.types.is_numeric_dtype(labels):
+        is_set &= labels != 0
+    return is_set
+
 
-    stock_data = stock_data.copy()  # Importante para evitar bugs
+def _rsiSignals(stock_data: pd.DataFrame, low, high):
+    """
+    Calcula o RSI uma única vez e devolve a decisão de cada candle junto com o RSI.
+    """
+    # **Calcula o RSI**
+    rsi_series = Indicators.getRSI(stock_data["close_price"], last_only=False)
 
-    # **Calcula o RSI e adiciona ao DataFrame**
-    stock_data["RSI"] = Indicators.getRSI(stock_data["close_price"], last_only=False)
+    # Último pico (RSI > high) e último vale (RSI < low) até cada candle, pelo rótulo do índice
+    labels = pd.Series(stock_data.index, index=stock_data.index)
+    last_peak = labels.where(rsi_series > high).ffill()
+    last_valley = labels.where(rsi_series < low).ffill()
 
-    if "RSI" not in stock_data.columns:
-        raise ValueError("O DataFrame deve conter a coluna 'RSI'. Verifique se o RSI foi calculado.")
+    # Último evento foi um vale (RSI < 30), mas ainda não passou de 70 → Mantém compra
+    buy = _isSet(last_valley) & (last_peak.isna() | (last_valley > last_peak))
 
-    rsi_series = stock_data["RSI"]
-    last_rsi = rsi_series.iloc[-1]  # Último valor do RSI
+    # Último evento foi um pico (RSI > 70), mas ainda não caiu até 30 → Mantém venda
+    sell = _isSet(last_peak) & (last_valley.isna() | (last_peak > last_valley))
 
-    # Identifica os momentos em que RSI cruzou os níveis de sobrecompra e sobrevenda
-    peaks = stock_data[rsi_series > high].index
-    valleys = stock_data[rsi_series < low].index
+    return decisionSeries(buy, sell), rsi_series
 
-    # Encontra o último pico e o último vale
-    last_peak = peaks[-1] if len(peaks) > 0 else None
-    last_valley = valleys[-1] if len(valleys) > 0 else None
 
-    trade_decision = None  # Mantém a posição até uma nova condição
+def getRsiTradeStrategy(stock_data: pd.DataFrame, low=30, high=70, verbose=True):
 
-    if last_valley and (last_peak is None or last_valley > last_peak):
-        # Último evento foi um vale (RSI < 30), mas ainda não passou de 70 → Mantém compra
-        trade_decision = True
+    decisions, rsi_series = _rsiSignals(stock_data, low, high)
 
-    elif last_peak and (last_valley is None or last_peak > last_valley):
-        # Último evento foi um pico (RSI > 70), mas ainda não caiu até 30 → Mantém venda
-        trade_decision = False
+    # A decisão ao vivo é o último elemento da série; mantém a posição até uma nova condição
+    trade_decision = lastDecision(decisions)
 
     if verbose:
+        last_rsi = rsi_series.iloc[-1]  # Último valor do RSI
+
+        # Encontra o último pico e o último vale
+        peaks = stock_data[rsi_series > high].index
+        valleys = stock_data[rsi_series < low].index
+        last_peak = peaks[-1] if len(peaks) > 0 else None
+        last_valley = valleys[-1] if len(valleys) > 0 else None
+
         print("-------")
         print("📊 Estratégia: RSI - Vales e Topos")
         print(f" | Último RSI: {last_rsi}")
@@ -44,3 +61,15 @@ def getRsiTradeStrategy(stock_data: pd.DataFrame, low=30, high=70, verbose=True)
         print("-------")
 
     return trade_decision
+
+
+def getRsiTradeStrategySeries(stock_data: pd.DataFrame, low=30, high=70, verbose=False):
+    """
+    Versão em série de getRsiTradeStrategy: calcula o RSI uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    decisions, _ = _rsiSignals(stock_data, low, high)
+    return decisions
+
+
+getRsiTradeStrategy.signal_series = getRsiTradeStrategySeries
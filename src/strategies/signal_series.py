@@ -0,0 +1,338 @@
+import inspect
+
+import numpy as np
+import pandas as pd
+
+from indicators.ohlcv_view import COLUMN_ALIASES, ohlcvView
+
+"""
+Modo "série de sinais" das estratégias.
+
+As estratégias ao vivo devolvem apenas a decisão do último candle (True = comprar, False = vender, None = nenhuma).
+Para backtests e varreduras de parâmetros é muito mais barato calcular os indicadores uma única vez sobre o
+histórico inteiro e obter a decisão de TODOS os candles de uma vez. Cada estratégia que suporta esse modo expõe
+uma função companheira (ex: getT3MATradeStrategySeries) registrada no atributo `signal_series` da função original.
+
+A decisão na posição i da série é exatamente a decisão que a estratégia ao vivo tomaria se recebesse
+stock_data.iloc[: i + 1].
+
+Para varreduras de parâmetros, algumas estratégias também expõem uma versão em lote (atributo `signal_batch`,
+ex: getT3MATradeStrategyBatch): recebe a lista de combinações de parâmetros e devolve as decisões de todas elas
+(uma coluna por combinação), com os indicadores de todos os períodos calculados de uma vez (indicators/period_batch.py).
+"""
+
+
+def decisionSeries(buy, sell, valid=None, sell_first=False):
+    """
+    Monta a série de decisões (True / False / None) a partir das máscaras de compra e venda.
+
+    :param buy: Série (ou DataFrame) booleana com as condições de compra.
+    :param sell: Série (ou DataFrame) booleana com as condições de venda.
+    :param valid: Máscara opcional; onde for False a decisão é None (dados insuficientes).
+    :param sell_first: Se True, a venda tem prioridade quando as duas condições são verdadeiras.
+    :return: Série (ou DataFrame) de objetos com True, False ou None.
+    """
+    buy_mask = np.asarray(buy, dtype=bool)
+    sell_mask = np.asarray(sell, dtype=bool)
+
+    decisions = np.full(buy_mask.shape, None, dtype=object)
+    if sell_first:
+        decisions[buy_mask] = True
+        decisions[sell_mask] = False
+    else:
+        decisions[sell_mask] = False
+        decisions[buy_mask] = True
+
+    if valid is not None:
+        decisions[~np.asarray(valid, dtype=bool)] = None
+
+    if isinstance(buy, pd.DataFrame):
+        return pd.DataFrame(decisions, index=buy.index, columns=buy.columns)
+    return pd.Series(decisions, index=buy.index)
+
+
+def decisionChain(rules, index, valid=None):
+    """
+    Reproduz a cadeia if/elif das estratégias ao vivo: em cada candle vale a decisão da primeira condição verdadeira.
+
+    :param rules: Lista de pares (condição, decisão). A condição é uma máscara booleana; a decisão é True, False,
+                  None ou um array com a decisão de cada candle.
+    :param index: Índice da série de decisões.
+    :param valid: Máscara opcional; onde for False a decisão é None (dados insuficientes).
+    :return: Série de objetos com True, False ou None (None quando nenhuma condição é verdadeira).
+    """
+    decisions = np.full(len(index), None, dtype=object)
+    decided = np.zeros(len(index), dtype=bool)
+    for condition, decision in rules:
+        take = np.asarray(condition, dtype=bool) & ~decided
+        decisions[take] = np.asarray(decision, dtype=object)[take] if np.ndim(decision) else decision
+        decided |= take
+
+    if valid is not None:
+        decisions[~np.asarray(valid, dtype=bool)] = None
+    return pd.Series(decisions, index=index)
+
+
+def lastValid(values, valid):
+    """
+    Reproduz o efeito de `dropna()` seguido de `iloc[-1]`: em cada posição devolve o último valor
+    cuja linha é válida até aquele ponto.
+    """
+    return values.where(valid).ffill()
+
+
+def shiftValid(values, valid, periods=1):
+    """
+    Equivale a `dropna()` seguido de `iloc[-1 - periods]`: em cada posição devolve o valor que está
+    `periods` linhas válidas antes da última linha válida até aquele ponto (NaN se não existir).
+    """
+    if isinstance(values, pd.DataFrame):
+        # Cada coluna com as suas linhas válidas: by_rank[r, coluna] = valor da r-ésima linha válida da coluna
+        valid_mask = np.asarray(valid, dtype=bool)
+        counts = valid_mask.cumsum(axis=0)
+        rows, columns = np.nonzero(valid_mask)
+        by_rank = np.full((len(valid_mask) + 1, valid_mask.shape[1]), np.nan)
+        by_rank[counts[rows, columns], columns] = np.asarray(values, dtype=float)[rows, columns]
+
+        rank = counts - periods
+        result = np.where(rank >= 1, by_rank[np.maximum(rank, 0), np.arange(valid_mask.shape[1])], np.nan)
+        return pd.DataFrame(result, index=values.index, columns=values.columns)
+
+    valid_mask = np.asarray(valid, dtype=bool)
+    positions = np.flatnonzero(valid_mask)
+
+    shifted = np.full(len(valid_mask), np.nan)
+    if len(positions) > periods:
+        shifted[positions[periods:]] = np.asarray(values, dtype=float)[positions[:-periods]]
+
+    # Última linha válida até cada posição (-1 enquanto nenhuma linha for válida)
+    last_position = np.maximum.accumulate(np.where(valid_mask, np.arange(len(valid_mask)), -1))
+    result = np.where(last_position >= 0, shifted[last_position], np.nan)
+    return pd.Series(result, index=values.index)
+
+
+def validCount(valid):
+    """Quantidade acumulada de linhas válidas (equivale a len(stock_data) depois do dropna no prefixo)."""
+    return valid.cumsum()
+
+
+def previousValue(values, periods=1):
+    """
+    Equivale a `iloc[-1 - periods] if len(stock_data) > periods else iloc[-1]` em cada posição: o valor de
+    'periods' candles antes, ou o próprio valor enquanto o prefixo ainda não tem candles suficientes.
+    """
+    previous = values.shift(periods)
+    previous.iloc[:periods] = values.iloc[:periods]
+    return previous
+
+
+def prefixLength(stock_data):
+    """Tamanho do prefixo em cada posição (o len(stock_data) que a estratégia ao vivo vê no candle i)."""
+    return pd.Series(np.arange(1, len(stock_data) + 1), index=stock_data.index)
+
+
+def decisionsToArray(decisions):
+    """
+    Converte a série de decisões em um array float: 1.0 = comprar, 0.0 = vender, NaN = nenhuma decisão.
+    """
+    values = np.asarray(decisions, dtype=object)
+    signal = np.full(values.shape, np.nan)
+    signal[values == True] = 1.0  # Comparação elemento a elemento no array de objetos
+    signal[values == False] = 0.0
+    return signal
+
+
+def lastDecision(decisions):
+    """Decisão do último candle, no mesmo formato devolvido pelas estratégias ao vivo."""
+    if len(decisions) == 0:
+        return None
+    return decisions.iloc[-1]
+
+
+def getSignalSeriesFunction(strategy_function):
+    """Retorna a função companheira de série da estratégia, ou None se ela não suportar o modo série."""
+    return getattr(strategy_function, "signal_series", None)
+
+
+def prefixSignalSeries(strategy_function, stock_data: pd.DataFrame, start=1, **strategy_kwargs):
+    """
+    Gera a série de decisões chamando a estratégia em cada prefixo do DataFrame.
+
+    É o caminho lento (custo quadrático), usado apenas para estratégias que ainda não têm a versão em série.
+    """
+    decisions = pd.Series(None, index=stock_data.index, dtype=object)
+    candles = ohlcvView(stock_data, read_only=True)  # Os prefixos são fatias somente leitura, sem cópia por candle
+    for i in range(start, len(stock_data)):
+        decisions.iloc[i] = strategy_function(candles.iloc[: i + 1], **strategy_kwargs)
+    return decisions
+
+
+def getSignalSeries(strategy_function, stock_data: pd.DataFrame, **strategy_kwargs):
+    """
+    Série completa de decisões da estratégia para o DataFrame informado.
+
+    Usa a versão vetorizada quando existir e cai para a reexecução por prefixo caso contrário.
+    """
+    series_function = getSignalSeriesFunction(strategy_function)
+    if series_function is not None:
+        return series_function(ohlcvView(stock_data, read_only=True), **strategy_kwargs)
+    return prefixSignalSeries(strategy_function, stock_data, **strategy_kwargs)
+
+
+def getSignalBatchFunction(strategy_function):
+    """Retorna a função companheira em lote da estratégia, ou None se ela não suportar o modo lote."""
+    return getattr(strategy_function, "signal_batch", None)
+
+
+def batchParameters(series_function, combinations):
+    """
+    Parâmetros de cada combinação completados com os valores padrão da versão em série da estratégia.
+
+    :param series_function: Versão em série (define os parâmetros aceitos e seus padrões).
+    :param combinations: Lista de dicionários de parâmetros (pode incluir verbose, que é ignorado).
+    :return: Dicionário {parâmetro: lista com o valor de cada combinação}.
+    """
+    signature = inspect.signature(series_function).parameters
+    names = [name for name in list(signature)[1:] if name != "verbose"]
+
+    for params in combinations:
+        unknown = set(params) - set(signature)
+        if unknown:
+            raise TypeError(f"{series_function.__name__}() recebeu parâmetros desconhecidos: {sorted(unknown)}")
+        missing = [name for name in names if name not in params and signature[name].default is inspect.Parameter.empty]
+        if missing:
+            raise TypeError(f"{series_function.__name__}() sem os parâmetros obrigatórios: {missing}")
+
+    return {name: [params.get(name, signature[name].default) for params in combinations] for name in names}
+
+
+def getSignalBatch(strategy_function, stock_data: pd.DataFrame, combinations):
+    """
+    Decisões de várias combinações de parâmetros sobre os mesmos candles.
+
+    Usa a versão em lote quando existir; caso contrário calcula a série de cada combinação (getSignalSeries).
+
+    :param combinations: Lista de dicionários de parâmetros da estratégia.
+    :return: DataFrame (tempo x combinação, colunas 0..n-1) de objetos com True, False ou None.
+    """
+    batch_function = getSignalBatchFunction(strategy_function)
+    candles = ohlcvView(stock_data, read_only=True)
+    if batch_function is not None:
+        return batch_function(candles, combinations)
+
+    decisions = np.full((len(candles), len(combinations)), None, dtype=object)
+    for column, params in enumerate(combinations):
+        decisions[:, column] = getSignalSeries(strategy_function, candles, **params).to_numpy()
+    return pd.DataFrame(decisions, index=candles.index, columns=range(len(combinations)))
+
+
+def panelSymbols(panel: pd.DataFrame):
+    """Símbolos de um painel (colunas campo x símbolo), na ordem das colunas."""
+    return list(dict.fromkeys(panel.columns.get_level_values(1)))
+
+
+def symbolData(panel: pd.DataFrame, symbol):
+    """
+    Candles de um único símbolo do painel, no formato de getStockData (coluna open_time e índice 0..n-1),
+    sem as linhas em que o símbolo não tem candle.
+    """
+    stock_data = panel.xs(symbol, axis=1, level=1).dropna(how="all")
+    return stock_data.rename_axis("open_time").reset_index()
+
+
+def getPanelSignalSeries(strategy_function, panel: pd.DataFrame, **strategy_kwargs):
+    """
+    Decisões de todos os símbolos de um painel (índice = tempo, colunas = campo x símbolo).
+
+    Estratégias cuja versão em série opera coluna a coluna (atributo `supports_panel`) calculam todos os símbolos
+    em uma única passada sobre os arrays 2-D; as demais são calculadas símbolo a símbolo.
+
+    :return: DataFrame (tempo x símbolo) de objetos com True, False ou None.
+    """
+    series_function = getSignalSeriesFunction(strategy_function)
+    symbols = panelSymbols(panel)
+
+    if series_function is not None and getattr(series_function, "supports_panel", False):
+        decisions = series_function(panel, **strategy_kwargs)
+        return decisions.reindex(columns=symbols)
+
+    decisions = np.full((len(panel), len(symbols)), None, dtype=object)
+    for column, symbol in enumerate(symbols):
+        stock_data = symbolData(panel, symbol)
+        rows = panel.index.get_indexer(stock_data["open_time"])
+        decisions[rows, column] = getSignalSeries(strategy_function, stock_data, **strategy_kwargs).to_numpy()
+    return pd.DataFrame(decisions, index=panel.index, columns=symbols)
+
+
+def _timeline(stock_data: pd.DataFrame):
+    # Horários dos candles (coluna open_time de getStockData ou o índice)
+    times = stock_data["open_time"] if "open_time" in stock_data.columns else stock_data.index
+    return pd.Index(times)
+
+
+def _timelineKey(stock_data: pd.DataFrame):
+    # Chave que identifica a linha do tempo inteira (símbolos com a mesma chave podem ser empilhados)
+    times = _timeline(stock_data)
+    if isinstance(times, pd.DatetimeIndex):
+        return str(times.dtype), times.asi8.tobytes()
+    return tuple(times)
+
+
+def stackPanel(stock_data_by_symbol: dict):
+    """
+    Empilha os candles de símbolos com a mesma linha do tempo em um painel (índice = tempo, colunas = campo x símbolo),
+    sem alinhar horários: é o caso dos bots de um mesmo intervalo, que recebem os mesmos open_time da API.
+
+    :param stock_data_by_symbol: Dicionário {símbolo: DataFrame no formato de getStockData}, todos com os mesmos horários.
+    :return: DataFrame com colunas MultiIndex (campo, símbolo); apelidos de ohlcvView (close, high, ...) ficam de fora.
+    """
+    symbols = list(stock_data_by_symbol)
+    frames = list(stock_data_by_symbol.values())
+    columns = frames[0].columns
+    fields = [
+        name for name in columns
+        if name != "open_time" and not (name in COLUMN_ALIASES and COLUMN_ALIASES[name] in columns)
+    ]
+
+    # Um único bloco float (campo x símbolo), como buildPanel em tests/portfolioBacktestRunner.py
+    values = np.empty((len(frames[0]), len(fields) * len(symbols)))
+    for field_index, field in enumerate(fields):
+        start = field_index * len(symbols)
+        values[:, start : start + len(symbols)] = np.column_stack([frame[field].to_numpy(dtype=float) for frame in frames])
+
+    index = _timeline(frames[0])
+    panel = pd.DataFrame(values, index=index, columns=pd.MultiIndex.from_product([fields, symbols]))
+    panel.index.name = "open_time"
+    return panel
+
+
+def getPanelDecisions(strategy_function, stock_data_by_symbol: dict, **strategy_kwargs):
+    """
+    Decisão do último candle de cada símbolo: a mesma que a estratégia ao vivo daria sobre os candles do símbolo.
+
+    Com versão em série que opera no painel (atributo `supports_panel`), os símbolos com a mesma linha do tempo são
+    empilhados (stackPanel) e avaliados em uma única passada sobre os arrays 2-D. O custo cresce de forma sublinear,
+    não constante: em benchmarks/panel_decision_check.py, 80x mais símbolos (5 -> 401) custam ~10-30x mais tempo,
+    ~3-6x menos que chamar símbolo a símbolo. As demais estratégias (e símbolos sem candles) são chamadas uma a uma.
+
+    :param stock_data_by_symbol: Dicionário {símbolo: DataFrame no formato de getStockData}.
+    :param strategy_kwargs: Argumentos da estratégia (inclusive verbose, repassado às chamadas).
+    :return: Dicionário {símbolo: True, False ou None}.
+    """
+    series_function = getSignalSeriesFunction(strategy_function)
+    decisions = {}
+
+    if series_function is not None and getattr(series_function, "supports_panel", False):
+        groups = {}  # linha do tempo -> símbolos
+        for symbol, stock_data in stock_data_by_symbol.items():
+            if len(stock_data):
+                groups.setdefault(_timelineKey(stock_data), []).append(symbol)
+        for symbols in groups.values():
+            panel = stackPanel({symbol: stock_data_by_symbol[symbol] for symbol in symbols})
+            last = series_function(panel, **strategy_kwargs).iloc[-1]
+            decisions.update((symbol, last[symbol]) for symbol in symbols)
+
+    for symbol, stock_data in stock_data_by_symbol.items():
+        if symbol not in decisions:
+            decisions[symbol] = strategy_function(ohlcvView(stock_data, read_only=True), **strategy_kwargs)
+    return {symbol: decisions[symbol] for symbol in stock_data_by_symbol}
@@ -1,5 +1,62 @@
+import numpy as np
 import pandas as pd
+from indicators.ohlcv_view import ohlcvView
+from indicators.period_batch import t3Batch
 from indicators.t3 import t3MovingAverage
+from strategies.signal_series import batchParameters, decisionSeries, lastDecision, lastValid, validCount
+
+
+def _prepareT3Data(stock_data: pd.DataFrame):
+    """
+    Garante as colunas 'close', 'high' e 'low' exigidas por t3MovingAverage,
+    criando aliases a partir de 'close_price', 'high_price' e 'low_price' quando necessário.
+    """
+    # Verificar se a coluna 'close' ou 'close_price' está disponível
+    if 'close' not in stock_data.columns and 'close_price' not in stock_data.columns:
+        raise ValueError("⚠️ A coluna 'close' ou 'close_price' é obrigatória nos dados fornecidos.")
+
+    if stock_data.columns.nlevels == 1:
+        return ohlcvView(stock_data)  # Os aliases apontam para os mesmos arrays (sem cópia)
+
+    # Apenas as colunas lidas pelo T3; em painéis (colunas campo x símbolo) cada uma é um DataFrame com todos os símbolos
+    columns = {}
+    for alias, column in (('close', 'close_price'), ('high', 'high_price'), ('low', 'low_price')):
+        if alias in stock_data.columns:
+            columns[alias] = stock_data[alias]
+        elif column in stock_data.columns:
+            columns[alias] = stock_data[column]
+    return pd.concat(columns, axis=1)
+
+
+def _t3Signals(stock_data: pd.DataFrame, fast_period, slow_period, volume_factor):
+    """
+    Calcula as duas T3 uma única vez e devolve a decisão de cada candle junto com os valores usados nela.
+    """
+    # Normalizando os nomes das colunas para compatibilidade com o indicador T3
+    data_for_t3 = _prepareT3Data(stock_data)
+
+    # Calcular as médias móveis T3 rápida e lenta
+    t3_fast = t3MovingAverage(data_for_t3, period=fast_period, volume_factor=volume_factor)
+    t3_slow = t3MovingAverage(data_for_t3, period=slow_period, volume_factor=volume_factor)
+    return _t3Decisions(t3_fast, t3_slow, slow_period)
+
+
+def _t3Decisions(t3_fast, t3_slow, slow_period):
+    """
+    Decisão de cada candle a partir das T3 rápida e lenta: séries, ou DataFrames com uma coluna por combinação
+    (slow_period com um valor por coluna).
+    """
+    # Linhas que sobrevivem ao dropna dos NaNs resultantes
+    valid = t3_fast.notna() & t3_slow.notna()
+    enough_data = validCount(valid) >= slow_period
+
+    last_t3_fast = lastValid(t3_fast, valid)
+    last_t3_slow = lastValid(t3_slow, valid)
+
+    # Decisão baseada no cruzamento das T3 MAs
+    buy = last_t3_fast > last_t3_slow
+    decisions = decisionSeries(buy, ~buy, valid=enough_data)
+    return decisions, {"t3_fast": last_t3_fast, "t3_slow": last_t3_slow, "enough_data": enough_data}
 
 
 # Estratégia baseada no cruzamento das T3 MA
@@ -21,47 +78,20 @@ def getT3MATradeStrategy(stock_data: pd.DataFrame,
     Retorno:
     - True para Compra, False para Venda, None se insuficiente.
     """
-
-    stock_data = stock_data.copy()
-
-    # Verificar se a coluna 'close' ou 'close_price' está disponível
-    if 'close' in stock_data.columns:
-        close_col = 'close'
-    elif 'close_price' in stock_data.columns:
-        close_col = 'close_price'
-    else:
-        raise ValueError("⚠️ A coluna 'close' ou 'close_price' é obrigatória nos dados fornecidos.")
-    
-    # Normalizando os nomes das colunas para compatibilidade com o indicador T3
-    data_for_t3 = stock_data.copy()
-    if 'close_price' in stock_data.columns and 'close' not in stock_data.columns:
-        data_for_t3['close'] = stock_data['close_price']
-    if 'high_price' in stock_data.columns and 'high' not in stock_data.columns:
-        data_for_t3['high'] = stock_data['high_price']
-    if 'low_price' in stock_data.columns and 'low' not in stock_data.columns:
-        data_for_t3['low'] = stock_data['low_price']
-
-    # Calcular as médias móveis T3 rápida e lenta
-    stock_data['t3_fast'] = t3MovingAverage(data_for_t3, period=fast_period, volume_factor=volume_factor)
-    stock_data['t3_slow'] = t3MovingAverage(data_for_t3, period=slow_period, volume_factor=volume_factor)
-
-    # Remover NaNs resultantes
-    stock_data.dropna(subset=['t3_fast', 't3_slow'], inplace=True)
+    decisions, indicators = _t3Signals(stock_data, fast_period, slow_period, volume_factor)
 
     # Verificar se há dados suficientes após remover NaNs
-    if len(stock_data) < slow_period:
+    if len(stock_data) == 0 or not indicators["enough_data"].iloc[-1]:
         if verbose:
             print("⚠️ Dados insuficientes após remoção de NaN. Pulando período...")
         return None
 
-    # Últimas T3 MA calculadas
-    last_t3_fast = stock_data['t3_fast'].iloc[-1]
-    last_t3_slow = stock_data['t3_slow'].iloc[-1]
-
-    # Decisão baseada no cruzamento das T3 MAs
-    trade_decision = last_t3_fast > last_t3_slow  # True=Compra, False=Venda
+    # A decisão ao vivo é o último elemento da série (True=Compra, False=Venda)
+    trade_decision = lastDecision(decisions)
 
     if verbose:
+        last_t3_fast = indicators["t3_fast"].iloc[-1]
+        last_t3_slow = indicators["t3_slow"].iloc[-1]
         print("-------")
         print("📊 Estratégia: T3 Moving Average (Tillson)")
         print(f" | Última T3 MA Rápida ({fast_period}): {last_t3_fast:.5f}")
@@ -70,3 +100,53 @@ def getT3MATradeStrategy(stock_data: pd.DataFrame,
         print("-------")
 
     return trade_decision
+
+
+def getT3MATradeStrategySeries(stock_data: pd.DataFrame,
+                               fast_period=7,
+                               slow_period=40,
+                               volume_factor=0.7,
+                               verbose=False):
+    """
+    Versão em série de getT3MATradeStrategy: calcula as duas T3 uma única vez sobre todo o histórico
+    e devolve a decisão (True / False / None) de cada candle.
+    """
+    decisions, _ = _t3Signals(stock_data, fast_period, slow_period, volume_factor)
+    return decisions
+
+
+def getT3MATradeStrategyBatch(stock_data: pd.DataFrame, combinations):
+    """
+    Versão em lote de getT3MATradeStrategy para varreduras: decisões de várias combinações de parâmetros
+    (uma coluna por combinação), com as T3 de todos os períodos de cada fator de volume calculadas de uma vez.
+    """
+    params = batchParameters(getT3MATradeStrategySeries, combinations)
+    data_for_t3 = _prepareT3Data(stock_data)
+    for col in ('high', 'low', 'close'):
+        if col not in data_for_t3.columns:
+            raise ValueError(f"Coluna '{col}' não encontrada nos dados")
+    close = data_for_t3['close']
+
+    decisions = np.full((len(close), len(combinations)), None, dtype=object)
+    volume_factors = np.asarray(params['volume_factor'])
+    for volume_factor in dict.fromkeys(params['volume_factor']):
+        columns = np.flatnonzero(volume_factors == volume_factor)
+        fast = [params['fast_period'][column] for column in columns]
+        slow = [params['slow_period'][column] for column in columns]
+
+        # Uma T3 por período distinto; cada combinação compara as colunas dos seus dois períodos
+        periods = list(dict.fromkeys(fast + slow))
+        t3 = t3Batch(close, periods, volume_factor)
+        position = {period: i for i, period in enumerate(periods)}
+        t3_fast = pd.DataFrame(t3[:, [position[period] for period in fast]], index=close.index)
+        t3_slow = pd.DataFrame(t3[:, [position[period] for period in slow]], index=close.index)
+
+        group, _ = _t3Decisions(t3_fast, t3_slow, np.asarray(slow))
+        decisions[:, columns] = group.to_numpy()
+
+    return pd.DataFrame(decisions, index=close.index, columns=range(len(combinations)))
+
+
+getT3MATradeStrategySeries.supports_panel = True
+getT3MATradeStrategy.signal_series = getT3MATradeStrategySeries
+getT3MATradeStrategy.signal_batch = getT3MATradeStrategyBatch
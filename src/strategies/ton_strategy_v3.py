@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
-from indicators.vortex import vortex  # Importa a função vortex do arquivo vortex.py
+from indicators.indicator_graph import column, ema, evaluateNodes, macdNodes, node, sma
+from indicators.vortex import vortexLines  # Importa a função vortexLines (VI+ e VI-) do arquivo vortex.py
+from strategies.signal_series import decisionSeries, lastDecision
 # Variável global para o modo custom (para imprimir sinais intercalados)
 last_custom_signal = None
 
@@ -10,17 +12,105 @@ def compute_RSI(series: pd.Series, period: int) -> pd.Series:
     Calcula o RSI utilizando o método de Wilder (média exponencial) para suavização,
     com um período padrão de 14.
     """
-    delta = series.diff()
-    up = delta.clip(lower=0)
-    down = -delta.clip(upper=0)
-    
-    # Cálculo da média exponencial com alpha = 1/period, conforme o método de Wilder
-    avg_gain = up.ewm(alpha=1/period, min_periods=period, adjust=False).mean()
-    avg_loss = down.ewm(alpha=1/period, min_periods=period, adjust=False).mean()
-    
-    rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
-    return rsi
+    return evaluateNodes({"close_price": series}, {"rsi": _wilderRsiNode(column("close_price"), period)})["rsi"]
+
+
+def _wilderRsiNode(close, period: int):
+    # Média exponencial com alpha = 1/period e min_periods=period, conforme o método de Wilder
+    delta = node("diff", close)
+    avg_gain = node("ewm_mean", node("clip", delta, lower=0), alpha=1 / period, min_periods=period)
+    avg_loss = node("ewm_mean", node("neg", node("clip", delta, upper=0)), alpha=1 / period, min_periods=period)
+    return node("rsi", avg_gain, avg_loss)
+
+
+def _advancedNodes(
+    m7_period: int,
+    m200_period: int,
+    m50_period: int,
+    rsi_period: int,
+    slowK_window: int,
+    slow_stochastic_smoothing_window: int,
+) -> dict:
+    """
+    Indicadores da estratégia v3 declarados no grafo de indicadores (coluna -> nó). As EMAs de 12/26 e o MACD são
+    os mesmos nós de indicators/macd.py e o diff do fechamento é o mesmo do RSI.
+    """
+    close = column("close_price")
+
+    # MACD (chamado de MCAD no código): EMAs de 12 e 26 períodos, linha de sinal de 9 e histograma
+    macd_line, signal_line, histogram = macdNodes(close, 12, 26, 9)
+
+    # Slow Stochastic: máxima/mínima de 'slowK_window' candles e média de %K com min_periods igual à janela
+    channel = node("channel", column("high_price"), column("low_price"), window=slowK_window)
+    highest_high = node("item", channel, index=0)
+    lowest_low = node("item", channel, index=1)
+    fast_k = node("div", node("scale", node("sub", close, lowest_low), factor=100), node("sub", highest_high, lowest_low))
+
+    # Médias móveis utilizando min_periods=1
+    return {
+        "M7": sma(close, m7_period, min_periods=1),
+        "M200": sma(close, m200_period, min_periods=1),
+        "M50": sma(close, m50_period, min_periods=1),
+        "EMA12": ema(close, 12),
+        "EMA26": ema(close, 26),
+        "MCAD": macd_line,
+        "MACD_signal": signal_line,
+        "MACD_histogram": histogram,
+        "RSI14": _wilderRsiNode(close, rsi_period),
+        "lowest_low": lowest_low,
+        "highest_high": highest_high,
+        "fast_K": fast_k,
+        "SlowS": sma(fast_k, slow_stochastic_smoothing_window, min_periods=slow_stochastic_smoothing_window),
+    }
+
+
+def _advancedIndicators(
+    stock_data: pd.DataFrame,
+    m7_period: int,
+    m200_period: int,
+    m50_period: int,
+    rsi_period: int,
+    slowK_window: int,
+    slow_stochastic_smoothing_window: int,
+) -> pd.DataFrame:
+    """
+    Calcula, uma única vez para todo o histórico, os indicadores usados na decisão da estratégia v3.
+    """
+    # Cópia rasa: as colunas novas ficam só no DataFrame devolvido, sem copiar nem alterar os candles recebidos
+    df = stock_data.copy(deep=False)
+    if "open_time" in df.columns and not df["open_time"].is_monotonic_increasing:
+        df = df.sort_values("open_time")
+
+    nodes = _advancedNodes(m7_period, m200_period, m50_period, rsi_period, slowK_window, slow_stochastic_smoothing_window)
+    for name, values in evaluateNodes(df, nodes).items():
+        df[name] = values
+
+    return df
+
+
+def _advancedDecisions(df: pd.DataFrame) -> pd.Series:
+    """
+    Aplica as condições de compra e venda da estratégia v3 a todos os candles de uma vez
+    (cada linha é comparada com a anterior, como latest/prev na versão ao vivo).
+    """
+    prev = df.shift(1)
+
+    # Condições comuns de COMPRA
+    stochastic_and_macd_rising = (
+        (df["SlowS"] > prev["SlowS"]) &
+        (df["SlowS"] < 75) &
+        (df["MCAD"] > 0) &
+        (df["MCAD"] > prev["MCAD"])
+    )
+    buy_conditions1 = (df["M200"] > prev["M50"]) & stochastic_and_macd_rising
+    buy_conditions2 = (df["M200"] < prev["M50"]) & stochastic_and_macd_rising
+
+    # Condições para VENDA
+    sell_condition1 = df["MACD_histogram"] < prev["MACD_histogram"]
+
+    # A venda tem prioridade sobre a compra
+    return decisionSeries(buy_conditions1 | buy_conditions2, sell_condition1, sell_first=True)
+
 
 def getAdvancedTradeStrategy_v3(
     stock_data: pd.DataFrame,
@@ -61,37 +151,16 @@ def getAdvancedTradeStrategy_v3(
 
     Retorna True para sinal de compra e False para sinal de venda.
     """
-    df = stock_data.copy()
-    df.sort_values("open_time", inplace=True)
-
-    # Cálculo das Médias Móveis utilizando min_periods=1
-    df["M7"]   = df["close_price"].rolling(window=m7_period, min_periods=1).mean()
-    df["M200"] = df["close_price"].rolling(window=m200_period, min_periods=1).mean()
-    df["M50"] = df["close_price"].rolling(window=m50_period, min_periods=1).mean()
-
-    # Cálculo do MACD (chamado de MCAD no código) utilizando as EMAs de 12 e 26 períodos
-    df["EMA12"] = df["close_price"].ewm(span=12, adjust=False).mean()
-    df["EMA26"] = df["close_price"].ewm(span=26, adjust=False).mean()
-    df["MCAD"] = df["EMA12"] - df["EMA26"]
-
-    # Linha de sinal do MACD: EMA de 9 períodos da linha MACD
-    df["MACD_signal"] = df["MCAD"].ewm(span=9, adjust=False).mean()
-
-    # Cálculo do histograma (barras do MACD): diferença entre a linha MACD e a linha de sinal
-    df["MACD_histogram"] = df["MCAD"] - df["MACD_signal"]
-
-    # Cálculo do RSI
-    df["RSI14"] = compute_RSI(df["close_price"], rsi_period)
-    
-    # Cálculo do Slow Stochastic utilizando min_periods=1
-    df["lowest_low"]   = df["low_price"].rolling(window=slowK_window, min_periods=slowK_window).min()
-    df["highest_high"] = df["high_price"].rolling(window=slowK_window, min_periods=slowK_window).max()
-    df["fast_K"] = 100 * (df["close_price"] - df["lowest_low"]) / (df["highest_high"] - df["lowest_low"])
-    df["SlowS"] = df["fast_K"].rolling(window=slow_stochastic_smoothing_window, min_periods=slow_stochastic_smoothing_window).mean()
+    df = _advancedIndicators(
+        stock_data, m7_period, m200_period, m50_period, rsi_period, slowK_window, slow_stochastic_smoothing_window
+    )
 
     # Cálculo do Indicador Vortex utilizando a função importada e preenchendo os NaN com backfill.
-    df["VIP"] = vortex(df, window=vortex_window, positive=True).bfill()
-    df["VIM"] = vortex(df, window=vortex_window, positive=False).bfill()
+    # (usado apenas na impressão dos detalhes)
+    if verbose:
+        vi_plus, vi_minus = vortexLines(df, window=vortex_window)  # VI+ e VI- na mesma passada
+        df["VIP"] = vi_plus.bfill()
+        df["VIM"] = vi_minus.bfill()
     
     # Verifica se há dados suficientes para comparação (pelo menos 2 linhas)
     if len(df) < 2:
@@ -99,7 +168,10 @@ def getAdvancedTradeStrategy_v3(
             print("⚠️ Dados insuficientes para execução da estratégia.")
         return None
 
-    # Seleciona os últimos dois registros para comparação
+    # A decisão ao vivo é o último elemento da série
+    trade_decision = lastDecision(_advancedDecisions(df))
+
+    # Seleciona os últimos dois registros para impressão
     latest = df.iloc[-1]
     prev = df.iloc[-2]
     
@@ -107,37 +179,6 @@ def getAdvancedTradeStrategy_v3(
     has_third_record = len(df) >= 3
     prev_prev = df.iloc[-3] if has_third_record else None
 
-    # Condições para COMPRA
-    buy_conditions1 = (
-        (latest["M200"] > prev["M50"]) and
-        (latest["SlowS"] > prev["SlowS"]) and
-        (latest["SlowS"] < 75) and
-        (latest["MCAD"] > 0) and
-        (latest["MCAD"] > prev["MCAD"]) 
-    )
-
-    buy_conditions2 = (
-        (latest["M200"] < prev["M50"]) and
-        (latest["SlowS"] > prev["SlowS"]) and
-        (latest["SlowS"] < 75) and
-        (latest["MCAD"] > 0) and
-        (latest["MCAD"] > prev["MCAD"]) 
- 
-    )
-
-    # Condições para VENDA   
-    sell_condition1 = (
-        (latest["MACD_histogram"] < prev["MACD_histogram"])
-        #(latest["close_price"] < latest["open_price"])
-    )
- 
-    if sell_condition1:
-        trade_decision = False  # Sinal de VENDA
-    elif buy_conditions1 or buy_conditions2:  
-        trade_decision = True   # Sinal de COMPRA
-    else:
-        trade_decision = None
-
     # Impressão dos dados (verbose)
     # Função auxiliar para impressão dos detalhes do candle
     def print_details():
@@ -197,3 +238,29 @@ def getAdvancedTradeStrategy_v3(
 
     # Retorne o sinal se necessário para o fluxo da estratégia
     return trade_decision
+
+
+
+def getAdvancedTradeStrategy_v3Series(
+    stock_data: pd.DataFrame,
+    m7_period: int = 7,
+    m200_period: int = 200,
+    m50_period: int = 50,
+    rsi_period: int = 14,
+    slowK_window: int = 14,
+    slow_stochastic_smoothing_window: int = 3,
+    vortex_window: int = 14,
+    verbose: bool = False,
+    print_mode: str = "custom"
+):
+    """
+    Versão em série de getAdvancedTradeStrategy_v3: calcula os indicadores uma única vez
+    e devolve a decisão (True / False / None) de cada candle.
+    """
+    df = _advancedIndicators(
+        stock_data, m7_period, m200_period, m50_period, rsi_period, slowK_window, slow_stochastic_smoothing_window
+    )
+    return _advancedDecisions(df)
+
+
+getAdvancedTradeStrategy_v3.signal_series = getAdvancedTradeStrategy_v3Series
@@ -1,20 +1,23 @@
 import numpy as np
 import pandas as pd
 from indicators import Indicators
+from indicators.indicator_graph import column, evaluateNodes, node, sma, trueRangeParts
+from indicators.kernels import utBotKernel
+from strategies.signal_series import decisionSeries
 
 
 def calculate_atr(high, low, close, period=10):
     """
     Calcula o Average True Range (ATR) com base nos valores de alta, baixa e fechamento.
     """
-    tr1 = high - low
-    tr2 = np.abs(high - close.shift(1))
-    tr3 = np.abs(low - close.shift(1))
+    # Termos do True Range como nós do grafo de indicadores (os mesmos do Vortex)
+    tr1, tr2, tr3 = trueRangeParts(column("high_price"), column("low_price"), column("close_price"))
 
-    tr = np.maximum(tr1, np.maximum(tr2, tr3))  # Obtém o maior True Range
-    atr = tr.rolling(window=period).mean()  # Calcula a média do TR para obter o ATR
+    tr = node("maximum", tr1, node("maximum", tr2, tr3))  # Obtém o maior True Range
+    atr = sma(tr, period)  # Calcula a média do TR para obter o ATR
 
-    return atr
+    candles = {"high_price": high, "low_price": low, "close_price": close}
+    return evaluateNodes(candles, {"atr": atr})["atr"]
 
 
 def utBotAlerts(stock_data: pd.DataFrame, atr_period=10, atr_multiplier=2, verbose=True):
@@ -37,31 +40,8 @@ def utBotAlerts(stock_data: pd.DataFrame, atr_period=10, atr_multiplier=2, verbo
 
     # atr = Indicators.getAtr(stock_data, window=atr_period)
 
-    # Inicializa o Trailing Stop
-    trailing_stop = pd.Series(np.zeros(len(close)), index=close.index)
-
-    # Itera para calcular o trailing stop dinamicamente
-    for i in range(1, len(close)):
-        if close[i] > trailing_stop[i - 1] and close[i - 1] > trailing_stop[i - 1]:
-            trailing_stop[i] = max(trailing_stop[i - 1], close[i] - atr_multiplier * atr[i])
-        elif close[i] < trailing_stop[i - 1] and close[i - 1] < trailing_stop[i - 1]:
-            trailing_stop[i] = min(trailing_stop[i - 1], close[i] + atr_multiplier * atr[i])
-        else:
-            trailing_stop[i] = (
-                close[i] - atr_multiplier * atr[i] if close[i] > trailing_stop[i - 1] else close[i] + atr_multiplier * atr[i]
-            )
-
-    # Inicializa a variável de posição
-    pos = np.zeros(len(close))
-
-    # Define as regras de compra e venda com base no cruzamento do preço com o trailing stop
-    for i in range(1, len(close)):
-        if close[i - 1] < trailing_stop[i - 1] and close[i] > trailing_stop[i]:
-            pos[i] = 1  # Compra
-        elif close[i - 1] > trailing_stop[i - 1] and close[i] < trailing_stop[i]:
-            pos[i] = -1  # Venda
-        else:
-            pos[i] = pos[i - 1]  # Mantém a posição anterior
+    # Trailing stop e posição de todos os candles
+    _, pos = utBotKernel(close.to_numpy(), atr.to_numpy(), atr_multiplier)
 
     trade_decision = pos[-1] == 1  # Define a decisão com base no último valor de pos
 
@@ -72,3 +52,18 @@ def utBotAlerts(stock_data: pd.DataFrame, atr_period=10, atr_multiplier=2, verbo
         print("-------")
 
     return trade_decision  # Retorna True se for para estar comprado, False se for para estar vendido
+
+
+def utBotAlertsSeries(stock_data: pd.DataFrame, atr_period=10, atr_multiplier=2, verbose=False):
+    """
+    Versão em série de utBotAlerts: calcula ATR e trailing stop uma única vez e devolve a decisão
+    (True / False) de cada candle.
+    """
+    atr = calculate_atr(stock_data["high_price"], stock_data["low_price"], stock_data["close_price"], atr_period)
+    _, pos = utBotKernel(stock_data["close_price"].to_numpy(), atr.to_numpy(), atr_multiplier)
+
+    buy = pd.Series(pos == 1, index=stock_data.index)
+    return decisionSeries(buy, ~buy)
+
+
+utBotAlerts.signal_series = utBotAlertsSeries
@@ -1,44 +1,35 @@
 import pandas as pd
 from indicators import Indicators
+from strategies.signal_series import decisionSeries, lastDecision
 
 
-def getVortexTradeStrategy(stock_data: pd.DataFrame, verbose=True):
+def _vortexSignals(stock_data: pd.DataFrame):
     """
-    Estratégia baseada no Indicador Vortex.
-    Retorna True se a posição deve estar comprada e False se deve estar vendida.
+    Calcula o Indicador Vortex (VI+ e VI-) uma única vez e devolve a decisão de cada candle junto com ele.
     """
+    vi_plus = Indicators.getVortex(stock_data, window=14, positive=True)
+    vi_minus = Indicators.getVortex(stock_data, window=14, positive=False)
 
-    stock_data = stock_data.copy()
-
-    # # Calcula o Indicador Vortex (VI+ e VI-)
-    stock_data["VI+"] = Indicators.getVortex(stock_data, window=14, positive=True)
-    stock_data["VI-"] = Indicators.getVortex(stock_data, window=14, positive=False)
-
-    if "VI+" not in stock_data.columns or "VI-" not in stock_data.columns:
-        raise ValueError("O DataFrame deve conter as colunas 'VI+' e 'VI-'. Verifique se o Vortex foi calculado.")
+    # Cruzamentos: VI+ acima de VI- (compra) ou VI- acima de VI+ (venda)
+    decisions = decisionSeries(vi_plus > vi_minus, vi_plus < vi_minus)
+    return decisions, vi_plus, vi_minus
 
-    vi_plus = stock_data["VI+"]
-    vi_minus = stock_data["VI-"]
 
-    # Últimos valores de VI+ e VI-
-    last_vi_plus = vi_plus.iloc[-1]
-    last_vi_minus = vi_minus.iloc[-1]
-
-    # Últimos cruzamentos
-    last_crossover_buy = vi_plus > vi_minus  # VI+ cruzou acima de VI- (sinal de compra)
-    last_crossover_sell = vi_plus < vi_minus  # VI- cruzou acima de VI+ (sinal de venda)
-
-    # Posição inicial
-    trade_decision = None
+def getVortexTradeStrategy(stock_data: pd.DataFrame, verbose=True):
+    """
+    Estratégia baseada no Indicador Vortex.
+    Retorna True se a posição deve estar comprada e False se deve estar vendida.
+    """
 
-    # Decisão de trade baseada no cruzamento
-    if last_crossover_buy.iloc[-1]:
-        trade_decision = True  # Compra
+    decisions, vi_plus, vi_minus = _vortexSignals(stock_data)
 
-    elif last_crossover_sell.iloc[-1]:
-        trade_decision = False  # Venda
+    # Decisão de trade baseada no último cruzamento
+    trade_decision = lastDecision(decisions)
 
     if verbose:
+        # Últimos valores de VI+ e VI-
+        last_vi_plus = vi_plus.iloc[-1]
+        last_vi_minus = vi_minus.iloc[-1]
         print("-------")
         print("📊 Estratégia: Vortex")
         print(f" | VI+: {last_vi_plus:.2f}")
@@ -47,3 +38,16 @@ def getVortexTradeStrategy(stock_data: pd.DataFrame, verbose=True):
         print("-------")
 
     return trade_decision
+
+
+def getVortexTradeStrategySeries(stock_data: pd.DataFrame, verbose=False):
+    """
+    Versão em série de getVortexTradeStrategy: calcula o Vortex uma única vez e devolve a decisão
+    (True / False / None) de cada candle.
+    """
+    decisions, _, _ = _vortexSignals(stock_data)
+    return decisions
+
+
+getVortexTradeStrategy.signal_series = getVortexTradeStrategySeries
+getVortexTradeStrategySeries.supports_panel = True
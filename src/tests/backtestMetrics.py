@@ -0,0 +1,147 @@
+import numpy as np
+import pandas as pd
+
+from Models.BacktestResultModel import BacktestResultModel
+
+"""
+Métricas de risco dos backtests calculadas somente com operações de array sobre a curva de capital (custo O(n)),
+baratas o suficiente para rodar em cada combinação de uma varredura de parâmetros.
+"""
+
+SECONDS_PER_YEAR = 365 * 24 * 60 * 60  # Cripto negocia 24/7
+
+
+def periodsPerYear(open_time):
+    """
+    Quantidade de candles por ano, estimada pelo intervalo mediano entre os open_time.
+
+    :param open_time: Série/array de datas dos candles.
+    :return: Candles por ano (1.0 se não for possível estimar, ou seja, métricas sem anualizar).
+    """
+    open_time = pd.DatetimeIndex(open_time)
+    if len(open_time) < 2:
+        return 1.0
+    seconds = float(np.median(np.diff(open_time.asi8))) / 1e9
+    return SECONDS_PER_YEAR / seconds if seconds > 0 else 1.0
+
+
+def backtestMetrics(equity, position, trade_returns, periods_per_year=1.0):
+    """
+    Calcula as métricas de risco a partir da curva de capital.
+
+    :param equity: Array com o capital de cada candle.
+    :param position: Array com a exposição de cada candle (1.0 = comprado, 0.0 = fora).
+    :param trade_returns: Array com o retorno (fração) de cada operação fechada.
+    :param periods_per_year: Candles por ano, usado para anualizar Sharpe e Sortino.
+    :return: Dicionário com max_drawdown_percentage, sharpe_ratio, sortino_ratio, exposure_percentage,
+             win_rate_percentage, average_trade_percentage e turnover.
+    """
+    equity = np.asarray(equity, dtype=float)
+    position = np.asarray(position, dtype=float)
+    trade_returns = np.asarray(trade_returns, dtype=float)
+
+    if len(equity) == 0:
+        return {
+            "max_drawdown_percentage": 0.0,
+            "sharpe_ratio": 0.0,
+            "sortino_ratio": 0.0,
+            "exposure_percentage": 0.0,
+            "win_rate_percentage": 0.0,
+            "average_trade_percentage": 0.0,
+            "turnover": 0.0,
+        }
+
+    # Drawdown: queda em relação ao maior capital já atingido
+    peak = np.maximum.accumulate(equity)
+    max_drawdown = float(np.max((peak - equity) / peak)) * 100
+
+    # Sharpe / Sortino sobre os retornos candle a candle (taxa livre de risco = 0)
+    bar_returns = equity[1:] / equity[:-1] - 1.0
+    mean_return = float(bar_returns.mean()) if len(bar_returns) else 0.0
+    volatility = float(bar_returns.std()) if len(bar_returns) else 0.0
+    downside = float(np.sqrt(np.mean(np.minimum(bar_returns, 0.0) ** 2))) if len(bar_returns) else 0.0
+    annualization = np.sqrt(periods_per_year)
+    sharpe = mean_return / volatility * annualization if volatility > 0 else 0.0
+    sortino = mean_return / downside * annualization if downside > 0 else 0.0
+
+    # Giro: valor negociado (cada entrada/saída movimenta o capital do candle) sobre o capital médio
+    position_changes = np.abs(np.diff(position, prepend=0.0))
+    turnover = float(np.dot(position_changes, equity) / equity.mean())
+
+    return {
+        "max_drawdown_percentage": max_drawdown,
+        "sharpe_ratio": sharpe,
+        "sortino_ratio": sortino,
+        "exposure_percentage": float(np.mean(position > 0)) * 100,
+        "win_rate_percentage": float(np.mean(trade_returns > 0)) * 100 if len(trade_returns) else 0.0,
+        "average_trade_percentage": float(trade_returns.mean()) * 100 if len(trade_returns) else 0.0,
+        "turnover": turnover,
+    }
+
+
+def buildBacktestResult(
+    strategy_name, close, position, entries, exits, initial_balance=1000, balance=None, trades=None, periods_per_year=1.0
+):
+    """
+    Monta o BacktestResultModel de uma simulação comprado/fora.
+
+    A curva de capital usa a mesma conta do simulateSignalBacktest: só varia quando o candle anterior estava comprado.
+
+    :param strategy_name: Nome da estratégia.
+    :param close: Array com os preços de fechamento.
+    :param position: Array com a posição de cada candle (1.0 = comprado, 0.0 = fora).
+    :param entries: Índices dos candles de compra.
+    :param exits: Índices dos candles de venda (a posição aberta no final é fechada no último preço).
+    :param initial_balance: Saldo inicial.
+    :param balance: Saldo final já calculado pelo motor (None = último valor da curva de capital).
+    :param trades: Operações contadas pelo motor (None = compras + vendas).
+    :param periods_per_year: Candles por ano (ver periodsPerYear).
+    :return: BacktestResultModel.
+    """
+    close = np.asarray(close, dtype=float)
+    position = np.asarray(position, dtype=float)
+    entries = np.asarray(entries, dtype=np.int64)
+    exits = np.asarray(exits, dtype=np.int64)
+    n = len(close)
+
+    bar_returns = np.zeros(n)
+    if n > 1:
+        bar_returns[1:] = np.where(position[:-1] > 0, close[1:] / close[:-1] - 1.0, 0.0)
+    equity = initial_balance * np.cumprod(1.0 + bar_returns)
+
+    exit_bars = exits if len(exits) >= len(entries) else np.append(exits, n - 1)
+    trade_returns = close[exit_bars] / close[entries] - 1.0 if len(entries) else np.empty(0)
+    trade_list = pd.DataFrame(
+        {
+            "entry": entries,
+            "exit": exit_bars,
+            "entry_price": close[entries],
+            "exit_price": close[exit_bars],
+            "return_percentage": trade_returns * 100,
+            "open": np.arange(len(entries)) >= len(exits),
+        }
+    )
+
+    if balance is None:
+        balance = float(equity[-1]) if n else float(initial_balance)
+    if trades is None:
+        trades = len(entries) + len(exits)
+
+    metrics = backtestMetrics(equity, position, trade_returns, periods_per_year)
+    return BacktestResultModel(
+        strategyName=strategy_name,
+        initialBalance=initial_balance,
+        balance=float(balance),
+        profitPercentage=float((balance - initial_balance) / initial_balance * 100),
+        trades=int(trades),
+        equity=equity,
+        position=position,
+        tradeList=trade_list,
+        maxDrawdownPercentage=metrics["max_drawdown_percentage"],
+        sharpeRatio=metrics["sharpe_ratio"],
+        sortinoRatio=metrics["sortino_ratio"],
+        exposurePercentage=metrics["exposure_percentage"],
+        winRatePercentage=metrics["win_rate_percentage"],
+        averageTradePercentage=metrics["average_trade_percentage"],
+        turnover=metrics["turnover"],
+    )
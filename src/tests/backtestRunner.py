@@ -1,9 +1,18 @@
 import numpy as np
 import pandas as pd
 
+from indicators.ohlcv_view import ohlcvView
+from tests.backtestMetrics import buildBacktestResult, periodsPerYear
+
 
 def backtestRunner(
-    stock_data: pd.DataFrame, strategy_function, strategy_instance=None, periods=900, initial_balance=1000, **strategy_kwargs
+    stock_data: pd.DataFrame,
+    strategy_function,
+    strategy_instance=None,
+    periods=900,
+    initial_balance=1000,
+    print_results=False,
+    **strategy_kwargs,
 ):
     """
     Executa um backtest de qualquer estratégia que segue a lógica de:
@@ -17,8 +26,9 @@ def backtestRunner(
     :param strategy_instance: Instância da classe (ex: devTrader) para estratégias que exigem 'self'.
     :param periods: Número de períodos a serem analisados no backtest.
     :param initial_balance: Saldo inicial da conta de trading.
+    :param print_results: Exibe o resumo do backtest no console.
     :param strategy_kwargs: Parâmetros adicionais para a estratégia.
-    :return: Exibe estatísticas do backtest.
+    :return: BacktestResultModel com saldo, curva de capital, operações e métricas de risco.
     """
     # 🔹 Ajuste para garantir que há dados suficientes para calcular médias móveis corretamente
     min_required_periods = strategy_kwargs.get("slow_window", 40) + 20  # Adicionamos um buffer extra
@@ -27,15 +37,22 @@ def backtestRunner(
     # 🔹 REMOVE LINHAS INICIAIS COM NaN PARA EVITAR PROBLEMAS
     stock_data.dropna(inplace=True)
 
+    # Candles somente leitura: cada prefixo é uma fatia dos mesmos arrays (nenhuma estratégia copia ou altera o histórico)
+    stock_data = ohlcvView(stock_data, read_only=True)
+    close = stock_data["close_price"].to_numpy()
+
     # Inicializa variáveis do backtest
     balance = initial_balance  # Saldo inicial
     position = 0  # 1 = comprado, -1 = vendido, 0 = sem posição
     entry_price = 0  # Preço de entrada na operação
     last_signal = None  # Guarda o último tipo de sinal para evitar compras/vendas consecutivas
     trades = 0  # Contador de operações
+    positions = np.zeros(len(stock_data))  # Posição ao final de cada candle
+    entries, exits = [], []  # Índices dos candles de compra e venda
 
-    print(f"📊 Iniciando backtest da estratégia: {strategy_function.__name__}")
-    print(f"🔹 Balanço inicial: ${balance:.2f}")
+    if print_results:
+        print(f"📊 Iniciando backtest da estratégia: {strategy_function.__name__}")
+        print(f"🔹 Balanço inicial: ${balance:.2f}")
 
     # Loop sobre cada período no dataset
     for i in range(1, len(stock_data)):
@@ -49,9 +66,10 @@ def backtestRunner(
 
         # Se o sinal for `None`, pulamos para evitar erros
         if signal is None:
+            positions[i] = position
             continue
 
-        close_price = stock_data.iloc[i]["close_price"]
+        close_price = close[i]
 
         # Compra apenas no primeiro sinal de compra e se não estiver comprado
         if signal and position == 0 and last_signal != "buy":
@@ -59,6 +77,7 @@ def backtestRunner(
             entry_price = close_price
             last_signal = "buy"
             trades += 1
+            entries.append(i)
 
         # Venda apenas no primeiro sinal de venda e se estiver comprado
         elif not signal and position == 1 and last_signal != "sell":
@@ -67,19 +86,30 @@ def backtestRunner(
             balance += profit
             last_signal = "sell"
             trades += 1
+            exits.append(i)
+
+        positions[i] = position
 
     # Fechar posição final
     if position == 1:
-        final_price = stock_data.iloc[-1]["close_price"]
+        final_price = close[-1]
         profit = ((final_price - entry_price) / entry_price) * balance
         balance += profit
 
-    # 🔹 Agora calculamos `profit_percentage` antes do `print()`
-    profit_percentage = ((balance - initial_balance) / initial_balance) * 100
+    result = buildBacktestResult(
+        strategy_function.__name__,
+        stock_data["close_price"].to_numpy(),
+        positions,
+        entries,
+        exits,
+        initial_balance=initial_balance,
+        balance=balance,
+        trades=trades,
+        periods_per_year=periodsPerYear(stock_data["open_time"]) if "open_time" in stock_data else 1.0,
+    )
 
     # Resultados
-    print(f"🔹 Balanço final: ${balance:.2f}")
-    print(f"📈 Lucro/prejuízo percentual: {profit_percentage:.2f}%")
-    print(f"📊 Total de operações realizadas: {trades}")
+    if print_results:
+        result.printResults()
 
-    return profit_percentage
+    return result
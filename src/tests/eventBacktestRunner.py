@@ -0,0 +1,314 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from modules.SimulatedExchange import SimulatedExchange
+from modules.TrailingStop import TRAILING_ACTIVATION_PERCENTAGE, TRAILING_GAP
+from strategies.signal_series import getSignalSeries, decisionsToArray
+
+"""
+Simulador orientado a eventos do BinanceTraderBot.
+
+Reproduz, candle a candle, o ciclo de BinanceTraderBot.execute contra uma corretora em memória
+(SimulatedExchange), sem chamadas à API e sem time.sleep:
+
+1. updateTrailingStopLoss - ativa o trailing com 3% de alta sobre o preço de compra, 1% abaixo do pico
+                            (modules/TrailingStop.py, os mesmos parâmetros do bot);
+2. stopLossTrigger        - vende tudo a mercado se o fechamento cair abaixo do stop (inicial ou trailing);
+3. takeProfitTrigger      - escada de metas take_profit_at_percentage / take_profit_amount_percentage;
+4. estratégia             - principal + fallback (StrategyRunner), compra se fora e vende se comprado.
+
+Após qualquer ordem o bot "dorme" delay_after_order segundos: nenhum ciclo (nem stop loss) é avaliado nesse
+intervalo. Cada ciclo é avaliado no fechamento do candle; as decisões das estratégias vêm do modo série, então
+o custo é de um único cálculo de indicadores mais um loop simples sobre arrays.
+
+Diferenças em relação ao bot ao vivo:
+- O bot verifica o mercado a cada time_to_trade segundos, inclusive com o candle ainda em formação; aqui há
+  exatamente um ciclo por candle fechado.
+- buyMarketOrder() sem quantidade usa o saldo do ativo (≈ 0 quando está fora); aqui a compra usa
+  traded_quantity ou, se for 0, traded_percentage % do saldo da moeda de cotação.
+"""
+
+
+def _adjustToStep(value, step):
+    """Arredonda a quantidade para baixo no step do ativo (sem arredondar se step for 0)."""
+    if step <= 0:
+        return value
+    return math.floor(value / step) * step
+
+
+def _candleSeconds(open_time):
+    """Duração de um candle em segundos, pela mediana dos intervalos de open_time."""
+    if len(open_time) < 2:
+        raise ValueError("São necessários pelo menos 2 candles para inferir a duração do candle. Informe candle_seconds.")
+    return float(np.median(np.diff(open_time)) / 1000)
+
+
+def _strategyDecisions(
+    stock_data, main_strategy, main_strategy_args, fallback_strategy, fallback_strategy_args, fallback_activated
+):
+    """
+    Decisões de todos os candles seguindo o StrategyRunner: a fallback só é usada onde a principal é inconclusiva.
+
+    :return: Array float com 1.0 (comprar), 0.0 (vender) ou NaN (nenhuma decisão).
+    """
+    main_args = {**(main_strategy_args or {}), "verbose": False}
+    signal = decisionsToArray(getSignalSeries(main_strategy, stock_data, **main_args))
+
+    if fallback_activated and fallback_strategy is not None:
+        fallback_args = {**(fallback_strategy_args or {}), "verbose": False}
+        fallback_signal = decisionsToArray(getSignalSeries(fallback_strategy, stock_data, **fallback_args))
+        signal = np.where(np.isnan(signal), fallback_signal, signal)
+
+    return signal
+
+
+def eventBacktestRunner(
+    stock_data: pd.DataFrame,
+    main_strategy,
+    main_strategy_args=None,
+    fallback_strategy=None,
+    fallback_strategy_args=None,
+    fallback_activated=True,
+    stock_code="BTC",
+    operation_code="BTCUSDT",
+    traded_quantity=0,
+    traded_percentage=100,
+    initial_balance=1000,
+    stop_loss_percentage=3.5,
+    take_profit_at_percentage=None,
+    take_profit_amount_percentage=None,
+    delay_after_order=60 * 60,
+    candle_seconds=None,
+    step_size=0.0,
+    fee_percentage=0.0,
+    periods=None,
+    verbose=True,
+):
+    """
+    Executa a simulação orientada a eventos da lógica completa do BinanceTraderBot.execute.
+
+    :param stock_data: DataFrame contendo os dados do ativo (formato de getStockData).
+    :param main_strategy: Função da estratégia principal.
+    :param main_strategy_args: Dicionário com argumentos extras para a estratégia principal.
+    :param fallback_strategy: Função da estratégia de fallback.
+    :param fallback_strategy_args: Dicionário com argumentos extras para a estratégia de fallback.
+    :param fallback_activated: Se a fallback é usada quando a principal é inconclusiva.
+    :param stock_code: Código do ativo (ex: "BTC").
+    :param operation_code: Código da operação (ex: "BTCUSDT").
+    :param traded_quantity: Quantidade comprada em cada entrada (0 = usa traded_percentage).
+    :param traded_percentage: (Em base 100%) Parte do saldo em moeda de cotação usada na compra, se traded_quantity = 0.
+    :param initial_balance: Saldo inicial na moeda de cotação.
+    :param stop_loss_percentage: (Em base 100%) Stop loss inicial abaixo do preço de compra.
+    :param take_profit_at_percentage: (Em base 100%) Metas de lucro (ex: [2, 4, 8]).
+    :param take_profit_amount_percentage: (Em base 100%) Quanto vender em cada meta (ex: [70, 30, 100]).
+    :param delay_after_order: Tempo (segundos) que o bot espera depois de uma ordem.
+    :param candle_seconds: Duração do candle em segundos. None = inferida a partir de open_time.
+    :param step_size: Step de quantidade do ativo (LOT_SIZE). 0 = sem arredondamento.
+    :param fee_percentage: (Em base 100%) Taxa da corretora sobre cada ordem.
+    :param periods: Quantidade de candles finais simulados. None = histórico inteiro.
+    :param verbose: Exibe o resumo da simulação.
+    :return: Dicionário com saldo final, lucro percentual, quantidade de ordens, tabela de ordens e curva de capital.
+    """
+    take_profit_at_percentage = take_profit_at_percentage or []
+    take_profit_amount_percentage = take_profit_amount_percentage or []
+    stop_loss_rate = stop_loss_percentage / 100
+
+    if periods is not None:
+        stock_data = stock_data[-periods:]
+    stock_data = stock_data.dropna().reset_index(drop=True)
+
+    close = stock_data["close_price"].to_numpy(dtype=float).tolist()
+    if "open_time" in stock_data.columns:
+        open_time = pd.DatetimeIndex(stock_data["open_time"]).asi8 // 1_000_000
+        if candle_seconds is None:
+            candle_seconds = _candleSeconds(open_time)
+    elif candle_seconds is None:
+        raise ValueError("stock_data sem a coluna 'open_time': informe candle_seconds.")
+    else:
+        open_time = np.arange(len(stock_data), dtype=np.int64) * int(candle_seconds * 1000)
+
+    cooldown_candles = max(1, math.ceil(delay_after_order / candle_seconds))
+    open_time = open_time.tolist()
+
+    signal = _strategyDecisions(
+        stock_data, main_strategy, main_strategy_args, fallback_strategy, fallback_strategy_args, fallback_activated
+    ).tolist()
+
+    exchange = SimulatedExchange(stock_code, initial_balance=initial_balance, fee_percentage=fee_percentage)
+    balances = exchange.balances
+    quote_code = exchange.quote_code
+    fee_rate = exchange.fee_rate
+
+    # Estado equivalente aos atributos do BinanceTraderBot
+    last_buy_price = 0.0
+    stop_loss_price = None
+    max_price_since_buy = 0.0
+    take_profit_index = 0
+
+    order_reasons = []
+    failed_orders = 0
+    stock_balance = np.zeros(len(close))
+    quote_balance = np.zeros(len(close))
+    next_cycle = 0
+
+    for i, close_price in enumerate(close):
+        if i >= next_cycle:
+            exchange.setMarket(close_price, open_time[i])
+            order_reason = None
+
+            # updateAllData: a posição vem do saldo do ativo
+            actual_trade_position = balances[stock_code] >= step_size if step_size > 0 else balances[stock_code] > 0
+            if not actual_trade_position:
+                take_profit_index = 0
+
+            if actual_trade_position:
+                # updateTrailingStopLoss
+                if last_buy_price > 0 and close_price >= last_buy_price * (1 + TRAILING_ACTIVATION_PERCENTAGE):
+                    if close_price > max_price_since_buy:
+                        max_price_since_buy = close_price
+                        new_trailing_stop = max_price_since_buy * (1 - TRAILING_GAP)
+                        if new_trailing_stop > stop_loss_price:
+                            stop_loss_price = new_trailing_stop
+
+                # stopLossTrigger
+                if close_price < stop_loss_price:
+                    quantity = _adjustToStep(balances[stock_code], step_size)
+                    try:
+                        exchange.create_order(symbol=operation_code, side="SELL", type="MARKET", quantity=quantity)
+                        max_price_since_buy = 0.0
+                    except ValueError:
+                        failed_orders += 1
+                    order_reason = "stop_loss"
+
+                # takeProfitTrigger
+                elif take_profit_index < len(take_profit_at_percentage):
+                    tp_percentage = take_profit_at_percentage[take_profit_index]
+                    tp_amount = take_profit_amount_percentage[take_profit_index]
+                    price_percentage_variation = (close_price - last_buy_price) / last_buy_price * 100
+
+                    if tp_percentage > 0 and round(price_percentage_variation, 2) >= round(tp_percentage, 2):
+                        quantity = _adjustToStep(balances[stock_code] * (tp_amount / 100), step_size)
+                        if quantity > 0:
+                            try:
+                                exchange.create_order(symbol=operation_code, side="SELL", type="MARKET", quantity=quantity)
+                                max_price_since_buy = 0.0
+                                take_profit_index += 1
+                                order_reason = "take_profit"
+                            except ValueError:
+                                # Como no bot: takeProfitTrigger devolve False e a estratégia roda no mesmo ciclo
+                                failed_orders += 1
+
+            # Estratégia (não há ordens abertas: as ordens a mercado são executadas na hora)
+            if order_reason is None:
+                trade_decision = signal[i]
+
+                if trade_decision == 1.0 and not actual_trade_position:
+                    if traded_quantity > 0:
+                        quantity = traded_quantity
+                    else:
+                        quantity = balances[quote_code] * (traded_percentage / 100) / (close_price * (1 + fee_rate))
+                    quantity = _adjustToStep(quantity, step_size)
+                    try:
+                        exchange.create_order(symbol=operation_code, side="BUY", type="MARKET", quantity=quantity)
+                        last_buy_price = close_price
+                        stop_loss_price = last_buy_price * (1 - stop_loss_rate)
+                        max_price_since_buy = last_buy_price
+                    except ValueError:
+                        failed_orders += 1
+                    order_reason = "buy_signal"
+
+                elif trade_decision == 0.0 and actual_trade_position:
+                    quantity = _adjustToStep(balances[stock_code], step_size)
+                    try:
+                        exchange.create_order(symbol=operation_code, side="SELL", type="MARKET", quantity=quantity)
+                        max_price_since_buy = 0.0
+                    except ValueError:
+                        failed_orders += 1
+                    order_reason = "sell_signal"
+
+            if order_reason is not None:
+                # O bot dorme delay_after_order depois de enviar uma ordem (mesmo que ela falhe)
+                next_cycle = i + cooldown_candles
+                if len(order_reasons) < len(exchange.orders):
+                    order_reasons.append(order_reason)
+            else:
+                next_cycle = i + 1
+
+        stock_balance[i] = balances[stock_code]
+        quote_balance[i] = balances[quote_code]
+
+    # Curva de capital marcada a mercado e tabela de ordens
+    close = np.asarray(close)
+    equity = quote_balance + stock_balance * close
+    final_balance = float(equity[-1]) if len(equity) else float(initial_balance)
+    profit_percentage = (final_balance - initial_balance) / initial_balance * 100
+
+    orders = pd.DataFrame(
+        [
+            {
+                "open_time": pd.Timestamp(order["time"], unit="ms", tz="UTC"),
+                "side": order["side"],
+                "reason": reason,
+                "price": float(order["fills"][0]["price"]),
+                "quantity": float(order["executedQty"]),
+                "fee": float(order["fills"][0]["commission"]),
+            }
+            for order, reason in zip(exchange.orders, order_reasons)
+        ],
+        columns=["open_time", "side", "reason", "price", "quantity", "fee"],
+    )
+    if "open_time" in stock_data.columns and getattr(stock_data["open_time"].dt, "tz", None) is not None:
+        orders["open_time"] = orders["open_time"].dt.tz_convert(stock_data["open_time"].dt.tz)
+
+    if verbose:
+        print(f"📊 Simulação orientada a eventos: {main_strategy.__name__} ({operation_code})")
+        print(f"🔹 Candles: {len(close)} | Espera após ordem: {cooldown_candles} candle(s)")
+        print(f"🔹 Balanço inicial: ${initial_balance:.2f}")
+        print(f"🔹 Balanço final: ${final_balance:.2f}")
+        print(f"📈 Lucro/prejuízo percentual: {profit_percentage:.2f}%")
+        print(f"📊 Total de ordens executadas: {len(orders)}")
+        for reason, count in orders["reason"].value_counts().items():
+            print(f" | {reason}: {count}")
+        if failed_orders:
+            print(f"⚠️ Ordens recusadas pela corretora simulada: {failed_orders}")
+
+    return {
+        "balance": final_balance,
+        "profit_percentage": profit_percentage,
+        "trades": len(orders),
+        "failed_orders": failed_orders,
+        "orders": orders,
+        "equity": pd.Series(equity, index=stock_data["open_time"] if "open_time" in stock_data.columns else None),
+    }
+
+
+def eventBacktestFromStockStart(stock_data: pd.DataFrame, stock_start, initial_balance=1000, **simulation_kwargs):
+    """
+    Executa a simulação com a mesma configuração usada em main.py para um ativo (StockStartModel).
+
+    :param stock_data: DataFrame contendo os dados do ativo.
+    :param stock_start: StockStartModel do ativo (ex: BTC_USDT de main.py).
+    :param initial_balance: Saldo inicial na moeda de cotação.
+    :param simulation_kwargs: Parâmetros extras de eventBacktestRunner (ex: fee_percentage, step_size, periods).
+    :return: O mesmo dicionário de eventBacktestRunner.
+    """
+    return eventBacktestRunner(
+        stock_data=stock_data,
+        main_strategy=stock_start.mainStrategy,
+        main_strategy_args=stock_start.mainStrategyArgs,
+        fallback_strategy=stock_start.fallbackStrategy,
+        fallback_strategy_args=stock_start.fallbackStrategyArgs,
+        fallback_activated=stock_start.fallBackActivated,
+        stock_code=stock_start.stockCode,
+        operation_code=stock_start.operationCode,
+        traded_quantity=stock_start.tradedQuantity,
+        traded_percentage=stock_start.tradedPercentage,
+        initial_balance=initial_balance,
+        stop_loss_percentage=stock_start.stopLossPercentage,
+        take_profit_at_percentage=stock_start.takeProfitAtPercentage,
+        take_profit_amount_percentage=stock_start.takeProfitAmountPercentage,
+        delay_after_order=stock_start.delayEntreOrdens,
+        **simulation_kwargs,
+    )
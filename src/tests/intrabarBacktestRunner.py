@@ -0,0 +1,304 @@
+import numpy as np
+import pandas as pd
+
+from Models.BacktestResultModel import BacktestResultModel
+from strategies.signal_series import getSignalSeries, decisionsToArray
+from tests.backtestMetrics import backtestMetrics, periodsPerYear
+from tests.vectorBacktestRunner import prepareBacktestData
+
+"""
+Backtest com stop loss, trailing stop e take profit avaliados dentro do candle (máxima / mínima).
+
+O bot ao vivo e os backtests comparam os níveis apenas com o fechamento, o que esconde stops atingidos no meio
+do candle e deixa o resultado otimista. Aqui cada operação é percorrida com operações de array sobre os candles em
+que ela fica aberta (sem loop Python por candle):
+
+- O stop de cada candle é o maior entre o stop inicial e o trailing (pico das máximas ANTERIORES ao candle,
+  ativado quando o pico sobe trailing_activation_percentage acima da compra e posicionado trailing_gap_percentage
+  abaixo do pico). Usar só os candles anteriores evita supor que a máxima veio antes da mínima.
+- O stop é atingido se a mínima tocar o nível; a execução é no nível ou na abertura, se o candle abrir abaixo (gap).
+- Cada meta de take profit é atingida se a máxima tocar o nível; a execução é no nível ou na abertura, se abrir acima.
+- Quando o mesmo candle toca o stop e uma meta, both_hit decide a ordem:
+  "stop_first" (conservador), "target_first" ou "nearest_open" (o nível mais próximo da abertura vem primeiro).
+
+Entradas e saídas por sinal seguem o backtestRunner: compra no fechamento do candle com sinal True se estiver fora,
+vende no fechamento com sinal False. Depois de um stop ou take profit total, a próxima entrada é o próximo sinal True.
+"""
+
+BOTH_HIT_RULES = ("stop_first", "target_first", "nearest_open")
+
+
+def _firstHit(mask):
+    """Posição do primeiro True do array (ou None)."""
+    position = int(np.argmax(mask)) if len(mask) else 0
+    return position if len(mask) and mask[position] else None
+
+
+def _tradeExits(
+    open_, high, low, entry_price, initial_stop, trailing_activation, trailing_gap, tp_prices, tp_fractions, both_hit
+):
+    """
+    Percorre os candles de uma operação (a partir do candle seguinte à compra) e calcula as saídas intrabar.
+
+    :return: Lista de (posição no segmento, preço, fração da posição vendida, motivo), em ordem de execução.
+    """
+    # Stop de cada candle: inicial ou trailing sobre o pico das máximas anteriores
+    peak = np.maximum.accumulate(np.concatenate(([entry_price], high[:-1])))
+    stop = np.full(len(high), initial_stop)
+    if trailing_activation is not None:
+        trailing = peak >= entry_price * (1 + trailing_activation)
+        stop = np.where(trailing, np.maximum(stop, peak * (1 - trailing_gap)), stop)
+
+    stop_bar = _firstHit(low <= stop)
+    tp_bars = [_firstHit(high >= tp_price) for tp_price in tp_prices]
+
+    # Eventos em ordem de candle; no mesmo candle a regra both_hit decide a ordem entre stop e metas
+    events = []
+    for level, bar in enumerate(tp_bars):
+        if bar is None or (stop_bar is not None and bar > stop_bar):
+            continue
+        if bar == stop_bar:
+            if both_hit == "stop_first":
+                continue
+            if both_hit == "nearest_open":
+                target_distance = tp_prices[level] - open_[bar]
+                stop_distance = open_[bar] - stop[bar]
+                if stop_distance <= target_distance:
+                    continue
+        events.append((bar, 0, level))
+    if stop_bar is not None:
+        events.append((stop_bar, 1, None))
+    events.sort()
+
+    exits = []
+    remaining = 1.0
+    for bar, is_stop, level in events:
+        if is_stop:
+            reason = "stop_loss" if stop[bar] == initial_stop else "trailing_stop"
+            exits.append((bar, min(open_[bar], stop[bar]), remaining, reason))
+            return exits
+        sold = remaining * tp_fractions[level]
+        exits.append((bar, max(open_[bar], tp_prices[level]), sold, "take_profit"))
+        remaining -= sold
+        if remaining <= 1e-12:
+            return exits
+    return exits
+
+
+def simulateIntrabarBacktest(
+    open_,
+    high,
+    low,
+    close,
+    signal,
+    initial_balance=1000,
+    stop_loss_percentage=3.5,
+    take_profit_at_percentage=None,
+    take_profit_amount_percentage=None,
+    trailing_activation_percentage=3,
+    trailing_gap_percentage=1,
+    both_hit="stop_first",
+):
+    """
+    Simula a estratégia com saídas intrabar a partir dos arrays de preços e sinais.
+
+    :param open_: Array com os preços de abertura.
+    :param high: Array com as máximas.
+    :param low: Array com as mínimas.
+    :param close: Array com os preços de fechamento.
+    :param signal: Array float com os sinais (1.0, 0.0 ou NaN) de cada candle.
+    :param initial_balance: Saldo inicial da conta de trading.
+    :param stop_loss_percentage: (Em base 100%) Stop loss inicial abaixo do preço de compra. None = sem stop inicial.
+    :param take_profit_at_percentage: (Em base 100%) Metas de lucro (ex: [2, 4, 8]).
+    :param take_profit_amount_percentage: (Em base 100%) Quanto da posição restante vender em cada meta (ex: [70, 30, 100]).
+    :param trailing_activation_percentage: (Em base 100%) Alta sobre a compra que ativa o trailing. None = sem trailing.
+    :param trailing_gap_percentage: (Em base 100%) Distância do trailing abaixo do pico.
+    :param both_hit: Regra para candles que tocam stop e meta: "stop_first", "target_first" ou "nearest_open".
+    :return: Dicionário com saldo final, lucro percentual, operações, tabela de operações e curva de capital.
+    """
+    if both_hit not in BOTH_HIT_RULES:
+        raise ValueError(f"Regra both_hit inválida: {both_hit}. Use uma de {BOTH_HIT_RULES}.")
+
+    open_, high, low, close = (np.asarray(values, dtype=float) for values in (open_, high, low, close))
+    signal = np.array(signal, dtype=float)
+    n = len(close)
+
+    take_profit_at_percentage = take_profit_at_percentage or []
+    take_profit_amount_percentage = take_profit_amount_percentage or []
+    levels = sorted(
+        (at, amount) for at, amount in zip(take_profit_at_percentage, take_profit_amount_percentage) if at > 0 and amount > 0
+    )
+    trailing_activation = None if trailing_activation_percentage is None else trailing_activation_percentage / 100
+    trailing_gap = trailing_gap_percentage / 100
+
+    # O sinal do primeiro candle é ignorado, como no backtestRunner
+    if n:
+        signal[0] = np.nan
+    buy_bars = np.flatnonzero(signal == 1.0)
+    sell_bars = np.flatnonzero(signal == 0.0)
+
+    cash = float(initial_balance)
+    units = np.zeros(n)
+    cash_curve = np.full(n, cash)
+    trades = []
+
+    next_buy = 0
+    while next_buy < len(buy_bars):
+        entry = int(buy_bars[next_buy])
+        entry_price = close[entry]
+        quantity = cash / entry_price
+        cash = 0.0
+
+        # Saída por sinal: primeiro False depois da compra (ou último candle, onde a posição é fechada)
+        sell_position = np.searchsorted(sell_bars, entry, side="right")
+        signal_exit = int(sell_bars[sell_position]) if sell_position < len(sell_bars) else n - 1
+
+        segment = slice(entry + 1, signal_exit + 1)
+        initial_stop = entry_price * (1 - stop_loss_percentage / 100) if stop_loss_percentage is not None else -np.inf
+        exits = _tradeExits(
+            open_[segment],
+            high[segment],
+            low[segment],
+            entry_price,
+            initial_stop,
+            trailing_activation,
+            trailing_gap,
+            [entry_price * (1 + at / 100) for at, _ in levels],
+            [amount / 100 for _, amount in levels],
+            both_hit,
+        )
+
+        # Quantidade mantida e saldo entre as saídas (parciais ou totais)
+        held = quantity
+        last_bar = entry
+        for offset, price, fraction, reason in exits:
+            bar = entry + 1 + offset
+            units[last_bar:bar] = held
+            cash_curve[last_bar:bar] = cash
+            sold = min(held, quantity * fraction)
+            held -= sold
+            cash += sold * price
+            trades.append((entry, bar, entry_price, price, sold / quantity, reason))
+            last_bar = bar
+
+        if held > quantity * 1e-12:
+            if signal[signal_exit] == 0.0:
+                # Restante sai no fechamento do candle com sinal de venda
+                units[last_bar:signal_exit] = held
+                cash_curve[last_bar:signal_exit] = cash
+                cash += held * close[signal_exit]
+                trades.append((entry, signal_exit, entry_price, close[signal_exit], held / quantity, "sell_signal"))
+                last_bar = signal_exit
+            else:
+                # Posição aberta no final: fechada no último preço, sem contar como operação
+                units[last_bar:] = held
+                cash_curve[last_bar:] = cash
+                cash += held * close[-1]
+                trades.append((entry, n - 1, entry_price, close[-1], held / quantity, "end"))
+                break
+        cash_curve[last_bar:] = cash
+
+        # Próxima compra: primeiro sinal True depois do candle em que a posição foi zerada
+        next_buy = int(np.searchsorted(buy_bars, last_bar, side="right"))
+
+    equity = cash_curve + units * close
+    balance = float(cash)
+    trades = pd.DataFrame(trades, columns=["entry", "exit", "entry_price", "exit_price", "fraction", "reason"])
+    operations = trades["entry"].nunique() + int((trades["reason"] != "end").sum())
+
+    return {
+        "balance": balance,
+        "profit_percentage": (balance - initial_balance) / initial_balance * 100,
+        "trades": int(operations),
+        "trade_list": trades,
+        "equity": equity,
+        "position": (units > 0).astype(float),
+    }
+
+
+def intrabarBacktestRunner(
+    stock_data: pd.DataFrame,
+    strategy_function,
+    periods=900,
+    initial_balance=1000,
+    stop_loss_percentage=3.5,
+    take_profit_at_percentage=None,
+    take_profit_amount_percentage=None,
+    trailing_activation_percentage=3,
+    trailing_gap_percentage=1,
+    both_hit="stop_first",
+    print_results=False,
+    **strategy_kwargs,
+):
+    """
+    Backtest da estratégia com stop loss, trailing stop e take profit avaliados na máxima / mínima de cada candle.
+
+    :param stock_data: DataFrame contendo os dados do ativo.
+    :param strategy_function: Função da estratégia de trading (ex: getT3MATradeStrategy).
+    :param periods: Número de períodos a serem analisados no backtest.
+    :param initial_balance: Saldo inicial da conta de trading.
+    :param stop_loss_percentage: (Em base 100%) Stop loss inicial abaixo do preço de compra. None = sem stop inicial.
+    :param take_profit_at_percentage: (Em base 100%) Metas de lucro (ex: [2, 4, 8]).
+    :param take_profit_amount_percentage: (Em base 100%) Quanto da posição restante vender em cada meta.
+    :param trailing_activation_percentage: (Em base 100%) Alta que ativa o trailing. None = sem trailing.
+    :param trailing_gap_percentage: (Em base 100%) Distância do trailing abaixo do pico.
+    :param both_hit: Regra para candles que tocam stop e meta: "stop_first", "target_first" ou "nearest_open".
+    :param print_results: Exibe o resumo do backtest no console.
+    :param strategy_kwargs: Parâmetros adicionais para a estratégia.
+    :return: BacktestResultModel (tradeList com uma linha por saída, inclusive as parciais, e o motivo).
+    """
+    stock_data = prepareBacktestData(stock_data, periods, **strategy_kwargs)
+
+    if print_results:
+        print(f"📊 Iniciando backtest intrabar da estratégia: {strategy_function.__name__}")
+        print(f"🔹 Balanço inicial: ${initial_balance:.2f}")
+
+    decisions = getSignalSeries(strategy_function, stock_data, **strategy_kwargs)
+    result = simulateIntrabarBacktest(
+        stock_data["open_price"].to_numpy(),
+        stock_data["high_price"].to_numpy(),
+        stock_data["low_price"].to_numpy(),
+        stock_data["close_price"].to_numpy(),
+        decisionsToArray(decisions),
+        initial_balance=initial_balance,
+        stop_loss_percentage=stop_loss_percentage,
+        take_profit_at_percentage=take_profit_at_percentage,
+        take_profit_amount_percentage=take_profit_amount_percentage,
+        trailing_activation_percentage=trailing_activation_percentage,
+        trailing_gap_percentage=trailing_gap_percentage,
+        both_hit=both_hit,
+    )
+
+    # Retorno de cada operação = soma das saídas (parciais) ponderadas pela fração vendida
+    trade_list = result["trade_list"]
+    entry_codes, entry_index = np.unique(trade_list["entry"].to_numpy(), return_inverse=True)
+    exit_returns = trade_list["fraction"].to_numpy() * (trade_list["exit_price"] / trade_list["entry_price"] - 1.0).to_numpy()
+    trade_returns = np.bincount(entry_index, weights=exit_returns, minlength=len(entry_codes))
+
+    periods_per_year = periodsPerYear(stock_data["open_time"]) if "open_time" in stock_data else 1.0
+    metrics = backtestMetrics(result["equity"], result["position"], trade_returns, periods_per_year)
+    backtest = BacktestResultModel(
+        strategyName=strategy_function.__name__,
+        initialBalance=initial_balance,
+        balance=result["balance"],
+        profitPercentage=result["profit_percentage"],
+        trades=result["trades"],
+        equity=result["equity"],
+        position=result["position"],
+        tradeList=trade_list,
+        maxDrawdownPercentage=metrics["max_drawdown_percentage"],
+        sharpeRatio=metrics["sharpe_ratio"],
+        sortinoRatio=metrics["sortino_ratio"],
+        exposurePercentage=metrics["exposure_percentage"],
+        winRatePercentage=metrics["win_rate_percentage"],
+        averageTradePercentage=metrics["average_trade_percentage"],
+        turnover=metrics["turnover"],
+    )
+
+    # Resultados
+    if print_results:
+        backtest.printResults()
+        for reason, count in trade_list["reason"].value_counts().items():
+            print(f" | {reason}: {count}")
+
+    return backtest
@@ -0,0 +1,290 @@
+import contextlib
+import io
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from strategies.signal_series import getSignalBatch, getSignalBatchFunction, getSignalSeries, decisionsToArray
+from tests.backtestMetrics import backtestMetrics, periodsPerYear
+from tests.backtestRunner import backtestRunner
+from tests.vectorBacktestRunner import prepareBacktestData, simulateSignalBacktest
+
+"""
+Varredura de parâmetros (grid search) das estratégias.
+
+Cada combinação do grid é um backtest independente, então as combinações são distribuídas em um pool
+de processos. Os candles NÃO são enviados (pickle) em cada tarefa: as colunas do DataFrame são copiadas
+uma única vez para um bloco de memória compartilhada e cada processo reconstrói o DataFrame ao iniciar.
+
+No engine "vector", estratégias com versão em lote (atributo `signal_batch`) calculam as decisões de todas as
+combinações de um lote de uma vez, com os indicadores de todos os períodos calculados juntos; só a simulação e as
+métricas continuam combinação a combinação.
+"""
+
+# DataFrame reconstruído a partir da memória compartilhada, um por processo do pool
+_worker_stock_data = None
+_worker_shared_memory = None
+
+
+def parameterGrid(param_grid: dict):
+    """
+    Expande o grid {parâmetro: [valores]} em uma lista de dicionários, um por combinação.
+
+    :param param_grid: Dicionário com a lista de valores de cada parâmetro (ex: {"fast_period": [5, 7]}).
+    :return: Lista de dicionários com todas as combinações.
+    """
+    names = list(param_grid.keys())
+    values = [
+        param_grid[name] if isinstance(param_grid[name], (list, tuple, range, np.ndarray)) else [param_grid[name]]
+        for name in names
+    ]
+    return [dict(zip(names, combination)) for combination in itertools.product(*values)]
+
+
+def _packStockData(stock_data: pd.DataFrame):
+    """
+    Copia as colunas do DataFrame para um único bloco de memória compartilhada.
+
+    Colunas de data (com ou sem fuso) são guardadas como int64 em nanossegundos. Colunas que são o mesmo array
+    (apelidos de indicators/ohlcv_view.py, ex: close e close_price) são guardadas uma vez e dividem o offset.
+
+    :return: (SharedMemory, layout) onde layout descreve nome, dtype, fuso e offset de cada coluna.
+    """
+    arrays = []
+    layout = []
+    offset = 0
+    packed = {}  # (endereço, dtype, bytes) do array original -> offset já ocupado por ele
+
+    for column in stock_data.columns:
+        series = stock_data[column]
+        timezone = None
+
+        if isinstance(series.dtype, pd.DatetimeTZDtype):
+            timezone = str(series.dt.tz)
+            values = series.array.asi8
+            kind = "datetime"
+        elif pd.api.types.is_datetime64_dtype(series.dtype):
+            values = series.to_numpy().view(np.int64)
+            kind = "datetime"
+        elif pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+            values = series.to_numpy()
+            kind = "numeric"
+        else:
+            raise ValueError(f"Coluna '{column}' não é numérica nem data e não pode ir para a memória compartilhada.")
+
+        key = (values.__array_interface__["data"][0], values.dtype.str, values.nbytes)
+        if key in packed:
+            layout.append((column, values.dtype.str, kind, timezone, packed[key]))
+            continue
+
+        values = np.ascontiguousarray(values)
+        arrays.append((values, offset))
+        layout.append((column, values.dtype.str, kind, timezone, offset))
+        packed[key] = offset
+        offset += values.nbytes
+
+    shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    for values, start in arrays:
+        np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf, offset=start)[:] = values
+
+    return shm, layout
+
+
+def _unpackStockData(buffer, layout, n_rows):
+    """Reconstrói o DataFrame a partir do bloco de memória compartilhada."""
+    columns = {}
+    unpacked = {}  # offset -> array (apelidos voltam a ser o mesmo array)
+    for column, dtype, kind, timezone, offset in layout:
+        if offset not in unpacked:
+            values = np.ndarray((n_rows,), dtype=np.dtype(dtype), buffer=buffer, offset=offset).copy()
+            if kind == "datetime":
+                values = pd.to_datetime(values, unit="ns")
+                if timezone is not None:
+                    values = values.tz_localize("UTC").tz_convert(timezone)
+            unpacked[offset] = values
+        columns[column] = unpacked[offset]
+    return pd.DataFrame(columns, copy=False)
+
+
+def _initSweepWorker(shm_name, layout, n_rows):
+    """Inicializador de cada processo do pool: anexa a memória compartilhada e reconstrói os candles."""
+    global _worker_stock_data, _worker_shared_memory
+    _worker_shared_memory = shared_memory.SharedMemory(name=shm_name)
+    _worker_stock_data = _unpackStockData(_worker_shared_memory.buf, layout, n_rows)
+
+
+def _runCombination(stock_data, strategy_function, params, engine, periods, initial_balance):
+    """
+    Executa o backtest de uma combinação de parâmetros.
+
+    :return: Dicionário com os parâmetros, lucro, saldo final, operações, métricas de risco e erro (se houver).
+    """
+    result = dict(params)
+    try:
+        if engine == "legacy":
+            with contextlib.redirect_stdout(io.StringIO()):
+                backtest = backtestRunner(
+                    stock_data=stock_data,
+                    strategy_function=strategy_function,
+                    periods=periods,
+                    initial_balance=initial_balance,
+                    **params,
+                )
+            result.update(backtest.metrics(), error=None)
+        else:
+            data = prepareBacktestData(stock_data, periods, **params)
+            with contextlib.redirect_stdout(io.StringIO()):
+                decisions = getSignalSeries(strategy_function, data, **params)
+            result.update(_signalResult(data, decisionsToArray(decisions), initial_balance))
+    except Exception as e:
+        result.update(profit_percentage=np.nan, balance=np.nan, trades=np.nan, error=f"{type(e).__name__}: {e}")
+    return result
+
+
+def _signalResult(data, signal, initial_balance):
+    """Simula os sinais (1.0 / 0.0 / NaN) sobre os candles recortados e devolve lucro, saldo, operações e métricas."""
+    close = data["close_price"].to_numpy()
+    backtest = simulateSignalBacktest(close, signal, initial_balance)
+
+    # Retorno de cada operação (a posição aberta no final é fechada no último preço)
+    entries, exits = backtest["entries"], backtest["exits"]
+    exit_prices = close[exits] if len(exits) >= len(entries) else np.append(close[exits], close[-1])
+    trade_returns = exit_prices / close[entries] - 1.0
+
+    return dict(
+        profit_percentage=backtest["profit_percentage"],
+        balance=backtest["balance"],
+        trades=backtest["trades"],
+        **backtestMetrics(backtest["equity"], backtest["position"], trade_returns, periodsPerYear(data["open_time"])),
+        error=None,
+    )
+
+
+def _runBatch(stock_data, strategy_function, combinations, periods, initial_balance):
+    """
+    Executa as combinações com a versão em lote da estratégia: as combinações que recortam os mesmos candles
+    (mesmo slow_window) têm as decisões calculadas juntas. Se o lote falhar, cada combinação é executada
+    individualmente (o erro fica só na combinação que falhou).
+
+    :return: Lista de resultados na ordem das combinações.
+    """
+    groups = {}
+    for position, params in enumerate(combinations):
+        groups.setdefault(params.get("slow_window", 40), []).append(position)
+
+    results = [None] * len(combinations)
+    for positions in groups.values():
+        group = [combinations[position] for position in positions]
+        try:
+            data = prepareBacktestData(stock_data, periods, **group[0])
+            with contextlib.redirect_stdout(io.StringIO()):
+                signals = decisionsToArray(getSignalBatch(strategy_function, data, group))
+        except Exception:
+            for position, params in zip(positions, group):
+                results[position] = _runCombination(stock_data, strategy_function, params, "vector", periods, initial_balance)
+            continue
+
+        for column, (position, params) in enumerate(zip(positions, group)):
+            result = dict(params)
+            try:
+                result.update(_signalResult(data, signals[:, column], initial_balance))
+            except Exception as e:
+                result.update(profit_percentage=np.nan, balance=np.nan, trades=np.nan, error=f"{type(e).__name__}: {e}")
+            results[position] = result
+    return results
+
+
+def _runCombinations(stock_data, strategy_function, combinations, engine, periods, initial_balance):
+    """Executa uma lista de combinações, em lote quando a estratégia tiver versão em lote e o engine for "vector"."""
+    if engine == "vector" and getSignalBatchFunction(strategy_function) is not None:
+        return _runBatch(stock_data, strategy_function, combinations, periods, initial_balance)
+    return [_runCombination(stock_data, strategy_function, params, engine, periods, initial_balance) for params in combinations]
+
+
+def _runSweepChunk(strategy_function, chunk, engine, periods, initial_balance):
+    """Tarefa do pool: executa um lote de combinações sobre os candles do processo."""
+    return _runCombinations(_worker_stock_data, strategy_function, chunk, engine, periods, initial_balance)
+
+
+def parameterSweep(
+    stock_data: pd.DataFrame,
+    strategy_function,
+    param_grid: dict,
+    periods=900,
+    initial_balance=1000,
+    engine="vector",
+    workers=None,
+    chunk_size=None,
+    verbose=True,
+    **fixed_kwargs,
+):
+    """
+    Executa o backtest de todas as combinações do grid em paralelo e devolve a tabela ordenada pelo lucro.
+
+    :param stock_data: DataFrame contendo os dados do ativo.
+    :param strategy_function: Função da estratégia de trading (ex: getT3MATradeStrategy). Deve ser uma função
+        de módulo (importável) para poder ser enviada aos processos.
+    :param param_grid: Dicionário com a lista de valores de cada parâmetro (ex: {"fast_period": [5, 7, 9]}).
+    :param periods: Número de períodos a serem analisados em cada backtest.
+    :param initial_balance: Saldo inicial da conta de trading.
+    :param engine: "vector" (vectorBacktestRunner, padrão) ou "legacy" (backtestRunner, candle a candle).
+    :param workers: Quantidade de processos. None = todos os núcleos; 1 = executa no processo atual.
+    :param chunk_size: Combinações por tarefa enviada ao pool. None = divide em ~4 lotes por processo.
+    :param verbose: Exibe o progresso e o melhor resultado.
+    :param fixed_kwargs: Parâmetros fixos repassados à estratégia em todas as combinações. As estratégias
+        sempre recebem verbose=False, já que os logs de cada candle não fazem sentido na varredura.
+    :return: DataFrame com uma linha por combinação (parâmetros, lucro, saldo, operações, métricas de risco, erro)
+        ordenado pelo lucro.
+    """
+    if engine not in ("vector", "legacy"):
+        raise ValueError(f"Engine inválida: {engine}. Use 'vector' ou 'legacy'.")
+
+    fixed_kwargs["verbose"] = False
+    combinations = [{**fixed_kwargs, **params} for params in parameterGrid(param_grid)]
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, len(combinations)))
+
+    if verbose:
+        print(f"🔎 Varredura de parâmetros da estratégia: {strategy_function.__name__}")
+        print(f"🔹 Combinações: {len(combinations)} | Processos: {workers} | Engine: {engine}")
+
+    stock_data = stock_data.reset_index(drop=True)
+
+    if workers == 1:
+        results = _runCombinations(stock_data, strategy_function, combinations, engine, periods, initial_balance)
+    else:
+        chunk_size = chunk_size or max(1, len(combinations) // (workers * 4))
+        chunks = [combinations[i : i + chunk_size] for i in range(0, len(combinations), chunk_size)]
+
+        shm, layout = _packStockData(stock_data)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_initSweepWorker, initargs=(shm.name, layout, len(stock_data))
+            ) as executor:
+                futures = [
+                    executor.submit(_runSweepChunk, strategy_function, chunk, engine, periods, initial_balance)
+                    for chunk in chunks
+                ]
+                results = [result for future in futures for result in future.result()]
+        finally:
+            shm.close()
+            shm.unlink()
+
+    # Remove os parâmetros fixos da tabela: eles são iguais em todas as linhas
+    table = pd.DataFrame(results).drop(columns=[key for key in fixed_kwargs if key not in param_grid], errors="ignore")
+    table = table.sort_values("profit_percentage", ascending=False, na_position="last", kind="stable").reset_index(drop=True)
+    table.insert(0, "rank", np.arange(1, len(table) + 1))
+
+    if verbose:
+        failed = table["error"].notna().sum()
+        if failed:
+            print(f"⚠️ {failed} combinações falharam (veja a coluna 'error').")
+        if len(table) and not np.isnan(table["profit_percentage"].iloc[0]):
+            best = {name: table[name].iloc[0] for name in param_grid}
+            print(f"🏆 Melhor combinação: {best} | Lucro: {table['profit_percentage'].iloc[0]:.2f}%")
+
+    return table
@@ -0,0 +1,193 @@
+import numpy as np
+import pandas as pd
+
+from strategies.signal_series import getPanelSignalSeries, decisionsToArray, panelSymbols
+
+"""
+Backtest de carteira com vários ativos.
+
+Os candles de N símbolos ficam alinhados pelo open_time em um único painel (índice = tempo, colunas = campo x símbolo).
+Os sinais de todos os símbolos saem de uma única passada da estratégia sobre os arrays 2-D e a simulação usa um
+saldo único em moeda de cotação compartilhado entre os ativos.
+
+Regras da carteira:
+- Mesma lógica comprado/fora do backtestRunner em cada símbolo (entra no sinal True, sai no sinal False).
+- Em cada candle as vendas são processadas antes das compras, liberando saldo.
+- Cada compra usa uma fatia igual do saldo livre: saldo / quantidade de símbolos fora do mercado naquele momento.
+- Símbolos sem candle em um horário não operam nele; posições abertas são avaliadas pelo último preço conhecido.
+"""
+
+
+def buildPanel(stock_data_by_symbol: dict):
+    """
+    Alinha os candles de vários símbolos em um único painel.
+
+    :param stock_data_by_symbol: Dicionário {símbolo: DataFrame no formato de getStockData}.
+    :return: DataFrame indexado por open_time com colunas MultiIndex (campo, símbolo).
+    """
+    symbols = list(stock_data_by_symbol.keys())
+    frames = [stock_data.drop_duplicates(subset="open_time", keep="last") for stock_data in stock_data_by_symbol.values()]
+    fields = [column for column in frames[0].columns if column != "open_time"]
+
+    # Linha do tempo comum (união dos horários) e posição de cada candle nela
+    open_time = pd.DatetimeIndex(pd.concat([stock_data["open_time"] for stock_data in frames]).drop_duplicates()).sort_values()
+    values = np.full((len(open_time), len(fields) * len(symbols)), np.nan)
+    for column, stock_data in enumerate(frames):
+        rows = open_time.get_indexer(stock_data["open_time"])
+        for field_index, field in enumerate(fields):
+            values[rows, field_index * len(symbols) + column] = stock_data[field].to_numpy(dtype=float)
+
+    # Um único bloco float (campo x símbolo): as estratégias fatiam campos inteiros sem consolidar blocos
+    panel = pd.DataFrame(values, index=open_time, columns=pd.MultiIndex.from_product([fields, symbols]))
+    panel.index.name = "open_time"
+    return panel
+
+
+def simulatePortfolioBacktest(close, signal, initial_balance=1000):
+    """
+    Simula a carteira com saldo compartilhado a partir das matrizes (tempo x símbolo) de preços e sinais.
+
+    :param close: Matriz com os preços de fechamento (NaN onde o símbolo não tem candle).
+    :param signal: Matriz float com os sinais (1.0 compra, 0.0 venda, NaN nenhum).
+    :param initial_balance: Saldo inicial da carteira.
+    :return: Dicionário com saldo final, lucro percentual, operações, curva de capital e métricas por símbolo.
+    """
+    close = np.asarray(close, dtype=float)
+    signal = np.array(signal, dtype=float)
+    n_rows, n_symbols = close.shape
+
+    # Sem candle = sem operação; o primeiro sinal é ignorado como no backtestRunner
+    signal[np.isnan(close)] = np.nan
+    if n_rows:
+        signal[0] = np.nan
+
+    # Posição de cada símbolo = último sinal válido (forward fill por coluna via índice acumulado)
+    last_index = np.where(np.isnan(signal), 0, np.arange(n_rows)[:, None])
+    np.maximum.accumulate(last_index, axis=0, out=last_index)
+    position = np.take_along_axis(signal, last_index, axis=0)
+    position[np.isnan(position)] = 0.0
+
+    changes = np.diff(position, axis=0, prepend=0.0)
+
+    # Eventos ordenados por candle, vendas antes de compras: (linha, é_compra, símbolo)
+    exit_rows, exit_symbols = np.nonzero(changes < 0)
+    entry_rows, entry_symbols = np.nonzero(changes > 0)
+    event_rows = np.concatenate([exit_rows, entry_rows])
+    event_is_entry = np.concatenate([np.zeros(len(exit_rows), dtype=bool), np.ones(len(entry_rows), dtype=bool)])
+    event_symbols = np.concatenate([exit_symbols, entry_symbols])
+    order = np.lexsort((event_symbols, event_is_entry, event_rows))
+
+    cash = float(initial_balance)
+    units = [0.0] * n_symbols
+    entry_cost = [0.0] * n_symbols
+    realized_pnl = np.zeros(n_symbols)
+    trades = np.zeros(n_symbols, dtype=np.int64)
+    flat_symbols = n_symbols
+
+    # Saldo e quantidades após cada evento, para montar a curva de capital
+    units_after = np.full((n_rows, n_symbols), np.nan)
+    cash_after = np.full(n_rows, np.nan)
+
+    for row, is_entry, symbol in zip(event_rows[order].tolist(), event_is_entry[order].tolist(), event_symbols[order].tolist()):
+        price = close[row, symbol]
+        if is_entry:
+            allocation = cash / flat_symbols
+            units[symbol] = allocation / price
+            entry_cost[symbol] = allocation
+            cash -= allocation
+            flat_symbols -= 1
+        else:
+            proceeds = units[symbol] * price
+            realized_pnl[symbol] += proceeds - entry_cost[symbol]
+            cash += proceeds
+            units[symbol] = 0.0
+            flat_symbols += 1
+        trades[symbol] += 1
+        units_after[row, symbol] = units[symbol]
+        cash_after[row] = cash
+
+    # Curva de capital marcada a mercado (último preço conhecido de cada símbolo)
+    if n_rows:
+        units_after[0] = np.where(np.isnan(units_after[0]), 0.0, units_after[0])
+        cash_after[0] = initial_balance if np.isnan(cash_after[0]) else cash_after[0]
+    held_units = pd.DataFrame(units_after).ffill().to_numpy()
+    cash_curve = pd.Series(cash_after).ffill().to_numpy()
+    mark_price = pd.DataFrame(close).ffill().fillna(0.0).to_numpy()
+    equity = cash_curve + (held_units * mark_price).sum(axis=1)
+
+    # Fechar posições abertas no último preço conhecido
+    last_price = mark_price[-1] if n_rows else np.zeros(n_symbols)
+    open_pnl = np.array(units) * last_price - np.where(np.array(units) > 0, entry_cost, 0.0)
+    balance = cash + float(np.dot(units, last_price))
+
+    # Resultado de cada símbolo operando sozinho com o saldo inteiro (mesma conta do vectorBacktestRunner)
+    bar_returns = np.zeros((n_rows, n_symbols))
+    if n_rows > 1:
+        bar_returns[1:] = np.where(
+            position[:-1] > 0, mark_price[1:] / np.where(mark_price[:-1] > 0, mark_price[:-1], np.nan) - 1.0, 0.0
+        )
+    standalone_profit = (np.prod(1.0 + np.nan_to_num(bar_returns), axis=0) - 1.0) * 100
+
+    return {
+        "balance": balance,
+        "profit_percentage": (balance - initial_balance) / initial_balance * 100,
+        "trades": int(trades.sum()),
+        "equity": equity,
+        "position": position,
+        "symbol_trades": trades,
+        "symbol_pnl": realized_pnl + open_pnl,
+        "symbol_standalone_profit": standalone_profit,
+    }
+
+
+def portfolioBacktestRunner(
+    panel: pd.DataFrame, strategy_function, periods=None, initial_balance=1000, verbose=True, **strategy_kwargs
+):
+    """
+    Executa o backtest de carteira de uma estratégia sobre todos os símbolos do painel.
+
+    :param panel: Painel de candles (ver buildPanel).
+    :param strategy_function: Função da estratégia de trading (ex: getT3MATradeStrategy).
+    :param periods: Quantidade de candles finais analisados. None = painel inteiro.
+    :param initial_balance: Saldo inicial da carteira em moeda de cotação.
+    :param verbose: Exibe o resumo por símbolo e da carteira.
+    :param strategy_kwargs: Parâmetros adicionais para a estratégia.
+    :return: Dicionário com saldo final, lucro percentual, operações, curva de capital e tabela por símbolo.
+    """
+    if periods is not None:
+        panel = panel.iloc[-periods:]
+
+    symbols = panelSymbols(panel)
+    strategy_kwargs["verbose"] = False
+    decisions = getPanelSignalSeries(strategy_function, panel, **strategy_kwargs)
+    result = simulatePortfolioBacktest(panel["close_price"][symbols].to_numpy(), decisionsToArray(decisions), initial_balance)
+
+    symbols_table = pd.DataFrame(
+        {
+            "symbol": symbols,
+            "trades": result["symbol_trades"],
+            "pnl": result["symbol_pnl"],
+            "standalone_profit_percentage": result["symbol_standalone_profit"],
+        }
+    )
+
+    if verbose:
+        print(f"📊 Backtest de carteira da estratégia: {strategy_function.__name__}")
+        print(f"🔹 Símbolos: {len(symbols)} | Candles: {len(panel)}")
+        print(f"🔹 Balanço inicial: ${initial_balance:.2f}")
+        for row in symbols_table.itertuples(index=False):
+            print(
+                f" | {row.symbol}: {row.trades} operações | Resultado na carteira: ${row.pnl:.2f} | "
+                f"Sozinho: {row.standalone_profit_percentage:.2f}%"
+            )
+        print(f"🔹 Balanço final: ${result['balance']:.2f}")
+        print(f"📈 Lucro/prejuízo percentual: {result['profit_percentage']:.2f}%")
+        print(f"📊 Total de operações realizadas: {result['trades']}")
+
+    return {
+        "balance": result["balance"],
+        "profit_percentage": result["profit_percentage"],
+        "trades": result["trades"],
+        "equity": pd.Series(result["equity"], index=panel.index),
+        "symbols": symbols_table,
+    }
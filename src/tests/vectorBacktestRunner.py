@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+
+from strategies.signal_series import getSignalSeries, decisionsToArray
+from tests.backtestMetrics import buildBacktestResult, periodsPerYear
+
+
+def prepareBacktestData(stock_data: pd.DataFrame, periods=900, **strategy_kwargs):
+    """
+    Recorta o histórico exatamente como o backtestRunner faz, para que os dois motores analisem os mesmos candles.
+
+    :param stock_data: DataFrame contendo os dados do ativo.
+    :param periods: Número de períodos a serem analisados no backtest.
+    :param strategy_kwargs: Parâmetros da estratégia (usa 'slow_window' para garantir o aquecimento das médias).
+    :return: DataFrame recortado, com índice reiniciado e sem linhas com NaN.
+    """
+    # 🔹 Ajuste para garantir que há dados suficientes para calcular médias móveis corretamente
+    min_required_periods = strategy_kwargs.get("slow_window", 40) + 20  # Adicionamos um buffer extra
+    stock_data = stock_data[-max(periods, min_required_periods) :].copy().reset_index(drop=True)
+
+    # 🔹 REMOVE LINHAS INICIAIS COM NaN PARA EVITAR PROBLEMAS
+    stock_data.dropna(inplace=True)
+    return stock_data
+
+
+def simulateSignalBacktest(close, signal, initial_balance=1000):
+    """
+    Simula a lógica comprado/fora do backtestRunner somente com operações de array.
+
+    - 1.0 = sinal de compra: entra se estiver fora.
+    - 0.0 = sinal de venda: sai se estiver comprado.
+    - NaN = nenhuma decisão: mantém a posição.
+
+    O sinal do primeiro candle é ignorado (o backtestRunner começa o loop no índice 1) e uma posição
+    aberta no final é fechada no último preço, sem contar como operação.
+
+    :param close: Array com os preços de fechamento.
+    :param signal: Array float com os sinais (1.0, 0.0 ou NaN) de cada candle.
+    :param initial_balance: Saldo inicial da conta de trading.
+    :return: Dicionário com saldo final, lucro percentual, operações, posição e curva de capital.
+    """
+    close = np.asarray(close, dtype=float)
+    signal = np.array(signal, dtype=float)
+    n = len(close)
+
+    if n == 0:
+        return {
+            "balance": float(initial_balance),
+            "profit_percentage": 0.0,
+            "trades": 0,
+            "entries": np.empty(0, dtype=np.int64),
+            "exits": np.empty(0, dtype=np.int64),
+            "position": np.empty(0),
+            "equity": np.empty(0),
+        }
+
+    signal[0] = np.nan
+
+    # Posição = último sinal válido até o candle (forward fill via índice acumulado)
+    last_index = np.where(np.isnan(signal), 0, np.arange(n))
+    np.maximum.accumulate(last_index, out=last_index)
+    position = signal[last_index]
+    position[np.isnan(position)] = 0.0
+
+    changes = np.diff(position, prepend=0.0)
+    entries = np.flatnonzero(changes > 0)
+    exits = np.flatnonzero(changes < 0)
+    trades = len(entries) + len(exits)
+
+    # Fechar posição final no último preço
+    exit_prices = close[exits]
+    if len(entries) > len(exits):
+        exit_prices = np.append(exit_prices, close[-1])
+
+    trade_returns = (exit_prices - close[entries]) / close[entries]
+    balance = initial_balance * np.prod(1.0 + trade_returns)
+
+    # Curva de capital marcada a mercado: só há variação quando o candle anterior estava comprado
+    bar_returns = np.zeros(n)
+    bar_returns[1:] = np.where(position[:-1] > 0, close[1:] / close[:-1] - 1.0, 0.0)
+    equity = initial_balance * np.cumprod(1.0 + bar_returns)
+
+    return {
+        "balance": float(balance),
+        "profit_percentage": float((balance - initial_balance) / initial_balance * 100),
+        "trades": trades,
+        "entries": entries,
+        "exits": exits,
+        "position": position,
+        "equity": equity,
+    }
+
+
+def vectorBacktestRunner(
+    stock_data: pd.DataFrame, strategy_function, periods=900, initial_balance=1000, print_results=False, **strategy_kwargs
+):
+    """
+    Backtest vetorizado: calcula os indicadores da estratégia UMA vez sobre todo o histórico e transforma
+    a série de decisões em posição/curva de capital com operações de array.
+
+    Gera as mesmas operações do backtestRunner, mas com custo linear no número de candles em vez de
+    reexecutar a estratégia em cada prefixo. Estratégias sem versão em série continuam funcionando,
+    porém pelo caminho lento (reexecução por prefixo).
+
+    :param stock_data: DataFrame contendo os dados do ativo.
+    :param strategy_function: Função da estratégia de trading (ex: getT3MATradeStrategy).
+    :param periods: Número de períodos a serem analisados no backtest.
+    :param initial_balance: Saldo inicial da conta de trading.
+    :param print_results: Exibe o resumo do backtest no console.
+    :param strategy_kwargs: Parâmetros adicionais para a estratégia.
+    :return: BacktestResultModel com saldo, curva de capital, operações e métricas de risco.
+    """
+    stock_data = prepareBacktestData(stock_data, periods, **strategy_kwargs)
+
+    if print_results:
+        print(f"📊 Iniciando backtest vetorizado da estratégia: {strategy_function.__name__}")
+        print(f"🔹 Balanço inicial: ${initial_balance:.2f}")
+
+    decisions = getSignalSeries(strategy_function, stock_data, **strategy_kwargs)
+    close = stock_data["close_price"].to_numpy()
+    simulation = simulateSignalBacktest(close, decisionsToArray(decisions), initial_balance)
+    result = buildBacktestResult(
+        strategy_function.__name__,
+        close,
+        simulation["position"],
+        simulation["entries"],
+        simulation["exits"],
+        initial_balance=initial_balance,
+        balance=simulation["balance"],
+        trades=simulation["trades"],
+        periods_per_year=periodsPerYear(stock_data["open_time"]) if "open_time" in stock_data else 1.0,
+    )
+
+    # Resultados
+    if print_results:
+        result.printResults()
+
+    return result
@@ -0,0 +1,256 @@
+import contextlib
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from strategies.signal_series import getSignalSeries, decisionsToArray
+from tests.parameterSweep import parameterGrid, _packStockData, _unpackStockData
+from tests.vectorBacktestRunner import simulateSignalBacktest
+
+"""
+Otimização walk-forward.
+
+O histórico é dividido em janelas móveis de treino (in-sample) seguidas de uma janela de teste (out-of-sample).
+Em cada janela os parâmetros com maior lucro no treino são escolhidos e avaliados no teste seguinte; as curvas
+de capital dos testes são emendadas em uma única curva fora da amostra.
+
+A série de sinais de cada combinação de parâmetros é calculada UMA vez sobre o histórico inteiro e depois apenas
+fatiada por janela: o sinal no candle i depende só dos candles até i, então a fatia é idêntica a recalcular a
+estratégia com todo o histórico disponível até cada candle, como o bot faz ao vivo.
+"""
+
+# Dados de cada processo do pool: candles reconstruídos e matrizes de sinais anexadas por nome
+_worker_stock_data = None
+_worker_shared_memory = {}
+
+
+def walkForwardWindows(n_rows, train_size, test_size, step=None):
+    """
+    Gera as janelas móveis (treino seguido de teste) sobre um histórico de n_rows candles.
+
+    :param n_rows: Quantidade de candles do histórico.
+    :param train_size: Candles de cada janela de treino.
+    :param test_size: Candles de cada janela de teste.
+    :param step: Deslocamento entre janelas. None = test_size (testes contíguos, sem sobreposição).
+    :return: Lista de tuplas (train_start, train_end, test_end); treino = [train_start, train_end), teste = [train_end, test_end).
+    """
+    step = step or test_size
+    return [
+        (start, start + train_size, start + train_size + test_size)
+        for start in range(0, n_rows - train_size - test_size + 1, step)
+    ]
+
+
+def _initWalkForwardWorker(shm_name, layout, n_rows):
+    """Inicializador de cada processo do pool: anexa a memória compartilhada e reconstrói os candles."""
+    global _worker_stock_data
+    _worker_shared_memory[shm_name] = shared_memory.SharedMemory(name=shm_name)
+    _worker_stock_data = _unpackStockData(_worker_shared_memory[shm_name].buf, layout, n_rows)
+
+
+def _attachSignals(shm_name, shape):
+    """Anexa (uma vez por processo) a matriz de sinais publicada na memória compartilhada."""
+    if shm_name not in _worker_shared_memory:
+        _worker_shared_memory[shm_name] = shared_memory.SharedMemory(name=shm_name)
+    return np.ndarray(shape, dtype=np.float64, buffer=_worker_shared_memory[shm_name].buf)
+
+
+def _computeSignals(stock_data, strategy_function, params):
+    """
+    Série de sinais (1.0 / 0.0 / NaN) de uma combinação sobre o histórico inteiro.
+
+    :return: (sinais, erro) - em caso de erro os sinais são todos NaN (a combinação nunca opera).
+    """
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            decisions = getSignalSeries(strategy_function, stock_data, **params)
+        return decisionsToArray(decisions), None
+    except Exception as e:
+        return np.full(len(stock_data), np.nan), f"{type(e).__name__}: {e}"
+
+
+def _computeSignalsChunk(strategy_function, chunk):
+    """Tarefa do pool: calcula os sinais de um lote de combinações."""
+    return [_computeSignals(_worker_stock_data, strategy_function, params) for params in chunk]
+
+
+def _optimizeWindow(close, signals, window, initial_balance):
+    """
+    Escolhe a combinação de maior lucro no treino e a avalia no teste seguinte.
+
+    :param close: Array com os preços de fechamento do histórico inteiro.
+    :param signals: Matriz (combinações x candles) com os sinais de cada combinação.
+    :param window: Tupla (train_start, train_end, test_end).
+    :param initial_balance: Saldo inicial de cada janela.
+    :return: Dicionário com o índice da melhor combinação, lucros de treino/teste e curva de capital do teste.
+    """
+    train_start, train_end, test_end = window
+
+    train_profits = np.array(
+        [
+            simulateSignalBacktest(close[train_start:train_end], signal[train_start:train_end], initial_balance)[
+                "profit_percentage"
+            ]
+            for signal in signals
+        ]
+    )
+    best = int(np.argmax(train_profits))  # Empate: vale a primeira combinação do grid
+
+    test = simulateSignalBacktest(close[train_end:test_end], signals[best, train_end:test_end], initial_balance)
+    return {
+        "best": best,
+        "train_profit": float(train_profits[best]),
+        "test_profit": test["profit_percentage"],
+        "test_trades": test["trades"],
+        "test_equity": test["equity"],
+    }
+
+
+def _optimizeWindowChunk(windows, signals_name, signals_shape, initial_balance):
+    """Tarefa do pool: otimiza um lote de janelas usando a matriz de sinais compartilhada."""
+    close = _worker_stock_data["close_price"].to_numpy()
+    signals = _attachSignals(signals_name, signals_shape)
+    return [_optimizeWindow(close, signals, window, initial_balance) for window in windows]
+
+
+def _chunks(items, n_chunks):
+    size = max(1, -(-len(items) // n_chunks))
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def walkForward(
+    stock_data: pd.DataFrame,
+    strategy_function,
+    param_grid: dict,
+    train_size=2000,
+    test_size=500,
+    step=None,
+    initial_balance=1000,
+    workers=None,
+    verbose=True,
+    **fixed_kwargs,
+):
+    """
+    Executa a otimização walk-forward da estratégia.
+
+    Cada janela começa zerada (fora do mercado) com initial_balance, como um backtestRunner sobre a fatia;
+    a curva fora da amostra é a composição das curvas de teste, cada uma continuando do capital final da anterior.
+
+    :param stock_data: DataFrame contendo os dados do ativo.
+    :param strategy_function: Função da estratégia de trading (ex: getT3MATradeStrategy).
+    :param param_grid: Dicionário com a lista de valores de cada parâmetro (ex: {"fast_period": [5, 7, 9]}).
+    :param train_size: Candles de cada janela de treino (in-sample).
+    :param test_size: Candles de cada janela de teste (out-of-sample).
+    :param step: Deslocamento entre janelas. None = test_size.
+    :param initial_balance: Saldo inicial da conta de trading.
+    :param workers: Quantidade de processos. None = todos os núcleos; 1 = executa no processo atual.
+    :param verbose: Exibe o resumo de cada janela e o resultado final.
+    :param fixed_kwargs: Parâmetros fixos repassados à estratégia (as estratégias sempre recebem verbose=False).
+    :return: Dicionário com a tabela de janelas, a curva de capital fora da amostra, saldo e lucro percentual final.
+    """
+    stock_data = stock_data.dropna().reset_index(drop=True)
+    close = stock_data["close_price"].to_numpy()
+
+    windows = walkForwardWindows(len(stock_data), train_size, test_size, step)
+    if not windows:
+        raise ValueError(
+            f"Histórico com {len(stock_data)} candles é curto demais para treino de {train_size} + teste de {test_size}."
+        )
+
+    fixed_kwargs["verbose"] = False
+    combinations = [{**fixed_kwargs, **params} for params in parameterGrid(param_grid)]
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, max(len(combinations), len(windows))))
+
+    if verbose:
+        print(f"🔁 Walk-forward da estratégia: {strategy_function.__name__}")
+        print(f"🔹 Combinações: {len(combinations)} | Janelas: {len(windows)} | Processos: {workers}")
+
+    if workers == 1:
+        computed = [_computeSignals(stock_data, strategy_function, params) for params in combinations]
+        signals = np.vstack([signal for signal, _ in computed])
+        results = [_optimizeWindow(close, signals, window, initial_balance) for window in windows]
+    else:
+        shm, layout = _packStockData(stock_data)
+        signals_shm = None
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_initWalkForwardWorker, initargs=(shm.name, layout, len(stock_data))
+            ) as executor:
+                # 1ª fase: sinais de cada combinação, calculados uma única vez sobre o histórico inteiro
+                futures = [
+                    executor.submit(_computeSignalsChunk, strategy_function, chunk)
+                    for chunk in _chunks(combinations, workers * 4)
+                ]
+                computed = [item for future in futures for item in future.result()]
+
+                signals_shape = (len(combinations), len(stock_data))
+                signals_shm = shared_memory.SharedMemory(create=True, size=8 * signals_shape[0] * signals_shape[1])
+                signals = np.ndarray(signals_shape, dtype=np.float64, buffer=signals_shm.buf)
+                signals[:] = np.vstack([signal for signal, _ in computed])
+
+                # 2ª fase: otimização das janelas em paralelo, fatiando a matriz de sinais
+                futures = [
+                    executor.submit(_optimizeWindowChunk, chunk, signals_shm.name, signals_shape, initial_balance)
+                    for chunk in _chunks(windows, workers)
+                ]
+                results = [item for future in futures for item in future.result()]
+                signals = signals.copy()  # Libera a referência ao buffer antes de fechar a memória compartilhada
+        finally:
+            shm.close()
+            shm.unlink()
+            if signals_shm is not None:
+                signals_shm.close()
+                signals_shm.unlink()
+
+    # Tabela de janelas e curva de capital fora da amostra emendada
+    open_time = stock_data["open_time"] if "open_time" in stock_data.columns else pd.Series(stock_data.index)
+    rows = []
+    equity_parts = []
+    balance = float(initial_balance)
+
+    for (train_start, train_end, test_end), result in zip(windows, results):
+        equity_parts.append(
+            pd.Series(result["test_equity"] / initial_balance * balance, index=open_time.iloc[train_end:test_end])
+        )
+        balance = float(equity_parts[-1].iloc[-1])
+
+        rows.append(
+            {
+                "train_start": open_time.iloc[train_start],
+                "test_start": open_time.iloc[train_end],
+                "test_end": open_time.iloc[test_end - 1],
+                **{name: combinations[result["best"]][name] for name in param_grid},
+                "train_profit": result["train_profit"],
+                "test_profit": result["test_profit"],
+                "test_trades": result["test_trades"],
+            }
+        )
+
+        if verbose:
+            best = {name: combinations[result["best"]][name] for name in param_grid}
+            print(
+                f" | {open_time.iloc[train_end]} → {best} | Treino: {result['train_profit']:.2f}% | "
+                f"Teste: {result['test_profit']:.2f}%"
+            )
+
+    errors = [error for _, error in computed if error is not None]
+    profit_percentage = (balance - initial_balance) / initial_balance * 100
+
+    if verbose:
+        if errors:
+            print(f"⚠️ {len(errors)} combinações falharam ao calcular os sinais (ex: {errors[0]}).")
+        print(f"🔹 Balanço final fora da amostra: ${balance:.2f}")
+        print(f"📈 Lucro/prejuízo percentual fora da amostra: {profit_percentage:.2f}%")
+
+    return {
+        "windows": pd.DataFrame(rows),
+        "equity": pd.concat(equity_parts),
+        "balance": balance,
+        "profit_percentage": profit_percentage,
+        "errors": errors,
+    }